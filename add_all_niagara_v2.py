@@ -3,20 +3,21 @@
 
 import json
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+import kb_loader
+from kb_journal import write_knowledge_base
 
 REPO_DIR = "/Users/morszhu/.openclaw/workspace/repos/realtime-tech-library"
 
 def load_kb():
-    with open(f"{REPO_DIR}/knowledge-base.js", 'r') as f:
-        content = f.read()
-    json_start = content.find('{')
-    json_end = content.rfind('}') + 1
-    return json.loads(content[json_start:json_end])
+    meta, articles = kb_loader.load_knowledge_base(f"{REPO_DIR}/knowledge-base.js")
+    return {"meta": meta, "articles": articles}
 
 def save_kb(data):
     js_content = f"const knowledgeBase = {json.dumps(data, ensure_ascii=False, indent=2)};\n"
-    with open(f"{REPO_DIR}/knowledge-base.js", 'w') as f:
-        f.write(js_content)
+    write_knowledge_base(f"{REPO_DIR}/knowledge-base.js", js_content, op='add_all_niagara_v2')
     print("✅ 已更新 knowledge-base.js")
 
 def add_all_niagara_v2(data):
@@ -3,6 +3,10 @@
 
 import json
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from kb_journal import write_knowledge_base
 
 REPO_DIR = "/Users/morszhu/.openclaw/workspace/repos/realtime-tech-library"
 
@@ -15,8 +19,7 @@ def load_kb():
 
 def save_kb(data):
     js_content = f"const knowledgeBase = {json.dumps(data, ensure_ascii=False, indent=2)};\n"
-    with open(f"{REPO_DIR}/knowledge-base.js", 'w') as f:
-        f.write(js_content)
+    write_knowledge_base(f"{REPO_DIR}/knowledge-base.js", js_content, op='add_niagara_v2')
     print("✅ 已更新 knowledge-base.js")
 
 def add_niagara_v2_articles(data):
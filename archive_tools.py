@@ -8,8 +8,14 @@
 import json
 import shutil
 import os
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+import kb_loader
+from article_renderer import render_article
+from kb_journal import write_knowledge_base
+
 REPO_DIR = "/Users/morszhu/.openclaw/workspace/repos/realtime-tech-library"
 ARCHIVE_DIR = f"{REPO_DIR}/archive"
 
@@ -21,17 +27,13 @@ def ensure_archive_dir():
 
 def load_knowledge_base():
     """加载知识库"""
-    with open(f"{REPO_DIR}/knowledge-base.js", 'r') as f:
-        content = f.read()
-    json_start = content.find('{')
-    json_end = content.rfind('}') + 1
-    return json.loads(content[json_start:json_end])
+    meta, articles = kb_loader.load_knowledge_base(f"{REPO_DIR}/knowledge-base.js")
+    return {"meta": meta, "articles": articles}
 
 def save_knowledge_base(data):
     """保存知识库"""
     js_content = f"const knowledgeBase = {json.dumps(data, ensure_ascii=False, indent=2)};\n"
-    with open(f"{REPO_DIR}/knowledge-base.js", 'w') as f:
-        f.write(js_content)
+    write_knowledge_base(f"{REPO_DIR}/knowledge-base.js", js_content, op='archive_tools')
     print("✅ 已更新 knowledge-base.js")
 
 def archive_siggraph_articles(data):
@@ -88,42 +90,14 @@ def simplify_to_v15(data):
             article = data['articles'][aid]
             
             # 简化为 V1.5 格式（保留基本信息，简化内容）
-            v15_content = f"""<div class="article-content">
-    <div class="flex flex-wrap items-center gap-3 mb-6">
-        <span class="tag-ta px-3 py-1 rounded-full text-sm">工具发布</span>
-        <span class="text-gray-500">{article.get('date', 'N/A')}</span>
-        <span class="text-gray-500">•</span>
-        <span class="text-gray-500">5分钟阅读</span>
-        <span class="text-gray-500">•</span>
-        <span class="text-gray-500">简单</span>
-    </div>
-
-    <h1>{info['title']}</h1>
-
-    <p class="text-xl text-gray-300 mb-6 leading-relaxed">
-        {info['summary']}
-    </p>
-
-    <div class="glass-card rounded-xl p-6 mb-6 border-l-4 border-blue-500">
-        <h3 class="text-lg font-semibold text-blue-400 mb-3">核心要点</h3>
-        <ul class="space-y-2 text-gray-300">
-            {''.join([f'<li>• {p}</li>' for p in info['key_points']])}
-        </ul>
-    </div>
-
-    <div class="bg-dark-700/30 rounded-lg p-4 my-4">
-        <p class="text-sm text-gray-400">
-            <strong>注：</strong>本文为工具发布简要总结（V1.5格式）。如需深度技术解析，请参考官方文档或查看相关技术指南。
-        </p>
-    </div>
-
-    <footer class="text-center text-gray-500 text-sm mt-12 pt-8 border-t border-slate-800">
-        <p>Realtime Tech Library • V1.5 工具发布摘要</p>
-        <p class="mt-2">最后更新: {datetime.now().strftime('%Y-%m-%d')}</p>
-    </footer>
-</div>"""
-            
-            article['content'] = v15_content
+            article['content'] = render_article(
+                'v1.5', 'ta',  # 原有的 V1.5 摘要固定使用 tag-ta 标签样式
+                title=info['title'],
+                summary=info['summary'],
+                key_points=info['key_points'],
+                date=article.get('date', 'N/A'),
+                updated=datetime.now().strftime('%Y-%m-%d')
+            )
             article['readTime'] = '5分钟'
             article['difficulty'] = '简单'
             article['author'] = 'Realtime Tech Library / V1.5摘要版'
@@ -4,14 +4,17 @@
  */
 
 const fs = require('fs');
+const vm = require('vm');
 
 const KB_PATH = './knowledge-base.js';
 const BACKUP_DIR = './articles-v2';
 
-// 读取知识库
+// 读取知识库：knowledge-base.js 是带页面函数的 JS，在沙箱里执行后取出 knowledgeBase
 let kbContent = fs.readFileSync(KB_PATH, 'utf8');
-const match = kbContent.match(/const knowledgeBase = ({[\s\S]*});?\s*$/);
-const kb = JSON.parse(match[1]);
+const kb = vm.runInNewContext(kbContent + '\n;knowledgeBase', { document: { addEventListener() {} } });
+
+// 自动摘要文章是结构化记录（layout + fields，没有 content），用 getArticle() 渲染正文
+const articleContent = id => (kb.getArticle ? kb.getArticle(id) : kb.articles[id]).content;
 
 console.log('╔════════════════════════════════════════════════════════════╗');
 console.log('║           Realtime Tech Library - 网站问题诊断报告           ║');
@@ -33,7 +36,8 @@ const categories = {
 };
 
 articles.forEach(([id, art]) => {
-  const size = art.content ? art.content.length : 0;
+  const content = articleContent(id);
+  const size = content ? content.length : 0;
   if (size < 2000) categories['占位符(<2KB)'].push({id, title: art.title, size});
   else if (size < 10000) categories['简短(2-10KB)'].push({id, title: art.title, size});
   else if (size < 30000) categories['中等(10-30KB)'].push({id, title: art.title, size});
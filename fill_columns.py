@@ -4,6 +4,12 @@
 """
 
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from kb_loader import load_knowledge_base
+from kb_journal import write_knowledge_base
 
 # 简化的补充文章数据
 new_articles = {
@@ -49,13 +55,8 @@ new_articles = {
     }
 }
 
-with open('knowledge-base.js', 'r') as f:
-    content = f.read()
-
-import re
-match = re.search(r'articles:\s*({.*?}),\s*currentCategory', content, re.DOTALL)
-if match:
-    articles = json.loads(match.group(1))
+_, articles = load_knowledge_base('knowledge-base.js')
+if articles:
     articles.update(new_articles)
     
     meta = {
@@ -79,7 +80,6 @@ function backToCategory() { showPage(knowledgeBase.currentCategory || 'home'); }
 document.addEventListener('DOMContentLoaded', function() { if (typeof lucide !== 'undefined') lucide.createIcons(); });
 '''
     
-    with open('knowledge-base.js', 'w') as f:
-        f.write(js_content)
+    write_knowledge_base('knowledge-base.js', js_content, op='fill_columns')
     
     print(f'✅ 已更新: {len(articles)}篇文章')
@@ -5,14 +5,15 @@
 """
 
 import json
-import re
+import os
+import sys
 
-with open('knowledge-base.js', 'r', encoding='utf-8') as f:
-    content = f.read()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from kb_loader import load_knowledge_base
+from kb_journal import write_knowledge_base
 
-match = re.search(r'articles:\s*({.*?}),\s*currentCategory', content, re.DOTALL)
-if match:
-    articles = json.loads(match.group(1))
+_, articles = load_knowledge_base('knowledge-base.js')
+if articles:
     
     # 1. UE 5.7 完整文章
     articles['ue57-release']['content'] = '''<div class="article-content"><div class="flex flex-wrap items-center gap-3 mb-6"><span class="tag-ue px-3 py-1 rounded-full text-sm">Unreal Engine</span><span class="text-gray-500">2025-11-12</span><span class="text-gray-500">•</span><span class="text-gray-500">20分钟阅读</span><span class="text-gray-500">•</span><span class="text-gray-500">困难</span></div><h1>Unreal Engine 5.7 正式发布：完整技术分析</h1><p class="text-xl text-gray-300">Epic Games于2025年11月12日正式发布Unreal Engine 5.7。本文基于官方Release Notes和Unreal Fest技术演讲，对核心新特性进行深度技术剖析。</p><div class="source-box"><div class="flex items-center gap-2 mb-2"><svg class="w-4 h-4 text-neon-amber" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13.828 10.172a4 4 0 00-5.656 0l-4 4a4 4 0 105.656 5.656l1.102-1.101m-.758-4.899a4 4 0 005.656 0l4-4a4 4 0 00-5.656-5.656l-1.1 1.1"></path></svg><span class="text-neon-amber font-medium">参考资源（点击阅读原文）</span></div><div class="text-sm text-gray-400"><div>• <a href="https://www.unrealengine.com/en-US/news/unreal-engine-5-7-is-now-available" target="_blank" class="text-neon-blue hover:underline">📄 Epic Games 官方发布页面 [原文]</a></div><div>• <a href="https://dev.epicgames.com/documentation/en-us/unreal-engine/unreal-engine-5-7-release-notes" target="_blank" class="text-neon-blue hover:underline">📄 完整 Release Notes [原文]</a></div><div>• <a href="https://www.cgchannel.com/2025/11/unreal-engine-5-7-five-key-features-for-cg-artists/" target="_blank" class="text-neon-blue hover:underline">📄 CGChannel 技术分析 [原文]</a></div></div></div><div class="tech-analysis-box" style="border-color: #00f0ff40;"><div class="flex items-center gap-2 mb-4"><span class="text-lg font-semibold" style="color: #00f0ff">🔬 深度技术分析</span></div><p class="mb-0 text-gray-300 leading-relaxed">UE 5.7是虚幻引擎向"完全程序化、完全动态"渲染转型的里程碑版本。核心突破包括：Nanite Foliage将Nanite技术扩展到植被渲染，解决高密度植被的性能与内存矛盾；MegaLights实现千光源实时渲染；PCG从实验版升级为正式版。</p></div><h2>🌿 Nanite Foliage：植被渲染的革命</h2><p>传统植被渲染面临两难：高密度网格导致内存爆炸，LOD又造成远处细节丢失。Nanite Foliage通过Cluster-Based表示法解决了这一矛盾。</p><h3>核心架构</h3><pre><code>【Nanite Foliage vs 传统Static Mesh】
@@ -89,7 +90,6 @@ foliage.DensityScale 0.5     // 降低密度测试</code></pre><h2>💡 实用
     meta = {"lastUpdated": "2026-02-28 19:35", "totalArticles": len(articles), "autoGenerated": True, "version": "5.1"}
     js = 'const knowledgeBase = { meta: ' + json.dumps(meta) + ', articles: ' + json.dumps(articles, ensure_ascii=False) + ', currentCategory: "home", getArticle(id) { return this.articles[id] || { title: "文章不存在", content: "<div>找不到</div>" }; }, getArticlesByCategory(category) { return Object.entries(this.articles).filter(([id, a]) => a.category === category).map(([id, a]) => ({ id, ...a })); } }; function showPage(pageId) { document.querySelectorAll(".page").forEach(p => p.classList.remove("active")); const t = document.getElementById("page-" + pageId); if (t) { t.classList.add("active"); } }'
     
-    with open('knowledge-base.js', 'w', encoding='utf-8') as f:
-        f.write(js)
+    write_knowledge_base('knowledge-base.js', js, op='final_upgrade')
     
     print(f'✅ 知识库已保存')
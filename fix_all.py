@@ -1,5 +1,10 @@
 import re
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from kb_journal import write_knowledge_base
 
 with open('knowledge-base.js', 'r', encoding='utf-8') as f:
     content = f.read()
@@ -19,8 +24,7 @@ try:
     print(f"✅ JSON 语法正确! 文章数量: {len(data.get('articles', {}))}")
     
     # 保存修复后的文件
-    with open('knowledge-base.js', 'w', encoding='utf-8') as f:
-        f.write(content)
+    write_knowledge_base('knowledge-base.js', content, op='fix_all')
     print("✅ 文件已保存")
     
 except json.JSONDecodeError as e:
@@ -6,31 +6,29 @@
 
 const fs = require('fs');
 const path = require('path');
+const vm = require('vm');
 
 const KB_PATH = path.join(__dirname, 'knowledge-base.js');
 
 // 读取文件
 let content = fs.readFileSync(KB_PATH, 'utf8');
 
-// 提取 JSON 部分（去掉 const knowledgeBase = 和最后的 ;）
-const jsonMatch = content.match(/const knowledgeBase = ({[\s\S]*});?\s*$/);
-if (!jsonMatch) {
-    console.error('❌ 无法解析 knowledge-base.js');
-    process.exit(1);
-}
-
+// knowledge-base.js 是带页面函数的 JS，在沙箱里执行后取出 knowledgeBase
 let kb;
 try {
-    kb = JSON.parse(jsonMatch[1]);
+    kb = vm.runInNewContext(content + '\n;knowledgeBase', { document: { addEventListener() {} } });
 } catch (e) {
-    console.error('❌ JSON 解析失败:', e.message);
+    console.error('❌ 无法解析 knowledge-base.js:', e.message);
     process.exit(1);
 }
 
+// 自动摘要文章是结构化记录（layout + fields，没有 content），用 getArticle() 渲染出正文
+const getArticle = id => (kb.getArticle && kb.articles[id] ? kb.getArticle(id) : kb.articles[id]);
+
 console.log('📋 检查文章...');
 
 // 修复 pScatter (440e06882426)
-const pscatter = kb.articles['440e06882426'];
+const pscatter = getArticle('440e06882426');
 if (pscatter && pscatter.content) {
     console.log('🔧 检查 pScatter 文章...');
     
@@ -151,7 +149,7 @@ sobel_y = nuke.nodes.Matrix(inputs=[pos_input], matrix='{ { -1 -2 -1 } { 0 0 0 }
 }
 
 // 3DGS 检查
-const gs = kb.articles['704c94c2a1d8'];
+const gs = getArticle('704c94c2a1d8');
 if (gs && gs.content) {
     console.log('🔧 检查 3DGS 文章...');
     
@@ -164,7 +162,7 @@ if (gs && gs.content) {
 }
 
 // 保存修复后的文件
-const output = 'const knowledgeBase = ' + JSON.stringify(kb, null, 2) + ';\n';
+const output = 'const knowledgeBase = ' + JSON.stringify({ meta: kb.meta, articles: kb.articles }, null, 2) + ';\n';
 fs.writeFileSync(KB_PATH, output, 'utf8');
 
 console.log('\n✅ 修复完成！');
@@ -4,26 +4,23 @@
 """
 
 import json
-import re
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from kb_loader import load_knowledge_base, parse_knowledge_base_text
+from kb_journal import write_knowledge_base
 
 KB_PATH = 'knowledge-base.js'
 
 def main():
     # 读取文件
-    with open(KB_PATH, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # 提取 JSON 部分
-    match = re.search(r'const knowledgeBase = ({[\s\S]*});?\s*$', content)
-    if not match:
-        print('❌ 无法解析 knowledge-base.js')
-        return
-    
     try:
-        kb = json.loads(match.group(1))
-    except json.JSONDecodeError as e:
-        print(f'❌ JSON 解析失败: {e}')
+        meta, articles = load_knowledge_base(KB_PATH)
+    except ValueError as e:
+        print(f'❌ 无法解析 knowledge-base.js: {e}')
         return
+    kb = {'meta': meta, 'articles': articles}
     
     print('📋 检查文章...')
     
@@ -107,18 +104,15 @@ def main():
     # 保存修复后的文件
     output = 'const knowledgeBase = ' + json.dumps(kb, ensure_ascii=False, indent=2) + ';\n'
     
-    with open(KB_PATH, 'w', encoding='utf-8') as f:
-        f.write(output)
+    write_knowledge_base(KB_PATH, output, op='fix_articles')
     
     print('\n✅ 修复完成！')
     
     # 验证
     try:
-        verify_match = re.search(r'const knowledgeBase = ({[\s\S]*});?\s*$', output)
-        if verify_match:
-            json.loads(verify_match.group(1))
-            print('✅ JSON 语法验证通过')
-    except json.JSONDecodeError as e:
+        parse_knowledge_base_text(output)
+        print('✅ JSON 语法验证通过')
+    except ValueError as e:
         print(f'❌ JSON 语法错误: {e}')
 
 if __name__ == '__main__':
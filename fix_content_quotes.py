@@ -1,69 +1,53 @@
-import json
-import re
+#!/usr/bin/env python3
+"""
+把文章正文中的中文引号 (“ ”) 替换为英文引号
+通过正文 blob (scripts/content_blob.py) 逐篇 mmap 读取、追加写入修改后的正文，只处理含中文引号的文章，
+不再逐行扫描整个 knowledge-base.js；正文写回存储时由 json.dumps 负责转义。
+"""
 
-with open('knowledge-base.js', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+import os
+import sys
+from datetime import datetime
 
-# 逐行处理，只在 content 字段内部替换中文引号
-in_content = False
-content_start_line = -1
-fixed_count = 0
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from content_blob import ContentBlob
+from kb_store import KnowledgeBaseStore
 
-for i, line in enumerate(lines):
-    # 检测 content 字段开始
-    if '"content":' in line and not in_content:
-        in_content = True
-        content_start_line = i
-        # 检查这一行是否也包含 content 的结束
-        # 如果行尾有 ", 则 content 在这一行结束
-        if line.rstrip().endswith('",') or line.rstrip().endswith('"'):
-            # 替换这一行中的中文引号
-            original = line
-            line = line.replace('"', '\\"').replace('"', '\\"')
-            if line != original:
-                lines[i] = line
-                fixed_count += 1
-                print(f'Fixed line {i+1} (single-line content)')
-            in_content = False
-    
-    elif in_content:
-        # 检查是否到达 content 的结束
-        # content 通常在 </div>" 或类似的 HTML 结束标签后结束
-        stripped = line.strip()
-        if (stripped == '"' or stripped.endswith('",') or stripped.endswith('"')) and 'content' not in line.lower():
-            # 这可能是 content 的结束
-            # 替换这一行中的中文引号
-            original = line
-            line = line.replace('"', '\\"').replace('"', '\\"')
-            if line != original:
-                lines[i] = line
-                fixed_count += 1
-                print(f'Fixed line {i+1} (content end)')
-            in_content = False
-        else:
-            # 在 content 内部，替换中文引号
-            original = line
-            line = line.replace('"', '\\"').replace('"', '\\"')
-            if line != original:
-                lines[i] = line
-                fixed_count += 1
-                print(f'Fixed line {i+1} (in content)')
+CHINESE_QUOTES = ('“', '”')
 
-print(f'\nTotal lines fixed: {fixed_count}')
 
-# 验证修复
-content = ''.join(lines)
-json_start = content.find('{')
-json_content = content[json_start:]
+def replace_quotes(html):
+    for quote in CHINESE_QUOTES:
+        html = html.replace(quote, '"')
+    return html
 
-try:
-    data = json.loads(json_content)
-    print(f"✅ JSON 语法正确! 文章数量: {len(data.get('articles', {}))}")
-    
-    # 保存修复后的文件
-    with open('knowledge-base.js', 'w', encoding='utf-8') as f:
-        f.writelines(lines)
-    print("✅ 文件已保存")
-    
-except json.JSONDecodeError as e:
-    print(f"❌ JSON 错误: 第 {e.lineno} 行 - {e.msg}")
+
+def fix_content_quotes(store, blob):
+    """修改含中文引号的文章正文，返回修改的篇数"""
+    blob.sync_from_store(store)
+    fixed = 0
+    for article_id in blob:
+        data = blob.get_bytes(article_id)
+        # 大多数文章不含中文引号，直接在字节上判断，不解码
+        if not any(quote.encode('utf-8') in data for quote in CHINESE_QUOTES):
+            continue
+        status = blob.patch(article_id, replace_quotes)
+        print(f'Fixed {article_id} ({status})')
+        fixed += 1
+    return fixed
+
+
+def main():
+    store = KnowledgeBaseStore()
+    with ContentBlob() as blob:
+        fixed = fix_content_quotes(store, blob)
+        print(f'\nTotal articles fixed: {fixed}')
+        if fixed:
+            blob.apply_to_store(store)
+            meta = dict(store.meta(), lastUpdated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            store.build(meta)
+            print("✅ 已重新生成 knowledge-base.js")
+
+
+if __name__ == '__main__':
+    main()
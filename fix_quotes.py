@@ -1,4 +1,9 @@
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from kb_journal import write_knowledge_base
 
 with open('knowledge-base.js', 'r', encoding='utf-8') as f:
     lines = f.readlines()
@@ -11,7 +16,6 @@ if len(lines) > 917:
     lines[917] = line
     print('Fixed line 918')
 
-with open('knowledge-base.js', 'w', encoding='utf-8') as f:
-    f.writelines(lines)
+write_knowledge_base('knowledge-base.js', ''.join(lines), op='fix_quotes')
 
 print('Done')
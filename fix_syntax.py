@@ -1,4 +1,9 @@
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from kb_journal import write_knowledge_base
 
 with open('knowledge-base.js', 'r') as f:
     content = f.read()
@@ -24,7 +29,6 @@ for i, line in enumerate(lines):
                     break
                 break
 
-with open('knowledge-base.js', 'w') as f:
-    f.write('\n'.join(lines))
+write_knowledge_base('knowledge-base.js', '\n'.join(lines), op='fix_syntax')
 
 print('Done')
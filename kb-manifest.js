@@ -0,0 +1,1150 @@
+// Realtime Tech Knowledge Base - Manifest (正文按需从 contentPath 加载)
+const knowledgeBase = {
+    meta: {
+    "lastUpdated": "2026-08-22 20:15:16",
+    "totalArticles": 1139,
+    "autoGenerated": true,
+    "version": "4.0-auto"
+},
+    articles: {
+        "12daadddfb57": {"title": "Epic Games lays off another 1,000 staff", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发", "Niagara粒子系统"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/12daadddfb57.json"},
+        "de6cf98c0112": {"title": "Fortnite developer Epic Games is cutting over 1,000 jobs", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发", "Niagara粒子系统"], "date": "Tue, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/de6cf98c0112.json"},
+        "e613f0d9187d": {"title": "VFX Character Axe Swing", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发", "Niagara粒子系统"], "date": "Tue, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e613f0d9187d.json"},
+        "3f9313837dc3": {"title": "Free tutorial: Creating Cinematics in 虚幻引擎 5", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发", "Niagara粒子系统"], "date": "Mon, 23 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3f9313837dc3.json"},
+        "ae9ddbcc62cd": {"title": "OpenUSD 26.03 adds support for 3D Gaussian Splats", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ae9ddbcc62cd.json"},
+        "cd3ca9eb2ee9": {"title": "Handy Maya add-on RefTool speeds up portrait modeling", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Tue, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cd3ca9eb2ee9.json"},
+        "62d41805896c": {"title": "Tencent's genAI animation tools don't seem to make games more fun", "category": "ai", "tags": ["机器学习", "神经网络", "生成式AI", "AI辅助开发"], "date": "Tue, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/62d41805896c.json"},
+        "328acc97b109": {"title": "ONYX Ai Matte automatically generates masks from video", "category": "ai", "tags": ["机器学习", "神经网络", "生成式AI", "AI辅助开发"], "date": "Tue, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/328acc97b109.json"},
+        "96bcdc233a58": {"title": "Behaviour Interactive acquires 7 Days to Die dev The Fun Pimps", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Tue, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/96bcdc233a58.json"},
+        "4abb232d870c": {"title": "Reforged Studios acquires Super Meat Boy 3D co-publisher Headup", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Tue, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4abb232d870c.json"},
+        "692869269e3e": {"title": "Report: Nintendo slashes Switch 2 production by a third due to weak U.S. sales", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Tue, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/692869269e3e.json"},
+        "1f4a1bd8dc22": {"title": "Autodesk releases Arnold 7.5.1 with free cloud rendering", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1f4a1bd8dc22.json"},
+        "c8e9d5ccfdbe": {"title": "Autodesk releases 3ds Max 2027", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c8e9d5ccfdbe.json"},
+        "5fd9793dfde9": {"title": "Maya 2027 is out: discover its new features", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5fd9793dfde9.json"},
+        "c2840171795a": {"title": "Active and pasive", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c2840171795a.json"},
+        "2998c19bd9df": {"title": "[Tool]Struct Alignment Visualizer - don't waste memory!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2998c19bd9df.json"},
+        "e7514673e001": {"title": "Important lessons from running a successful video game crowdfunding campaign", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e7514673e001.json"},
+        "919e7661df46": {"title": "Fortnite Rocket Racing and more are being sunsetted amidst layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/919e7661df46.json"},
+        "5dc32060228b": {"title": "Epic Games layoffs serve as a timely reminder that accountability is dead", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5dc32060228b.json"},
+        "23a4793648e5": {"title": "Xbox and Netflix 'kicking around' ideas for subscription bundles", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/23a4793648e5.json"},
+        "f09000337f57": {"title": "Dispatch developer AdHoc says don't confuse your plot for narrative", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f09000337f57.json"},
+        "6aa2ebcbe657": {"title": "Unity vs Unreal: Which One Is Better?", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6aa2ebcbe657.json"},
+        "23e254b9a247": {"title": "Very First Solo Missile Projectile VFX,,,", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/23e254b9a247.json"},
+        "292f796997e1": {"title": "Sitni Sati releases FumeFX 7.0 for Maya with FumeFX GPU", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Thu, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/292f796997e1.json"},
+        "39c75bf1604a": {"title": "Autodesk releases MotionBuilder 2027", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Thu, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/39c75bf1604a.json"},
+        "f99aed3fffdc": {"title": "Why I’m building a \"Sovereign\" Physics Math Layer", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f99aed3fffdc.json"},
+        "41674e528ebf": {"title": "Donkey Kong Bananza has a big-brained approach to asset recycling", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/41674e528ebf.json"},
+        "68a583b40709": {"title": "Analyst says Epic Games layoffs send a clear signal: 'This will not get any easier'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/68a583b40709.json"},
+        "2abb42bd85c1": {"title": "The Nex Playground is getting a price hike because of the memory crisis", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2abb42bd85c1.json"},
+        "e2e6521941f5": {"title": "Nintendo tweaks Switch 2 software pricing to make digital copies more appealing", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e2e6521941f5.json"},
+        "01ff73ca6286": {"title": "Autodesk releases Mudbox 2027", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/01ff73ca6286.json"},
+        "f1d96d33dcc2": {"title": "KeyShot releases KeyShot Studio 2026.1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f1d96d33dcc2.json"},
+        "36567cb5367a": {"title": "Assorted tips for UI Toolkit + a development in Godot", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/36567cb5367a.json"},
+        "02028be5a1f3": {"title": "Looking for coders for c#", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/02028be5a1f3.json"},
+        "19fe007f34f4": {"title": "[Free 教程] Pro-Level Unreal VFX Portfolio Logic (Free for 30 Days)", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/19fe007f34f4.json"},
+        "a2ce798ff66f": {"title": "Game Dev Digest Issue #324 - Steam, DLC, Patterns, and more", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a2ce798ff66f.json"},
+        "c4f9f243259a": {"title": "Anybody need somebody to do the music for their game?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c4f9f243259a.json"},
+        "a380c3c885df": {"title": "Embergen - How to Render Skybox in Render All?", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a380c3c885df.json"},
+        "90f9e9faa8e3": {"title": "The industry is in a 'really horrible place,' say Brenda and John Romero", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/90f9e9faa8e3.json"},
+        "34a8cb34961d": {"title": "Owlcat Games is using generative AI to 'iterate faster' on The Expanse", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/34a8cb34961d.json"},
+        "ee36329e5716": {"title": "Unity sunsetting Ads Network and divesting publishing label Supersonic", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ee36329e5716.json"},
+        "9a91ca622787": {"title": "Sony confirms PS5 hardware is about to become even more expensive", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9a91ca622787.json"},
+        "7d6c31d698e9": {"title": "Nintendo cuts Switch 2 production, layoffs at Epic and PlayStation, and another Saudi acquisition - Patch Notes #45", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7d6c31d698e9.json"},
+        "be6789fc00bb": {"title": "Howler 2026.5 adds 3D landscape generator Fractal Garden", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/be6789fc00bb.json"},
+        "773c0bdf12a7": {"title": "AMD releases FSR SDK 2.2 with new AI denoiser Ray Regeneration", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/773c0bdf12a7.json"},
+        "b623dde58c59": {"title": "PITVYPR Dev BLog #10: Level Generation Part 3: Simple Encounters, Prefabs, and Generalization", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b623dde58c59.json"},
+        "b836a4bd1a3f": {"title": "Niagara粒子系统 ribbon trail in local space", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b836a4bd1a3f.json"},
+        "add338988c82": {"title": "3d Humanoid Building and Animation", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/add338988c82.json"},
+        "56df9eb2c218": {"title": "DEMoCap 1.7 and Drag[en]gine 1.31 发布d", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/56df9eb2c218.json"},
+        "b61b1f47690b": {"title": "Game Dev is Easy: 3D Modelling", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b61b1f47690b.json"},
+        "7ac4c6c4ef96": {"title": "Reply to feedback reply...", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7ac4c6c4ef96.json"},
+        "d903d75a51a9": {"title": "Free tool VDBRender adds native OpenVDB rendering to Nuke", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 30 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d903d75a51a9.json"},
+        "0eaa62a297ae": {"title": "Get neat lightweight 3D sculpting and painting app Tamga", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 30 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0eaa62a297ae.json"},
+        "285ff16fe983": {"title": "How to achieve soft particle blending in Unity?", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Mon, 30 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/285ff16fe983.json"},
+        "8a36aec40623": {"title": "PUBG Blindspot shuts down after 2 months in early access", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 30 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8a36aec40623.json"},
+        "56244e590671": {"title": "Report: Series Entertainment-owned mobile studio Pixelberry lays off staff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 30 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/56244e590671.json"},
+        "fd947bcc53ca": {"title": "Free-to-play spinoff The Elder Scrolls: Blades is being shut down", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 30 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fd947bcc53ca.json"},
+        "d6771c37d59a": {"title": "Wanderstop developer Ivy Road is shutting down", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 30 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d6771c37d59a.json"},
+        "11125de95aeb": {"title": "MetaHuman DNA add-on for Blender gets new RBF Editor", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/11125de95aeb.json"},
+        "8ec32a3db310": {"title": "Root Motion isn't working in Animation Montages", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8ec32a3db310.json"},
+        "a458cd064222": {"title": "Pro-Level Unreal VFX Portfolio Logic (Free Coupons Sold Out)ㅜㅜ", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a458cd064222.json"},
+        "39899a519d5c": {"title": "[HIRING] 虚幻引擎5 VFX \\Tech artist — OddMeter", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/39899a519d5c.json"},
+        "41a7565876fc": {"title": "What happens when story serves art direction in Absolum - Narrative Notebook #2", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/41a7565876fc.json"},
+        "60d499029906": {"title": "An Emmy-winning animation studio just bought the rights to multiple Roblox titles", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/60d499029906.json"},
+        "eb81e191083a": {"title": "Moss developer Polyarc is laying off staff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/eb81e191083a.json"},
+        "c2177a207c7c": {"title": "Rec Room shutting down after failing to become 'sustainably profitable'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c2177a207c7c.json"},
+        "4c212446594f": {"title": "Embracer Group has laid off 124 employees at Eidos Montreal", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4c212446594f.json"},
+        "739ea28e1941": {"title": "Tearing Meat Effect", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 01 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/739ea28e1941.json"},
+        "ef271d5ee755": {"title": "April VFX Sketch[#]: Silly", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Sat, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ef271d5ee755.json"},
+        "22b528e5e987": {"title": "Try new 3D texture painting app Wafer free in beta for Windows", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Wed, 01 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/22b528e5e987.json"},
+        "48592629299a": {"title": "Adobe releases Photoshop 27.5", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Wed, 01 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/48592629299a.json"},
+        "bc231efe4610": {"title": "Boris FX acquires Vegas Pro, Sound Forge and Acid Pro", "category": "render", "tags": ["实时渲染", "图形学算法", "光线追踪", "PBR材质"], "date": "Wed, 01 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bc231efe4610.json"},
+        "673fca4d5356": {"title": "Shift Up has acquired Resident Evil creator Shinji Mikami's new studio", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Wed, 01 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/673fca4d5356.json"},
+        "3186a99145e2": {"title": "Small Waterfall (Looking for Feedback)", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 01 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3186a99145e2.json"},
+        "1b2daa7ca8f6": {"title": "Krafton, Flyquest, Arbitrum invest $3.5M in Psychedelic Games' MOBA Golden Tides", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 01 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1b2daa7ca8f6.json"},
+        "6d386e9ef7a6": {"title": "French consumer group sues Ubisoft over shutdown of The Crew", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 01 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6d386e9ef7a6.json"},
+        "a7f10117c27d": {"title": "'More time innovating; less time writing code:' Arc Raiders publisher Nexon believes AI will liberate its workforce", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 01 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a7f10117c27d.json"},
+        "fcaef14b4aed": {"title": "Call of Duty: Black Ops 7 appears to earn an estimated $30 thousand on Steam per negative review", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Wed, 01 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fcaef14b4aed.json"},
+        "2d09156a02fc": {"title": "In-Game VFX Reference Website", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2d09156a02fc.json"},
+        "df208fce1227": {"title": "Would anyone like to work on a rec room like game?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/df208fce1227.json"},
+        "223cb7b21f65": {"title": "Dragon Attack, Houdini and Niagara粒子系统 Forever", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/223cb7b21f65.json"},
+        "36d003957d00": {"title": "Fire spread decal combine to one", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/36d003957d00.json"},
+        "5688a3ed136c": {"title": "Stormgate rushing offline mode after losing server access to an AI company", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5688a3ed136c.json"},
+        "8c1daddc0da0": {"title": "Nexon agrees to publish Overwatch in Korea", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8c1daddc0da0.json"},
+        "516987955143": {"title": "The Last of Us Online was around '80%' complete when Naughty Dog canceled it", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/516987955143.json"},
+        "f5ea98d8a82f": {"title": "On the ground at GDC: how are devs responding to industry calamity?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f5ea98d8a82f.json"},
+        "2730439bc1e8": {"title": "Goat Simulator maker Coffee Stain shutters Malmo studio", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2730439bc1e8.json"},
+        "9fbd8e17bc27": {"title": "Rokoko Create generates full-body animations for free", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9fbd8e17bc27.json"},
+        "c6a870b49b40": {"title": "New artist video hosting platform FrameRate aims to take on Vimeo", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c6a870b49b40.json"},
+        "90e902e1d49f": {"title": "Beeble launches AI roto service Background Remover", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/90e902e1d49f.json"},
+        "74c7f965e5ac": {"title": "Unigine 2.21 is out", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/74c7f965e5ac.json"},
+        "9037eeac21c2": {"title": "Does it matter how I make my game if I'm more comfortable doing it a certain way?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9037eeac21c2.json"},
+        "fdc09b5e656e": {"title": "Embracer layoffs, Nintendo's patent problem, and is Baby Steps an Uncharted sequel? - Patch Notes #46", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Fri, 03 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fdc09b5e656e.json"},
+        "7c214875bfbc": {"title": "Game Dev Digest Issue #325 - UI, Worflows, Patterns and more", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7c214875bfbc.json"},
+        "14146c09da65": {"title": "Trigonix - New Mobile Puzzle Game!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/14146c09da65.json"},
+        "8448a9e94446": {"title": "MechWarrior dev Piranha Games lays off 30% of staff, says CEO", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8448a9e94446.json"},
+        "63a7af9bce31": {"title": "Laptop mishaps and a GDC chat with Owlchemy Labs CEO Andrew Eiche", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/63a7af9bce31.json"},
+        "8877a14746dc": {"title": "Report: Take-Two lays off the head of AI and multiple team members", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8877a14746dc.json"},
+        "4f1b7bb79a47": {"title": "Valeriia: Sketch #", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染", "Niagara"], "date": "Fri, 03 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4f1b7bb79a47.json"},
+        "ec8f1a903185": {"title": "Paladin Tactics: Combat VFX & Skill System — 虚幻引擎5 Breakdown", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sat, 04 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ec8f1a903185.json"},
+        "9041e9a9c9de": {"title": "Cornucopia Raw Dev Log #1: GPU Instancing, or How 2,583 Plants Became 3 Draw Calls", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 05 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9041e9a9c9de.json"},
+        "d9eba292e0e6": {"title": "Looking for work - remote (anywhere) or Studio in Canada", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sun, 05 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d9eba292e0e6.json"},
+        "685836e688a5": {"title": "Almost funded but not quite, designing and some interactive fiction │ Falterstone prototype #7", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 05 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/685836e688a5.json"},
+        "c9da3d6d9526": {"title": "教程: Introduction to Technical Animation for Games", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 06 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c9da3d6d9526.json"},
+        "c4062b70c152": {"title": "Free tool: Open Light generates procedural HDR light textures", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c4062b70c152.json"},
+        "9459a60514dd": {"title": "I want your people guidance how can I make my project better:", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9459a60514dd.json"},
+        "b132fd606de1": {"title": "A 6-Concept Roadmap to Semi-Realism: Showcased by Student Work", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 06 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b132fd606de1.json"},
+        "62620fcd3725": {"title": "IlluGen in a Live AAA Pipeline — Textures, Meshes & Niagara粒子系统 Systems in One Workflow", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 06 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/62620fcd3725.json"},
+        "139940c1cde6": {"title": "Former Halo Studios art director, other employees, accuse studio of harassment and retaliation", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/139940c1cde6.json"},
+        "4464989213ca": {"title": "How can your game win the 'attention war?' Turn to storytelling", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4464989213ca.json"},
+        "0b644bd0c0be": {"title": "Obituary: Double Dragon creator Yoshihisa Kishimoto has passed away at age 64", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Mon, 06 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0b644bd0c0be.json"},
+        "ccb45d8c24b1": {"title": "Get free Maya character rigging toolset mGear 5.3", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ccb45d8c24b1.json"},
+        "74cd9a4bf8f9": {"title": "Craftpix Indie Jam 2", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 03 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/74cd9a4bf8f9.json"},
+        "53ad3697d470": {"title": "What brought me back to game development?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/53ad3697d470.json"},
+        "8cbd2cdb5b4a": {"title": "I want your people guidance how can I make my project better:", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8cbd2cdb5b4a.json"},
+        "4145b8dba736": {"title": "How to Build a Paper Prototype for Your Game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 09 De", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4145b8dba736.json"},
+        "c71cd855d54e": {"title": "Are you interested in learning game design with a pro?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c71cd855d54e.json"},
+        "a6c7abe5e35f": {"title": "Orbs made in 虚幻引擎 with Materials and Niagara Particle System", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发", "Niagara粒子系统"], "date": "Tue, 07 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a6c7abe5e35f.json"},
+        "4e955e0589e9": {"title": "Retopoflow 4 now makes Blender auto-save in Edit Mode", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Tue, 07 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4e955e0589e9.json"},
+        "e74c4f24eb9b": {"title": "How to make this portal material on a plane?", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染", "Niagara"], "date": "Tue, 07 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e74c4f24eb9b.json"},
+        "51d0bd7b306a": {"title": "[LF Narrative Writer] Isle of Athena – Sandbox RPG survival game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/51d0bd7b306a.json"},
+        "5d5ebcf9a792": {"title": "Feedback for water emerging effect", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 07 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5d5ebcf9a792.json"},
+        "679c2ef59db7": {"title": "Scene depth, lit opaque. Ocean help", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 07 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/679c2ef59db7.json"},
+        "9baedbd4bfa5": {"title": "Blizzard explains visual updates to Overwatch's Anran", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9baedbd4bfa5.json"},
+        "8372d8b7389c": {"title": "Sony to acquire machine learning company Cinemersive Labs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8372d8b7389c.json"},
+        "3807d0e1c42b": {"title": "People of Note's hook-y approach to designing a turn-based musical RPG", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3807d0e1c42b.json"},
+        "53ee4eef468f": {"title": "Time Manipulation in Unity 6", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/53ee4eef468f.json"},
+        "75e5344d4413": {"title": "Netflix launches 'Playground' video game app for children", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Wed, 08 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/75e5344d4413.json"},
+        "c7f978e60009": {"title": "From Panic to Relief: The Week I Thought My Crypto Was Gone Forever Mighty Hacker Recovery Helps. +13439473496 WhatsApp Canada. Lost Wallet Access / How to recover lost Bitcoin wallet", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c7f978e60009.json"},
+        "4e2db41b5414": {"title": "IlluGen → 虚幻引擎5 | Building Real-Time VFX Assets from Scratch", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 08 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4e2db41b5414.json"},
+        "cc0653bc1029": {"title": "Peak co-developer Landfall might finance your next indie game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cc0653bc1029.json"},
+        "ac95089f953b": {"title": "Finding inspiration and a bit of hope in CorgiSpace", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ac95089f953b.json"},
+        "3d3c721584b9": {"title": "Supercell CEO Ilkka Paananen to receive BAFTA Fellowship", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3d3c721584b9.json"},
+        "c4f8e7341c06": {"title": "Chaos discontinues its Phoenix fluid simulation software", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c4f8e7341c06.json"},
+        "6f438a5fe7fa": {"title": "GameCube Development Kit Hardware", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6f438a5fe7fa.json"},
+        "f83f368f51c1": {"title": "Looking for feedback on a browser-based narrative strategy simulation", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f83f368f51c1.json"},
+        "8470f1bc8d2e": {"title": "1000xResist creator: the game industry needs a universal video codec for FMV games", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8470f1bc8d2e.json"},
+        "7e9a6be39e53": {"title": "Split Fiction dev Hazelight Studios accrues 50M total sales", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7e9a6be39e53.json"},
+        "f8cdc9bab649": {"title": "Black Tabby Games slinks into game publishing with 1000xResist creator's next game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f8cdc9bab649.json"},
+        "486a0538eb65": {"title": "Konami's eFootball tops 1 billion downloads", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/486a0538eb65.json"},
+        "60c4be98a739": {"title": "Off The Grid developer Gunzilla accused of failing to pay employees", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/60c4be98a739.json"},
+        "3077c387ae21": {"title": "Nekki releases Cascadeur 2026.1", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 10 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3077c387ae21.json"},
+        "3c0fa2c8619d": {"title": "Autodesk acquires core tech of AI motion-capture firm Radical", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3c0fa2c8619d.json"},
+        "514d96dab09f": {"title": "Get 650+ free assets for building dungeons in Blender and 虚幻引擎5", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 09 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/514d96dab09f.json"},
+        "f6b23e8a267d": {"title": "It's been a while...", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 10 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f6b23e8a267d.json"},
+        "83d5cc373a86": {"title": "Steps to Make a Simple Game in Unity", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/83d5cc373a86.json"},
+        "adb871053f79": {"title": "Houdini plant-generation toolkit Natsura is now in early access", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Fri, 10 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/adb871053f79.json"},
+        "98c837cffd89": {"title": "Gunzilla called out, Netflix's surprise app store surge, and indie publishers rise up - Patch Notes #47", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Fri, 10 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/98c837cffd89.json"},
+        "0897c2fc7c75": {"title": "Game Dev Digest Issue #326 - UI Toolkit, C#, and more", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 10 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0897c2fc7c75.json"},
+        "a5863cbf9b42": {"title": "Looking for help for a 3d dinosaur game that's already begun production", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 10 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a5863cbf9b42.json"},
+        "2dc314ea0568": {"title": "Regulus: Sketch #", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Fri, 10 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2dc314ea0568.json"},
+        "1a6aa9513673": {"title": "Doki Doki Literature Club removed from Google Play over depiction of sensitive themes", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 10 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1a6aa9513673.json"},
+        "c6d9371a3e54": {"title": "Inhouse Audio System - BAudio", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 12 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c6d9371a3e54.json"},
+        "e091996285c9": {"title": "move sprite in unity with mouse", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 12 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e091996285c9.json"},
+        "38375394fd99": {"title": "Digital Extremes Warframe: The Old Peace Art Blast", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Mon, 30 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/38375394fd99.json"},
+        "df22b677d178": {"title": "Ubisoft Avatar: Frontiers of Pandora From the Ashes Art Blast", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 11 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/df22b677d178.json"},
+        "2f327f932c66": {"title": "Battlefield 6 Art Blast", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 24 Fe", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2f327f932c66.json"},
+        "c83fb0fbd17f": {"title": "AFEELA 1 Theme Design Challenge Presented by Sony Honda Mobility Winners Announcement", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Fri, 19 De", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c83fb0fbd17f.json"},
+        "04feebbe1833": {"title": "Manticore Games Out of Time Art Blast", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 18 De", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/04feebbe1833.json"},
+        "24ec495ace80": {"title": "Download 480+ free kitbash assets and materials with Cargo 3.0", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Sun, 12 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/24ec495ace80.json"},
+        "ed0a2f0705cc": {"title": "What are the Core Pilars for a good Portfolio?", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染", "Niagara"], "date": "Sun, 12 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ed0a2f0705cc.json"},
+        "c2d2799b79fe": {"title": "World Scale Matters", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 12 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c2d2799b79fe.json"},
+        "7f2b7836696f": {"title": "Event<T> type question", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 12 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7f2b7836696f.json"},
+        "ce3b577a720d": {"title": "Academy Software Foundation adopts OpenPGL", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ce3b577a720d.json"},
+        "fda3a818266a": {"title": "Latest GameDev.net Improvements", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 12 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fda3a818266a.json"},
+        "d9b5580b3410": {"title": "Roblox is introducing age-based accounts for children and teens", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d9b5580b3410.json"},
+        "cb3880f3a1ad": {"title": "Report: Epic hoping to reinvigorate Fortnite with Disney-themed extraction shooter", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cb3880f3a1ad.json"},
+        "2f433985d943": {"title": "My GameCube Game Development Studio Setup", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2f433985d943.json"},
+        "858e4d3081e2": {"title": "You can now use V-Ray free for commercial work in Blender", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Tue, 14 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/858e4d3081e2.json"},
+        "b9e11328755f": {"title": "UK government commits £28.5 million to supporting local game developers", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Tue, 14 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b9e11328755f.json"},
+        "f56e770bac4e": {"title": "New week, new question! Laser VFX - multiple lasers focussed on a single point", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 14 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f56e770bac4e.json"},
+        "f5c9ca4398c6": {"title": "Data and player sentiment highlight the value of authentic LGBTQ narratives", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f5c9ca4398c6.json"},
+        "f9bc958c3d24": {"title": "How Capcom's Pragmata blends puzzle-solving with sci-fi combat", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f9bc958c3d24.json"},
+        "65050f3beb7b": {"title": "Bloober CEO says relying on one title creates 'too much risk' in today's market", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/65050f3beb7b.json"},
+        "89ddb1d8bf9d": {"title": "Inkle co-founder explains how TR-49 broke even in three hours", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/89ddb1d8bf9d.json"},
+        "c97ee1555dc1": {"title": "Amazon is downscaling cloud video game service Luna", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c97ee1555dc1.json"},
+        "33d31202fd85": {"title": "Blackmagic Design releases DaVinci Resolve 21.0 in beta", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Tue, 14 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/33d31202fd85.json"},
+        "fa7f2cfcde25": {"title": "Adobe releases Substance 3D Designer 16.0", "category": "render", "tags": ["实时渲染", "图形学算法", "光线追踪", "PBR材质"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fa7f2cfcde25.json"},
+        "2622cbea1d04": {"title": "Maxon releases ZBrush 2026.2 and ZBrush for iPad 2026.2", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2622cbea1d04.json"},
+        "a33d287ada48": {"title": "Maxon releases motion graphics software Autograph for free", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a33d287ada48.json"},
+        "b05a7269c4c7": {"title": "Adobe releases After Effects 26.2", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b05a7269c4c7.json"},
+        "1c63b9435044": {"title": "Epic Games releases Twinmotion 2026.1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1c63b9435044.json"},
+        "164ac68ef885": {"title": "Deep Sea Claustrophobia goes free (a late postmortem?)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/164ac68ef885.json"},
+        "087b7f048776": {"title": "Short term with possibility for long term", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/087b7f048776.json"},
+        "1dbefdc2b15d": {"title": "RuneScape developer to expand its IP to the Asia-Pacific region", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1dbefdc2b15d.json"},
+        "0211c1428036": {"title": "Report: New Xbox chief says Game Pass 'has become too expensive'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0211c1428036.json"},
+        "424d5ec33cd3": {"title": "Video game lawyer implores devs to understand ownership and swerve generative AI", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/424d5ec33cd3.json"},
+        "25722c68681e": {"title": "ID@Xbox global director says Xbox Game Pass is a discovery multiplier", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/25722c68681e.json"},
+        "958bb565ea54": {"title": "See Reallusion’s 2026 roadmap: redefining 3D with hybrid AI", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 16 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/958bb565ea54.json"},
+        "438fedc5c840": {"title": "Ubisoft Halifax union members agree settlement after studio closure", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 16 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/438fedc5c840.json"},
+        "2e60d02042f5": {"title": "Maxon ships Cinema 4D 2026.2, unveils Cinema 4D for iPad beta", "category": "render", "tags": ["实时渲染", "图形学算法", "光线追踪", "PBR材质"], "date": "Thu, 16 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2e60d02042f5.json"},
+        "3459c3b8c668": {"title": "[HIRING] Senior VFX Artist - Unknown Worlds (Subnautica 2)", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染", "Niagara"], "date": "Thu, 16 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3459c3b8c668.json"},
+        "9acb454e96ea": {"title": "Number wordimnotallowedtosay", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 16 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9acb454e96ea.json"},
+        "0f66cabbcb10": {"title": "How to use the unity Timeline", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 16 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0f66cabbcb10.json"},
+        "1cc8b07458a2": {"title": "Optimization of Materials for Particles in Niagara粒子系统", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 16 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1cc8b07458a2.json"},
+        "c8f0e2525111": {"title": "Ludum Dare will officially end in October 2028", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 16 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c8f0e2525111.json"},
+        "ed1ebc72fe10": {"title": "US representative Maxwell Frost protests Saudi buyout of EA", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ed1ebc72fe10.json"},
+        "a27e3226ff4a": {"title": "PBJayz- Portfolio Work - Fairy Wind Blast", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染", "Niagara"], "date": "Thu, 16 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a27e3226ff4a.json"},
+        "dfe7a2e9b62e": {"title": "Canva makes motion graphics and animation app Cavalry free", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/dfe7a2e9b62e.json"},
+        "7e58715fa7c8": {"title": "what softwares would be better for my game?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7e58715fa7c8.json"},
+        "95241f9158a2": {"title": "Ubisoft union workers agree settlement, legal advice for game devs, and is Xbox Game Pass too expensive? - Patch Notes #48", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Fri, 17 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/95241f9158a2.json"},
+        "58639ec11d9a": {"title": "IMS Creators always keeps you updated", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/58639ec11d9a.json"},
+        "b670cdcdef9e": {"title": "Iron Galaxy Studios lays off 'a number' of workers as it reduces company size", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b670cdcdef9e.json"},
+        "a1edb6692904": {"title": "Supporting juniors and sharpening your creativity", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a1edb6692904.json"},
+        "15cd22cf3a71": {"title": "Panic won't release Playdate titles that use certain forms of generative AI", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/15cd22cf3a71.json"},
+        "d8729892e5ed": {"title": "What Egosoft's three decades of making space sims tells us about serving 'niche' audiences", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d8729892e5ed.json"},
+        "9b1f0fe6333d": {"title": "Plasticity 2026.1 is out", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Fri, 17 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9b1f0fe6333d.json"},
+        "b48f06c5e9da": {"title": "Charge! multiplayer FPS retrospective", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 18 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b48f06c5e9da.json"},
+        "a69322b1099e": {"title": "[发布] Musa Tactics: Combat VFX & Skill System 虚幻引擎5 Breakdown", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sat, 18 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a69322b1099e.json"},
+        "5c90301e650b": {"title": "Gamedeveloper: job stable enough? Small prototypes or bigger games?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 18 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5c90301e650b.json"},
+        "08b45fb84858": {"title": "Music Producer looking to collaborate with small/indie team.", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 19 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/08b45fb84858.json"},
+        "e80798d589fb": {"title": "Blizzard Entertainment World of Warcraft: Midnight", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 14 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e80798d589fb.json"},
+        "6f908cd743dc": {"title": "Staged Pipelines and what people think of them", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 20 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6f908cd743dc.json"},
+        "1d3ef4235a16": {"title": "Niagra Ribbons Mess", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Mon, 20 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1d3ef4235a16.json"},
+        "ddef948b82c0": {"title": "Sneak peek: NeXus for Blender", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Mon, 20 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ddef948b82c0.json"},
+        "5780e2708d13": {"title": "CLO Virtual Fashion releases Marvelous Designer 2026.0", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Mon, 20 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5780e2708d13.json"},
+        "8c612bb70ad6": {"title": "'I was ignored:' BAFTA criticised after pulling indie game trailer from awards ceremony", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Mon, 20 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8c612bb70ad6.json"},
+        "76e099f77d93": {"title": "In 虚幻引擎5, How can I make a similar effect to the Pikmin 3's \"Juice filling bottle\"?", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 20 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/76e099f77d93.json"},
+        "9bda22f92bc2": {"title": "Pragmata has topped 1 million sales in two days", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 20 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9bda22f92bc2.json"},
+        "1a369629c8cd": {"title": "Maxon releases Redshift 2026.5", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1a369629c8cd.json"},
+        "b7d1732d39d5": {"title": "Maxon releases Red Giant 2026.4", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b7d1732d39d5.json"},
+        "e4f045ee0e64": {"title": "教程: Animating a Dragon Rider for Film & VFX", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 20 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e4f045ee0e64.json"},
+        "5d72f5d0d5b3": {"title": "game for collaboration", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5d72f5d0d5b3.json"},
+        "5ad825087cb8": {"title": "这是一个想法，法阵的溶解出现", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 21 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5ad825087cb8.json"},
+        "d4d6fb3a0154": {"title": "Sony rolls out age verification for PlayStation users in the UK and Ireland", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统", "工具开发"], "date": "Tue, 21 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d4d6fb3a0154.json"},
+        "33ae5d449ef6": {"title": "Autodesk releases Flame 2027", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/33ae5d449ef6.json"},
+        "54f4333fa35c": {"title": "How Double Fine balances fun with pottery sculpting in Kiln", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/54f4333fa35c.json"},
+        "47c58c1e0a68": {"title": "Windrose surpasses 1M sales within a week", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/47c58c1e0a68.json"},
+        "f9c1155fdc7f": {"title": "Xbox is slashing the price of Game Pass", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f9c1155fdc7f.json"},
+        "a8c095d07792": {"title": "Sanrio launches self-publishing label Sanrio Games", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a8c095d07792.json"},
+        "11dbcbdd2a8c": {"title": "Union workers take legal action against Build A Rocket Boy over alleged privacy violations", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/11dbcbdd2a8c.json"},
+        "0a34dbebcff9": {"title": "Does it matter how I make my game if I'm more comfortable doing it a certain way?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0a34dbebcff9.json"},
+        "cceb2179d116": {"title": "Master Material VFX *FREE USE* UNITY", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 22 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cceb2179d116.json"},
+        "6c11749b8d10": {"title": "TAA issue with dithering (masked materials) in 虚幻引擎5", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 22 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6c11749b8d10.json"},
+        "ae17c0defedd": {"title": "Nintendo is being sued by customers seeking tariff refunds", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ae17c0defedd.json"},
+        "1b44c2202040": {"title": "Dead by Daylight studio Behaviour Interactive confirms layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1b44c2202040.json"},
+        "8bc59bb2bb93": {"title": "Report: Ubisoft cancels social-sim game Alterra", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8bc59bb2bb93.json"},
+        "2fb218dabfef": {"title": "'A scope document is not your plan:' Laying the groundwork for indie success", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2fb218dabfef.json"},
+        "8ebd7dac800a": {"title": "3D texture painting app Wafer is now available for Windows", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8ebd7dac800a.json"},
+        "78b8c747b873": {"title": "Open-source material authoring software Material Maker 1.6 is out", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/78b8c747b873.json"},
+        "d160ec6ee586": {"title": "Houdini GPU liquid solver Paradigm 1.0 is now available", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d160ec6ee586.json"},
+        "5f79642d21ab": {"title": "Chaos reinstates support for AMD GPUs in V-Ray", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5f79642d21ab.json"},
+        "585b40cba268": {"title": "Chaos releases V-Ray 7 更新 3 for 3ds Max", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/585b40cba268.json"},
+        "84b8e0145e77": {"title": "Canada federal government concerned about children's safety in Roblox", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/84b8e0145e77.json"},
+        "2f0a3855c2c1": {"title": "The Super Mario Galaxy Movie earns $747M at global box office", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2f0a3855c2c1.json"},
+        "c54cfc485291": {"title": "Newly-launched Ivors Composers Awards will honor video game composers", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c54cfc485291.json"},
+        "127d545be644": {"title": "'It's going to be extremely hard to repair the relationship:' The Subnautica 2 legal dispute is far from over", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/127d545be644.json"},
+        "fc24e98ba67f": {"title": "Otoy releases OctaneRender 2026.3", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fc24e98ba67f.json"},
+        "1039a47b1b9b": {"title": "Fired Unknown Worlds execs withdraw claim that Krafton violated court order by announcing Subnautica 2 release date", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1039a47b1b9b.json"},
+        "4f10ef0c3844": {"title": "#4. Inside Game Audio: How Nikola Nikita Jeremić Builds Interactive Music Systems (Part 2)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4f10ef0c3844.json"},
+        "84266d953473": {"title": "Mid-level Level Designer looking for PORTFOLIO feedback", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/84266d953473.json"},
+        "a1ea29cfa3f1": {"title": "Clair Obscur: Expedition 33 has topped 8 million sales worldwide", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a1ea29cfa3f1.json"},
+        "75f87b98c214": {"title": "Inside Housemarque's improved narrative process for Saros", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/75f87b98c214.json"},
+        "26a982d11c64": {"title": "Xbox will reevaluate exclusivity and target daily active players under new leadership", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/26a982d11c64.json"},
+        "2b14480d4e3d": {"title": "Atari acquires emulation studio Implicit Conversions", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2b14480d4e3d.json"},
+        "e5fe3302e2b8": {"title": "Build A Rocket Boy facing legal action, Behaviour Interactive cuts jobs, and Xbox has a new 'north star' - Patch Notes #49", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e5fe3302e2b8.json"},
+        "a15e8623c9a5": {"title": "Free tutorial: Race Vehicle Concept Design – Cinematic Rendering", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 25 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a15e8623c9a5.json"},
+        "79bdf2e682db": {"title": "Gamedev is Easy: Teaming Up", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 26 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/79bdf2e682db.json"},
+        "55a7864b7300": {"title": "Sketchbook releases Sketchbook Pro 9.4", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/55a7864b7300.json"},
+        "e199c648c5f2": {"title": "Canva releases Affinity 3.2", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e199c648c5f2.json"},
+        "236ed65f6037": {"title": "Video Playback System Middleware", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/236ed65f6037.json"},
+        "842ff3a7331c": {"title": "Does anyone have any idea about animation on triangle polys?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/842ff3a7331c.json"},
+        "aa0f3c2eca72": {"title": "DNE and Gracia release 4-minute streamable 4DGS performance", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/aa0f3c2eca72.json"},
+        "faa3ac9cd359": {"title": "Best resources to learn about explosion timing?", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/faa3ac9cd359.json"},
+        "414df0aad507": {"title": "Stefano Falubba - 3 years of stylized VFX", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/414df0aad507.json"},
+        "5485ada56d24": {"title": "'Millimeters matter:' Making the Steam Controller 'just work' on day one", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5485ada56d24.json"},
+        "72a2ffb46fdb": {"title": "Magic: The Gathering Arena devs are unionizing to deliver genAI and layoff protections", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/72a2ffb46fdb.json"},
+        "139e6309b1ed": {"title": "Xbox boss: Memory crisis could impact next-gen hardware availability and pricing", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/139e6309b1ed.json"},
+        "abd4f2952048": {"title": "People Can Fly acquires Cooldown Games to establish dedicated publishing vertical", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/abd4f2952048.json"},
+        "cca9afa686ae": {"title": "The Steam Controller will retail for $99", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cca9afa686ae.json"},
+        "89994c106d16": {"title": "New to GameDev.net: Teams, Studios, School, and Your Profile", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/89994c106d16.json"},
+        "9a100ce46529": {"title": "Looking for a library that can do DirectX texture compression...", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9a100ce46529.json"},
+        "f300f9f65f78": {"title": "Adobe releases Photoshop 27.6", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f300f9f65f78.json"},
+        "8ffdfec62a27": {"title": "World Creator 2026.4 is out with a new free Community Edition", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8ffdfec62a27.json"},
+        "4acbb3539235": {"title": "Reallusion releases Headshot 3.0", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4acbb3539235.json"},
+        "50c6f88dd2b3": {"title": "Are there commonly acknowledged guidelines on samplerates, bitdepth, file types and tracklengths for game audio?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/50c6f88dd2b3.json"},
+        "b89b1b54716a": {"title": "'We've been a little bit too romantic:' Ustwo CEO says lowering development costs is now paramount", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b89b1b54716a.json"},
+        "e1dadafa91c9": {"title": "Sony to increase PlayStation hardware prices in Southeast Asia", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e1dadafa91c9.json"},
+        "bc8b9cd7784c": {"title": "GitHub Copilot is pivoting to usage-based billing after becoming unsustainable", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bc8b9cd7784c.json"},
+        "8a5cf8cae935": {"title": "[Remote job] VFX for stylized PC Game on 虚幻引擎", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 29 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8a5cf8cae935.json"},
+        "e29857182b5f": {"title": "Digital Bros buys the rights to Wuchang: Fallen Feathers for €4 million", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e29857182b5f.json"},
+        "a6a70ef83c09": {"title": "The secret to Overwatch's revitalization? Over-communicating.", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a6a70ef83c09.json"},
+        "592ec719abdf": {"title": "Landfall and Aggro Crab team up for Make-a-Wish game bundle", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/592ec719abdf.json"},
+        "f49e0ca855ee": {"title": "Starbreeze to develop a second Payday experience in Roblox", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f49e0ca855ee.json"},
+        "b352e8b8db01": {"title": "KeenTools releases GeoTracker for Houdini in free open beta", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b352e8b8db01.json"},
+        "1915b538a39a": {"title": "AI developer Anthropic becomes Blender’s latest Corporate Patron", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1915b538a39a.json"},
+        "c71a00ee74bf": {"title": "A Moron's Journey | Learning C, Why?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c71a00ee74bf.json"},
+        "9d0f28bc3378": {"title": "sprite jump", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9d0f28bc3378.json"},
+        "504b4bdc3927": {"title": "Xbox delivers record monthly active users, but hardware revenue is still in decline", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/504b4bdc3927.json"},
+        "3abe42abd693": {"title": "Looking for Developer Collaborator --- Timeline Dominion, an Alternate-History Strategy Simulator", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3abe42abd693.json"},
+        "775da6f983d9": {"title": "Elias : Sketch #", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/775da6f983d9.json"},
+        "98b158c0cb74": {"title": "Enduring advice for all game producers: Unlocking the Vault 2.0", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/98b158c0cb74.json"},
+        "2708a147f623": {"title": "GameMaker incorporates Claude Code to enable AI-assisted workflows", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2708a147f623.json"},
+        "27c11b5c312a": {"title": "Sony clarifies confusion around DRM game licenses on PlayStation", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/27c11b5c312a.json"},
+        "ef4ea1005c58": {"title": "'The company as a whole no longer exists:' GreedFall developer Spiders confirms closure", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ef4ea1005c58.json"},
+        "05366523d280": {"title": "Ashimoz : Sketch #", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/05366523d280.json"},
+        "d753d5950dc9": {"title": "Community Sketch Voting - Sketch #: Silly", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d753d5950dc9.json"},
+        "e011b55054dc": {"title": "Rebellion's Atomfall is being turned into a TV series", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ap", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e011b55054dc.json"},
+        "cf7ece82e7ad": {"title": "Devlog #1: Planning \"Underground\" (Andrax Studio)", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 01 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cf7ece82e7ad.json"},
+        "086236af97f1": {"title": "We tested the Steam Controller", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 01 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/086236af97f1.json"},
+        "85617a92f45d": {"title": "Report: VR specialist Survios has laid off the majority of its development team", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 01 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/85617a92f45d.json"},
+        "d442ba7f4c0b": {"title": "GameMaker says AI coding is inevitable, Sony clarifies DRM confusion, and how video games are helping Rikers inmates - Patch Notes #50", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 01 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d442ba7f4c0b.json"},
+        "1da66325ce7d": {"title": "Looking for volunteers. (Developers and 3D artists)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 01 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1da66325ce7d.json"},
+        "3770fa671b29": {"title": "Just how integral is a long character development to fantasy RPG?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 02 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3770fa671b29.json"},
+        "9a86817808f3": {"title": "[Tool] CopyPxl — Turn any image into a BMFont sheet (Unity, Godot, Phaser ready) — Week 2 update", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 03 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9a86817808f3.json"},
+        "ffb5108120d5": {"title": "Test the roblox game!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 03 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ffb5108120d5.json"},
+        "b507077ed131": {"title": "VFX Artist on UnrealEngine", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sun, 03 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b507077ed131.json"},
+        "608e0d73bae3": {"title": "Season 4", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 04 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/608e0d73bae3.json"},
+        "269d1cc4b0c3": {"title": "LightWave Digital unveils LightWave 2026", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 04 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/269d1cc4b0c3.json"},
+        "2779439f9762": {"title": "Material authoring software InstaMAT gets native Linux edition", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 04 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2779439f9762.json"},
+        "77551b4ed0ec": {"title": "Anthropic’s patronage of Blender downgraded to one-off donation", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 04 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/77551b4ed0ec.json"},
+        "dd65b011f3fd": {"title": "Get Unity modeling, texturing and rigging tool UModeler X free", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 03 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/dd65b011f3fd.json"},
+        "bb0acfca9534": {"title": "ArcBrush is a free node-based image editor and texture editor", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 01 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bb0acfca9534.json"},
+        "e940d6247002": {"title": "I built a Gaming DNA platform for players and game industry professionals — looking for feedback", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 04 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e940d6247002.json"},
+        "692af832e0c4": {"title": "Meet the indie studios funding other indie studios", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 04 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/692af832e0c4.json"},
+        "951b6b571533": {"title": "Unreality Layers", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 05 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/951b6b571533.json"},
+        "21842bad863f": {"title": "My 2D Isometric RPG Project", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 05 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/21842bad863f.json"},
+        "12044b3a0c08": {"title": "Vfx Assets for Unreal engine", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 05 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/12044b3a0c08.json"},
+        "97a7ce6fb079": {"title": "Valve to restock Steam Controller after it sells out in a day", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 05 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/97a7ce6fb079.json"},
+        "132c1e934ac1": {"title": "New Remedy CEO wants to preserve small budgets and break into Asia", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 05 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/132c1e934ac1.json"},
+        "a83e2eae7597": {"title": "Metacore restructuring to the tune of 'up to 160' redundancies", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 05 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a83e2eae7597.json"},
+        "1b52eccb3b6d": {"title": "Kinforge dev Seeker Entertainment is furloughing staff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 05 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1b52eccb3b6d.json"},
+        "c6f4f64d16bd": {"title": "GameStop tables $55.5 billion takeover bid for eBay", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 05 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c6f4f64d16bd.json"},
+        "336992a7b72b": {"title": "Seeking critical feedback of a tool idea for 2d sprite lighting. (not promoting)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 05 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/336992a7b72b.json"},
+        "7b746d05874a": {"title": "Remote - VFX Freelance 虚幻引擎5 - PC Game", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 06 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7b746d05874a.json"},
+        "7ee7fcd7caee": {"title": "Xbox appoints new internal leaders and ditches Copilot AI", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 06 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7ee7fcd7caee.json"},
+        "130e697ae135": {"title": "Autodesk launches free online kitbashing tool Project Falcon", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 06 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/130e697ae135.json"},
+        "7f25ed57943f": {"title": "Character Control Rig generates rigs for MetaHumans in Blender", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 06 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7f25ed57943f.json"},
+        "bf43fd9d06f7": {"title": "Sneak peek: NeXus for Blender", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 05 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bf43fd9d06f7.json"},
+        "795bc6c9cbc3": {"title": "Tried to make my AI smarter… and it somehow became dumber 😂", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 06 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/795bc6c9cbc3.json"},
+        "80d18c2233b3": {"title": "EA boasts record year thanks to Battlefield 6 and EA Sports FC", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 06 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/80d18c2233b3.json"},
+        "f3e639f77986": {"title": "Former LucasArts, Ubisoft veteran Clint Hocking founds new studio", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 06 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f3e639f77986.json"},
+        "bfbc29f07fc5": {"title": "EVE Online studio CCP Games turns independent and rebrands as Fenris Creations", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 06 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bfbc29f07fc5.json"},
+        "34126d6fb50e": {"title": "CWA Canada president says Saudi buyout of EA should trigger 'virtually every alarm bell'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 06 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/34126d6fb50e.json"},
+        "0f97cc1938a4": {"title": "Griffin Gaming Partners launches $100M fund to support indie developers", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 07 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0f97cc1938a4.json"},
+        "f77d65f0fbee": {"title": "Gearbox Studio Quebec founders start new studio", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 07 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f77d65f0fbee.json"},
+        "5b40ab438492": {"title": "Cozygon's VFX Journey", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 07 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5b40ab438492.json"},
+        "c068de97b9e2": {"title": "Mobile dev Mindtail raises $2 million to build 'AI-powered' games", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 07 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c068de97b9e2.json"},
+        "fe23884a622d": {"title": "'Not-for-profit' biz models can make for better showcases, say Triple-i Initiative organizers", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 07 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fe23884a622d.json"},
+        "9c72b81b1b03": {"title": "Capcom's Pragmata tops 2M sales within first month", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 07 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9c72b81b1b03.json"},
+        "0c850ee6fc17": {"title": "Atari acquires the rights to five Wizardry titles", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 07 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0c850ee6fc17.json"},
+        "de33065d7a68": {"title": "Royal Render at 25: the industry’s artist-first render manager", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/de33065d7a68.json"},
+        "eb99ab75e865": {"title": "Motion design tool Autograph is now free to studios", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 07 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/eb99ab75e865.json"},
+        "577fcc289063": {"title": "Maxon adds hex tiling for textures to Redshift 2026.6", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 07 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/577fcc289063.json"},
+        "825542415f78": {"title": "MARINE2D – Survival/action with a reworked tutorial, less lag, and a ton of tweaks (Patch 1.02 Beta)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/825542415f78.json"},
+        "600c76a56178": {"title": "CRM64Pro GDK v0.17.0 Major GUI update", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/600c76a56178.json"},
+        "e1a918ef27c9": {"title": "Simon and Friends - Oldshool destructible terrain artillery shooter with modern mechanics", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e1a918ef27c9.json"},
+        "d4ab932a74d6": {"title": "Seeking feedback and critiques on Lux VFX", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d4ab932a74d6.json"},
+        "56d841abb562": {"title": "Etheral AOE Stun - Looking for feedback to help polish further", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/56d841abb562.json"},
+        "a887ddb1fe08": {"title": "Sketch #: Winners and Badges!", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a887ddb1fe08.json"},
+        "0568b07c3758": {"title": "PlayStation sees AI as a 'powerful tool,' teams including Naughty Dog, San Diego Studio already using it", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0568b07c3758.json"},
+        "109d0f589abe": {"title": "PlayStation 5 hardware sales down amid price hikes and memory shortage", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/109d0f589abe.json"},
+        "dcc5893a840a": {"title": "2K makes layoffs at Project Ethos developer 31st Union", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/dcc5893a840a.json"},
+        "73a7a2cfe610": {"title": "Switch 2 outpacing original Switch after nearing 20 million sales", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/73a7a2cfe610.json"},
+        "044527902093": {"title": "GameStop wants eBay, Nintendo confirms Switch 2 price hike, and union boss says EA buyout is a national security risk - Patch Notes #51", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 08 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/044527902093.json"},
+        "9f1fb2b707d0": {"title": "教程: Claymation in ZBrush", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 09 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9f1fb2b707d0.json"},
+        "ceaea89f2bf8": {"title": "How to use a well defined array as function parameter in C?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 09 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ceaea89f2bf8.json"},
+        "00a3ea76980a": {"title": "发布 of Shield / Paladin / Mage Series on 虚幻引擎 Fab", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sat, 09 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/00a3ea76980a.json"},
+        "c5fe3373d867": {"title": "Niagara粒子系统 Spline Particle", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sat, 09 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c5fe3373d867.json"},
+        "5f7c47a20997": {"title": "From Ideas Guy To Wanting To Be a Designer, Forced to Be a Programmer", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 10 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5f7c47a20997.json"},
+        "5d42e28ed654": {"title": "Why did no one tell me about how useful the is into making games?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 11 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5d42e28ed654.json"},
+        "9c29982a2910": {"title": "New on ArtStation: Showcasing Pro Artists, New Reactions & Message Request System", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 06 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9c29982a2910.json"},
+        "3f983a73d8dd": {"title": "Drag[en]gine 1.32 发布d", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 11 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3f983a73d8dd.json"},
+        "80eef56ec01c": {"title": "Is it possible to hide a function in C? (extern a function declaration)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 11 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/80eef56ec01c.json"},
+        "7ebb72b262bc": {"title": "Alex Oxspring and The Stupendium found new studio Stupendium Softworks", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 11 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7ebb72b262bc.json"},
+        "fe24b08eaf16": {"title": "Double Fine petitions to unionize", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 11 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fe24b08eaf16.json"},
+        "9983a634c53d": {"title": "MeshCache Studio is a fast, flexible viewer for 3D mesh caches", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 11 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9983a634c53d.json"},
+        "44b75368f0f3": {"title": "New to VFX and I need some help!", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 12 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/44b75368f0f3.json"},
+        "6f445af7985a": {"title": "Wall Collision", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 12 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6f445af7985a.json"},
+        "929b5d88e256": {"title": "虚幻引擎5.6 stylized portal shader help — Ratchet & Clank inspired", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 12 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/929b5d88e256.json"},
+        "b88ffd957bc1": {"title": "Niagara粒子系统 writes to render target?", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 12 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b88ffd957bc1.json"},
+        "875c13b72168": {"title": "Niagara粒子系统 gas sim appears partially/completely black", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 12 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/875c13b72168.json"},
+        "d9e8a94943a9": {"title": "Metroid Dread developer MercurySteam conducts layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 12 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d9e8a94943a9.json"},
+        "bbbbceed9aee": {"title": "Sega is lowering the priority of games-as-a-service titles", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 12 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bbbbceed9aee.json"},
+        "68c1f51551e2": {"title": "Report: Microsoft Israel's general manager leaves amid alleged unethical use of Azure", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 12 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/68c1f51551e2.json"},
+        "a370e2d03948": {"title": "Video codecs are a nightmare for game developers, but there's no solution in sight", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 12 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a370e2d03948.json"},
+        "be7cce768b74": {"title": "Indika developer raises $5M in funding for next project", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 12 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/be7cce768b74.json"},
+        "095efb596f20": {"title": "How do I find a programmer to build  my tactical shooter design?", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 13 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/095efb596f20.json"},
+        "c1751645d7fc": {"title": "Time Games' opening lineup includes a fantasy prediction market game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 13 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c1751645d7fc.json"},
+        "fa3749fe9747": {"title": "Last Flag dev Night Street Games is laying off staff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 13 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fa3749fe9747.json"},
+        "60cb01b72e4a": {"title": "Buying a new PC", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 14 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/60cb01b72e4a.json"},
+        "6a841811173e": {"title": "Polygonflow releases free Dash asset manager for 虚幻引擎", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 14 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6a841811173e.json"},
+        "602db06d37e8": {"title": "Blackmagic Design releases Fusion Studio 21.0 in beta", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 14 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/602db06d37e8.json"},
+        "13a03519b4fa": {"title": "World Machine will support VDM-based terrain, not just heightmaps", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 13 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/13a03519b4fa.json"},
+        "282a1d040a9f": {"title": "music producer looking for project", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 14 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/282a1d040a9f.json"},
+        "ed14cab27df5": {"title": "Tekken veteran Katsuhiro Harada to lead new SNK subsidiary", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 14 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ed14cab27df5.json"},
+        "2c1312ac089f": {"title": "Report: WWE 2K26 dev Visual Concepts is laying off staff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 14 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2c1312ac089f.json"},
+        "dad9bba08386": {"title": "Report: Amazon cancels The Lord of the Rings MMO", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 14 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/dad9bba08386.json"},
+        "e413a60b6043": {"title": "Nintendo president: Switch 2 price increases due to war on Iran and AI-driven memory crisis", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 14 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e413a60b6043.json"},
+        "d4dd97df4146": {"title": "'Your proposal is neither credible nor attractive:' eBay rejects GameStop takeover bid", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 14 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d4dd97df4146.json"},
+        "05bb2dc793aa": {"title": "10 expert tips for building production-ready lighting macros", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 15 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/05bb2dc793aa.json"},
+        "1977f224ca98": {"title": "Boris FX releases Continuum 2026.5", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 15 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1977f224ca98.json"},
+        "5870397b16ea": {"title": "Game Dev Digest Issue #331 - AI Opinions, Grass System, How Tos, and more", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 15 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5870397b16ea.json"},
+        "f56cb21d827f": {"title": "Line-Plane Question", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 15 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f56cb21d827f.json"},
+        "f34be5972b59": {"title": "Smart VAT - Spawn VAT Assets with a Particle System and more!", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Fri, 15 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f34be5972b59.json"},
+        "ae5b46dbc162": {"title": "Stories from making Marvel Rivals", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 15 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ae5b46dbc162.json"},
+        "a45bfddf1859": {"title": "Subnautica 2 has surpassed 2 million sales in 12 hours", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 15 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a45bfddf1859.json"},
+        "f58619a3c020": {"title": "Politicians accuse Rockstar of obstructing legal process, eBay rebuffs GameStop, and video game hardware screams now - Patch Notes #52", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 15 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f58619a3c020.json"},
+        "1c960b9053a7": {"title": "教程: Creating a Sci-fi Dome Barrier in 虚幻引擎", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sat, 16 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1c960b9053a7.json"},
+        "7a06f01d39a2": {"title": "Learning OpenGL Part 1: Hello Window – Textures", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 16 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7a06f01d39a2.json"},
+        "1721e1a28185": {"title": "Terrain-mesh blending in Leadwerks 5.1", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 16 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1721e1a28185.json"},
+        "32da3f847790": {"title": "Learning OpenGl Part 2: Camera and Matrices", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 17 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/32da3f847790.json"},
+        "496ccedc5a54": {"title": "Bring It! Week Four", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 17 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/496ccedc5a54.json"},
+        "81f272a54c39": {"title": "Godot Engine  - Paintball Game Project Open Source Version", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 18 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/81f272a54c39.json"},
+        "962fa08d8f75": {"title": "Arc Raiders tops 16 million sales and could be heading to China", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 18 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/962fa08d8f75.json"},
+        "4d2890da966e": {"title": "The Nex Playground is launching in the UK and Ireland", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 18 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4d2890da966e.json"},
+        "6125a6cfa328": {"title": "See amazing demo videos of Wētā FX’s in-house simulation tools", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 18 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6125a6cfa328.json"},
+        "ea853bebd941": {"title": "World Machine 4059 ‘Dragontail Peak’ is out", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 18 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ea853bebd941.json"},
+        "01e042318056": {"title": "3D texture painting app Wafer has come to Windows and macOS", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 18 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/01e042318056.json"},
+        "2798105c38e7": {"title": "How AI Makes Game Development Easier", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 18 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2798105c38e7.json"},
+        "88e430b214cf": {"title": "Obituary: Veteran voice actor Tom Kane has passed away at 64", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 18 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/88e430b214cf.json"},
+        "67740fabbcac": {"title": "Made yet another game jam project, this time people downloaded it", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 19 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/67740fabbcac.json"},
+        "7df10360d754": {"title": "Great game idea, brand new coder.", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 19 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7df10360d754.json"},
+        "e133b53d53c6": {"title": "Sony increasing the price of PlayStation Plus for new customers", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 19 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e133b53d53c6.json"},
+        "c87ecbe26bc8": {"title": "Архетипы в именах. Почему герои — не случайные", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 19 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c87ecbe26bc8.json"},
+        "e62b981711af": {"title": "Flaming aura, heeeelp", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 19 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e62b981711af.json"},
+        "2962fd0f7726": {"title": "Fortnite returns to the App Store everywhere except Australia", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 19 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2962fd0f7726.json"},
+        "b6b42c51e727": {"title": "What happened when one game writer tried making a game in 30 days with Godot", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 19 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b6b42c51e727.json"},
+        "9d2b62092d8c": {"title": "CI Games and Epic Games terminate Lords of the Fallen II publishing deal", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 19 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9d2b62092d8c.json"},
+        "04b7c25a8005": {"title": "Celsys releases Clip Studio Paint 5", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 20 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/04b7c25a8005.json"},
+        "59609a58a652": {"title": "New motion graphics tool Caddis puts a node graph in every layer", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 19 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/59609a58a652.json"},
+        "ad25f769abbe": {"title": "Mocap Actor Looking for Projects", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 19 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ad25f769abbe.json"},
+        "34e661abbfca": {"title": "Former Housemarque game director launches new studio Cosmic Division", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 20 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/34e661abbfca.json"},
+        "9cd97c6d449e": {"title": "Embracer to spin off major video game franchises and studios", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 20 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9cd97c6d449e.json"},
+        "98f64a24d3c4": {"title": "'Our ambitions are as big as the Wii:' How the Nex Playground is targeting the global market", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 20 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/98f64a24d3c4.json"},
+        "350fde485c9a": {"title": "Sony is being sued for alleged tariff 'double recovery windfall'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 19 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/350fde485c9a.json"},
+        "7e9fb953f252": {"title": "Looking for help on my boat wake", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 20 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7e9fb953f252.json"},
+        "f1298ced42ad": {"title": "Ubisoft's net bookings are down 54% year-on-year", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 20 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f1298ced42ad.json"},
+        "c7342f537597": {"title": "Xbox adds Matthew Ball and Scott Van Vliet to leadership team", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 20 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c7342f537597.json"},
+        "f77d70fb7516": {"title": "Hasbro cancels Dungeons &amp; Dragons game led by Respawn veterans", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 20 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f77d70fb7516.json"},
+        "a7757997c7c1": {"title": "Embracer chairman says cost control 'does not get enough respect' after presiding over years of layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 20 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a7757997c7c1.json"},
+        "1a77d680b641": {"title": "UK publisher EdCorp breaks cover after signing Garbage Country", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 20 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1a77d680b641.json"},
+        "1b35f0782f97": {"title": "Adobe releases Photoshop 27.7", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 21 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1b35f0782f97.json"},
+        "385ee381c763": {"title": "Introduction to Integration Methods", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 21 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/385ee381c763.json"},
+        "f8c35de58ffb": {"title": "How I developed the artstyle for my main character", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 21 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f8c35de58ffb.json"},
+        "4898710df51c": {"title": "Potatuk - Sketchbook", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 21 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4898710df51c.json"},
+        "3d0eabd05c84": {"title": "Autodesk releases 3ds Max 2027.1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 21 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3d0eabd05c84.json"},
+        "b2c0ad9d327e": {"title": "Autodesk releases Maya 2027.1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 21 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b2c0ad9d327e.json"},
+        "e0c4a5434c4d": {"title": "I am making a souls game I can’t pay with anything but I can give u 100 credit for what you do but I need a 3d modeler and a coder", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 21 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e0c4a5434c4d.json"},
+        "feab244d9507": {"title": "Destiny 2's active development will end in June", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 21 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/feab244d9507.json"},
+        "ac30686843d7": {"title": "Splinter Cell designer says modern lighting has made stealth games harder to read", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 21 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ac30686843d7.json"},
+        "345e546c39f1": {"title": "Opinion: Lars Wingefors is out of his mind", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 21 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/345e546c39f1.json"},
+        "ab3f73246ebe": {"title": "LATAM indie devs lay out how to improve your text animation", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 21 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ab3f73246ebe.json"},
+        "52e6b80ca725": {"title": "Get 120+ free materials and assets from the new Mari Texture Library", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 22 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/52e6b80ca725.json"},
+        "76f74f9d3937": {"title": "Boris FX releases Sapphire 2026.5", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 22 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/76f74f9d3937.json"},
+        "4d7849e9c0ab": {"title": "Enjoy my content", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 22 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4d7849e9c0ab.json"},
+        "d1fcbb2e41b9": {"title": "Unity or Unreal for Remote Realtime VFX Jobs — Which Should I Focus on First?", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 22 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d1fcbb2e41b9.json"},
+        "8428a17a6207": {"title": "IMS Creators: Story twists without limits!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 22 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8428a17a6207.json"},
+        "58d83629bbdd": {"title": "Subnautica 2 hits four million sales", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 22 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/58d83629bbdd.json"},
+        "8b4e641a3bb4": {"title": "Take-Two expects to earn $8B in FY27 thanks to Grand Theft Auto VI", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 22 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8b4e641a3bb4.json"},
+        "e6ee866eda75": {"title": "Layoffs imminent at Bungie, former BioWare devs launch new studio, and GTA VI still on for November - Patch Notes #53", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 22 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e6ee866eda75.json"},
+        "185cd946a11c": {"title": "So, i cheated a little... AND IT'S GREAT!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 23 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/185cd946a11c.json"},
+        "3aaaf29e8e68": {"title": "Composer seeking Free/PWYC work", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 23 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3aaaf29e8e68.json"},
+        "47234cedf75c": {"title": "How to Think Like an Indie (Without Losing Your Mind)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/47234cedf75c.json"},
+        "e3a3f2b95dec": {"title": "[Demo][PC] Astralis: Dawnblades - heroic fantasy tactical RPG, looking for feedback", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e3a3f2b95dec.json"},
+        "e03a180a22a9": {"title": "Learning OpenGL Part 3: Lighting and Normals", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e03a180a22a9.json"},
+        "017e6d3de628": {"title": "Yelena Rider: Hells & Shells (Godot Retro FPS) — Volunteer Recruitment (Artists & Composer)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 24 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/017e6d3de628.json"},
+        "7318c477ce07": {"title": "Indie dev mistakes to avoid", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7318c477ce07.json"},
+        "70b1b4be8a4f": {"title": "Leadwerks 5.1 Beta is Now Available, with Support for Potato PCs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/70b1b4be8a4f.json"},
+        "69735f39cd27": {"title": "Game idea: squad permadeath system where death switches playable characters", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 25 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/69735f39cd27.json"},
+        "fd55836f1e2e": {"title": "Can an artist with no coding background realistically make a game using AI coding tools now?", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fd55836f1e2e.json"},
+        "9d270f0e331a": {"title": "Flamethrower (虚幻引擎 5)", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9d270f0e331a.json"},
+        "4d7bb5b2b5bb": {"title": "Report: Latest Nintendo Switch 2 production estimates contrast hardware forecast", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4d7bb5b2b5bb.json"},
+        "b88612bac506": {"title": "How Brazil's government boosts the local game industry", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b88612bac506.json"},
+        "0d09863b3924": {"title": "Microsoft to pay $250M to settle lawsuit filed by aggrieved Activision Blizzard shareholders", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0d09863b3924.json"},
+        "982566945221": {"title": "Report: Wizards of the Coast is trying to discourage workers from unionizing", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/982566945221.json"},
+        "97eaf202620c": {"title": "What Should Someone Learn First In Game Development?", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/97eaf202620c.json"},
+        "09350756a13a": {"title": "PS5 exclusive Destruction AllStars shut down after five years", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/09350756a13a.json"},
+        "7419f0f911a3": {"title": "Book Review/Analysis: Dungeon Crawler Carl", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7419f0f911a3.json"},
+        "1c16e259247e": {"title": "Report: Payment for some TheGamer staff now tied to per-article sessions", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1c16e259247e.json"},
+        "140813783ea8": {"title": "The Witcher 3: Wild Hunt is getting a new expansion 12 years after launch", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/140813783ea8.json"},
+        "db08f972f1b0": {"title": "My worst nightmare became true", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/db08f972f1b0.json"},
+        "4d0cfe403d74": {"title": "🎮 Unity VFX Artist / Technical Artist", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4d0cfe403d74.json"},
+        "05f8b46c35b1": {"title": "[HIRING] Senior Technical/VFX Artist [In Person Preferred, Remote Maybe OK]", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/05f8b46c35b1.json"},
+        "c82f5c31c0f1": {"title": "Niagara粒子系统 Ribbon Renderer — Driving V-axis curvature across chain/whip bones", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c82f5c31c0f1.json"},
+        "f9b2e3908aa7": {"title": "Baking Animated Maya Procedural Shaders into Texture Sequences for Engine/DCC Export", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f9b2e3908aa7.json"},
+        "efb9a5eba1e2": {"title": "ShapeMeshing Maya FX Assets - Store Rebuild", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/efb9a5eba1e2.json"},
+        "27aa6b354a4c": {"title": "Global Game Jam launches micro-grant program to support indies and emerging talent", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/27aa6b354a4c.json"},
+        "913c2fdf3072": {"title": "Valve raises Steam Deck OLED prices by over $200", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/913c2fdf3072.json"},
+        "78b99983f119": {"title": "Chaos releases Corona 15 for 3ds Max and Blender", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/78b99983f119.json"},
+        "eb21079f3cdd": {"title": "Polygonflow releases Dash 1.11", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 27 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/eb21079f3cdd.json"},
+        "49ae8d504e1e": {"title": "Free tutorial: Blender Hard-Surface Modeling Techniques", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 26 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/49ae8d504e1e.json"},
+        "3e7916dd385b": {"title": "The More I Learn About Game Dev, The Less Simple It Looks", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3e7916dd385b.json"},
+        "2c50a08631b7": {"title": "Stylized Tornado VFX", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2c50a08631b7.json"},
+        "8f17ca7fa9f8": {"title": "Remedy Entertainment CEO: Alan Wake and Control should have sold more", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8f17ca7fa9f8.json"},
+        "536e657283c9": {"title": "The Rockstar Game Workers Union breaks cover", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/536e657283c9.json"},
+        "e66f45e149bd": {"title": "Star Trek: Voyager - Across the Unknown reinvents TV storytelling for survival strategy - Narrative Notebook #3", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 28 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e66f45e149bd.json"},
+        "3cf02f3f3a94": {"title": "Massive crowd simulation software gets free edition", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3cf02f3f3a94.json"},
+        "e195a2182268": {"title": "Devlog 2026-05-29", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e195a2182268.json"},
+        "f2234ad2b5c7": {"title": "Solo Dev Seeking Feedback: A New Blockchain Gaming Model Focused on Adversarial Mechanics", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f2234ad2b5c7.json"},
+        "ecc15266d684": {"title": "Boris FX releases Silhouette 2026", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ecc15266d684.json"},
+        "521433769426": {"title": "Gearfall DEVLOG #0.5", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/521433769426.json"},
+        "0b7eff1677a0": {"title": "Crafting Clair Obscur: Expedition 33's mournful tale ft. Jennifer Svedeberg-Yen", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0b7eff1677a0.json"},
+        "9d2290f19fac": {"title": "Balatro publisher Playstack is being sold to GameSpot and Fandom parent company", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9d2290f19fac.json"},
+        "5922902c53ed": {"title": "007 First Light has topped 1.5 million sales", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5922902c53ed.json"},
+        "995f09993613": {"title": "Micro-grants for indies, another hardware price hike, and Valnet sinks to new lows - Patch Notes #54", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 29 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/995f09993613.json"},
+        "cbd613aba520": {"title": "XNormal VDM calculation", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 30 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cbd613aba520.json"},
+        "37f38ec2c274": {"title": "Goodbye", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/37f38ec2c274.json"},
+        "2ed64906c148": {"title": "Survival mechanics [GEARFALL DEVLOG #2]", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2ed64906c148.json"},
+        "baf11d9121c7": {"title": "C++26 Reflection Follow-up", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/baf11d9121c7.json"},
+        "5f042e00acb2": {"title": "Luiz Elias releases Mush3D 3.0", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5f042e00acb2.json"},
+        "5c8c31a39d34": {"title": "Pilgway releases 3DCoat 2026 with new GPU texturing system", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5c8c31a39d34.json"},
+        "eb16a4c4ad24": {"title": "Download Moonshot’s amazing rigged Komodo dragon model", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/eb16a4c4ad24.json"},
+        "6e75f813f8a1": {"title": "The Pixel Farm adds new point cloud toolset to PFTrack 26.05", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 30 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6e75f813f8a1.json"},
+        "869a076141d0": {"title": "Alexey Vanzhula releases Modeler 26.3 for Houdini", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 30 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/869a076141d0.json"},
+        "5a5a4500969a": {"title": "First post and first C++ question", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5a5a4500969a.json"},
+        "d9671bf168c3": {"title": "Dark Star Taliyah (Fan Art)", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Mon, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d9671bf168c3.json"},
+        "faccf12a257a": {"title": "June VFX Sketch[#68]: Glitch", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Sun, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/faccf12a257a.json"},
+        "a49a9a7af29e": {"title": "Atari to acquire Crossy Road developer Hipster Whale", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a49a9a7af29e.json"},
+        "063f4f7609d1": {"title": "Fable reboot delayed until February 2027", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/063f4f7609d1.json"},
+        "790e055a0ce5": {"title": "Download Moonshot’s amazing free rigged Komodo dragon model", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 31 Ma", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/790e055a0ce5.json"},
+        "95f3ecc2144c": {"title": "Unity crashed bruh [NOT DEVLOG]", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/95f3ecc2144c.json"},
+        "a94b8b7ac231": {"title": "UK social media ban could impact video game platforms", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a94b8b7ac231.json"},
+        "7bca834edbd5": {"title": "(Unnamed Game) Dev Log Video 2 - Level Design", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7bca834edbd5.json"},
+        "7d6ad32a63fd": {"title": "CoalBananas Sketchbook", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7d6ad32a63fd.json"},
+        "f19a9396de0b": {"title": "Cosmic Projectile VFX", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f19a9396de0b.json"},
+        "e6d9b4bb0c55": {"title": "How to direct unconventional games like Control Resonant", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e6d9b4bb0c55.json"},
+        "caab8ba2523d": {"title": "Bungie experiments by adding casual PvP-lite mode to Marathon", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/caab8ba2523d.json"},
+        "ed15a933d23d": {"title": "Learning OpenGl Part 4: Materials and Specular Maps", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ed15a933d23d.json"},
+        "da7beeb112e9": {"title": "Can anyone join my team?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/da7beeb112e9.json"},
+        "0ea07dcdbe7c": {"title": "Tekken 8 game director Kohei Ikeda has left Bandai Namco", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0ea07dcdbe7c.json"},
+        "3dcc8e296113": {"title": "PlayStation first-party game sales show a decline since 2020", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3dcc8e296113.json"},
+        "036c5d8677ae": {"title": "(Unnamed Game) Dev Log Video 3 - Patrolling Enemy", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/036c5d8677ae.json"},
+        "f6e2c0ab15a9": {"title": "Design Discussion: Reducing Inventory Stress in Loot-Based RPGs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f6e2c0ab15a9.json"},
+        "17341d9ad5f7": {"title": "Mina the Hollower sells 300,000 copies in three days", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/17341d9ad5f7.json"},
+        "33118b99595f": {"title": "Collab Rites of fate", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/33118b99595f.json"},
+        "1f87e99268a4": {"title": "Looking for Feedback on Gearomancer’s UI Screens", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1f87e99268a4.json"},
+        "a22e366fc4f9": {"title": "PlayerUnknown Productions is laying off staff and halting development on Go Wayback", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a22e366fc4f9.json"},
+        "b4dc973b6506": {"title": "更新: Team17 has laid off members of its marketing and communications department", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b4dc973b6506.json"},
+        "60365a10e0eb": {"title": "Total consumer spending on games topped $60B in the US in 2025", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/60365a10e0eb.json"},
+        "0a491a0a23e0": {"title": "Blackmagic Design releases DaVinci Resolve 21.0", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0a491a0a23e0.json"},
+        "1a8163ef99b7": {"title": "Blackmagic Design releases Fusion Studio 21.0", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1a8163ef99b7.json"},
+        "9a976896d3d0": {"title": "Download 140+ free modular assets for building a sci-fi base", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9a976896d3d0.json"},
+        "ea1e45c09013": {"title": "Nevercenter releases Silo 2026.1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ea1e45c09013.json"},
+        "db01f68d28a5": {"title": "(Unnamed Game) Dev Log Video 4 - Green Slime Enemy (art and animation need some more work)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/db01f68d28a5.json"},
+        "d4e75d0e59a0": {"title": "Amazon suggests IO Interactive might not return for 007 First Light sequel", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d4e75d0e59a0.json"},
+        "e5eb03056838": {"title": "Touching some grass in OpenGL - compute shaders and indirect draw", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e5eb03056838.json"},
+        "de8eaf95a405": {"title": "I'd like your initial opinions on Cot, a Web dev language I invented", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/de8eaf95a405.json"},
+        "2bf1ee05336e": {"title": "[发布d] Real Fake Interiors - Unity3D Bake Tool + Shader: Fake rooms that look 3D from any angle!", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2bf1ee05336e.json"},
+        "7a264739714b": {"title": "Show my vfx i made for laser beam with Raycast tracing", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7a264739714b.json"},
+        "85301dba3abe": {"title": "Nintendo to debut a Switch 2 model with replaceable batteries in the EU", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/85301dba3abe.json"},
+        "49b82341a79a": {"title": "How the Replaced devs fixed display bloat with a stylish gadget", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/49b82341a79a.json"},
+        "89d0f46fa093": {"title": "Reallusion’s 3D character contest is back for 2026: $45,000 in prizes", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 05 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/89d0f46fa093.json"},
+        "6449d7313730": {"title": "#Pong - Devlog 2 - I can play versus the computer", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 05 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6449d7313730.json"},
+        "5f6fd8c877c7": {"title": "Microsoft and Valve sued, PlayStation's first party downturn, and could a UK social media ban impact games? - Patch Notes #55", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 05 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5f6fd8c877c7.json"},
+        "38cf57f12e5c": {"title": "Generating walking/running/jumping sprites", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 06 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/38cf57f12e5c.json"},
+        "f5fece1b6a63": {"title": "Outer Space Cinematic: Ground Zero", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 05 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f5fece1b6a63.json"},
+        "c06487a090ba": {"title": "Paramount unveils new 'unified' Paramount Games Studio", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 05 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c06487a090ba.json"},
+        "018465791067": {"title": "Anyone looking for an ambient soundtrack for your game?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 06 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/018465791067.json"},
+        "877a0a7550b7": {"title": "Problem with Sounds in SFML 3", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 07 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/877a0a7550b7.json"},
+        "1d1f14a54fcc": {"title": "ZpriteForge v1.1 - The \"Pro-Tools\" 更新 (Select, Dither, Tile Mode & More!)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 07 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1d1f14a54fcc.json"},
+        "54c7ffc9c5b8": {"title": "Looking for assistance creating proof of concept for RPG combat framework", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sun, 07 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/54c7ffc9c5b8.json"},
+        "0c0a86f62694": {"title": "Senior VFX Artist for Stylized Unity3D Games, Fully Remote in Europe", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Mon, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0c0a86f62694.json"},
+        "e0899a30514a": {"title": "Dragon Epic, Houdini and Niagara粒子系统 Forever", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e0899a30514a.json"},
+        "aa3e51d05016": {"title": "Ivan Ostanin: Sketch #68", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/aa3e51d05016.json"},
+        "60f2921300dc": {"title": "How That's No Moon's Crossfire evolves the cover-based shooter", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/60f2921300dc.json"},
+        "a620519eaac1": {"title": "Sneak peek: Houdini 22", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a620519eaac1.json"},
+        "3d83bf8a0df6": {"title": "NeXus for Blender is now free in beta", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 06 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3d83bf8a0df6.json"},
+        "8f5d4f1a7ea5": {"title": "Stefano Falubba: Sketch#68", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8f5d4f1a7ea5.json"},
+        "5337a3c12cf5": {"title": "Jlazzaro Introduction and VFX breakdowns from Polyarc Games", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Mon, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5337a3c12cf5.json"},
+        "0413342ff724": {"title": "教程: Creating a Real-Time Horse Groom for Games", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0413342ff724.json"},
+        "c8b9ba07cc6e": {"title": "3DGS Render 5.0 lets you animate Gaussian Splats inside Blender", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c8b9ba07cc6e.json"},
+        "55cd0449ab61": {"title": "Starting as an Extraction Shooter, then adding 5v5 and Survival modes later in Unreal? Is this a player-base/technical trap?", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/55cd0449ab61.json"},
+        "3552cb7046de": {"title": "Synæsthesia: Sketch #68", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3552cb7046de.json"},
+        "531b55c853be": {"title": "Manus: Sketch #68", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/531b55c853be.json"},
+        "d99d2027081e": {"title": "Fire Attacks VFX pack for Unity", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d99d2027081e.json"},
+        "4875e238784a": {"title": "Nintendo of Europe to pay $40M fine for Joy-Con drift issues", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4875e238784a.json"},
+        "b6ddc2803512": {"title": "Xbox is rethinking strategy around Project Helix thanks to the memory crisis", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b6ddc2803512.json"},
+        "a79951f7c07d": {"title": "Telltale Games is back, but can it learn from its past mistakes?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a79951f7c07d.json"},
+        "13725b0da16b": {"title": "007: First Light sales hit 3M in less than two weeks", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/13725b0da16b.json"},
+        "9fc07e5d0e33": {"title": "Xbox console exclusives are returning on a 'case-by-case' basis", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9fc07e5d0e33.json"},
+        "95a63aafe796": {"title": "ZpriteForge v1.2 - The \"Pro Workflow\" 更新 (Custom Canvas, Retro Palettes & Spritesheets)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/95a63aafe796.json"},
+        "fe12241a4216": {"title": "GL API design: Vertex buffers and immediate-mode rendering", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fe12241a4216.json"},
+        "b2fb71fdeff1": {"title": "Xbox CEO unsure whether Activision Blizzard merger is paying off", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b2fb71fdeff1.json"},
+        "582dfc5e2212": {"title": "Maxon releases Redshift 2026.7", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/582dfc5e2212.json"},
+        "c9be7fbca37b": {"title": "Maxon releases Cinema 4D 2026.3", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c9be7fbca37b.json"},
+        "9ea9e7af0105": {"title": "Do you have any recommendations on single-precision floating point libraries?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9ea9e7af0105.json"},
+        "57b53e8df799": {"title": "Fake 3D Flipbook Rotation - how is it done?", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/57b53e8df799.json"},
+        "f1f40cef5dbd": {"title": "Can't Photoshop layers \"Just be normal!\" ? (they can now)", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f1f40cef5dbd.json"},
+        "0371c6a43e0e": {"title": "Valve confirms it won't restock Steam Gift Cards", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0371c6a43e0e.json"},
+        "077219fc5e04": {"title": "Ubisoft closing Winnipeg and Belgrade studios and making further layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/077219fc5e04.json"},
+        "f3873765bd02": {"title": "ESA says anti-deepfake act could 'devastate' video game industry", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f3873765bd02.json"},
+        "b04d174a9ceb": {"title": "Homing missiles 虚幻引擎5", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b04d174a9ceb.json"},
+        "de7e34349a0e": {"title": "Unreal Niagara粒子系统 For Loop Example", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/de7e34349a0e.json"},
+        "5f483909dad6": {"title": "Destruction Demo", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5f483909dad6.json"},
+        "b1a7f8cf38d9": {"title": "Xbox announces business 'reset' amid reports of layoffs and studio closures", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b1a7f8cf38d9.json"},
+        "3c5ada7ef76d": {"title": "IMS Creators: Turn complex logic into a visual system", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3c5ada7ef76d.json"},
+        "9bf18facf821": {"title": "Megamans MegaBuster-WIP Feedback", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9bf18facf821.json"},
+        "639b46991de8": {"title": "Unreal Niagara粒子系统 Fish WPO Example", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/639b46991de8.json"},
+        "b5f83e7a478e": {"title": "Report: Pokemon Go video scans may have been used for AI drone training", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b5f83e7a478e.json"},
+        "87511b0dc946": {"title": "Crimson Desert tops 6M sales within three months", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/87511b0dc946.json"},
+        "a4a6ce30f2c3": {"title": "Independent game publications revive bundles in defiance of 'cut-throat competitive market'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a4a6ce30f2c3.json"},
+        "48edd31ebf26": {"title": "Playgama releases Web Games Industry Map to show off the ecosystem", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 12 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/48edd31ebf26.json"},
+        "d98b9be3f950": {"title": "Hello!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d98b9be3f950.json"},
+        "feab5c50e7f5": {"title": "Playstack sold, Xbox announces business 'reset,' and is generative AI poisoning the well? - Patch Notes #56", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 12 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/feab5c50e7f5.json"},
+        "b55c8a60552f": {"title": "Devlog 2026-06-12", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 12 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b55c8a60552f.json"},
+        "bc24d189be89": {"title": "Introducing MyHomeGames – A Retro Gaming & Emulation Hub for Home Computers", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 12 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bc24d189be89.json"},
+        "be4f7122c7c7": {"title": "The art of game writing in 'non-narrative' games ft. Emma Kidwell and Harrison Pink", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 12 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/be4f7122c7c7.json"},
+        "4657a0bad5a3": {"title": "Playstack CEO pledges to be 'mindful' about growth after majority takeover", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 12 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4657a0bad5a3.json"},
+        "b27f5f1a4a59": {"title": "[HIRING] VFX Art Managers – Riot Games Singapore", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Sat, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b27f5f1a4a59.json"},
+        "939a3afd874d": {"title": "How My Crash Course in Game Art Taught Me to Let Go of Doubt and Just Do It", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/939a3afd874d.json"},
+        "2162847cabce": {"title": "Scrut.Hut is now Developing", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2162847cabce.json"},
+        "e7fb45057679": {"title": "New free online VFX procedural textures with node base editor", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Sat, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e7fb45057679.json"},
+        "f13b9a8eecec": {"title": "Download Gregor Weiss’s free bear creature rig", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f13b9a8eecec.json"},
+        "dcfdbf9c395b": {"title": "教程: Snow Simulation Workflows in Houdini", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/dcfdbf9c395b.json"},
+        "65af0ce378fb": {"title": "Boris FX releases Mocha Pro 2026.5", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 12 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/65af0ce378fb.json"},
+        "eb0bbd91b52d": {"title": "Open 3D Foundation releases O3DE 2026.5", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/eb0bbd91b52d.json"},
+        "c875dd97497b": {"title": "LF Builders of a map", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c875dd97497b.json"},
+        "283b241c9106": {"title": "FPS Collision Detection/Response with Stairs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/283b241c9106.json"},
+        "f8454572fbeb": {"title": "LightWave Digital releases LightWave 2026", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f8454572fbeb.json"},
+        "ba597fb76e0d": {"title": "[Survey] Indie Game Developers: What Are Your Biggest Development Challenges?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ba597fb76e0d.json"},
+        "279f734ba2ee": {"title": "Check our new CC public VFX gallery", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Sun, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/279f734ba2ee.json"},
+        "2f14cb518ea6": {"title": "VAT Blood FX", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2f14cb518ea6.json"},
+        "f0bef3962871": {"title": "Looking for a real-time VFX", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Mon, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f0bef3962871.json"},
+        "4cc05880dad1": {"title": "Report: Multiple Xbox game studio heads negotiating with Xbox to avoid closure", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4cc05880dad1.json"},
+        "ba2ab5eabbef": {"title": "EA announces advertising platform to launch ads 'directly into gameplay'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ba2ab5eabbef.json"},
+        "65790d738d80": {"title": "Report: Two former Rare execs are leaving Xbox", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/65790d738d80.json"},
+        "f563d41611de": {"title": "Microsoft CEO says Xbox must become 'sustainable' as it reportedly considers major spinoff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f563d41611de.json"},
+        "addceb9bbb0f": {"title": "UK social media ban will restrict 'high-risk' features on game platforms", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/addceb9bbb0f.json"},
+        "b9106fd2f50c": {"title": "V-Ray for Blender 更新 3 now runs on Linux", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b9106fd2f50c.json"},
+        "ed79cd4d06f8": {"title": "QuadSpinner releases Gaea 2.3", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ed79cd4d06f8.json"},
+        "a92e4bd5808e": {"title": "Learning OpenGL Part: The End - Model loading", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a92e4bd5808e.json"},
+        "01ea09c7b6fd": {"title": "Time-travel FPS metroidvania - Tempus Vitae", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/01ea09c7b6fd.json"},
+        "e3bef3d8fdd9": {"title": "Ashimoz : Sketch#68", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e3bef3d8fdd9.json"},
+        "394ad1a60803": {"title": "Analyzing Mouse: P.I. For Hire's audacious worldbuilding - Narrative Notebook #4", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/394ad1a60803.json"},
+        "250aebb185d9": {"title": "Treyarch studio head steps down after 22 years", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/250aebb185d9.json"},
+        "9acca1497c4a": {"title": "Banned horror title Horses begins recouping development costs after selling 30,000 copies", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9acca1497c4a.json"},
+        "e35ab4e6a385": {"title": "Download a free 3D castle model in FBX format", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e35ab4e6a385.json"},
+        "18c0973c9b65": {"title": "CRM64Pro GDK v0.18.0 Video, CDCv2 and Scene import update", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/18c0973c9b65.json"},
+        "9910203b9f37": {"title": "Looking for Feedback on Gearomancer’s UI Screens!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9910203b9f37.json"},
+        "3d005cbc0ad7": {"title": "Luna Abyss development team laid off by Kwalee", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3d005cbc0ad7.json"},
+        "cdd63e8ac34f": {"title": "更新 v1.2: The \"Smart Workflow\" 更新 is Here! 🚀 İçerik: Hello pixel artists and game devs! 🎨", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cdd63e8ac34f.json"},
+        "85eed9ed45e9": {"title": "[HIRING] Looking for Unreal FX Artist", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/85eed9ed45e9.json"},
+        "9ed51ae601cc": {"title": "Sequence VFX - looking for feedback", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9ed51ae601cc.json"},
+        "7ada6cf2e947": {"title": "Don't Nod pursuing 'several levers' to secure financial future after Tencent decides against short-term investment", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7ada6cf2e947.json"},
+        "8ed40f480c56": {"title": "虚幻引擎 6 will merge 虚幻引擎5 and UEFN into 'a single, unified engine'", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8ed40f480c56.json"},
+        "54ae811a5ae3": {"title": "OtherSide Entertainment lays off 17 staff following game cancellation", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/54ae811a5ae3.json"},
+        "63a07da41c5c": {"title": "Report: Xbox was set on splitting with Ninja Theory when unveiling its new project", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/63a07da41c5c.json"},
+        "92902f090ada": {"title": "Returnal director will be 'responsibly ambitious' to ensure his new studio prospers", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/92902f090ada.json"},
+        "1256b21c2dca": {"title": "Gameplay Advance", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1256b21c2dca.json"},
+        "7e15109a41c1": {"title": "Looking for devs to help me make a game (unpaid)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7e15109a41c1.json"},
+        "84daed1acfbf": {"title": "Get the free MetaHuman Animator Markerless Motion Capture plugin", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/84daed1acfbf.json"},
+        "4da485a21aaa": {"title": "Adobe releases Photoshop 27.8", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4da485a21aaa.json"},
+        "e8af93d16d09": {"title": "Adobe releases After Effects 26.3", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e8af93d16d09.json"},
+        "0f19b8440b2c": {"title": "虚幻引擎 5.8 is here: discover its 5 key features for CG artists", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0f19b8440b2c.json"},
+        "de59eae15c73": {"title": "New horizons", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/de59eae15c73.json"},
+        "d3a370778f17": {"title": "[RevShare] [LFS] [Game Designer] 2D Sandbox MMO, 6 months in, fully playable", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d3a370778f17.json"},
+        "e629f3e48efd": {"title": "Getting started in VFX for games", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e629f3e48efd.json"},
+        "2383954edb50": {"title": "'A new industry with a new identity:' How Canadian devs are faring in 2026", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2383954edb50.json"},
+        "a0376b8337a4": {"title": "Pocketpair lead on generative AI: Gamers don't want it", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a0376b8337a4.json"},
+        "69e32d5c838c": {"title": "Vampire Survivors dev 'reviewing' Fortnite collab after Epic's AI announcement", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/69e32d5c838c.json"},
+        "57b17bffa602": {"title": "Rockstar's legal setback, Final Fantasy tax incentives, and PlayStation swaps 'PC' for 'AI' - Patch Notes #57", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 19 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/57b17bffa602.json"},
+        "f1c2998ae11f": {"title": "GameDev.net now has an MCP server", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 19 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f1c2998ae11f.json"},
+        "a6d85f7680fe": {"title": "[Hobby/RevShare] Systems/Gameplay Programmer needed for Hard Sci-Fi Logistics Simulation (Publisher Interest from Hooded Horse)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 19 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a6d85f7680fe.json"},
+        "919aa700042b": {"title": "Hello everyone! I need some help :)", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Fri, 19 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/919aa700042b.json"},
+        "19e8195c2c96": {"title": "Kabam consolidating LA office and making layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 19 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/19e8195c2c96.json"},
+        "d2620173583f": {"title": "Report: Former Xbox president Sarah Bond and Take-Two CEO Strauss Zelnick linked to Peter Thiel's secret society", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 19 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d2620173583f.json"},
+        "fff5dd92026a": {"title": "[Revshare] Looking for a Programmer(Unity, unreal or godot) and a 3d Character Generalist(Modelling and animation) For an rpg style fighting game", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 19 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fff5dd92026a.json"},
+        "ff011fed5949": {"title": "虚幻引擎 - The \"EngineMisc\" in the low level memory tracker could be tricky for you.", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sat, 20 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ff011fed5949.json"},
+        "b221590efa23": {"title": "[Rev-Share] Solo Beginner looking for Unity Physics Programmer & 3D Artist (PICKUP RUNNER)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 20 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b221590efa23.json"},
+        "bbe2fb3232a2": {"title": "10 things CG artists need to know about 虚幻引擎 6", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sun, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bbe2fb3232a2.json"},
+        "aee2956105f4": {"title": "Action Map with Regards to Deep Learning", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/aee2956105f4.json"},
+        "2728790448ba": {"title": "We’re Looking for Team Members and Community Members for a Medieval Strategy Game in Limited Beta", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2728790448ba.json"},
+        "24caea6bcc74": {"title": "Angular Momentum 教程", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/24caea6bcc74.json"},
+        "d60cace29207": {"title": "Rasterizer Project - Part 1: Getting started", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d60cace29207.json"},
+        "2ec0cfec6bed": {"title": "Cozy Farming UI Kit — 2D UI Asset Pack with Interactive Demo", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2ec0cfec6bed.json"},
+        "dbc22d666a4b": {"title": "'Larger budgets and longer schedules do not lead to better games:' Thank You For Your Application recoups dev costs in 22 hours", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/dbc22d666a4b.json"},
+        "05d993cffd64": {"title": "Obituary: Ubisoft co-founder Claude Guillemot dies in plane crash", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/05d993cffd64.json"},
+        "324253143a21": {"title": "Unity releases Unity 6.5: discover 5 key features for CG artists", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/324253143a21.json"},
+        "a5ca486a067a": {"title": "How do you diagnose mobile game ad revenue drops?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a5ca486a067a.json"},
+        "88b6e252c570": {"title": "Steam Machine pricing starts at $1,049 for 512GB model", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/88b6e252c570.json"},
+        "d62c0337d70c": {"title": "Report: EA conducts layoffs in Hyderabad, India and the US", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d62c0337d70c.json"},
+        "d2de4333af74": {"title": "Ubisoft eliminates 93 roles in San Francisco", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d2de4333af74.json"},
+        "af519bf6351c": {"title": "Godot confirms it tolerates 'some AI assistance' but rejects 'vibe coded' tag", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/af519bf6351c.json"},
+        "3579a65e209c": {"title": "French union STJV to commence national strike outside Quantic Dream", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3579a65e209c.json"},
+        "3efabba2909a": {"title": "Autodesk releases Arnold 7.5.2 with 3D Gaussian Splatting", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3efabba2909a.json"},
+        "f2946cb60059": {"title": "Play Classic Minesweeper Online – Free, Fast & Browser-Based", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f2946cb60059.json"},
+        "799ed9d02c70": {"title": "Valve is making it easier to build your own Steam Machine", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/799ed9d02c70.json"},
+        "ab81d13af7c5": {"title": "Utilizing Statistical Information with Flow and Logic Depicted by Profiler Logs to Design New Structured Software", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ab81d13af7c5.json"},
+        "6d5fc2bbabe1": {"title": "PixelatedSourav || Sketch #2", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6d5fc2bbabe1.json"},
+        "7d55bca79007": {"title": "Stormhound: Sketch #68", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7d55bca79007.json"},
+        "853ebb84afcb": {"title": "How a 12 year wait made Alien Isolation 2 a better sequel", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/853ebb84afcb.json"},
+        "225bae2ab270": {"title": "Report: Tencent mulling exits from multiple Japanese studios", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/225bae2ab270.json"},
+        "4c7762fd8dd6": {"title": "Well now all I know is MDMA goes well with Business Management", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4c7762fd8dd6.json"},
+        "56529c1b4052": {"title": "Atari and MobyGames launch new career development platform called Moby Professional", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/56529c1b4052.json"},
+        "89e851a55b70": {"title": "Hi, i may need some help got any one know how to make ship wake correctly for boucyacy", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/89e851a55b70.json"},
+        "badfe0d0fac0": {"title": "Former Xbox employees warn of potential for retaliation in rumored impending layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/badfe0d0fac0.json"},
+        "24c772c27ca2": {"title": "Investment house Denmu announces 'auteur-first' $50 million fund for game devs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/24c772c27ca2.json"},
+        "a73977a88cc3": {"title": "New publisher Trailmark Games promises 'new path forward' for licensed games", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a73977a88cc3.json"},
+        "1fa0970d3f5d": {"title": "Grand Theft Auto 6's $80 price settles the $100 question", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1fa0970d3f5d.json"},
+        "42ea28683270": {"title": "Epic Games releases RealityScan 2.2 with AMD GPU support", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/42ea28683270.json"},
+        "98a44c8cd1d3": {"title": "New motion graphics tool Caddis puts a node graph in every layer", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/98a44c8cd1d3.json"},
+        "feabd5aba240": {"title": "Adobe releases Substance 3D Painter 12.1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/feabd5aba240.json"},
+        "717ae9f7a7fe": {"title": "Reallusion releases free animation tool iClone Personal", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/717ae9f7a7fe.json"},
+        "0850e2a2c807": {"title": "EA’s Battlefield Studios backs the Godot Development Fund", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0850e2a2c807.json"},
+        "875e5214126f": {"title": "TiltBump - mobile browser arcade game using phone tilt controls", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/875e5214126f.json"},
+        "ee8adc8bcdd5": {"title": "Magic: The Gathering Arena developers have successfully unionized", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ee8adc8bcdd5.json"},
+        "05480bd1d666": {"title": "Analysts attempt to make sense of Xbox's latest exclusivity pivot", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/05480bd1d666.json"},
+        "9ff98a39e3da": {"title": "Tim Sweeney says only hope for new games is to 'connect to economies of other games'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9ff98a39e3da.json"},
+        "199e3607d9c2": {"title": "KeyShot releases KeyShot 2026.2", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/199e3607d9c2.json"},
+        "68b0556dfa2e": {"title": "Vultures: launch on steam very very soon! (2021-2026)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/68b0556dfa2e.json"},
+        "b0e4c9983641": {"title": "Smitaa: Sketch #68", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b0e4c9983641.json"},
+        "e2178c53b10f": {"title": "Meccha Chameleon sells 7M copies in first two weeks", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e2178c53b10f.json"},
+        "52cf41b197ef": {"title": "VR dev Combat Waffle Studios lays off staff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/52cf41b197ef.json"},
+        "033bffd5a89c": {"title": "Microsoft raises price of Xbox consoles once again, sunsets 2TB model", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/033bffd5a89c.json"},
+        "48a445ee78a0": {"title": "Sony is laying off 'most' of the Destiny team and 'some' Marathon devs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/48a445ee78a0.json"},
+        "6c87951ba6a4": {"title": "Italian studio 34BigThings regains independence from Embracer", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6c87951ba6a4.json"},
+        "2bd959f728bc": {"title": "Boris FX releases Optics 2026.5 with AI-powered facial masking", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2bd959f728bc.json"},
+        "0d232c1778a6": {"title": "Adobe to acquire Topaz Labs", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0d232c1778a6.json"},
+        "9f492005d9fe": {"title": "It's a fail...", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9f492005d9fe.json"},
+        "61a4c59215fb": {"title": "[RevShare] i need team, 3D artist and programmer for Solo and Multiplayer CooP game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/61a4c59215fb.json"},
+        "fcec9f65a22c": {"title": "ZpriteForge v2: We Completely Redesigned Our Free Pixel Art Editor! 🎨", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fcec9f65a22c.json"},
+        "52cfe59568f9": {"title": "Anonymous functions and local variables", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/52cfe59568f9.json"},
+        "9bf7dade32e9": {"title": "Keywords has laid off 128 employees in San Francisco", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9bf7dade32e9.json"},
+        "87fb674d1ae2": {"title": "Steam Machine sticker shock, even more Ubisoft layoffs, and another Xbox price hike - Patch Notes #58", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/87fb674d1ae2.json"},
+        "b92f8b309dc9": {"title": "A journey from Windows-only to cross-platform: Porting my Vulkan renderer.", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 27 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b92f8b309dc9.json"},
+        "0f753e57bb26": {"title": "I wanna do music for Indie Games!!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 27 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0f753e57bb26.json"},
+        "37637e44085e": {"title": "Shortcut to restart niagara preview timeline", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sat, 27 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/37637e44085e.json"},
+        "cc56b6aaa6e7": {"title": "My TRPG has A-star pathfinding with verticality", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 27 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cc56b6aaa6e7.json"},
+        "21c991f2396d": {"title": "I have a prototype but don't know my next production milestone. What would you do next?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/21c991f2396d.json"},
+        "8c974bfceca8": {"title": "OPERATION OBLITERATION 2 IS NOW RELEASED!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8c974bfceca8.json"},
+        "84bd31a20b3d": {"title": "A decision-making model for running a colony simulation.", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/84bd31a20b3d.json"},
+        "6d49f1b320bf": {"title": "AMD’s FSR SDK 2.3 makes FSR 4.1 upscaling work on older GPUs", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6d49f1b320bf.json"},
+        "5cbad26e10a6": {"title": "I built a gaming news social platform — it's live in beta, would love your feedback!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5cbad26e10a6.json"},
+        "488e126e0798": {"title": "How do you decide whether a metric should change your game design?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/488e126e0798.json"},
+        "91119ff710ca": {"title": "Free VFX textures", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Mon, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/91119ff710ca.json"},
+        "8670000e5170": {"title": "Nintendo is increasing the price of Switch 2 in South Korea", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8670000e5170.json"},
+        "1afe7c1b2dd7": {"title": "Inside Skybound's video game strategy ft. David 'DA' Alpert and Jon Goldman", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1afe7c1b2dd7.json"},
+        "e2ede96c27cd": {"title": "Adobe releases Substance 3D Sampler 6.0", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e2ede96c27cd.json"},
+        "a6e03e8d18f2": {"title": "Unpaid, hobby project", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a6e03e8d18f2.json"},
+        "b6121ee8001d": {"title": "Radiation Effect Niagara粒子系统 system", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b6121ee8001d.json"},
+        "4d305e2de366": {"title": "Supermassive Games CEO steps down following launch of Directive 8020", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4d305e2de366.json"},
+        "e4b0a023bf8c": {"title": "Why Build an Application in Godot, Much Less a SUITE of them?!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e4b0a023bf8c.json"},
+        "9a873348bfaa": {"title": "nDreams co-founder launches indie game and music studio Atmospheric", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9a873348bfaa.json"},
+        "1e2152bd401a": {"title": "Rasterizer Project - Part 2: Lines and Optimization (Excited reaction)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1e2152bd401a.json"},
+        "39ae2450161e": {"title": "Is ranged combat always better than melee combat?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/39ae2450161e.json"},
+        "0d444401c514": {"title": "Unreal Real-time Explosion FX", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0d444401c514.json"},
+        "93d214354eb7": {"title": "IO Interactive to lay off employees after Xbox pulls support for untitled fantasy game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/93d214354eb7.json"},
+        "62f4e195833c": {"title": "Memory manufacturers sued in class action suit alleging price and supply fixing", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/62f4e195833c.json"},
+        "3c7129b272f0": {"title": "Report: Xbox considering sale or closure of Arkane, other studios, as layoffs loom", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3c7129b272f0.json"},
+        "dca2e0260dd7": {"title": "Opinion: Everything hurts and no one knows when the pain will end", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/dca2e0260dd7.json"},
+        "8a5a712c19b8": {"title": "Grand Theft Auto developers seek union recognition at Rockstar", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8a5a712c19b8.json"},
+        "e51aca7b6a38": {"title": "Defold 1.13.0 has been released + summary of the first half of 2026", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e51aca7b6a38.json"},
+        "868c07200186": {"title": "Community Sketch Voting - Sketch #68: Glitch", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/868c07200186.json"},
+        "e61fd21b1570": {"title": "I'm working on a new free/open source 3D character and scene design tool and looking for feedback", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e61fd21b1570.json"},
+        "d3ae87148901": {"title": "Rockstar accused of ignoring pay inequity, mandating crunch, and weaponizing bonuses", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d3ae87148901.json"},
+        "2c393905e5e8": {"title": "Check my new material made we my own procedural node editor", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2c393905e5e8.json"},
+        "a285924d12ae": {"title": "Foundry releases Mari 8.0 in open beta", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a285924d12ae.json"},
+        "9b8412739795": {"title": "Foundry releases Nuke 17.1 in open beta", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9b8412739795.json"},
+        "2bed005b12cf": {"title": "Get 120 free modular 3D assets for building a desert city", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2bed005b12cf.json"},
+        "924f285b16e0": {"title": "Polygonflow releases Dash 1.12", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/924f285b16e0.json"},
+        "ba6b3b213427": {"title": "JangaFX just made effects tool VectorayGen available free", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ba6b3b213427.json"},
+        "ebf9080aff9e": {"title": "How to create color pallet gradient", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ebf9080aff9e.json"},
+        "f9127179f1e5": {"title": "Union workers establish hardship fund to support devs impacted by layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f9127179f1e5.json"},
+        "2e036e520a9d": {"title": "Ubisoft taps former 2K president Christoph Hartmann to oversee Tom Clancy franchise", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2e036e520a9d.json"},
+        "f4f40552c74e": {"title": "Godot to ban (almost all) AI coding contributions", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f4f40552c74e.json"},
+        "de20c53f300b": {"title": "Krafton and Unknown Worlds founders settle Subnautica 2 legal dispute", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/de20c53f300b.json"},
+        "88cdff4f0544": {"title": "OtherSide Entertainment lays off 18 from Thick as Thieves team", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 01 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/88cdff4f0544.json"},
+        "bdaa6c2d2a77": {"title": "Inbibo releases Adonis 2.1 with AdonisML", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bdaa6c2d2a77.json"},
+        "5e6ee6ea5ef6": {"title": "Scrut.Hut is working on Stich Development Library", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5e6ee6ea5ef6.json"},
+        "5c0175a94565": {"title": "[REVSHARE] Steinvar (虚幻引擎5 Fantasy Adventure RPG) – Looking for Team Members", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5c0175a94565.json"},
+        "af08541075bb": {"title": "Aletsux - Sketchbook", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 02 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/af08541075bb.json"},
+        "38a1e47d4ce2": {"title": "Mixos lets you paint PBR textures in your web browser", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/38a1e47d4ce2.json"},
+        "c413ffaf3942": {"title": "I need help with my creature simulation game!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c413ffaf3942.json"},
+        "30b57fb796b3": {"title": "Doctor Strange Portal VFX", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/30b57fb796b3.json"},
+        "54ded6764262": {"title": "Beta button bug", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/54ded6764262.json"},
+        "d9554ca04107": {"title": "Enginefall developer Red Rover Interactive is making layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d9554ca04107.json"},
+        "b8608e4ef917": {"title": "Cyberpunk 2077 has sold 40 million copies worldwide", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b8608e4ef917.json"},
+        "c2d8f5da9e53": {"title": "Rockstar workers hit back, PlayStation ditches physical discs, and chipmakers accused of price fixing -  Patch Notes #59", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 03 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c2d8f5da9e53.json"},
+        "6ce706dc1e5d": {"title": "Free tutorial: Lighting Realistic Rainy Weather in 虚幻引擎 5", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sat, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6ce706dc1e5d.json"},
+        "984eddf9cfd5": {"title": "I’m building a small tool to diagnose mobile ad revenue drops", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/984eddf9cfd5.json"},
+        "a2d9cb5c4d20": {"title": "Do you list your credits?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 04 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a2d9cb5c4d20.json"},
+        "9d80becb9717": {"title": "Online Block Blast Solver – A free puzzle tool for players and developers", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 05 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9d80becb9717.json"},
+        "443bddca6bff": {"title": "Godot vs Unity vs 虚幻引擎? Which to use on HP Victus 15 as a solo developer with no experience? I never seem to get a good solid answer on which is best to use as a solo game developer. I want the game to be 3D.", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sun, 05 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/443bddca6bff.json"},
+        "e5cdf4381cd2": {"title": "Entropy Engine producing seeds for procedural game mechanics — feedback wanted", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 05 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e5cdf4381cd2.json"},
+        "627b6f05a03d": {"title": "Anybody out there?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/627b6f05a03d.json"},
+        "cc49ba58b6c9": {"title": "how work in small projects can somebody help and how to contribute in community and gain experience", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cc49ba58b6c9.json"},
+        "0988a7d5b348": {"title": "MD's VFX Sketchbook", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Sun, 05 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0988a7d5b348.json"},
+        "f6ea3fb08d0c": {"title": "Accuracy of physics constraints", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f6ea3fb08d0c.json"},
+        "9cce73c6eb1f": {"title": "Nintendo is winding down original Switch sales in Europe", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9cce73c6eb1f.json"},
+        "b1af0491b213": {"title": "Xbox cutting 3,200 jobs and parting ways with Double Fine, Compulsion, Ninja Theory, and Undead Labs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b1af0491b213.json"},
+        "e5fe91d65e7e": {"title": "Ingress developer Niantic Spatial shuttering New Zealand office", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e5fe91d65e7e.json"},
+        "bc36bbb07109": {"title": "EVE Online's cross-platform game engine framework is now fully open source", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 06 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bc36bbb07109.json"},
+        "0144d2405395": {"title": "**Stylized Water VFX in 虚幻引擎**", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 07 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0144d2405395.json"},
+        "f7f434b1a854": {"title": "Report: Obsidian losing around one quarter of its staff to 'Xbox reset'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f7f434b1a854.json"},
+        "0b3c24c7ae23": {"title": "Supercell starts developer grants program for African studios", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0b3c24c7ae23.json"},
+        "a4b704a80c3a": {"title": "Xbox CEO amidst layoffs: 'I think our core has to be healthy'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a4b704a80c3a.json"},
+        "6a9e2935e9e2": {"title": "IO Interactive closing Istanbul studio after regaining control of Project Fantasy", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6a9e2935e9e2.json"},
+        "177168e44d53": {"title": "Report: Roughly half of the id Software team have been laid off", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/177168e44d53.json"},
+        "ecd532ddda68": {"title": "Rasterizer Project - Part 3: Geometry", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ecd532ddda68.json"},
+        "0af4e6dfb317": {"title": "'Used, abused, and discarded:' CWA Canada slams Microsoft over handling of Bethesda layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0af4e6dfb317.json"},
+        "59440af695e7": {"title": "Otoy releases OctaneRender 2026.4", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/59440af695e7.json"},
+        "2604fa24a7ea": {"title": "Reallusion releases Headshot 3.1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2604fa24a7ea.json"},
+        "2f7f9146e9d8": {"title": "Get versions of the free Thinkbox tools that work with 3ds Max 2027", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 07 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2f7f9146e9d8.json"},
+        "d5e8749ca4bf": {"title": "Fighting game collision", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d5e8749ca4bf.json"},
+        "dfe088f5bc15": {"title": "Blizzard eliminates 'small number' of roles in China", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/dfe088f5bc15.json"},
+        "c7bc0cb5d23a": {"title": "Mobile game Mario Kart Tour is winding down", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c7bc0cb5d23a.json"},
+        "682c834cc8c9": {"title": "Opinion: Welcome to the house of pain, brought to you by Xbox", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/682c834cc8c9.json"},
+        "245fc0ffc046": {"title": "Check out free cross-platform retopology tool AutoRemesher", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/245fc0ffc046.json"},
+        "b149bf3773f3": {"title": "Brick eliminator game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b149bf3773f3.json"},
+        "a2ed3321e079": {"title": "Mario Item Box - Breadown", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a2ed3321e079.json"},
+        "edf08dec3418": {"title": "Sketch #68: Winners and Badges!", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/edf08dec3418.json"},
+        "692342a86917": {"title": "Xbox had laid off 379 Zenimax workers in Maryland", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/692342a86917.json"},
+        "e6fe97f57442": {"title": "Atari appoints Andreas Deptolla as president of Atari Europe", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 08 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e6fe97f57442.json"},
+        "32573938bf33": {"title": "Zibra AI launches new real-time VFX technology ZibraGDS", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/32573938bf33.json"},
+        "a8279bbb72b0": {"title": "Try ByHand, Truong CG Artist’s free digital sculpting software", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a8279bbb72b0.json"},
+        "2d6651afa28f": {"title": "BG3 Harm Spell Sound Redesign", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2d6651afa28f.json"},
+        "146929991d4e": {"title": "Building an always-on ad revenue monitor for AppLovin MAX studios (feedback welcome)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/146929991d4e.json"},
+        "bd49ce39dc47": {"title": "虚幻引擎5 Heterogeneous Volume: Low-density Houdini VDB smoke becomes dotted / pixelated", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bd49ce39dc47.json"},
+        "7041daf05ca5": {"title": "Mario Item Box - [虚幻引擎5]", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7041daf05ca5.json"},
+        "409738a3df7b": {"title": "Eurogamer and VG247 veterans launch new independent site", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/409738a3df7b.json"},
+        "4c43c167d28f": {"title": "Fired Marathon director says he's settled lawsuit with Sony", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4c43c167d28f.json"},
+        "b7b94fd14fcc": {"title": "A risk-averse video game industry is failing marginalized developers", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b7b94fd14fcc.json"},
+        "2a4081d0045c": {"title": "First 12 min Gameplay", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2a4081d0045c.json"},
+        "59bca70904d4": {"title": "[RevShare / Portfolio] 虚幻引擎5 Movement-Focused FPS Seeking 3D Modelers & Animators", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/59bca70904d4.json"},
+        "70791de732d9": {"title": "'We mean business:' Xbox union workers fighting back with 'Save Our Devs' rally on July 15", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/70791de732d9.json"},
+        "12cbcca4515e": {"title": "Asha Sharma joins Federal Reserve advisory task force days after laying off thousands at Xbox", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 09 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/12cbcca4515e.json"},
+        "29b36530dddc": {"title": "Chaos releases V-Ray 7.4 for Maya", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/29b36530dddc.json"},
+        "13b73c260cee": {"title": "Devlog 2026-07-10", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/13b73c260cee.json"},
+        "061754b9dd42": {"title": "[REVSHARE] Steinvar — Social Media & Community Manager + Video Production Specialist", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/061754b9dd42.json"},
+        "483846484bf9": {"title": "NexusMods CEO digs into the dynamics of video game modding ft. Victor Folmann", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/483846484bf9.json"},
+        "74cc470df87c": {"title": "Own goal specialist Xbox rifles another into the roof of the net - Patch Notes #60", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 10 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/74cc470df87c.json"},
+        "e73bd00dc0ae": {"title": "教程: create cliff materials in Substance 3D Designer", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e73bd00dc0ae.json"},
+        "1a5ac6e0e111": {"title": "My road to water spell VFX", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Sat, 11 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1a5ac6e0e111.json"},
+        "248494bd8244": {"title": "[RevShare] Looking for a 2D artist for a VN/RPG dark fantasy game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 12 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/248494bd8244.json"},
+        "cbd88c33b6d0": {"title": "Howler 2027 is out with new 3D rendering environment Howler 3D", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cbd88c33b6d0.json"},
+        "996dfb84eb6a": {"title": "Chaos releases V-Ray 7.4 for Houdini", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/996dfb84eb6a.json"},
+        "835f16e266f6": {"title": "Magic of Lies", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/835f16e266f6.json"},
+        "3532b1ad349f": {"title": "Game-Ready Characters, Creatures & Environments", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3532b1ad349f.json"},
+        "56fa8970dfdd": {"title": "Destiny2 Glacier Grenade Re-Create", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/56fa8970dfdd.json"},
+        "f6208462ba3d": {"title": "The Alters and Frostpunk developer 11 Bit Studios is laying off 20 employees", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f6208462ba3d.json"},
+        "ca035eedb280": {"title": "Games Done Quick apologizes for partnering with Saudi-owned studio SNK", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ca035eedb280.json"},
+        "529069b74b8c": {"title": "'A kick in the teeth:' Game workers protest alleged misconduct at MindsEye developer Build A Rocket Boy", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/529069b74b8c.json"},
+        "aaca2cf3d182": {"title": "5 years ago I was asking this forum how to make sword slash trails in Unity. Now I built a tool for it — and I'd love your feedback", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/aaca2cf3d182.json"},
+        "26c41406365d": {"title": "Assassin's Creed Black Flag Resynced crosses 2 million in sales as studio strikes over proposed layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/26c41406365d.json"},
+        "f00355563ee7": {"title": "Paramount confirms Mike Zaimont is employed by Avatar Legends dev", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f00355563ee7.json"},
+        "df7ddb571b67": {"title": "Compulsion Games posts call for business partners after Xbox spinoff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/df7ddb571b67.json"},
+        "7dc9c00be17e": {"title": "Studio founded by former Star Wars: Galaxy of Heroes GM lays off staff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7dc9c00be17e.json"},
+        "f184cd32686e": {"title": "Spin Master lays off Paw Patrol: The Game devs two days after launch", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f184cd32686e.json"},
+        "29eb17e63b93": {"title": "MatchKit is up. Here's what it is, and what it isn't.", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/29eb17e63b93.json"},
+        "782a63350b52": {"title": "'The entire thing is going to fall apart:' Inside the latest round of mass layoffs at Xbox", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/782a63350b52.json"},
+        "ea38c0f9abad": {"title": "Google open-sources GNM Head, its parametric human head model", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ea38c0f9abad.json"},
+        "eb0605235d45": {"title": "Blender 5.2 LTS is here: discover its 5 key features", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/eb0605235d45.json"},
+        "281717b72e86": {"title": "Open-source material authoring software Material Maker 1.7 is out", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 14 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/281717b72e86.json"},
+        "31ce907c7dc4": {"title": "Esri releases CityEngine 2026", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/31ce907c7dc4.json"},
+        "b4a3cecc7e0a": {"title": "Abstract updates InstaLOD 2026", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 13 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b4a3cecc7e0a.json"},
+        "2b0789e37548": {"title": "Former Epic Games VP appointed Saber Interactive's chief business officer", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2b0789e37548.json"},
+        "a215fdef1734": {"title": "Dead Space co-creator Glen Schofield retires", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a215fdef1734.json"},
+        "904eae074281": {"title": "NYU opens incubator applications for New York City-area devs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/904eae074281.json"},
+        "42f14673199f": {"title": "UK union launches free resource to decode video game writing contracts", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/42f14673199f.json"},
+        "621d1f24267a": {"title": "IWGB Game Workers union forms 'redundancy taskforce' to defend workers' rights", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 15 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/621d1f24267a.json"},
+        "39c9a9abdab6": {"title": "some new ideas", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/39c9a9abdab6.json"},
+        "df932d61e233": {"title": "SideFX just released Houdini 22", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/df932d61e233.json"},
+        "6ffbe4cc63e7": {"title": "🎮 Building an AI Solver for a \"Simple\" Puzzle Game Was Much Harder Than Expected", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6ffbe4cc63e7.json"},
+        "20038d62b138": {"title": "Unions take legal action against Microsoft for allegedly mishandling Xbox layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/20038d62b138.json"},
+        "b48618215020": {"title": "'The goal of design is to efficiently communicate ideas'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b48618215020.json"},
+        "ff9566594f19": {"title": "ZeniMax Online Studios leadership included in Xbox mass layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ff9566594f19.json"},
+        "5ae25d86c996": {"title": "Pokemon Go owner Scopely 'reorganizes' Stumble Guys team", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 16 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5ae25d86c996.json"},
+        "ac024849553a": {"title": "Khronos Group sponsors free glTF importer/exporter for 3ds Max", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ac024849553a.json"},
+        "f154814f5b86": {"title": "Devlog 2026-07-17", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f154814f5b86.json"},
+        "fb31d47783f2": {"title": "Looking for people interested in building an MMO-lite experience for Oblivion Remastered", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fb31d47783f2.json"},
+        "b7df147f254a": {"title": "Steam hardware survey reveals a SHOCKING TRUTH hidden in plain sight", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b7df147f254a.json"},
+        "a523f3bc55fe": {"title": "ZA/UM Studios to lay off up to 32 workers two months after releasing Zero Parades: For Dead Spies", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a523f3bc55fe.json"},
+        "00b313688164": {"title": "Todd Howard says 'the timing is right' for a collaboration with Obsidian", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/00b313688164.json"},
+        "88fb51a31fdb": {"title": "Labor unions challenge Xbox, GameStop CEO says physical game sales are 'irrelevant,' and Glen Schofield retires - Patch Notes #61", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/88fb51a31fdb.json"},
+        "450e084a3657": {"title": "[WIP] Chroniques IA — An AI Game Master RPG platform for persistent campaigns and modular rules, looking for honest feedback", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/450e084a3657.json"},
+        "90a96ff17e22": {"title": "I Need Testers for my Puzzle Game Tile Quest", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 18 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/90a96ff17e22.json"},
+        "3ee0b779faa7": {"title": "Game Developers: Have You Ever Been Treated Like a Corporate Cybersecurity Risk?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 19 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3ee0b779faa7.json"},
+        "aaf337753f4d": {"title": "3Dflow releases 3DF Zephyr 9.0 with 3D Gaussian Splatting", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/aaf337753f4d.json"},
+        "bb694d78f62a": {"title": "The Character DNA MetaHuman add-on for Blender is now free", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 17 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bb694d78f62a.json"},
+        "f9549208c777": {"title": "I'm trying to learn how to make games", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 20 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f9549208c777.json"},
+        "be0a38104b9e": {"title": "Realm of Echoes — real-time browser MMORPG, looking for onboarding and combat feedback", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 20 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/be0a38104b9e.json"},
+        "d73e8aab79de": {"title": "Two thirds of remaining Doom (2016) devs laid off during latest round of Xbox cuts", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 20 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d73e8aab79de.json"},
+        "27e9cbcff71f": {"title": "ArcBrush 1.5 is an interesting $49 node-based image editor", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 20 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/27e9cbcff71f.json"},
+        "e5957c5066d2": {"title": "Dusk Light", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 20 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e5957c5066d2.json"},
+        "9698d5f57237": {"title": "mirinori — Your Game Vision, Brought to Life Through Music", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 20 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9698d5f57237.json"},
+        "523e729ae9c8": {"title": "Netflix says its critically-panned FIFA World Cup video game was a 'top tier' performer", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 20 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/523e729ae9c8.json"},
+        "2a9c5d6f76db": {"title": "Basic Game Engine Design - Easy for Everyone, Let us Simplify Here", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2a9c5d6f76db.json"},
+        "e0c11e4a258f": {"title": "Nintendo says consumers are not legally entitled to tariff refunds", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e0c11e4a258f.json"},
+        "b632fd2a507c": {"title": "Edge of Memories developer Midgar Studio is being liquidated", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b632fd2a507c.json"},
+        "558a0b44a092": {"title": "Unity unveils Unity 7 roadmap with update path that won't break your build", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/558a0b44a092.json"},
+        "2b50921e3200": {"title": "Foundry releases new AI-powered SmartRoto add-on for Nuke", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2b50921e3200.json"},
+        "d5c939f3961b": {"title": "Chaos releases V-Ray 7.4 for Blender", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d5c939f3961b.json"},
+        "fd310671f98d": {"title": "CRM64Pro GDK v0.19.0 Particle effects, 2D lighting and Universal VTT maps", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fd310671f98d.json"},
+        "9b58ad913702": {"title": "A game with no heads up display elements ?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9b58ad913702.json"},
+        "13604cf7783a": {"title": "Former Wreckreation team starts up new studio working on sequel", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/13604cf7783a.json"},
+        "f0ec24e10d94": {"title": "Pentiment director emphasizes the importance of RPG players not controlling everything", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f0ec24e10d94.json"},
+        "eaa26389fe4f": {"title": "What developers can learn from this generation of game criticism", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/eaa26389fe4f.json"},
+        "32d82d6e8383": {"title": "Report: Splitgate dev 1047 games lays off staff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 21 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/32d82d6e8383.json"},
+        "657acba22ad5": {"title": "Making a chat bot play video games.", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/657acba22ad5.json"},
+        "46d8d679d247": {"title": "Alpha Dog Games returns to independence two years after being shuttered by Xbox", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/46d8d679d247.json"},
+        "b26f7a908665": {"title": "Majutori development worklog (example)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b26f7a908665.json"},
+        "af890e677ca2": {"title": "Feedback Requested: Peaceful Alpine Megacity Builder / Exploration Game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/af890e677ca2.json"},
+        "e7c3f53b00c5": {"title": "Graphic Programmer (Shader/VFX)🎮", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e7c3f53b00c5.json"},
+        "cbfa5bcfee64": {"title": "System that allows to make slash effects in 10 seconds", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cbfa5bcfee64.json"},
+        "fdbd149225e1": {"title": "Microsoft launches Xbox backward compatibility for PC", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fdbd149225e1.json"},
+        "4c9a7f9ec9fc": {"title": "A Kinect game that debuted in 2013 has been revived in the year of our lord 2026", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4c9a7f9ec9fc.json"},
+        "9ddbc87787f7": {"title": "Splatoon Raiders started off as a tower defense game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9ddbc87787f7.json"},
+        "c5692cf774bf": {"title": "'Human Fall Flat 2 is cancelled. We are making Human Fall Flat 3:' No Brakes Games founder looks back on a defining decade", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c5692cf774bf.json"},
+        "b71c4c731ebe": {"title": "Hasbro records $56M write down after scrapping 'several' video games", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b71c4c731ebe.json"},
+        "53dc59b40de0": {"title": "Autodesk releases 3ds Max 2026.2 with editable Gaussian Splats", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/53dc59b40de0.json"},
+        "94cb82c197f5": {"title": "Maya 2026.2 lets you train your own AI animation models", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/94cb82c197f5.json"},
+        "77496c2f4223": {"title": "Sisir is a promising new free standalone hair grooming tool", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Wed, 22 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/77496c2f4223.json"},
+        "95c6b1113a45": {"title": "Artificial Intelligence Work in Progress", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/95c6b1113a45.json"},
+        "cfd00ae49e23": {"title": "✨Yo! Pixel artist here 👀", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cfd00ae49e23.json"},
+        "aec0149d8075": {"title": "Inhouse Audio System", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/aec0149d8075.json"},
+        "c70af5b47b99": {"title": "Steam adds wishlist categories and cross-region gifting", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c70af5b47b99.json"},
+        "4f65262f05c7": {"title": "Vermila Studios lays off its staff, studio closure a 'feasible possibility' in coming months", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4f65262f05c7.json"},
+        "2806f0b61133": {"title": "Saudi Arabia's divisive EA buyout approved under EU merger rules", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2806f0b61133.json"},
+        "beb2eac15139": {"title": "Bethesda union slams Xbox for offering the 'bare legal minimum in terms of severance'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/beb2eac15139.json"},
+        "c77f57c07153": {"title": "Maxon releases Redshift 2026.8", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c77f57c07153.json"},
+        "2015a5b8b928": {"title": "Lux Aeterna turned time into a procedural system in The Dinosaurs", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2015a5b8b928.json"},
+        "8a8aaa29a9df": {"title": "Pilgway releases 3DCoat 2026 and 3DCoatTextura 2026", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8a8aaa29a9df.json"},
+        "ca3b48f67185": {"title": "Autodesk releases Arnold 7.5.3", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 23 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ca3b48f67185.json"},
+        "9e6d99fa2a6c": {"title": "Best Free-to-Try Seedance 2.0 Workflow for Stable Game Trailer Shot Tests (Then Scale With API)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9e6d99fa2a6c.json"},
+        "0dd42fb5f9b8": {"title": "Black Flag Resynced beats annual sales expectations in two weeks", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0dd42fb5f9b8.json"},
+        "0136dad2cd12": {"title": "How Jackbox Games navigated the post-pandemic sales slump ft. Mike Bilder", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0136dad2cd12.json"},
+        "9b6e6a20d89e": {"title": "Saudi-led EA buyout receives EU approval, Xbox trials ad-supported game streaming, and Poinpy is eternal - Patch Notes #62", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 24 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9b6e6a20d89e.json"},
+        "3a7d1e8cf633": {"title": "Concept Artist Diaries nº1 - From big companies to indies", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3a7d1e8cf633.json"},
+        "0ad19ae4ba57": {"title": "World Machine ‘Dragontail Peak’ now runs on macOS and Linux", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0ad19ae4ba57.json"},
+        "7f0301739fad": {"title": "Maxon releases Red Giant 2026.5", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 25 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7f0301739fad.json"},
+        "9a27c3df65de": {"title": "Added My Third Hobby Game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9a27c3df65de.json"},
+        "4836aa9f8725": {"title": "Corrupt(?) XACT3 Sound Bank when attaching RPC to streaming sound", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4836aa9f8725.json"},
+        "506ab95c0f20": {"title": "Remake of C64 game Heart of Africa (follow-up to Seven Cities of Gold)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/506ab95c0f20.json"},
+        "de4f2f50ff00": {"title": "Wistoria Magic", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Sun, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/de4f2f50ff00.json"},
+        "bce9579ff2db": {"title": "How do you turn playtester comments into issues you can actually fix?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bce9579ff2db.json"},
+        "ca93aac2ab6b": {"title": "ShapeMeshing: From 2D Animation to Real-Time 3D Effects", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Mon, 27 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ca93aac2ab6b.json"},
+        "973ef4e4aaff": {"title": "SIGGRAPH 2026 Links", "category": "render", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 26 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/973ef4e4aaff.json"},
+        "8b3b758e5afe": {"title": "Atari and Universal to create movies based on classic properties including Asteroids and Missile Command", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8b3b758e5afe.json"},
+        "3df573665923": {"title": "Abstract adds a new 2D painting system to InstaMAT 2026-07", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3df573665923.json"},
+        "98a3723db3b9": {"title": "Autodesk releases Flame 2027.1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/98a3723db3b9.json"},
+        "3873068fc9b7": {"title": "教程: Creating a Charged Energy Beam in 虚幻引擎", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 27 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3873068fc9b7.json"},
+        "08b0efc354b3": {"title": "Engine VI 更新", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 27 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/08b0efc354b3.json"},
+        "12447a00f89f": {"title": "Otoy releases OctaneRender 2027.1 in alpha", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/12447a00f89f.json"},
+        "ce60e7d47e16": {"title": "RandomControl releases Maverick Studio and Maverick Indie 2026.1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ce60e7d47e16.json"},
+        "f1bebffa01ba": {"title": "Custom Shaders for Unit and Target Selection", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f1bebffa01ba.json"},
+        "b06d1735125b": {"title": "Rum Barrel Run – A Small Endless Runner Made with Unity", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b06d1735125b.json"},
+        "fdc114b49ce7": {"title": "'I have been hunted down by HR reps, lawyers, and comms people:' Developers discuss the pain and prevalence of side work clauses", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fdc114b49ce7.json"},
+        "008fff58d88f": {"title": "new portfolio and new project bugged", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/008fff58d88f.json"},
+        "4e3c4809a498": {"title": "Wizards of the Coast president John Hight is stepping down", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4e3c4809a498.json"},
+        "621238aabc21": {"title": "Quest maker Meta is having its cake and eating it", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/621238aabc21.json"},
+        "3f8db0c6eec5": {"title": "Make GameDev.net Yours: Avatars, Badges, and Founding Supporters", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3f8db0c6eec5.json"},
+        "a87fca5967fe": {"title": "I Almost Gave Up on My 2D Game — Until I Found aifps", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a87fca5967fe.json"},
+        "1b43102000c5": {"title": "EA boss awarded $38.6M after year of franchise success, studio layoffs, and GenAI adoption", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1b43102000c5.json"},
+        "d0724c5bfe61": {"title": "Double Fine making layoffs after being jettisoned by Xbox", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d0724c5bfe61.json"},
+        "7ac6f8f9be3f": {"title": "Resident Evil Requiem has sold over 8M units", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7ac6f8f9be3f.json"},
+        "cf90b7d02590": {"title": "Obituary: TaleWorlds Entertainment co-founder İpek Yavuz has passed away", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cf90b7d02590.json"},
+        "f37eeff2c25d": {"title": "Physical Atmosphere² generates insanely detailed Blender skies", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f37eeff2c25d.json"},
+        "8e914b97a31e": {"title": "RTX Render for Character Creator and iClone is now in open beta", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8e914b97a31e.json"},
+        "d49d813c4fbd": {"title": "ASWF and DreamWorks Animation release MoonRay 2026.29", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d49d813c4fbd.json"},
+        "765d7fdaed62": {"title": "Pixar releases RenderMan 27.3", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 28 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/765d7fdaed62.json"},
+        "159e04234dce": {"title": "BG3 Lightning Bolt Sound Redesign", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/159e04234dce.json"},
+        "0b57b1a94966": {"title": "creating a new game looking for ppl \"unpaid for now\"", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0b57b1a94966.json"},
+        "4526b36d23b2": {"title": "Subnautica 2 and PUBG bolster Krafton's Q2 revenue", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4526b36d23b2.json"},
+        "6646570e09dd": {"title": "Tencent-owned Lightspeed LA is laying off staff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6646570e09dd.json"},
+        "ba72ae7e6ed7": {"title": "Epic Games hires former head of Blizzard's Battle.net", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 29 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ba72ae7e6ed7.json"},
+        "965479b761ca": {"title": "Inspector Designer Pro – A visual tool for creating custom Unity inspectors without editor scripting", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/965479b761ca.json"},
+        "8e3e1ac61d3f": {"title": "Xbox hardware revenue fell by $1.7 billion during fiscal 2026", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8e3e1ac61d3f.json"},
+        "4455648acd16": {"title": "Realtime snow with vfx, but not only vfx", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4455648acd16.json"},
+        "b1e089a0a913": {"title": "Narrative Notebook #5: UNBEATABLE's music video vibes can't be beat", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b1e089a0a913.json"},
+        "d7f93537dbcb": {"title": "The truth behind the resurrection of Poinpy", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d7f93537dbcb.json"},
+        "9e8025aeacaf": {"title": "Unity brings dedicated engine support to Netflix Games", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9e8025aeacaf.json"},
+        "4237271422c3": {"title": "If knowledge is power, why are game companies setting it alight?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4237271422c3.json"},
+        "df95a1c72258": {"title": "I made a browser-based Text Effects Editor for game UI, logos, and banners", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 31 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/df95a1c72258.json"},
+        "aabf741a6049": {"title": "VFX Mesh Lab — free Unity editor tool for VFX-ready meshes", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/aabf741a6049.json"},
+        "8e649c538b93": {"title": "Reallusion launches AccuFace 2", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 31 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8e649c538b93.json"},
+        "70e67de8d6b0": {"title": "Check out this free Gaussian Splatting plugin for After Effects", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/70e67de8d6b0.json"},
+        "bea2f4d23ddc": {"title": "Devlog 2026-07-31", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 31 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bea2f4d23ddc.json"},
+        "8c4ba1b1d560": {"title": "I require some help with my Soul Ops Game. (Game where you protect a soul from bosses like ones from undertale AUs)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 31 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8c4ba1b1d560.json"},
+        "9e0b4102f94c": {"title": "EA clears US regulatory approvals in take-private deal", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 31 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9e0b4102f94c.json"},
+        "835d7c44731f": {"title": "Xbox CEO declares priorities after 'reset'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 31 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/835d7c44731f.json"},
+        "c9181347d2ae": {"title": "GDC Side Quest - A Sit-Down With The Indomitable Sam Beart", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 31 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c9181347d2ae.json"},
+        "5dff5d887d9b": {"title": "Double Fine cuts staff, Xbox's revenue decline, and Leon Kennedy pays off - Patch Notes #63", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 31 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5dff5d887d9b.json"},
+        "766287220b3f": {"title": "The Hidden Backdoor to the Gaming World is Open: Join ZypherNews!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 31 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/766287220b3f.json"},
+        "a4114c571057": {"title": "August VFX Sketch[#69]: Colorless", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 30 Ju", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a4114c571057.json"},
+        "335d03b101bc": {"title": "Devlog #2: Planning \"Underground\" (Andrax Studio)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 01 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/335d03b101bc.json"},
+        "d4f0695fc8ed": {"title": "Coreball – a one-button browser timing game, looking for feel feedback", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 01 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d4f0695fc8ed.json"},
+        "740edd78df98": {"title": "Better Graphics and Lower System Requirements in Leadwerks 5.1", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 01 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/740edd78df98.json"},
+        "0d13b7d20176": {"title": "In a turn-based strategy game, how does utility AI take global objectives into account?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 02 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0d13b7d20176.json"},
+        "6152444d7a65": {"title": "Finding What Matters: Smarter News, Research, and Industry Directories", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 02 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6152444d7a65.json"},
+        "e011200ad45a": {"title": "Motion graphics tool Caddis 1.0 puts a node graph in every layer", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 03 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e011200ad45a.json"},
+        "eeabc623f6e3": {"title": "Autodesk open-sources Golaem for Houdini and 虚幻引擎", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 03 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/eeabc623f6e3.json"},
+        "61a1342dadc6": {"title": "The Gnomon Workshop releases Introduction to ZBrush 2026", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 03 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/61a1342dadc6.json"},
+        "65d48619ee19": {"title": "Escape Motions releases Rebelle 8.3", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 01 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/65d48619ee19.json"},
+        "712fa7160dd1": {"title": "Phzical Inst. — 8 browser-based gamer skill tests. Think you're good? Prove it.", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 03 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/712fa7160dd1.json"},
+        "de0517c835f5": {"title": "Niagara粒子系统: Killing particles based on Skeletal Mesh Vertex Color Data", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Mon, 03 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/de0517c835f5.json"},
+        "79733f322de9": {"title": "APHA 0.1", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 03 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/79733f322de9.json"},
+        "bb9cfab9e3de": {"title": "How Silent Hill: Townfall gets deep into its protagonist's headspace", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 03 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bb9cfab9e3de.json"},
+        "11f4bbfd349f": {"title": "Report: FIFA World Cup developer Refactor Games shuttered by Delphi Interactive", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 03 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/11f4bbfd349f.json"},
+        "da34befe78a8": {"title": "Xbox hardware now costs a lot more in the UK and Europe", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 03 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/da34befe78a8.json"},
+        "cf341ad796c9": {"title": "PlayStation 5 sales have topped 95 million units worldwide", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 03 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cf341ad796c9.json"},
+        "bd0a2b037c63": {"title": "Get 60,000+ free 3D assets for Maya, Godot and Rhino", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 04 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bd0a2b037c63.json"},
+        "104cfb51ee35": {"title": "Volinga Plugin Pro lets you relight 4DGS data inside 虚幻引擎", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 04 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/104cfb51ee35.json"},
+        "fe9f85d68447": {"title": "How do you automate repetitive tasks during game development?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 04 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fe9f85d68447.json"},
+        "8dd00b7217bd": {"title": "Strength Buff FX (WIP)", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Tue, 04 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8dd00b7217bd.json"},
+        "0b8a5ef8762b": {"title": "Free open-source 虚幻引擎5 content automation: JSON to DataAssets to live editor updates", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 04 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0b8a5ef8762b.json"},
+        "7ce4997cedc6": {"title": "Xerath 更新d VFX - League of Legends Fan Art", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 04 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7ce4997cedc6.json"},
+        "ebb53a0978e8": {"title": "EA is now owned by Saudi Arabia and Donald Trump's son-in-law", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 04 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ebb53a0978e8.json"},
+        "9968c7819ae0": {"title": "Devs raise $130,000 in just five days to support laid-off peers", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 04 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9968c7819ae0.json"},
+        "d8e7f438f8ba": {"title": "Amid child safety lawsuits, Roblox says it 'continues' to push toward a standard for digital safety", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 04 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d8e7f438f8ba.json"},
+        "e8bccc67cf68": {"title": "Live service revenue dominates in EA's last fiscal report ahead of Saudi deal", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 04 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e8bccc67cf68.json"},
+        "751e906c374d": {"title": "Is BiteTheBytes’ Material Creator the new Substance 3D Designer?", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 05 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/751e906c374d.json"},
+        "e05be53c5eca": {"title": "See EDI’s high-octane VFX breakdown for Motorvalley", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 05 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e05be53c5eca.json"},
+        "56a9240db7dd": {"title": "Climate Game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 05 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/56a9240db7dd.json"},
+        "094a7e2d2738": {"title": "Drag[en]gine 1.33 and DEMoCap 0.9 发布d", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 05 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/094a7e2d2738.json"},
+        "d888c7a4c0b7": {"title": "Mirroring a VR view", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 05 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d888c7a4c0b7.json"},
+        "33d6eac03660": {"title": "Rengifs : Sketch #69", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 05 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/33d6eac03660.json"},
+        "21af1a9c160e": {"title": "Publisher Secret Mode opens development studio to support internal projects", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 05 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/21af1a9c160e.json"},
+        "e31f39495c01": {"title": "Candy Crush maker King has declined staff's collective bargaining agreement", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 05 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e31f39495c01.json"},
+        "fc54526cec30": {"title": "Policymakers across Europe told to do more to support local game industry", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 05 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fc54526cec30.json"},
+        "e140ce2a9c34": {"title": "Coffee Stain bullish despite underperformance of Deep Rock Galactic spinoff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 05 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e140ce2a9c34.json"},
+        "eec04b5ea1f4": {"title": "Surviving Day! Steam 发布 1.0v - Needs Play Testers!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/eec04b5ea1f4.json"},
+        "e75295179f9b": {"title": "Nekki releases Cascadeur 2026.2 with animation layers", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e75295179f9b.json"},
+        "7891b852dd30": {"title": "Armature is a free AI-assisted standalone character rigging tool", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7891b852dd30.json"},
+        "05582a819ad7": {"title": "Adobe releases Photoshop 27.9.1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/05582a819ad7.json"},
+        "f23b5290b3f0": {"title": "See FutureWorks’ VFX breakdown for Indian epic Kantara: Chapter 1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f23b5290b3f0.json"},
+        "418a3d6d5ab8": {"title": "Looking to hire people for dunyZ", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/418a3d6d5ab8.json"},
+        "de0ff23729a3": {"title": "Understanding the manager pattern for an enemy state machine.", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/de0ff23729a3.json"},
+        "d6e0ffcc35d6": {"title": "My first VFX portfolio", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d6e0ffcc35d6.json"},
+        "4eac064b69f1": {"title": "Brais' Sketchbook", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4eac064b69f1.json"},
+        "8321ac206be9": {"title": "Nintendo Switch 2 hardware sales are down 34.4 percent year-on-year", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8321ac206be9.json"},
+        "cda41a7c8a4f": {"title": "Unity sells Supersonic publishing business to Tripledot for $40M", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cda41a7c8a4f.json"},
+        "e7d39a6aa4c0": {"title": "Halo Studios jettisons long-serving contractors after launch of Halo: Campaign Evolved", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e7d39a6aa4c0.json"},
+        "f709764f7f03": {"title": "Rockstar wants you to pay Netflix to watch the next GTA VI trailer before it's released to the masses", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f709764f7f03.json"},
+        "1c7a5dc26b81": {"title": "Devolver wants to delist because indie publishing is not 'compatible' with public trading", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 06 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1c7a5dc26b81.json"},
+        "df5f963e2c46": {"title": "Help with Correct Programming Language and Graphics Library for Non-Editor Focused Game", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Fri, 07 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/df5f963e2c46.json"},
+        "3679998a3912": {"title": "Designing a browser-local word-grid practice game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 07 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3679998a3912.json"},
+        "c555b834f884": {"title": "Pushing the limits in Simulating a City, One Page at a Time", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 07 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c555b834f884.json"},
+        "2ecab344f33c": {"title": "GTA V surpasses 230 million sales months before GTA VI touches down", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 07 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2ecab344f33c.json"},
+        "54bbf59aac92": {"title": "What devs need to know about localization, ft. Concha Fernandez Alvarez, Aurelie Perrin, and Guido Di Carlo", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 07 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/54bbf59aac92.json"},
+        "e93f47068544": {"title": "EA taken private by Saudi Arabia, GTA marketing jumps the shark, and Devolver's huge mistake - Patch Notes #64", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 07 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e93f47068544.json"},
+        "6b5d772bcf8f": {"title": "I Started Making a Dark Fantasy RPG Inspired by Classic RPGs Like DIABLO, BALDUR’S GATE and ARCANUM", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 08 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6b5d772bcf8f.json"},
+        "87d68e160a21": {"title": "VFX Portfolio - PBJayz on Dragon Encounter", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Sat, 08 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/87d68e160a21.json"},
+        "b9e7cd7767a7": {"title": "Dev Log - 8 Major Fixes!", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 08 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b9e7cd7767a7.json"},
+        "6f942147bdd9": {"title": "Combat rework, the West Reach & friends", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 08 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6f942147bdd9.json"},
+        "d59f49d80659": {"title": "Character Stat sheets", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 09 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d59f49d80659.json"},
+        "72f469adbf97": {"title": "Ideas for a survival horror game with dinosaurs.", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 10 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/72f469adbf97.json"},
+        "94e3c3beeb0e": {"title": "GGDB.pro - Good Gamer's Database", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 10 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/94e3c3beeb0e.json"},
+        "fca5943ddac9": {"title": "Any Tips for Development Documentation?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 10 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fca5943ddac9.json"},
+        "551d8295d427": {"title": "The video game site backed by Walmart has laid off its editorial team", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 10 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/551d8295d427.json"},
+        "bc2a5229ac42": {"title": "EVE Online studio hires former Icelandic minister to lead autonomous AI efforts", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 10 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bc2a5229ac42.json"},
+        "01c4d047edd2": {"title": "Unity credits AI advertising platform for driving its 'best quarter ever'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 10 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/01c4d047edd2.json"},
+        "89e6f84f1133": {"title": "Looking for 2D Artist for platformer fantasy game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 11 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/89e6f84f1133.json"},
+        "99c71cd0482e": {"title": "Storm Studios’ VFX breakdown for Daredevil: Born Again S2", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 11 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/99c71cd0482e.json"},
+        "48b1a4f25d3b": {"title": "Autodesk is discontinuing Mudbox, its digital sculpting software", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 10 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/48b1a4f25d3b.json"},
+        "31c49ad1f8c0": {"title": "See Dexter Studios’ VFX breakdown for The WONDERfools", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 10 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/31c49ad1f8c0.json"},
+        "9668053b3deb": {"title": "New CG software you may have missed: 9 August 2026", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 09 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9668053b3deb.json"},
+        "5978c544dadf": {"title": "Free tutorial: Design Mechs in VR Using Substance 3D Modeler", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 09 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5978c544dadf.json"},
+        "4af97a7f478c": {"title": "ecks Framework Announcement", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 11 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4af97a7f478c.json"},
+        "65b75046544a": {"title": "Looking for a Professional music composer for your game?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 11 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/65b75046544a.json"},
+        "06bbd6d35a5b": {"title": "Report: Crossfire dev That's No Moon lays off 14 staff", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 11 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/06bbd6d35a5b.json"},
+        "8b6e60d01505": {"title": "Three indie horror publishers faced sexual harassment claims – what comes next?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 11 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8b6e60d01505.json"},
+        "60496fa2dd05": {"title": "Remedy Entertainment touts pricing Control Resonant 'attractively for an AAA title'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 11 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/60496fa2dd05.json"},
+        "18f357dde933": {"title": "Supermassive Games begins third round of layoffs in three years", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 11 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/18f357dde933.json"},
+        "ac06b3488c69": {"title": "Ukie claims 'restrictive' subscription proposals could harm game businesses in the UK", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 11 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ac06b3488c69.json"},
+        "5c83646bde9a": {"title": "Check out DNEG’s gritty VFX breakdown for Motor City", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5c83646bde9a.json"},
+        "d3eb3af786f5": {"title": "MediaPlane 2.0 puts a nonlinear editor inside Maya", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d3eb3af786f5.json"},
+        "afb87652f2f1": {"title": "'One flag for each laid off dev:' Union workers stage unmissable protest for Xbox boss Asha Sharma", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/afb87652f2f1.json"},
+        "fd52170826de": {"title": "Former Ubisoft Barcelona devs launch Dark Ritual Studios", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 11 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fd52170826de.json"},
+        "ac32380dde01": {"title": "Ephere releases Ornatrix 4 for Cinema 4D", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ac32380dde01.json"},
+        "c947bed9d76b": {"title": "OGame", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c947bed9d76b.json"},
+        "dad3ae7f326d": {"title": "In case you wanna make a game like Wolf3d...", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/dad3ae7f326d.json"},
+        "153ab1c44f7a": {"title": "How would you create this smoke effect?", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/153ab1c44f7a.json"},
+        "cedaca5a17d7": {"title": "Amazon to rescind its publisher role on Lost Ark and Throne and Liberty by early 2027", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cedaca5a17d7.json"},
+        "ba0a356e6c5b": {"title": "Developers expect generative AI to impact roles and team sizes in the next three years", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ba0a356e6c5b.json"},
+        "04f5c1469f06": {"title": "Meccha Chameleon tops 20M sales in two months", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/04f5c1469f06.json"},
+        "8a7e7889fab3": {"title": "Epic Games sells ArtStation and Sketchfab to KitBash", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8a7e7889fab3.json"},
+        "10f605bc2fa7": {"title": "See how Untold Studios created Masters of the Universe titles", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/10f605bc2fa7.json"},
+        "6898d3e15492": {"title": "Robotics Game Idea only have document", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6898d3e15492.json"},
+        "5a17a98856fc": {"title": "Beginner Graphics Programming Study 指南", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5a17a98856fc.json"},
+        "ed07b377c7f9": {"title": "PBJayz: Sketch #69", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 12 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ed07b377c7f9.json"},
+        "58219412e439": {"title": "Can a 3D game be translated into an engine-independent intermediate representation?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/58219412e439.json"},
+        "abfd6d53410c": {"title": "[PAID] Looking for a Unity VFX Artist – Stylized Mobile Tower Defense", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/abfd6d53410c.json"},
+        "57bf3265722c": {"title": "Netflix closing Oxenfree developer Night School Studio and Moonloot Games", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/57bf3265722c.json"},
+        "f01ca759302c": {"title": "2K announces new Vancouver-based AAA studio led by EA veteran", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/f01ca759302c.json"},
+        "15f4683b419f": {"title": "Xsolla rolls out publishing tools to keep players 'engaged' after the first purchase", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/15f4683b419f.json"},
+        "17cb4a389cdc": {"title": "Saber Interactive to add Rideshare 'Stimulator' AI disclosure after public controversy", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/17cb4a389cdc.json"},
+        "7022cc623e63": {"title": "Opinion: Deprofessionalization could foster toxic work environments on small teams", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/7022cc623e63.json"},
+        "d8d4afa77f6c": {"title": "How Dupp Film created a hybrid CG mermaid for Summer of 1985", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 14 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d8d4afa77f6c.json"},
+        "59781d2c259d": {"title": "Marmoset releases Toolbag 5.03", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/59781d2c259d.json"},
+        "28bd932feb24": {"title": "Simple triangle in the browser using WebAssembly, OpenGL ES, C++, and SDL3", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 13 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/28bd932feb24.json"},
+        "77977ef4a586": {"title": "VFX and UI for a spellbook in my game", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Fri, 14 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/77977ef4a586.json"},
+        "bc33e3fbea8e": {"title": "Scabby versus Sharma, Twitch's GenAI admission, and Netflix shutters more studios - Patch Notes #65", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 14 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bc33e3fbea8e.json"},
+        "8bdcf79b2760": {"title": "Auras, Effect Stacking, Resistances & GF/MF/Bonus XP stats", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 15 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/8bdcf79b2760.json"},
+        "5c1d9e335727": {"title": "race car game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 14 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5c1d9e335727.json"},
+        "6c8554b08898": {"title": "Why Great Games Need Great Music (And How the Right Score Changes Everything)", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 15 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6c8554b08898.json"},
+        "e9b04d9247dc": {"title": "Game engine audio -- constraints and best practices", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 15 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/e9b04d9247dc.json"},
+        "50939e436cbe": {"title": "3d physics environment as an alternative approach to creating 3d computer games", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 15 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/50939e436cbe.json"},
+        "4e36033449a0": {"title": "What Kills a Game? Why do game developers do this?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sun, 16 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4e36033449a0.json"},
+        "46d26ddb6e34": {"title": "How to resize images locally before upload without giving up privacy", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 17 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/46d26ddb6e34.json"},
+        "bd6aa1a054f0": {"title": "ALIS 1.0.0: first free playable Windows build — walk a reconstructed real city district", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 17 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/bd6aa1a054f0.json"},
+        "b2196ea78e9d": {"title": "How Forbidden Solitaire brought solitaire games to the forefront", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 17 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b2196ea78e9d.json"},
+        "20387e5a41df": {"title": "Inner Pocket is a new indie publisher looking to champion 'curiosity games'", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 17 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/20387e5a41df.json"},
+        "c06861aeaba8": {"title": "Pokemon Pokopia has topped 5 million sales worldwide", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 17 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c06861aeaba8.json"},
+        "0b26889f4dc1": {"title": "Barbie and Hot Wheels owner Mattel launches Mattel Game Studios", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 17 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0b26889f4dc1.json"},
+        "c80f27b4ecec": {"title": "Stylized Water & Ocean Combat VFX (Work in Progress)", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Tue, 18 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c80f27b4ecec.json"},
+        "33506f6eeabb": {"title": "WINGS really, really wants to fund your neat indie video game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 18 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/33506f6eeabb.json"},
+        "d2bad4bd1acd": {"title": "Check out benuts’ 1980s-tastic VFX breakdown for Police Flash 80", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 18 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d2bad4bd1acd.json"},
+        "5d14a57c3fd3": {"title": "ArtDeck is a new alternative to PureRef that supports video", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 18 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5d14a57c3fd3.json"},
+        "6e1be40e7155": {"title": "See ReDefine’s VFX breakdown of Indian war drama Ikkis", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 17 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/6e1be40e7155.json"},
+        "2c8b870293fa": {"title": "New CG software you may have missed: 16 August 2026", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Mon, 17 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2c8b870293fa.json"},
+        "993cbec99ffb": {"title": "教程: Tracking & Compositing VFX for Film & TV", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 15 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/993cbec99ffb.json"},
+        "a3b8fe70f6a6": {"title": "First Steampunk era preview screenshots", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 18 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a3b8fe70f6a6.json"},
+        "532cd8f6df9c": {"title": "Memory crisis is driving uncertainty over PlayStation 6's launch date", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 18 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/532cd8f6df9c.json"},
+        "cd391fe86e72": {"title": "Deus Ex director Warren Spector is retiring after nearly 45 years in game dev", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 18 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/cd391fe86e72.json"},
+        "aa288af313ce": {"title": "Roblox being investigated by U.S. Senate after reporting 65,381 instances of suspected child abuse in 2025", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 18 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/aa288af313ce.json"},
+        "74a7b8267203": {"title": "Arco tops 100,000 sales in two years and breaks even", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Tue, 18 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/74a7b8267203.json"},
+        "21579644db1f": {"title": "Email notifications", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/21579644db1f.json"},
+        "a66bec1911ca": {"title": "'I feel dirty:' EA workers trapped in a maelstrom of cynicism and doubt after Saudi buyout", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a66bec1911ca.json"},
+        "4a88682b7710": {"title": "Scantic trains 3D Gaussian Splats entirely on your phone", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4a88682b7710.json"},
+        "d80abc189286": {"title": "See how Storm Studios created its VFX for Season 2 of Percy Jackson", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d80abc189286.json"},
+        "92624a16d694": {"title": "CreativeRates tells you how much other people are earning in VFX", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/92624a16d694.json"},
+        "912e52ea2a88": {"title": ".gr2 optimizer radgame tools granny 2.11", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/912e52ea2a88.json"},
+        "c0b4dbb7b7fe": {"title": "How I Choose a Prebuilt Mobile Game Project That Runs Perfectly", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c0b4dbb7b7fe.json"},
+        "38bc8b6d3a03": {"title": "Dark Waters Tornado", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/38bc8b6d3a03.json"},
+        "1466fde08287": {"title": "Harvey Smith and fellow Arkane Austin veterans announce a new studio, Black Pony Immersive", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1466fde08287.json"},
+        "b91a93a3d4a6": {"title": "Triple-A vets and accessibility experts launch new game dev co-op: Raze and Rebuild Studio", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/b91a93a3d4a6.json"},
+        "0ddf4307fb27": {"title": "Report: PlayStation scales back live service ambitions for Horizon Hunters Gathering, reassigns devs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/0ddf4307fb27.json"},
+        "d54779c61476": {"title": "Human: Fall Flat veterans launch new UK studio Pretty Cool Games", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/d54779c61476.json"},
+        "48c5696eb40c": {"title": "First-Pass Tests for an AI-Generated 3D Level in Unity: Reachability, Collisions, and Performance", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/48c5696eb40c.json"},
+        "2ef5231322dc": {"title": "What if different game studios built their own solar systems in one shared game?", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Wed, 19 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2ef5231322dc.json"},
+        "ede8b4b9e2a4": {"title": "Ground Energy Pulse", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 20 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/ede8b4b9e2a4.json"},
+        "c734cb941cc0": {"title": "New 虚幻引擎 Stylized Water VFX Course", "category": "ue", "tags": ["虚幻引擎5", "渲染优化", "游戏开发"], "date": "Thu, 20 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/c734cb941cc0.json"},
+        "586cd7ae752b": {"title": "See how Vine FX created 150 VFX shots for Enola Holmes 3", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 20 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/586cd7ae752b.json"},
+        "4848b8a0c2f7": {"title": "Version 0.0.1", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 20 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/4848b8a0c2f7.json"},
+        "fa0078f1dc55": {"title": "how do i turn a fun game loop to a Complete commercial game", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 20 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/fa0078f1dc55.json"},
+        "575997f148e5": {"title": "NixieFX, a browser-based particle editor for Three.js and PixiJS", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 20 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/575997f148e5.json"},
+        "a35d54b3efe0": {"title": "Makers Fund expands game industry footprint through $250 million investment round", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 20 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/a35d54b3efe0.json"},
+        "327eeb4aa34f": {"title": "Hundreds of union workers rally across North America to protest Xbox layoffs", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Thu, 20 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/327eeb4aa34f.json"},
+        "32ee1fd6327a": {"title": "[Unpaid/Portfolio] Looking for a Real-Time VFX Artist for a Stylized Indie Game (Unity)", "category": "ta-render", "tags": ["视觉特效", "渲染优化", "实时渲染"], "date": "Thu, 20 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/32ee1fd6327a.json"},
+        "75d4f7576e80": {"title": "See VFX breakdowns for Season 3 of Foundation in one place", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 21 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/75d4f7576e80.json"},
+        "2cdc6abcba38": {"title": "Foundry releases Nuke 17.1", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 21 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2cdc6abcba38.json"},
+        "1612948a5f1a": {"title": "Playgama releases Wrap, completing its infrastructure for scaling games on standalone websites", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 21 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/1612948a5f1a.json"},
+        "430454517890": {"title": "Take-Two subpoenas Microsoft and Discord in bid to halt extensive Grand Theft Auto VI leak", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 21 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/430454517890.json"},
+        "2eed53142708": {"title": "We're finally talking about AI, ft. David 'Rez' Graham and Luke Dicken", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 21 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/2eed53142708.json"},
+        "9d0b9862c86f": {"title": "EA staff worries over Saudi buyout, Grand Theft Auto 6 leaks, and Peak's last major update - Patch Notes #66", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Fri, 21 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/9d0b9862c86f.json"},
+        "3daf5d314a55": {"title": "Data-Driven Cameras", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 22 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/3daf5d314a55.json"},
+        "67e1025506d0": {"title": "Master Cinematic Matte Painting for Production", "category": "ta", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 22 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/67e1025506d0.json"},
+        "5e1850cb2fbb": {"title": "Fully modeled backrooms game with actuall lore", "category": "multiplat", "tags": ["技术美术", "Shader开发", "材质系统"], "date": "Sat, 22 Au", "readTime": "5分钟", "layout": "v1", "contentPath": "kb-content/5e1850cb2fbb.json"}
+    }
+};
@@ -0,0 +1,16 @@
+// 文章正文渲染 - 由 scripts/article_renderer.py 生成
+const kbRenderData = {"layouts": {"v1": {"literals": ["<div class=\"article-content\">\n    <div class=\"flex flex-wrap items-center gap-3 mb-6\">\n        <span class=\"", " px-3 py-1 rounded-full text-sm\">", "</span>\n        <span class=\"text-gray-500\">", "</span>\n        <span class=\"text-gray-500\">•</span>\n        <span class=\"text-gray-500\">", "</span>\n    </div>\n    <h1>", "</h1>\n    <p class=\"text-xl text-gray-300 mb-6\">", "</p>\n    <div class=\"source-box\">\n        <div class=\"flex items-center gap-2 mb-2\">\n            <svg class=\"w-4 h-4 text-neon-amber\" fill=\"none\" stroke=\"currentColor\" viewBox=\"0 0 24 24\">\n                <path stroke-linecap=\"round\" stroke-linejoin=\"round\" stroke-width=\"2\" d=\"M13.828 10.172a4 4 0 00-5.656 0l-4 4a4 4 0 105.656 5.656l1.102-1.101m-.758-4.899a4 4 0 005.656 0l4-4a4 4 0 00-5.656-5.656l-1.1 1.1\"></path>\n            </svg>\n            <span class=\"text-neon-amber font-medium\">原文链接</span>\n        </div>\n        <div class=\"text-sm text-gray-400\">\n            <div>• <a href=\"", "\" target=\"_blank\" class=\"text-neon-blue hover:underline\">", " - 查看完整原文</a></div>\n        </div>\n    </div>\n    <div class=\"tech-analysis-box\" style=\"border-color: ", "40;\">\n        <div class=\"flex items-center gap-2 mb-4\">\n            <span class=\"text-lg font-semibold\" style=\"color: ", "\">🔬 技术分析</span>\n        </div>\n        <p class=\"mb-0 text-gray-300 leading-relaxed\">", "</p>\n    </div>\n    <h2>🎯 核心技术点</h2>\n    <div class=\"flex flex-wrap gap-2 mb-6\">", "</div>\n    <div class=\"bg-dark-700/50 rounded-xl p-6 mt-8 border-l-4\" style=\"border-color: ", "\">\n        <p class=\"mb-0 text-gray-400\">\n            <strong style=\"color: ", "\">💡 提示:</strong> \n            本文为自动抓取生成的中文摘要。如需完整技术细节，请点击上方原文链接。\n        </p>\n    </div>\n</div>"], "fields": ["tag_class", "category_name", "published", "audience", "title", "summary", "link", "source", "color", "color", "analysis", "tech_tags", "color", "color"], "defaults": {"title": "title", "technologies": "tags", "published": "date"}, "lists": {"tech_tags": ["tech_tag", "technologies"]}}}, "themes": {"ue": {"name": "Unreal Engine", "color": "#00f0ff"}, "ta": {"name": "技术美术", "color": "#b026ff"}, "render": {"name": "实时渲染", "color": "#ffbe0b"}, "ta-render": {"name": "TA渲染专栏", "color": "#00ff88"}, "ai": {"name": "AI技术", "color": "#ff006e"}, "vfx": {"name": "特效专栏", "color": "#ff6600"}, "multiplat": {"name": "多端开发", "color": "#00ccff"}}, "items": {"tech_tag": "<span class=\"{tag_class} px-3 py-1 rounded-full text-sm\">{text}</span>"}};
+function kbRenderItems(kind, items, tagClass) { if (!items || !items.length) return ''; const [before, after] = kbRenderData.items[kind].replace('{tag_class}', tagClass).split('{text}'); return before + items.join(after + before) + after; }
+function kbRenderContent(a) {
+    if (a.content || !a.layout) return a.content || '';
+    const data = kbRenderData.layouts[a.layout];
+    const values = {};
+    for (const [field, key] of Object.entries(data.defaults)) values[field] = a[key];
+    Object.assign(values, a.fields);
+    const theme = kbRenderData.themes[values.theme || a.category] || kbRenderData.themes.ta;
+    Object.assign(values, { tag_class: 'tag-' + a.category, category_name: theme.name, color: theme.color });
+    for (const [slot, [kind, name]] of Object.entries(data.lists)) values[slot] = kbRenderItems(kind, values[name], values.tag_class);
+    let html = data.literals[0];
+    data.fields.forEach((field, i) => { html += values[field] + data.literals[i + 1]; });
+    return html;
+}
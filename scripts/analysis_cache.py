@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+文章分析缓存 (内容寻址)
+- 键 = sha256(标题, 摘要, 分类, 生成器版本)，同一篇文章再次分析时直接返回缓存的 JSON
+- 生成器版本: 本地模板用 auto_fetch_enhanced.ANALYSIS_TEMPLATE_VERSION，
+  Kimi 用提示词模板和模型名的哈希 (kimi_client.PROMPT_VERSION)，改提示词后旧缓存自动失效
+- 按最近使用顺序保存，超过 max_entries 时淘汰最久未用的条目 (LRU)
+- 保存在 data/analysis_cache.json
+
+用法:
+    python3 scripts/analysis_cache.py stats
+    python3 scripts/analysis_cache.py clear
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+WORKSPACE = "."
+ANALYSIS_CACHE_FILE = f"{WORKSPACE}/data/analysis_cache.json"
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def analysis_key(article, version):
+    """计算缓存键，字段之间用 \\0 分隔避免拼接歧义"""
+    parts = (article.get('title', ''), article.get('summary', ''), article.get('category', ''), version)
+    return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+class AnalysisCache:
+    """分析结果的 LRU 缓存，线程安全"""
+
+    def __init__(self, path=ANALYSIS_CACHE_FILE, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> {"backend", "version", "analysis"}，顺序即最近使用顺序（末尾最新）
+        self.entries = OrderedDict()
+        self.run_stats = {"hits": 0, "misses": 0}
+        self.dirty = False
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries.update(json.load(f).get("entries", {}))
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"  ⚠️ 分析缓存损坏，重新开始: {e}")
+
+    def get(self, article, version):
+        key = analysis_key(article, version)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.run_stats["misses"] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.run_stats["hits"] += 1
+            self.dirty = True
+            return entry["analysis"]
+
+    def put(self, article, backend, version, analysis):
+        key = analysis_key(article, version)
+        with self._lock:
+            self.entries[key] = {"backend": backend, "version": version, "analysis": analysis}
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self.dirty = True
+
+    def invalidate(self, backend, current_version):
+        """删除该后端旧版本的条目，返回删除数量"""
+        with self._lock:
+            stale = [k for k, e in self.entries.items()
+                     if e["backend"] == backend and e["version"] != current_version]
+            for key in stale:
+                del self.entries[key]
+            if stale:
+                self.dirty = True
+        return len(stale)
+
+    def cached(self, backend, version, generate):
+        """包装单篇生成函数 generate(article)，先查缓存，未命中时生成并写入"""
+        def wrapper(article):
+            analysis = self.get(article, version)
+            if analysis is None:
+                analysis = generate(article)
+                if analysis is not None:
+                    self.put(article, backend, version, analysis)
+            return analysis
+        return wrapper
+
+    def save(self):
+        with self._lock:
+            if not self.dirty:
+                return
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({"entries": self.entries}, f, ensure_ascii=False, separators=(',', ':'))
+            self.dirty = False
+
+    def summary(self):
+        hits, misses = self.run_stats["hits"], self.run_stats["misses"]
+        total = hits + misses
+        rate = hits / total * 100 if total else 0
+        return f"分析缓存命中 {hits} / 未命中 {misses} (命中率 {rate:.0f}%), 共 {len(self.entries)} 条"
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    cache = AnalysisCache()
+    if command == 'stats':
+        by_version = {}
+        for entry in cache.entries.values():
+            name = f"{entry['backend']} {entry['version']}"
+            by_version[name] = by_version.get(name, 0) + 1
+        print(f"📦 {cache.path}: {len(cache.entries)} 条 (上限 {cache.max_entries})")
+        for name, count in sorted(by_version.items()):
+            print(f"  {name}: {count}")
+    elif command == 'clear':
+        cache.entries.clear()
+        cache.dirty = True
+        cache.save()
+        print("✅ 分析缓存已清空")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+文章正文HTML渲染（V1 / V1.5 / V2 三种版式共用一个渲染器）
+- 模板在导入时编译成 f-string 渲染函数（{name} 为字段），渲染一篇文章就是一次函数调用
+- 分类相关的部分（标签 class、分类名、主题色）按 (版式, 分类) 预先填入模板并缓存，
+  每篇文章只填自己的字段
+- 原文链接图标、技术分析框、提示框等公共片段只定义一次，各版式拼装使用
+
+版式:
+    v1    自动抓取的摘要文章 (auto_fetch*.py)
+    v1.5  工具发布简要总结 (archive_tools.simplify_to_v15)
+    v2    深度分析文章：多条参考资源 + 自定义正文段落 (update_complete.py 等)
+
+结构化记录:
+    V1 文章在知识库中只存 layout + fields（摘要、分析、技术点、原文链接等），不存整段 content，
+    公共的HTML外壳由模板渲染：构建时渲染搜索索引，浏览器端由 render_js() 生成的 kbRenderContent() 渲染。
+    与记录元数据重复的字段 (title / tags / date) 不再存第二份，见 RECORD_DEFAULTS。
+
+用法:
+    html = render_article('v1', 'ue', title=..., summary=..., ...)
+    pages = render_many([('v1', 'ue', fields), ...])
+    record = structure_record(article)    # content → layout + fields，无法无损还原时返回 None
+    html = render_record(record)
+    pages = render_records([文章JSON原文, ...], jobs=8)    # 多进程批量渲染，结果与逐篇渲染逐字节相同
+    python3 scripts/article_renderer.py bench [数量] [--jobs N]    # 批量渲染耗时（串行 / 多进程）
+    python3 scripts/article_renderer.py js              # 输出浏览器端渲染脚本
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+CATEGORY_CONFIG = {
+    "ue": {"name": "Unreal Engine", "color": "#00f0ff"},
+    "ta": {"name": "技术美术", "color": "#b026ff"},
+    "render": {"name": "实时渲染", "color": "#ffbe0b"},
+    "ta-render": {"name": "TA渲染专栏", "color": "#00ff88"},
+    "ai": {"name": "AI技术", "color": "#ff006e"},
+    "vfx": {"name": "特效专栏", "color": "#ff6600"},
+    "multiplat": {"name": "多端开发", "color": "#00ccff"}
+}
+
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+
+class Template:
+    """
+    预编译模板，字段名为 {name}。
+    编译时生成一个 f-string 渲染函数：字面量作为函数的默认参数（局部变量），字段从 values 字典取，
+    渲染一篇文章只是一次函数调用，与手写 f-string 速度相同。
+    """
+
+    def __init__(self, text, _parts=None):
+        parts = _parts or _PLACEHOLDER.split(text)
+        self.literals = parts[0::2]
+        self.fields = parts[1::2]
+        self.render = self._compile()
+
+    def _compile(self):
+        names = {f"_l{i}": literal for i, literal in enumerate(self.literals)}
+        body = ''.join(f'{{_l{i}}}{{values["{name}"]}}' for i, name in enumerate(self.fields))
+        body += f'{{_l{len(self.fields)}}}'
+        params = ''.join(f", {name}={name}" for name in names)
+        namespace = dict(names)
+        exec(f"def render(values{params}):\n    return f'{body}'\n", namespace)
+        return namespace['render']
+
+    def bind(self, **values):
+        """固定部分字段，返回新模板（相邻字面量合并）"""
+        parts = [self.literals[0]]
+        for name, literal in zip(self.fields, self.literals[1:]):
+            if name in values:
+                parts[-1] += str(values[name]) + literal
+            else:
+                parts += [name, literal]
+        return Template(None, parts)
+
+
+# ---------- 公共片段 ----------
+
+LINK_ICON = '''<svg class="w-4 h-4 text-neon-amber" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13.828 10.172a4 4 0 00-5.656 0l-4 4a4 4 0 105.656 5.656l1.102-1.101m-.758-4.899a4 4 0 005.656 0l4-4a4 4 0 00-5.656-5.656l-1.1 1.1"></path>
+            </svg>'''
+
+SOURCE_BOX = '''    <div class="source-box">
+        <div class="flex items-center gap-2 mb-2">
+            ''' + LINK_ICON + '''
+            <span class="text-neon-amber font-medium">{source_label}</span>
+        </div>
+        <div class="text-sm text-gray-400">
+{source_items}        </div>
+    </div>
+'''
+
+ANALYSIS_BOX = '''    <div class="tech-analysis-box" style="border-color: {color}40;">
+        <div class="flex items-center gap-2 mb-4">
+            <span class="text-lg font-semibold" style="color: {color}">{analysis_title}</span>
+        </div>
+        <p class="mb-0 text-gray-300 leading-relaxed">{analysis}</p>
+    </div>
+'''
+
+TIP_BOX = '''    <div class="bg-dark-700/50 rounded-xl p-6 mt-8 border-l-4" style="border-color: {color}">
+        <p class="mb-0 text-gray-400">
+            <strong style="color: {color}">💡 提示:</strong> 
+            {tip}
+        </p>
+    </div>
+'''
+
+LINK_ITEM = '            <div>• <a href="{url}" target="_blank" class="text-neon-blue hover:underline">{text}</a></div>\n'
+
+# 列表项模板，{text} 为每一项的内容
+ITEM_TEMPLATES = {
+    'tech_tag': '<span class="{tag_class} px-3 py-1 rounded-full text-sm">{text}</span>',
+    'reference': '            <div>• {text}</div>\n',
+    'key_point': '<li>• {text}</li>',
+}
+
+# ---------- 版式 ----------
+
+V1 = '''<div class="article-content">
+    <div class="flex flex-wrap items-center gap-3 mb-6">
+        <span class="{tag_class} px-3 py-1 rounded-full text-sm">{category_name}</span>
+        <span class="text-gray-500">{published}</span>
+        <span class="text-gray-500">•</span>
+        <span class="text-gray-500">{audience}</span>
+    </div>
+    <h1>{title}</h1>
+    <p class="text-xl text-gray-300 mb-6">{summary}</p>
+''' + SOURCE_BOX.replace('{source_label}', '原文链接').replace(
+    '{source_items}', LINK_ITEM.replace('{url}', '{link}').replace('{text}', '{source} - 查看完整原文')
+) + ANALYSIS_BOX.replace('{analysis_title}', '🔬 技术分析') + '''    <h2>🎯 核心技术点</h2>
+    <div class="flex flex-wrap gap-2 mb-6">{tech_tags}</div>
+''' + TIP_BOX.replace('{tip}', '本文为自动抓取生成的中文摘要。如需完整技术细节，请点击上方原文链接。') + '</div>'
+
+V15 = '''<div class="article-content">
+    <div class="flex flex-wrap items-center gap-3 mb-6">
+        <span class="{tag_class} px-3 py-1 rounded-full text-sm">{badge}</span>
+        <span class="text-gray-500">{date}</span>
+        <span class="text-gray-500">•</span>
+        <span class="text-gray-500">{read_time}阅读</span>
+        <span class="text-gray-500">•</span>
+        <span class="text-gray-500">{difficulty}</span>
+    </div>
+
+    <h1>{title}</h1>
+
+    <p class="text-xl text-gray-300 mb-6 leading-relaxed">
+        {summary}
+    </p>
+
+    <div class="glass-card rounded-xl p-6 mb-6 border-l-4 border-blue-500">
+        <h3 class="text-lg font-semibold text-blue-400 mb-3">核心要点</h3>
+        <ul class="space-y-2 text-gray-300">
+            {key_points}
+        </ul>
+    </div>
+
+    <div class="bg-dark-700/30 rounded-lg p-4 my-4">
+        <p class="text-sm text-gray-400">
+            <strong>注：</strong>本文为工具发布简要总结（V1.5格式）。如需深度技术解析，请参考官方文档或查看相关技术指南。
+        </p>
+    </div>
+
+    <footer class="text-center text-gray-500 text-sm mt-12 pt-8 border-t border-slate-800">
+        <p>Realtime Tech Library • V1.5 工具发布摘要</p>
+        <p class="mt-2">最后更新: {updated}</p>
+    </footer>
+</div>'''
+
+V2 = '''<div class="article-content">
+    <div class="flex flex-wrap items-center gap-3 mb-6">
+        <span class="{tag_class} px-3 py-1 rounded-full text-sm">{badge}</span>
+        <span class="text-gray-500">{date}</span>
+        <span class="text-gray-500">•</span>
+        <span class="text-gray-500">{read_time}阅读</span>
+        <span class="text-gray-500">•</span>
+        <span class="text-gray-500">{difficulty}</span>
+    </div>
+    <h1>{title}</h1>
+    <p class="text-xl text-gray-300 mb-6">{summary}</p>
+{source_box}''' + ANALYSIS_BOX + '''{sections}{tip_box}</div>'''
+
+SOURCE_BOX_TEMPLATE = Template(SOURCE_BOX)
+LINK_ITEM_TEMPLATE = Template(LINK_ITEM)
+TIP_BOX_TEMPLATE = Template(TIP_BOX)
+
+LAYOUTS = {
+    'v1': Template(V1),
+    'v1.5': Template(V15),
+    'v2': Template(V2),
+}
+
+
+@lru_cache(maxsize=None)
+def category_fields(category, theme=None):
+    """
+    分类相关的固定字段。标签 class 总是 tag-<分类>；分类名和主题色取 theme（默认同分类），
+    未知的按 ta 处理（早期 auto_fetch.py 生成的 multiplat 文章就是这样渲染的）
+    """
+    config = CATEGORY_CONFIG.get(theme or category, CATEGORY_CONFIG['ta'])
+    return {'tag_class': f"tag-{category}", 'category_name': config['name'], 'color': config['color']}
+
+
+@lru_cache(maxsize=None)
+def layout_template(layout, category, theme=None):
+    """(版式, 分类, 主题) 对应的模板，分类字段已填入"""
+    return LAYOUTS[layout].bind(**category_fields(category, theme))
+
+
+@lru_cache(maxsize=None)
+def _item_affixes(kind, category):
+    """列表项模板在 {text} 前后的固定部分"""
+    before, _, after = ITEM_TEMPLATES[kind].replace('{tag_class}', category_fields(category)['tag_class']).partition('{text}')
+    return before, after
+
+
+def render_items(kind, items, category='ta'):
+    """渲染列表片段：tech_tag / key_point / reference，items 为字符串列表"""
+    if not items:
+        return ''
+    before, after = _item_affixes(kind, category)
+    return before + (after + before).join(items) + after
+
+
+def render_source_box(references, label='参考资源'):
+    """references: [(文字, 链接或None)]，为空时返回空字符串"""
+    if not references:
+        return ''
+    items = ''.join(LINK_ITEM_TEMPLATE.render({'text': text, 'url': url}) if url else render_items('reference', [text])
+                    for text, url in references)
+    return SOURCE_BOX_TEMPLATE.render({'source_label': label, 'source_items': items})
+
+
+def _prepare(layout, category, fields):
+    """把列表类字段渲染成HTML片段，补齐可选字段"""
+    values = dict(fields)
+    if layout == 'v1':
+        values['tech_tags'] = render_items('tech_tag', fields['technologies'], category)
+    elif layout == 'v1.5':
+        values['key_points'] = render_items('key_point', fields['key_points'])
+        values.setdefault('badge', '工具发布')
+        values.setdefault('read_time', '5分钟')
+        values.setdefault('difficulty', '简单')
+    elif layout == 'v2':
+        values.setdefault('badge', category_fields(category, fields.get('theme'))['category_name'])
+        values.setdefault('analysis_title', '🔬 技术分析')
+        values.setdefault('sections', '')
+        values['source_box'] = render_source_box(fields.get('references'), fields.get('source_label', '参考资源'))
+        tip = fields.get('tip')
+        color = category_fields(category, fields.get('theme'))['color']
+        values['tip_box'] = TIP_BOX_TEMPLATE.render({'color': color, 'tip': tip}) if tip else ''
+    return values
+
+
+def render_article(layout, category, **fields):
+    """渲染一篇文章的正文HTML；fields 中的 theme 可指定与分类不同的配色"""
+    return layout_template(layout, category, fields.get('theme')).render(_prepare(layout, category, fields))
+
+
+def render_many(items):
+    """批量渲染 [(版式, 分类, 字段字典)]，返回HTML列表"""
+    return [layout_template(layout, category, fields.get('theme')).render(_prepare(layout, category, fields))
+            for layout, category, fields in items]
+
+
+# ---------- 结构化记录 ----------
+
+# 可以存成结构化记录的版式
+STRUCTURED_LAYOUTS = ('v1',)
+
+# 字段缺省时取记录上的哪个键
+RECORD_DEFAULTS = {
+    'v1': {'title': 'title', 'technologies': 'tags', 'published': 'date'},
+}
+
+# 列表类字段：模板中的片段字段 → (列表项类型, 字段名)
+LIST_FIELDS = {
+    'v1': {'tech_tags': ('tech_tag', 'technologies')},
+}
+
+
+def record_fields(article):
+    """结构化记录的完整字段（补上从记录元数据取的缺省值）"""
+    fields = dict(article['fields'])
+    for field, key in RECORD_DEFAULTS.get(article['layout'], {}).items():
+        if field not in fields:
+            fields[field] = article.get(key)
+    return fields
+
+
+def render_record(article):
+    """
+    文章记录的正文HTML：有 content 直接返回（手工脚本改过正文的记录以 content 为准），
+    结构化记录按 layout + fields 渲染
+    """
+    if article.get('content') or 'layout' not in article:
+        return article.get('content', '')
+    return render_article(article['layout'], article.get('category', 'ta'), **record_fields(article))
+
+
+def make_record(article, layout, **fields):
+    """
+    生成结构化记录：article 为不含正文的记录 (title/category/tags/date/...)，
+    fields 为版式字段；与记录元数据相同的字段不重复存储。
+    """
+    defaults = RECORD_DEFAULTS.get(layout, {})
+    stored = {name: value for name, value in fields.items()
+              if not (name in defaults and article.get(defaults[name]) == value)}
+    return dict(article, layout=layout, fields=stored)
+
+
+@lru_cache(maxsize=None)
+def _content_pattern(layout, category, theme):
+    """把模板的字面量转义、字段换成命名分组，用于从正文反解字段"""
+    template = layout_template(layout, category, theme)
+    pattern = re.escape(template.literals[0])
+    for name, literal in zip(template.fields, template.literals[1:]):
+        pattern += f"(?P<{name}>.*?)" + re.escape(literal)
+    return re.compile(pattern, re.DOTALL)
+
+
+def _split_items(kind, html, category):
+    """render_items() 的逆操作，格式不符时返回 None"""
+    if not html:
+        return []
+    before, after = _item_affixes(kind, category)
+    if not (html.startswith(before) and html.endswith(after)):
+        return None
+    return html[len(before):len(html) - len(after)].split(after + before)
+
+
+def structure_record(article):
+    """
+    把带 content 的记录转成结构化记录。只有重新渲染与原 content 逐字节相同时才转换，否则返回 None。
+    依次尝试分类本身的配色和 ta 配色（早期 multiplat 文章用的是 ta 的分类名和颜色）。
+    """
+    content = article.get('content')
+    category = article.get('category', 'ta')
+    if not content or 'layout' in article:
+        return None
+    meta = {key: value for key, value in article.items() if key != 'content'}
+    for layout in STRUCTURED_LAYOUTS:
+        for theme in (None, 'ta'):
+            match = _content_pattern(layout, category, theme).fullmatch(content)
+            if not match:
+                continue
+            fields = match.groupdict()
+            for slot, (kind, name) in LIST_FIELDS.get(layout, {}).items():
+                fields[name] = _split_items(kind, fields.pop(slot), category)
+            if any(value is None for value in fields.values()):
+                continue
+            if theme and CATEGORY_CONFIG.get(category) != CATEGORY_CONFIG[theme]:
+                fields['theme'] = theme
+            record = make_record(meta, layout, **fields)
+            if render_record(record) == content:
+                return record
+    return None
+
+
+# ---------- 多进程批量渲染 ----------
+
+# 每个任务渲染的文章数：太小进程间通信开销占比高，太大核数多时负载不均
+RENDER_CHUNK = 500
+# 没有指定 jobs 时，少于这么多篇直接在当前进程渲染（启动进程池要几十毫秒，1000 篇 V1 串行渲染约 15ms）
+PARALLEL_MIN = 1000
+
+
+def _render_chunk(raws):
+    """子进程中渲染一块文章：传入/传出的都是字符串，解析JSON也在子进程中完成"""
+    return [render_record(json.loads(raw)) for raw in raws]
+
+
+def render_records(raws, jobs=None, chunk_size=RENDER_CHUNK):
+    """
+    批量渲染文章正文，raws 为文章JSON原文列表（如 KnowledgeBaseStore.iter_raw() 的值），
+    返回与 raws 一一对应的HTML列表。
+    按 chunk_size 分块交给进程池，结果按原顺序合并，与串行渲染逐字节相同；
+    指定 jobs 时总是按 jobs 个进程渲染（jobs <= 1 串行），每个进程至少分到一块；
+    不指定时文章数达到 PARALLEL_MIN 才按CPU核数多进程渲染。
+    """
+    raws = list(raws)
+    if jobs is None:
+        jobs = (os.cpu_count() or 1) if len(raws) >= PARALLEL_MIN else 1
+    if jobs <= 1 or len(raws) < 2:
+        return _render_chunk(raws)
+    chunk_size = max(1, min(chunk_size, -(-len(raws) // jobs)))
+    chunks = [raws[i:i + chunk_size] for i in range(0, len(raws), chunk_size)]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+        return [html for pages in pool.map(_render_chunk, chunks) for html in pages]
+
+
+# ---------- 浏览器端渲染 ----------
+
+RENDER_JS_TAIL = '''function kbRenderItems(kind, items, tagClass) { if (!items || !items.length) return ''; const [before, after] = kbRenderData.items[kind].replace('{tag_class}', tagClass).split('{text}'); return before + items.join(after + before) + after; }
+function kbRenderContent(a) {
+    if (a.content || !a.layout) return a.content || '';
+    const data = kbRenderData.layouts[a.layout];
+    const values = {};
+    for (const [field, key] of Object.entries(data.defaults)) values[field] = a[key];
+    Object.assign(values, a.fields);
+    const theme = kbRenderData.themes[values.theme || a.category] || kbRenderData.themes.ta;
+    Object.assign(values, { tag_class: 'tag-' + a.category, category_name: theme.name, color: theme.color });
+    for (const [slot, [kind, name]] of Object.entries(data.lists)) values[slot] = kbRenderItems(kind, values[name], values.tag_class);
+    let html = data.literals[0];
+    data.fields.forEach((field, i) => { html += values[field] + data.literals[i + 1]; });
+    return html;
+}
+'''
+
+
+def render_js():
+    """浏览器端渲染脚本：模板字面量和分类配置由本模块导出，公共HTML只在脚本里出现一次"""
+    kinds = sorted({kind for spec in LIST_FIELDS.values() for kind, _ in spec.values()})
+    data = {
+        'layouts': {layout: {'literals': LAYOUTS[layout].literals, 'fields': LAYOUTS[layout].fields,
+                             'defaults': RECORD_DEFAULTS.get(layout, {}),
+                             'lists': {slot: list(spec) for slot, spec in LIST_FIELDS.get(layout, {}).items()}}
+                    for layout in STRUCTURED_LAYOUTS},
+        'themes': CATEGORY_CONFIG,
+        'items': {kind: ITEM_TEMPLATES[kind] for kind in kinds},
+    }
+    return (f"// 文章正文渲染 - 由 scripts/article_renderer.py 生成\n"
+            f"const kbRenderData = {json.dumps(data, ensure_ascii=False)};\n" + RENDER_JS_TAIL)
+
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == 'js':
+        sys.stdout.write(render_js())
+        return
+    if len(sys.argv) < 2 or sys.argv[1] != 'bench':
+        print(__doc__)
+        sys.exit(1)
+    args = sys.argv[2:]
+    jobs = int(args[args.index('--jobs') + 1]) if '--jobs' in args else os.cpu_count() or 1
+    positional = [arg for i, arg in enumerate(args) if arg != '--jobs' and (i == 0 or args[i - 1] != '--jobs')]
+    count = int(positional[0]) if positional else 100000
+
+    categories = list(CATEGORY_CONFIG)
+    items = []
+    for i in range(count):
+        fields = {
+            'title': f"文章 {i}", 'summary': "摘要" * 40, 'analysis': "分析" * 80,
+            'technologies': ["Nanite", "Lumen", "Niagara"], 'link': f"https://example.com/{i}",
+            'source': "80 Level", 'published': "2026-03-01", 'audience': "技术美术师",
+        }
+        items.append(('v1', categories[i % len(categories)], fields))
+
+    start = time.perf_counter()
+    pages = render_many(items)
+    elapsed = time.perf_counter() - start
+    size = sum(len(page) for page in pages)
+    print(f"✅ 渲染 {count} 篇 V1 文章: {elapsed:.2f}s ({count / elapsed:,.0f} 篇/秒, {size / 1024 / 1024:.1f} MB)")
+
+    # 结构化记录：串行 vs 多进程
+    raws = [json.dumps(make_record({'title': fields['title'], 'category': category, 'tags': fields['technologies'],
+                                    'date': fields['published']}, layout, **fields), ensure_ascii=False)
+            for layout, category, fields in items]
+    start = time.perf_counter()
+    serial = render_records(raws, jobs=1)
+    serial_time = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = render_records(raws, jobs=jobs)
+    parallel_time = time.perf_counter() - start
+    print(f"✅ 渲染 {count} 条结构化记录: 串行 {serial_time:.2f}s, {jobs} 进程 {parallel_time:.2f}s "
+          f"({serial_time / parallel_time:.1f}x), 结果{'一致' if parallel == serial else '不一致 ❌'}")
+
+
+if __name__ == "__main__":
+    main()
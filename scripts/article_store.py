@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+抓取文章的追加式存储 (替代整体重写的 data/articles.json)
+- data/articles.jsonl: 每行一篇文章 JSON，只追加；同一ID再次写入时后写覆盖先写
+- data/articles.idx: 每行一个ID，与 jsonl 逐行对应；去重只读这个小文件
+- 读取时逐行产出，不在内存中构建完整字典；被覆盖的旧版本根据索引中的出现次数跳过
+- 旧版本行数超过 COMPACT_RATIO 时自动压缩
+
+用法:
+    python3 scripts/article_store.py import data/articles.json   # 从旧的 articles.json 导入
+    python3 scripts/article_store.py compact                     # 压缩并按 jsonl 重建索引
+    python3 scripts/article_store.py stats
+"""
+
+import json
+import os
+import sys
+
+WORKSPACE = "."
+ARTICLE_LOG_FILE = f"{WORKSPACE}/data/articles.jsonl"
+ARTICLE_INDEX_FILE = f"{WORKSPACE}/data/articles.idx"
+
+# 被覆盖的旧版本占比超过这个值时，append() 之后自动压缩
+COMPACT_RATIO = 0.2
+
+
+class ArticleStore:
+    """data/articles.jsonl + data/articles.idx"""
+
+    def __init__(self, log_file=ARTICLE_LOG_FILE, index_file=ARTICLE_INDEX_FILE):
+        self.log_file = log_file
+        self.index_file = index_file
+        self._counts = None
+
+    # ---------- 索引 ----------
+
+    def _load_counts(self):
+        """{id: 在 jsonl 中出现的次数}，只读取索引文件"""
+        if self._counts is None:
+            self._counts = {}
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        article_id = line.rstrip('\n')
+                        if article_id:
+                            self._counts[article_id] = self._counts.get(article_id, 0) + 1
+        return self._counts
+
+    def ids(self):
+        """所有文章ID（去重检查用）"""
+        return set(self._load_counts())
+
+    def __contains__(self, article_id):
+        return article_id in self._load_counts()
+
+    def __len__(self):
+        return len(self._load_counts())
+
+    def dead_rows(self):
+        """被覆盖的旧版本行数"""
+        counts = self._load_counts()
+        return sum(counts.values()) - len(counts)
+
+    # ---------- 写入 ----------
+
+    def append(self, articles, overwrite=False):
+        """
+        追加文章（可迭代的 article，必须带 id 字段），默认跳过已存在的ID。
+        返回实际写入的ID列表。
+        """
+        counts = self._load_counts()
+        # 同一批次里重复的ID只写最后一个
+        batch = {}
+        for article in articles:
+            if overwrite or article['id'] not in counts:
+                batch[article['id']] = article
+        rows = list(batch.values())
+        if not rows:
+            return []
+
+        os.makedirs(os.path.dirname(self.log_file) or '.', exist_ok=True)
+        # 先写 jsonl 再写索引：中途失败最多留下未索引的行，compact() 可以修复
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            for article in rows:
+                f.write(json.dumps(article, ensure_ascii=False) + '\n')
+        with open(self.index_file, 'a', encoding='utf-8') as f:
+            for article in rows:
+                f.write(article['id'] + '\n')
+                counts[article['id']] = counts.get(article['id'], 0) + 1
+
+        total = sum(counts.values())
+        if self.dead_rows() > total * COMPACT_RATIO:
+            self.compact()
+        return [article['id'] for article in rows]
+
+    def compact(self):
+        """只保留每篇文章的最新版本，并按 jsonl 重建索引"""
+        latest = {}
+        if os.path.exists(self.log_file):
+            with open(self.log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        article = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 写入中断留下的半行
+                        continue
+                    latest.pop(article['id'], None)
+                    latest[article['id']] = line
+
+        tmp = self.log_file + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            for line in latest.values():
+                f.write(line + '\n')
+        os.replace(tmp, self.log_file)
+        with open(self.index_file, 'w', encoding='utf-8') as f:
+            for article_id in latest:
+                f.write(article_id + '\n')
+        self._counts = {article_id: 1 for article_id in latest}
+        return len(latest)
+
+    def import_json(self, path):
+        """从旧格式的 {id: article} JSON 文件导入"""
+        with open(path, 'r', encoding='utf-8') as f:
+            articles = json.load(f)
+        return self.append(dict(article, id=aid) for aid, article in articles.items())
+
+    # ---------- 读取 ----------
+
+    def iter_articles(self):
+        """逐篇产出 (id, article)，每篇只产出最新版本（按最新版本在文件中的位置排序）"""
+        if not os.path.exists(self.log_file):
+            return
+        remaining = dict(self._load_counts())
+        with open(self.log_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    article = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                article_id = article['id']
+                count = remaining.get(article_id)
+                if count is None:
+                    # 未写入索引的行（索引写入前中断），仍然产出
+                    yield article_id, article
+                elif count > 1:
+                    remaining[article_id] = count - 1
+                elif count == 1:
+                    remaining[article_id] = 0
+                    yield article_id, article
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    store = ArticleStore()
+
+    if command == 'import':
+        path = sys.argv[2] if len(sys.argv) > 2 else f"{WORKSPACE}/data/articles.json"
+        added = store.import_json(path)
+        print(f"✅ 从 {path} 导入 {len(added)} 篇文章 (共 {len(store)} 篇)")
+    elif command == 'compact':
+        before = store.dead_rows()
+        count = store.compact()
+        print(f"✅ 压缩完成: {count} 篇文章, 去掉 {before} 个旧版本")
+    elif command == 'stats':
+        counts = {}
+        for _, article in store.iter_articles():
+            category = article.get('category', '')
+            counts[category] = counts.get(category, 0) + 1
+        print(f"📚 {store.log_file}: {len(store)} 篇文章, {store.dead_rows()} 个旧版本")
+        for category, count in sorted(counts.items(), key=lambda x: -x[1]):
+            print(f"  {category}: {count}")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
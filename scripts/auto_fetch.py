@@ -7,39 +7,33 @@
 import json
 import feedparser
 import hashlib
-import os
 import re
 from datetime import datetime
 
+from article_renderer import make_record
+from article_store import ArticleStore
+from dedup_index import DedupIndex
+from feed_cache import FeedCache
+from feed_fetcher import download_feed
+from kb_store import KnowledgeBaseStore
+from keyword_matcher import KeywordMatcher
+from near_dup import NearDupIndex, filter_near_duplicates
+from url_canon import canonicalize_url
+
 WORKSPACE = "."
 SOURCES_FILE = f"{WORKSPACE}/data/sources.json"
-ARTICLES_FILE = f"{WORKSPACE}/data/articles.json"
 KB_FILE = f"{WORKSPACE}/knowledge-base.js"
 
-CATEGORY_CONFIG = {
-    "ue": {"name": "Unreal Engine", "color": "#00f0ff"},
-    "ta": {"name": "技术美术", "color": "#b026ff"},
-    "render": {"name": "实时渲染", "color": "#ffbe0b"},
-    "ta-render": {"name": "TA渲染专栏", "color": "#00ff88"},
-    "ai": {"name": "AI技术", "color": "#ff006e"}
-}
+# 本脚本一直只给这几个分类配色，其他分类（vfx、multiplat）沿用 ta 的名称和颜色
+THEMED_CATEGORIES = ("ue", "ta", "render", "ta-render", "ai")
 
 def load_sources():
     with open(SOURCES_FILE, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def load_existing_articles():
-    if os.path.exists(ARTICLES_FILE):
-        with open(ARTICLES_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
-
-def save_articles(articles):
-    with open(ARTICLES_FILE, 'w', encoding='utf-8') as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
-
 def generate_article_id(url):
-    return hashlib.md5(url.encode()).hexdigest()[:12]
+    """规范化链接后取哈希，跟踪参数、http/https、结尾斜杠不同的链接得到同一个ID"""
+    return hashlib.md5(canonicalize_url(url).encode()).hexdigest()[:12]
 
 def clean_html(text):
     if not text:
@@ -48,20 +42,28 @@ def clean_html(text):
     text = re.sub(r'\s+', ' ', text)
     return text.strip()
 
+UE_KEYWORDS = ['unreal', 'ue5', 'ue4', 'niagara', 'lumen', 'nanite']
+
+_matchers = {}
+
+def article_matcher(exclude_keywords):
+    """排除词 + UE关键词编译成一个匹配器，按排除词列表缓存"""
+    key = tuple(exclude_keywords)
+    if key not in _matchers:
+        _matchers[key] = KeywordMatcher({'exclude': exclude_keywords, 'ue': UE_KEYWORDS})
+    return _matchers[key]
+
 def should_include_article(article, settings):
     """过滤Unity文章"""
-    title = article.get('title', '').lower()
-    summary = article.get('summary', '').lower()
+    hits = article_matcher(settings.get('exclude_keywords', [])).scan(
+        article.get('title', ''), article.get('summary', ''))
     
-    exclude_keywords = settings.get('exclude_keywords', [])
-    for keyword in exclude_keywords:
-        if keyword.lower() in title or keyword.lower() in summary:
-            print(f"    ⏭️  跳过(Unity): {article['title'][:50]}...")
-            return False
+    if hits['exclude']:
+        print(f"    ⏭️  跳过(Unity): {article['title'][:50]}...")
+        return False
     
     # 检测UE相关内容
-    ue_keywords = ['unreal', 'ue5', 'ue4', 'niagara', 'lumen', 'nanite']
-    if any(kw in title.lower() or kw in summary.lower() for kw in ue_keywords):
+    if hits['ue']:
         article['category'] = 'ue'
         print(f"    ⭐ 发现UE内容")
     
@@ -128,65 +130,32 @@ def generate_simple_analysis(article):
         "implementation_difficulty": config["difficulty"]
     }
 
-def generate_content_html(article, analysis):
-    """生成文章HTML"""
-    title = analysis['chinese_title']
-    summary = analysis['technical_summary']
-    tech_analysis = analysis['technical_analysis']
-    technologies = analysis['key_technologies']
-    link = article.get('link', '')
-    published = article.get('published', datetime.now().strftime('%Y-%m-%d'))[:10]
-    source = article.get('source_name', '未知来源')
-    category = article.get('category', 'ta')
-    
-    config = CATEGORY_CONFIG.get(category, CATEGORY_CONFIG['ta'])
-    tag_class = f"tag-{category}"
-    
-    tech_tags = ''.join([f'<span class="{tag_class} px-3 py-1 rounded-full text-sm">{tech}</span>' for tech in technologies])
-    
-    html = f'''<div class="article-content">
-    <div class="flex flex-wrap items-center gap-3 mb-6">
-        <span class="{tag_class} px-3 py-1 rounded-full text-sm">{config['name']}</span>
-        <span class="text-gray-500">{published}</span>
-        <span class="text-gray-500">•</span>
-        <span class="text-gray-500">{analysis['target_audience']}</span>
-    </div>
-    <h1>{title}</h1>
-    <p class="text-xl text-gray-300 mb-6">{summary}</p>
-    <div class="source-box">
-        <div class="flex items-center gap-2 mb-2">
-            <svg class="w-4 h-4 text-neon-amber" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13.828 10.172a4 4 0 00-5.656 0l-4 4a4 4 0 105.656 5.656l1.102-1.101m-.758-4.899a4 4 0 005.656 0l4-4a4 4 0 00-5.656-5.656l-1.1 1.1"></path>
-            </svg>
-            <span class="text-neon-amber font-medium">原文链接</span>
-        </div>
-        <div class="text-sm text-gray-400">
-            <div>• <a href="{link}" target="_blank" class="text-neon-blue hover:underline">{source} - 查看完整原文</a></div>
-        </div>
-    </div>
-    <div class="tech-analysis-box" style="border-color: {config['color']}40;">
-        <div class="flex items-center gap-2 mb-4">
-            <span class="text-lg font-semibold" style="color: {config['color']}">🔬 技术分析</span>
-        </div>
-        <p class="mb-0 text-gray-300 leading-relaxed">{tech_analysis}</p>
-    </div>
-    <h2>🎯 核心技术点</h2>
-    <div class="flex flex-wrap gap-2 mb-6">{tech_tags}</div>
-    <div class="bg-dark-700/50 rounded-xl p-6 mt-8 border-l-4" style="border-color: {config['color']}">
-        <p class="mb-0 text-gray-400">
-            <strong style="color: {config['color']}">💡 提示:</strong> 
-            本文为自动抓取生成的中文摘要。如需完整技术细节，请点击上方原文链接。
-        </p>
-    </div>
-</div>'''
-    return html
+def generate_content_fields(article, analysis):
+    """文章正文字段（V1 版式，正文HTML由 article_renderer.py 渲染）"""
+    fields = {
+        'title': analysis['chinese_title'],
+        'summary': analysis['technical_summary'],
+        'analysis': analysis['technical_analysis'],
+        'technologies': analysis['key_technologies'],
+        'link': article.get('link', ''),
+        'published': article.get('published', datetime.now().strftime('%Y-%m-%d'))[:10],
+        'source': article.get('source_name', '未知来源'),
+        'audience': analysis['target_audience']
+    }
+    if article.get('category', 'ta') not in THEMED_CATEGORIES:
+        fields['theme'] = 'ta'
+    return fields
 
-def fetch_rss_source(source):
-    """抓取RSS源"""
+def fetch_rss_source(source, cache=None):
+    """抓取RSS源（传入 cache 时使用条件请求，未变化的源直接跳过）"""
     articles = []
     try:
         print(f"  抓取: {source['name']}...")
-        feed = feedparser.parse(source['url'])
+        body = download_feed(source['url'], cache=cache, cache_key=source.get('id'))
+        if body is None:
+            print("  ⏸ 未变化 (304)")
+            return articles
+        feed = feedparser.parse(body)
         max_articles = source.get('max_articles', 3)  # 减少数量避免过多
         
         for entry in feed.entries[:max_articles]:
@@ -215,63 +184,36 @@ def fetch_rss_source(source):
     return articles
 
 def update_knowledge_base(new_articles):
-    """更新知识库"""
-    # 读取现有知识库
-    with open(KB_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    match = re.search(r'articles:\s*({.*?}),\s*currentCategory', content, re.DOTALL)
-    if not match:
-        print("❌ 无法解析知识库")
-        return False
-    
-    articles = json.loads(match.group(1))
+    """更新知识库：新文章追加到增量存储，再由存储生成 knowledge-base.js"""
+    store = KnowledgeBaseStore(kb_file=KB_FILE)
+    store.ensure_synced()
     
     # 添加新文章
+    records = {}
     for article_id, article_data in new_articles.items():
-        if article_id not in articles:
+        if article_id not in store:
             article = article_data['article']
             analysis = article_data['analysis']
-            config = CATEGORY_CONFIG.get(article['category'], CATEGORY_CONFIG['ta'])
             
-            articles[article_id] = {
+            records[article_id] = make_record({
                 'title': analysis['chinese_title'],
                 'category': article['category'],
                 'tags': analysis['key_technologies'],
                 'date': article.get('published', datetime.now().strftime('%Y-%m-%d'))[:10],
                 'author': f"{article['source_name']} / 自动摘要",
                 'readTime': '5分钟',
-                'difficulty': analysis['implementation_difficulty'],
-                'content': generate_content_html(article, analysis)
-            }
+                'difficulty': analysis['implementation_difficulty']
+            }, 'v1', **generate_content_fields(article, analysis))
             print(f"  + 添加: {analysis['chinese_title'][:40]}...")
+    store.add_articles(records)
     
-    # 重新构建知识库
+    # 重新生成知识库
     meta = {
         "lastUpdated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        "totalArticles": len(articles),
         "autoGenerated": True,
         "version": "4.0-auto"
     }
-    
-    js_content = f'''// Realtime Tech Knowledge Base - Auto Generated
-const knowledgeBase = {{
-    meta: {json.dumps(meta, indent=4)},
-    articles: {json.dumps(articles, ensure_ascii=False, indent=4)},
-    currentCategory: 'home',
-    getArticle(id) {{ return this.articles[id] || {{ title: '文章不存在', content: '<div class="text-center py-12"><h2>找不到该文章</h2></div>' }}; }},
-    getArticlesByCategory(category) {{ return Object.entries(this.articles).filter(([id, a]) => a.category === category).map(([id, a]) => ({{ id, ...a }})); }}
-}};
-function showPage(pageId) {{ document.querySelectorAll('.page').forEach(p => p.classList.remove('active')); const t = document.getElementById('page-' + pageId); if (t) {{ if (['ue','ta','render','ta-render','ai'].includes(pageId)) loadCategoryPage(pageId); t.classList.add('active'); }} if (pageId !== 'article') knowledgeBase.currentCategory = pageId; document.getElementById('mobile-menu').classList.add('hidden'); window.scrollTo(0, 0); }}
-function loadCategoryPage(category) {{ const page = document.getElementById('page-' + category); const articles = knowledgeBase.getArticlesByCategory(category); const names = {{'ue':'Unreal Engine','ta':'技术美术','render':'实时渲染','ta-render':'TA渲染专栏','ai':'AI技术'}}; const classes = {{'ue':'tag-ue','ta':'tag-ta','render':'tag-render','ta-render':'tag-ta-render','ai':'tag-ai'}}; let html = articles.map(a => `<div onclick="showArticle('${{a.id}}')" class="glass-panel rounded-2xl p-6 card-hover cursor-pointer"><div class="flex items-center gap-2 mb-3"><span class="${{classes[category]}} px-2 py-1 rounded text-xs">${{a.tags[0]}}</span><span class="text-gray-500 text-xs">${{a.readTime}}</span><span class="text-gray-500 text-xs">•</span><span class="text-gray-500 text-xs">${{a.difficulty}}</span></div><h3 class="text-xl font-semibold text-white mb-2">${{a.title}}</h3><p class="text-gray-400 text-sm">${{a.author}} · ${{a.date}}</p></div>`).join(''); if (articles.length === 0) html = '<div class="glass-panel rounded-2xl p-12 text-center"><h3>该分类暂无文章</h3></div>'; page.innerHTML = `<div class="py-12 px-6"><div class="max-w-7xl mx-auto"><div class="flex items-center gap-4 mb-8"><button onclick="showPage('home')" class="flex items-center gap-2 px-4 py-2 rounded-lg glass-panel hover:bg-white/5"><i data-lucide="home" class="w-5 h-5"></i><span>回到主页</span></button><div><h2 class="text-3xl font-bold ${{category === 'ta-render' ? 'text-neon-green' : 'text-white'}}">${{names[category]}}</h2><p class="text-gray-500">共 ${{articles.length}} 篇技术文章</p></div></div><div class="grid grid-cols-1 md:grid-cols-2 gap-6">${{html}}</div></div></div>`; }}
-function showArticle(id) {{ const a = knowledgeBase.getArticle(id); const p = document.getElementById('page-article'); p.innerHTML = `<div class="py-12 px-6"><div class="max-w-4xl mx-auto"><button onclick="backToCategory()" class="flex items-center gap-2 text-gray-400 hover:text-white mb-6"><i data-lucide="arrow-left" class="w-5 h-5"></i><span>返回分类</span></button><div class="glass-panel rounded-3xl p-8 md:p-12">${{a.content}}</div></div></div>`; showPage('article'); if (typeof lucide !== 'undefined') lucide.createIcons(); }}
-function backToCategory() {{ if (knowledgeBase.currentCategory && knowledgeBase.currentCategory !== 'home') showPage(knowledgeBase.currentCategory); else showPage('home'); }}
-function toggleMobileMenu() {{ document.getElementById('mobile-menu').classList.toggle('hidden'); }}
-document.addEventListener('DOMContentLoaded', function() {{ if (typeof lucide !== 'undefined') lucide.createIcons(); const t = document.getElementById('last-update-time'); if (t) t.textContent = knowledgeBase.meta.lastUpdated; }});
-'''
-    
-    with open(KB_FILE, 'w', encoding='utf-8') as f:
-        f.write(js_content)
+    store.build(meta, header="// Realtime Tech Knowledge Base - Auto Generated")
     
     return True
 
@@ -285,24 +227,32 @@ def main():
     sources = config.get('sources', [])
     settings = config.get('settings', {})
     
-    existing_articles = load_existing_articles()
-    print(f"\n现有文章: {len(existing_articles)} 篇")
+    # 去重只读取布隆过滤器，命中时再查磁盘上的精确索引
+    article_store = ArticleStore()
+    dedup = DedupIndex()
+    print(f"\n现有文章: {len(dedup)} 篇")
     
     # 抓取新文章
+    feed_cache = FeedCache()
     new_articles = []
     for source in sources:
         if not source.get('enabled', True):
             continue
         
         source['max_articles'] = settings.get('max_articles_per_source', 3)
-        fetched = fetch_rss_source(source)
+        fetched = fetch_rss_source(source, feed_cache)
         
         for article in fetched:
-            if article['id'] not in existing_articles:
+            if dedup.claim(article):
                 if should_include_article(article, settings):
                     new_articles.append(article)
     
-    print(f"\n新发现: {len(new_articles)} 篇")
+    # 同一篇报道的不同链接按内容相似度去重
+    near_dup = NearDupIndex()
+    new_articles = filter_near_duplicates(new_articles, near_dup)
+    
+    print(f"\n{feed_cache.summary()}")
+    print(f"新发现: {len(new_articles)} 篇")
     
     if new_articles:
         # 生成分析和更新知识库
@@ -314,16 +264,21 @@ def main():
                 'article': article,
                 'analysis': analysis
             }
-            existing_articles[article['id']] = article
         
         print("\n更新知识库...")
         if update_knowledge_base(processed):
-            save_articles(existing_articles)
+            article_store.append(new_articles)
+            for article in new_articles:
+                dedup.add(article['id'], article['link'])
+            dedup.save()
+            near_dup.save()
+            feed_cache.save()
             print(f"✅ 已添加 {len(processed)} 篇新文章")
             print("知识库已更新，准备提交...")
         else:
             print("❌ 更新失败")
     else:
+        feed_cache.save()
         print("\n✓ 没有新文章")
     
     print("="*60)
@@ -2,46 +2,46 @@
 """
 全自动更新脚本 - 确保每个分类至少2篇文章
 自动抓取RSS + 生成中文分析 + 更新知识库 + 分类均衡
+
+每次运行的分阶段/分源耗时追加到 logs/metrics.jsonl（见 run_metrics.py）:
+    python3 scripts/auto_fetch_enhanced.py [--profile] [--trace-memory]
 """
 
 import json
 import feedparser
 import hashlib
-import os
 import re
 from datetime import datetime, timedelta
 
+from analysis_cache import AnalysisCache
+from article_renderer import CATEGORY_CONFIG, make_record
+from article_store import ArticleStore
+from dedup_index import DedupIndex
+from feed_cache import FeedCache
+from feed_fetcher import (
+    DEFAULT_TIMEOUT, download_feed, fetch_settings, fetch_sources_concurrently, source_timeout
+)
+from kb_store import KnowledgeBaseStore
+from keyword_matcher import KeywordMatcher
+from kimi_client import KIMI_API_KEY, PROMPT_VERSION, AsyncAnalysisClient
+from near_dup import NearDupIndex, filter_near_duplicates
+from run_metrics import RunMetrics, profiling_flags, span
+from url_canon import canonicalize_url
+
 WORKSPACE = "."
 SOURCES_FILE = f"{WORKSPACE}/data/sources.json"
-ARTICLES_FILE = f"{WORKSPACE}/data/articles.json"
 KB_FILE = f"{WORKSPACE}/knowledge-base.js"
 
-CATEGORY_CONFIG = {
-    "ue": {"name": "Unreal Engine", "color": "#00f0ff"},
-    "ta": {"name": "技术美术", "color": "#b026ff"},
-    "render": {"name": "实时渲染", "color": "#ffbe0b"},
-    "ta-render": {"name": "TA渲染专栏", "color": "#00ff88"},
-    "ai": {"name": "AI技术", "color": "#ff006e"},
-    "vfx": {"name": "特效专栏", "color": "#ff6600"},
-    "multiplat": {"name": "多端开发", "color": "#00ccff"}
-}
+# 修改 generate_analysis() 的模板后需要递增，使分析缓存中的旧结果失效
+ANALYSIS_TEMPLATE_VERSION = "local-1"
 
 def load_sources():
     with open(SOURCES_FILE, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def load_existing_articles():
-    if os.path.exists(ARTICLES_FILE):
-        with open(ARTICLES_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
-
-def save_articles(articles):
-    with open(ARTICLES_FILE, 'w', encoding='utf-8') as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
-
 def generate_article_id(url):
-    return hashlib.md5(url.encode()).hexdigest()[:12]
+    """规范化链接后取哈希，跟踪参数、http/https、结尾斜杠不同的链接得到同一个ID"""
+    return hashlib.md5(canonicalize_url(url).encode()).hexdigest()[:12]
 
 def clean_html(text):
     if not text:
@@ -65,38 +65,50 @@ def parse_date(date_str):
             continue
     return datetime.now()
 
-def should_include_article(article, settings, existing_ids):
+# 自动分类关键词
+CATEGORY_KEYWORDS = {
+    'ue': ['unreal', 'ue5', 'ue4', 'niagara', 'lumen', 'nanite', 'epic games'],
+    'ai': ['ai ', 'artificial intelligence', 'machine learning', 'neural', 'deep learning', 'generative', 'gpt', 'llm'],
+    'render': ['rendering', 'ray tracing', 'global illumination', 'pbr', 'shader', 'graphics']
+}
+
+_matchers = {}
+
+def article_matcher(exclude_keywords):
+    """排除词 + 分类词编译成一个匹配器，按排除词列表缓存"""
+    key = tuple(exclude_keywords)
+    if key not in _matchers:
+        _matchers[key] = KeywordMatcher(dict(CATEGORY_KEYWORDS, exclude=exclude_keywords))
+    return _matchers[key]
+
+def should_include_article(article, settings, dedup):
     """过滤文章"""
-    if article['id'] in existing_ids:
+    if not dedup.claim(article):
         return False
     
-    title = article.get('title', '').lower()
-    summary = article.get('summary', '').lower()
+    # 标题和摘要只扫描一次，得到排除词和各分类的命中情况
+    hits = article_matcher(settings.get('exclude_keywords', [])).scan(
+        article.get('title', ''), article.get('summary', ''))
     
     # 排除Unity文章
-    exclude_keywords = settings.get('exclude_keywords', [])
-    for keyword in exclude_keywords:
-        if keyword.lower() in title or keyword.lower() in summary:
-            print(f"    ⏭️  跳过(Unity): {article['title'][:50]}...")
-            return False
+    if hits['exclude']:
+        print(f"    ⏭️  跳过(Unity): {article['title'][:50]}...")
+        return False
     
     # 检测UE相关内容并自动分类
-    ue_keywords = ['unreal', 'ue5', 'ue4', 'niagara', 'lumen', 'nanite', 'epic games']
-    if any(kw in title.lower() or kw in summary.lower() for kw in ue_keywords):
+    if hits['ue']:
         if article['category'] != 'ue':
             article['category'] = 'ue'
             print(f"    ⭐ 自动归类为UE: {article['title'][:40]}...")
     
     # 检测AI相关内容
-    ai_keywords = ['ai ', 'artificial intelligence', 'machine learning', 'neural', 'deep learning', 'generative', 'gpt', 'llm']
-    if any(kw in title.lower() or kw in summary.lower() for kw in ai_keywords):
+    if hits['ai']:
         if article['category'] != 'ai':
             article['category'] = 'ai'
             print(f"    🤖 自动归类为AI: {article['title'][:40]}...")
     
     # 检测渲染相关内容
-    render_keywords = ['rendering', 'ray tracing', 'global illumination', 'pbr', 'shader', 'graphics']
-    if any(kw in title.lower() or kw in summary.lower() for kw in render_keywords):
+    if hits['render']:
         if article['category'] not in ['render', 'ta-render']:
             article['category'] = 'render'
             print(f"    🎨 自动归类为渲染: {article['title'][:40]}...")
@@ -193,226 +205,192 @@ def generate_analysis(article, category):
         "implementation_difficulty": config["difficulty"]
     }
 
-def generate_content_html(article, analysis):
-    """生成文章HTML"""
-    title = analysis['chinese_title']
-    summary = analysis['technical_summary']
-    tech_analysis = analysis['technical_analysis']
-    technologies = analysis['key_technologies']
-    link = article.get('link', '')
-    published = article.get('published', datetime.now().strftime('%Y-%m-%d'))[:10]
-    source = article.get('source_name', '未知来源')
-    category = article.get('category', 'ta')
-    
-    config = CATEGORY_CONFIG.get(category, CATEGORY_CONFIG['ta'])
-    tag_class = f"tag-{category}"
-    
-    tech_tags = ''.join([f'<span class="{tag_class} px-3 py-1 rounded-full text-sm">{tech}</span>' for tech in technologies])
-    
-    html = f'''<div class="article-content">
-    <div class="flex flex-wrap items-center gap-3 mb-6">
-        <span class="{tag_class} px-3 py-1 rounded-full text-sm">{config['name']}</span>
-        <span class="text-gray-500">{published}</span>
-        <span class="text-gray-500">•</span>
-        <span class="text-gray-500">{analysis['target_audience']}</span>
-    </div>
-    <h1>{title}</h1>
-    <p class="text-xl text-gray-300 mb-6">{summary}</p>
-    <div class="source-box">
-        <div class="flex items-center gap-2 mb-2">
-            <svg class="w-4 h-4 text-neon-amber" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13.828 10.172a4 4 0 00-5.656 0l-4 4a4 4 0 105.656 5.656l1.102-1.101m-.758-4.899a4 4 0 005.656 0l4-4a4 4 0 00-5.656-5.656l-1.1 1.1"></path>
-            </svg>
-            <span class="text-neon-amber font-medium">原文链接</span>
-        </div>
-        <div class="text-sm text-gray-400">
-            <div>• <a href="{link}" target="_blank" class="text-neon-blue hover:underline">{source} - 查看完整原文</a></div>
-        </div>
-    </div>
-    <div class="tech-analysis-box" style="border-color: {config['color']}40;">
-        <div class="flex items-center gap-2 mb-4">
-            <span class="text-lg font-semibold" style="color: {config['color']}">🔬 技术分析</span>
-        </div>
-        <p class="mb-0 text-gray-300 leading-relaxed">{tech_analysis}</p>
-    </div>
-    <h2>🎯 核心技术点</h2>
-    <div class="flex flex-wrap gap-2 mb-6">{tech_tags}</div>
-    <div class="bg-dark-700/50 rounded-xl p-6 mt-8 border-l-4" style="border-color: {config['color']}">
-        <p class="mb-0 text-gray-400">
-            <strong style="color: {config['color']}">💡 提示:</strong> 
-            本文为自动抓取生成的中文摘要。如需完整技术细节，请点击上方原文链接。
-        </p>
-    </div>
-</div>'''
-    return html
+def analyze_articles(articles):
+    """
+    批量生成分析，结果顺序与 articles 一致。
+    配置了 KIMI_API_KEY 时并发调用 Kimi，失败的文章回退到本地模板 generate_analysis()。
+    两种后端的结果都写入分析缓存，重跑时已分析过的文章不再重新生成。
+    """
+    cache = AnalysisCache()
+    cache.invalidate("local", ANALYSIS_TEMPLATE_VERSION)
+    def local_analysis(article):
+        with span('analysis.generate'):
+            return generate_analysis(article, article['category'])
 
-def fetch_rss_source(source, max_articles=5):
-    """抓取RSS源"""
+    local = cache.cached("local", ANALYSIS_TEMPLATE_VERSION, local_analysis)
+
+    if not KIMI_API_KEY:
+        results = [local(article) for article in articles]
+    else:
+        print(f"\n🤖 使用Kimi分析 {len(articles)} 篇文章...")
+        cache.invalidate("kimi", PROMPT_VERSION)
+        client = AsyncAnalysisClient()
+        inputs = [dict(article, summary=clean_html(article.get('summary', ''))) for article in articles]
+        results = client.run(inputs, fallback=local, cache=cache)
+        print(f"  Kimi请求 {client.stats['requests']} 次, 重试 {client.stats['retries']} 次, "
+              f"回退本地 {client.stats['failures']} 篇")
+
+    cache.save()
+    print(f"  {cache.summary()}")
+    return results
+
+def generate_content_fields(article, analysis):
+    """文章正文字段（V1 版式，正文HTML由 article_renderer.py 渲染）"""
+    return {
+        'title': analysis['chinese_title'],
+        'summary': analysis['technical_summary'],
+        'analysis': analysis['technical_analysis'],
+        'technologies': analysis['key_technologies'],
+        'link': article.get('link', ''),
+        'published': article.get('published', datetime.now().strftime('%Y-%m-%d'))[:10],
+        'source': article.get('source_name', '未知来源'),
+        'audience': analysis['target_audience']
+    }
+
+def fetch_rss_source(source, max_articles=5, timeout=DEFAULT_TIMEOUT, cache=None):
+    """抓取RSS源（传入 cache 时使用条件请求，未变化的源直接跳过）"""
     articles = []
-    try:
-        print(f"  抓取: {source['name']}...")
-        feed = feedparser.parse(source['url'])
-        count = 0
-        
-        for entry in feed.entries[:max_articles * 2]:  # 多抓一些用于过滤
-            if count >= max_articles:
-                break
-                
-            article_id = generate_article_id(entry.get('link', ''))
-            published = entry.get('published', '') or entry.get('updated', datetime.now().strftime('%Y-%m-%d'))
-            summary = entry.get('summary', '')
-            if not summary and 'content' in entry:
-                summary = entry.content[0].value
-            
-            article = {
-                'id': article_id,
-                'title': entry.get('title', '无标题'),
-                'link': entry.get('link', ''),
-                'summary': clean_html(summary),
-                'published': published,
-                'source_name': source['name'],
-                'category': source['category'],
-                'fetched_at': datetime.now().isoformat()
-            }
-            articles.append(article)
-            count += 1
-        
-        print(f"  ✓ {len(articles)} 篇")
-    except Exception as e:
-        print(f"  ✗ 失败: {e}")
+    with span('fetch.source', source=source.get('id', source['name'])) as info:
+        try:
+            with span('fetch.download'):
+                body = download_feed(source['url'], source_timeout(source, timeout), cache, source.get('id'))
+            if body is None:
+                info['status'] = 'not_modified'
+                print(f"  ⏸ {source['name']}: 未变化 (304)")
+                return articles
+            with span('fetch.parse'):
+                articles = parse_feed_entries(body, source, max_articles)
+            info['articles'] = len(articles)
+            print(f"  ✓ {source['name']}: {len(articles)} 篇")
+        except Exception as e:
+            info['status'] = 'error'
+            print(f"  ✗ {source['name']} 失败: {e}")
     
     return articles
 
-def parse_knowledge_base():
-    """解析知识库文件，返回 articles 字典"""
-    with open(KB_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # 尝试多种方式解析
-    # 方式1: 匹配 "articles": { ... } 结构（新格式）
-    match = re.search(r'"articles":\s*({.*})\s*}\s*;?\s*$', content, re.DOTALL)
-    if match:
-        try:
-            return json.loads(match.group(1))
-        except json.JSONDecodeError as e:
-            print(f"  方式1解析失败: {e}")
-    
-    # 方式2: 匹配 articles: { ... }, currentCategory 结构（旧格式）
-    match = re.search(r'"?articles"?\s*:\s*({.*?}),\s*"?currentCategory"?', content, re.DOTALL)
-    if match:
-        try:
-            return json.loads(match.group(1))
-        except json.JSONDecodeError as e:
-            print(f"  方式2解析失败: {e}")
+def parse_feed_entries(body, source, max_articles):
+    """解析 feed 正文，返回文章列表"""
+    articles = []
+    feed = feedparser.parse(body)
+    count = 0
     
-    # 方式3: 尝试提取整个 knowledgeBase 对象
-    match = re.search(r'const\s+knowledgeBase\s*=\s*({.*?});\s*$', content, re.DOTALL)
-    if match:
-        try:
-            # 这是一个JavaScript对象，不是标准JSON，需要处理
-            kb_text = match.group(1)
-            # 尝试提取 articles 部分
-            articles_match = re.search(r'"articles":\s*({(?:[^{}]|{(?:[^{}]|{[^{}]*})*})*})', kb_text, re.DOTALL)
-            if articles_match:
-                return json.loads(articles_match.group(1))
-        except Exception as e:
-            print(f"  方式3解析失败: {e}")
+    for entry in feed.entries[:max_articles * 2]:  # 多抓一些用于过滤
+        if count >= max_articles:
+            break
+        
+        article_id = generate_article_id(entry.get('link', ''))
+        published = entry.get('published', '') or entry.get('updated', datetime.now().strftime('%Y-%m-%d'))
+        summary = entry.get('summary', '')
+        if not summary and 'content' in entry:
+            summary = entry.content[0].value
+        
+        article = {
+            'id': article_id,
+            'title': entry.get('title', '无标题'),
+            'link': entry.get('link', ''),
+            'summary': clean_html(summary),
+            'published': published,
+            'source_name': source['name'],
+            'category': source['category'],
+            'fetched_at': datetime.now().isoformat()
+        }
+        articles.append(article)
+        count += 1
     
-    print("❌ 无法解析知识库 - 所有方式都失败")
-    return None
+    return articles
 
 def update_knowledge_base(new_articles):
-    """更新知识库"""
-    # 解析现有知识库
-    articles = parse_knowledge_base()
-    if articles is None:
-        # 如果解析失败，尝试使用已存在的文章
-        articles = {}
-        print("⚠️ 解析失败，将创建新的知识库")
+    """更新知识库：新文章追加到增量存储，再由存储生成 knowledge-base.js"""
+    store = KnowledgeBaseStore(kb_file=KB_FILE)
+    store.ensure_synced()
     
     # 添加新文章
+    records = {}
     for article_id, article_data in new_articles.items():
-        if article_id not in articles:
+        if article_id not in store:
             article = article_data['article']
             analysis = article_data['analysis']
-            config = CATEGORY_CONFIG.get(article['category'], CATEGORY_CONFIG['ta'])
             
-            articles[article_id] = {
+            records[article_id] = make_record({
                 'title': analysis['chinese_title'],
                 'category': article['category'],
                 'tags': analysis['key_technologies'],
                 'date': article.get('published', datetime.now().strftime('%Y-%m-%d'))[:10],
                 'author': f"{article['source_name']} / 自动摘要",
                 'readTime': '5分钟',
-                'difficulty': analysis['implementation_difficulty'],
-                'content': generate_content_html(article, analysis)
-            }
+                'difficulty': analysis['implementation_difficulty']
+            }, 'v1', **generate_content_fields(article, analysis))
             print(f"  + 添加: {analysis['chinese_title'][:40]}...")
+    store.add_articles(records)
     
-    # 重新构建知识库
+    # 重新生成知识库
     meta = {
         "lastUpdated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        "totalArticles": len(articles),
         "autoGenerated": True,
         "version": "4.1-enhanced"
     }
-    
-    js_content = f'''// Realtime Tech Knowledge Base - Enhanced Auto Generated
-const knowledgeBase = {{
-    meta: {json.dumps(meta, indent=4)},
-    articles: {json.dumps(articles, ensure_ascii=False, indent=4)},
-    currentCategory: 'home',
-    getArticle(id) {{ return this.articles[id] || {{ title: '文章不存在', content: '<div class="text-center py-12"><h2>找不到该文章</h2></div>' }}; }},
-    getArticlesByCategory(category) {{ return Object.entries(this.articles).filter(([id, a]) => a.category === category).map(([id, a]) => ({{ id, ...a }})); }}
-}};
-function showPage(pageId) {{ document.querySelectorAll('.page').forEach(p => p.classList.remove('active')); const t = document.getElementById('page-' + pageId); if (t) {{ if (['ue','ta','render','ta-render','ai'].includes(pageId)) loadCategoryPage(pageId); t.classList.add('active'); }} if (pageId !== 'article') knowledgeBase.currentCategory = pageId; document.getElementById('mobile-menu').classList.add('hidden'); window.scrollTo(0, 0); }}
-function loadCategoryPage(category) {{ const page = document.getElementById('page-' + category); const articles = knowledgeBase.getArticlesByCategory(category); const names = {{'ue':'Unreal Engine','ta':'技术美术','render':'实时渲染','ta-render':'TA渲染专栏','ai':'AI技术'}}; const classes = {{'ue':'tag-ue','ta':'tag-ta','render':'tag-render','ta-render':'tag-ta-render','ai':'tag-ai'}}; let html = articles.map(a => `<div onclick="showArticle('${{a.id}}')" class="glass-panel rounded-2xl p-6 card-hover cursor-pointer"><div class="flex items-center gap-2 mb-3"><span class="${{classes[category]}} px-2 py-1 rounded text-xs">${{a.tags[0]}}</span><span class="text-gray-500 text-xs">${{a.readTime}}</span><span class="text-gray-500 text-xs">•</span><span class="text-gray-500 text-xs">${{a.difficulty}}</span></div><h3 class="text-xl font-semibold text-white mb-2">${{a.title}}</h3><p class="text-gray-400 text-sm">${{a.author}} · ${{a.date}}</p></div>`).join(''); if (articles.length === 0) html = '<div class="glass-panel rounded-2xl p-12 text-center"><h3>该分类暂无文章</h3></div>'; page.innerHTML = `<div class="py-12 px-6"><div class="max-w-7xl mx-auto"><div class="flex items-center gap-4 mb-8"><button onclick="showPage('home')" class="flex items-center gap-2 px-4 py-2 rounded-lg glass-panel hover:bg-white/5"><i data-lucide="home" class="w-5 h-5"></i><span>回到主页</span></button><div><h2 class="text-3xl font-bold ${{category === 'ta-render' ? 'text-neon-green' : 'text-white'}}">${{names[category]}}</h2><p class="text-gray-500">共 ${{articles.length}} 篇技术文章</p></div></div><div class="grid grid-cols-1 md:grid-cols-2 gap-6">${{html}}</div></div></div>`; }}
-function showArticle(id) {{ const a = knowledgeBase.getArticle(id); const p = document.getElementById('page-article'); p.innerHTML = `<div class="py-12 px-6"><div class="max-w-4xl mx-auto"><button onclick="backToCategory()" class="flex items-center gap-2 text-gray-400 hover:text-white mb-6"><i data-lucide="arrow-left" class="w-5 h-5"></i><span>返回分类</span></button><div class="glass-panel rounded-3xl p-8 md:p-12">${{a.content}}</div></div></div>`; showPage('article'); if (typeof lucide !== 'undefined') lucide.createIcons(); }}
-function backToCategory() {{ if (knowledgeBase.currentCategory && knowledgeBase.currentCategory !== 'home') showPage(knowledgeBase.currentCategory); else showPage('home'); }}
-function toggleMobileMenu() {{ document.getElementById('mobile-menu').classList.toggle('hidden'); }}
-document.addEventListener('DOMContentLoaded', function() {{ if (typeof lucide !== 'undefined') lucide.createIcons(); const t = document.getElementById('last-update-time'); if (t) t.textContent = knowledgeBase.meta.lastUpdated; }});
-'''
-    
-    with open(KB_FILE, 'w', encoding='utf-8') as f:
-        f.write(js_content)
+    store.build(meta, header="// Realtime Tech Knowledge Base - Enhanced Auto Generated")
     
     return True
 
-def main():
+def run_update(metrics):
     print("="*60)
     print("🤖 Realtime Tech 增强版全自动更新")
     print(f"时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*60)
     
-    config = load_sources()
-    sources = config.get('sources', [])
-    settings = config.get('settings', {})
-    
-    max_per_source = settings.get('max_articles_per_source', 5)
-    min_per_category = settings.get('min_articles_per_category', 2)
-    fetch_days = settings.get('fetch_days_back', 3)
-    
-    existing_articles = load_existing_articles()
-    existing_ids = set(existing_articles.keys())
-    print(f"\n现有文章: {len(existing_articles)} 篇")
+    with span('setup'):
+        config = load_sources()
+        sources = config.get('sources', [])
+        settings = config.get('settings', {})
+        
+        max_per_source = settings.get('max_articles_per_source', 5)
+        min_per_category = settings.get('min_articles_per_category', 2)
+        fetch_days = settings.get('fetch_days_back', 3)
+        
+        # 去重只读取布隆过滤器，命中时再查磁盘上的精确索引
+        article_store = ArticleStore()
+        dedup = DedupIndex()
+    print(f"\n现有文章: {len(dedup)} 篇")
     
-    # 按分类分组抓取
+    # 并发抓取所有源，再按源顺序分类
     category_articles = {cat: [] for cat in CATEGORY_CONFIG.keys()}
     
-    for source in sources:
-        if not source.get('enabled', True):
-            continue
-        
-        fetched = fetch_rss_source(source, max_per_source)
-        
-        for article in fetched:
-            if should_include_article(article, settings, existing_ids):
-                if is_recent_article(article, fetch_days):
-                    cat = article['category']
-                    if cat in category_articles:
-                        category_articles[cat].append(article)
-                    else:
-                        category_articles['ta'].append(article)
+    fetch_config = fetch_settings(settings)
+    feed_cache = FeedCache()
+    enabled_sources = [s for s in sources if s.get('enabled', True)]
+    print(f"\n📡 并发抓取 {len(enabled_sources)} 个源 (线程: {fetch_config['workers']}, 单域名并发: {fetch_config['max_per_host']})")
+    with span('fetch', sources=len(enabled_sources)):
+        fetch_results = fetch_sources_concurrently(
+            enabled_sources,
+            lambda source: fetch_rss_source(source, max_per_source, fetch_config['timeout'], feed_cache),
+            workers=fetch_config['workers'],
+            max_per_host=fetch_config['max_per_host']
+        )
+    
+    print(f"  {feed_cache.summary()}")
+    
+    candidates = []
+    source_keys = {}
+    with span('filter'):
+        for source, fetched in fetch_results:
+            metrics.count('fetched', len(fetched))
+            for article in fetched:
+                source_keys[article['id']] = source.get('id')
+                if should_include_article(article, settings, dedup):
+                    if is_recent_article(article, fetch_days):
+                        candidates.append(article)
+    metrics.count('candidates', len(candidates))
+    
+    # 同一篇报道的不同链接（转载、多个标签 feed）按内容相似度去重
+    with span('near_dup'):
+        near_dup = NearDupIndex()
+        for article in filter_near_duplicates(candidates, near_dup):
+            cat = article['category']
+            if cat in category_articles:
+                category_articles[cat].append(article)
+            else:
+                category_articles['ta'].append(article)
     
     # 统计各分类文章数
     print("\n📊 各分类新文章统计:")
@@ -433,6 +411,13 @@ def main():
     
     print(f"\n📝 最终选取: {len(final_articles)} 篇")
     
+    # 有文章因配额被丢弃的源不更新校验头，下次运行重新读取整个 feed，被丢弃的文章还有机会入选
+    selected = {article['id'] for article in final_articles}
+    for articles in category_articles.values():
+        for article in articles:
+            if article['id'] not in selected:
+                feed_cache.revert(source_keys[article['id']])
+    
     # 分类统计
     final_by_category = {cat: 0 for cat in CATEGORY_CONFIG.keys()}
     for article in final_articles:
@@ -448,38 +433,46 @@ def main():
     if final_articles:
         # 生成分析和更新知识库
         processed = {}
-        for article in final_articles:
+        with span('analysis', articles=len(final_articles)):
+            analyses = analyze_articles(final_articles)
+        for article, analysis in zip(final_articles, analyses):
             print(f"\n处理: {article['title'][:50]}...")
-            analysis = generate_analysis(article, article['category'])
             processed[article['id']] = {
                 'article': article,
                 'analysis': analysis
             }
-            existing_articles[article['id']] = article
         
         print("\n💾 更新知识库...")
-        if update_knowledge_base(processed):
-            save_articles(existing_articles)
+        with span('kb_update'):
+            updated = update_knowledge_base(processed)
+        if updated:
+            with span('save'):
+                article_store.append(final_articles)
+                for article in final_articles:
+                    dedup.add(article['id'], article['link'])
+                dedup.save()
+                near_dup.save({article['id'] for article in final_articles})
+                feed_cache.save()
+            metrics.count('new_articles', len(processed))
             print(f"\n✅ 成功添加 {len(processed)} 篇新文章")
             
-            # 更新统计
+            # 更新统计（只读存储索引，无需重新解析知识库）
             print("\n📊 更新后各分类统计:")
-            articles = parse_knowledge_base()
-            if articles:
-                cat_counts = {cat: 0 for cat in CATEGORY_CONFIG.keys()}
-                for aid, article in articles.items():
-                    cat = article.get('category', 'ta')
-                    if cat in cat_counts:
-                        cat_counts[cat] += 1
-                
-                for cat, count in cat_counts.items():
-                    print(f"  {CATEGORY_CONFIG[cat]['name']}: {count}篇")
+            cat_counts = KnowledgeBaseStore(kb_file=KB_FILE).category_counts()
+            for cat in CATEGORY_CONFIG.keys():
+                print(f"  {CATEGORY_CONFIG[cat]['name']}: {cat_counts.get(cat, 0)}篇")
         else:
             print("❌ 更新失败")
     else:
+        feed_cache.save()
         print("\n✓ 没有新文章")
     
     print("="*60)
 
+def main():
+    with RunMetrics('auto_fetch_enhanced', **profiling_flags()) as metrics:
+        run_update(metrics)
+        metrics.print_summary()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+kb_loader 基准测试
+用 knowledge-base.js 中的真实文章放大生成 1x / 2x / 4x / 8x 的知识库，
+对比 kb_loader 与旧的三种正则解析方式，输出耗时和每 MB 耗时。
+kb_loader 的每 MB 耗时应保持平稳（线性），旧方式可能失败或截断。
+
+用法:
+    python3 scripts/bench_kb_loader.py [knowledge-base.js] [--scales 1,2,4,8]
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+
+from kb_loader import load_knowledge_base, parse_knowledge_base_text
+from kb_store import KB_JS_TAIL
+
+# 代码示例里出现 "}, currentCategory" 时，旧的懒惰正则会在这里截断，导致解析失败
+TRAP_ARTICLE = {
+    "title": "正则截断测试",
+    "category": "ta",
+    "tags": ["test"],
+    "content": "<pre><code>let state = {page: 1}, currentCategory = 'ue';</code></pre>"
+}
+
+
+def legacy_parse(content):
+    """旧版 auto_fetch_enhanced.parse_knowledge_base() 的三种正则方式"""
+    match = re.search(r'"articles":\s*({.*})\s*}\s*;?\s*$', content, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(1))
+        except json.JSONDecodeError:
+            pass
+    match = re.search(r'"?articles"?\s*:\s*({.*?}),\s*"?currentCategory"?', content, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(1))
+        except json.JSONDecodeError:
+            pass
+    match = re.search(r'const\s+knowledgeBase\s*=\s*({.*?});\s*$', content, re.DOTALL)
+    if match:
+        try:
+            articles_match = re.search(r'"articles":\s*({(?:[^{}]|{(?:[^{}]|{[^{}]*})*})*})',
+                                       match.group(1), re.DOTALL)
+            if articles_match:
+                return json.loads(articles_match.group(1))
+        except Exception:
+            pass
+    return None
+
+
+def synthesize(meta, articles, scale):
+    """把文章复制 scale 份，生成与自动生成格式一致的 knowledge-base.js 文本"""
+    items = []
+    for i in range(scale):
+        for aid, article in articles.items():
+            items.append((f"{aid}-{i}" if i else aid, article))
+    items.append(("regex-trap", TRAP_ARTICLE))
+    body = ',\n'.join(f'        {json.dumps(aid)}: {json.dumps(a, ensure_ascii=False)}' for aid, a in items)
+    meta = dict(meta, totalArticles=len(items))
+    return (f"const knowledgeBase = {{\n    meta: {json.dumps(meta, indent=4)},\n"
+            f"    articles: {{\n{body}\n    }},\n{KB_JS_TAIL}"), len(items)
+
+
+def best_of(fn, repeat=3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    args = sys.argv[1:]
+    scales = [1, 2, 4, 8]
+    if '--scales' in args:
+        i = args.index('--scales')
+        scales = [int(x) for x in args[i + 1].split(',')]
+        del args[i:i + 2]
+    kb_file = args[0] if args else 'knowledge-base.js'
+
+    meta, articles = load_knowledge_base(kb_file, render_content=False)
+    print(f"基准文章: {len(articles)} 篇 ({kb_file})\n")
+    print(f"{'规模':>4} {'文章数':>7} {'大小MB':>8} {'kb_loader':>11} {'ms/MB':>7} {'旧正则':>11} {'ms/MB':>7}  旧正则结果")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            text, count = synthesize(meta, articles, scale)
+            path = os.path.join(tmp, f"kb-{scale}.js")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            size_mb = os.path.getsize(path) / 1024 / 1024
+
+            new_time, (_, parsed) = best_of(lambda: load_knowledge_base(path, render_content=False))
+            assert len(parsed) == count, "kb_loader 文章数不一致"
+
+            old_time, old_parsed = best_of(lambda: legacy_parse(text))
+            if old_parsed is None:
+                old_status = "解析失败"
+            elif len(old_parsed) != count:
+                old_status = f"截断: {len(old_parsed)}/{count}"
+            else:
+                old_status = "正确"
+
+            print(f"{scale:>4}x {count:>7} {size_mb:>8.2f} {new_time * 1000:>9.1f}ms {new_time * 1000 / size_mb:>7.1f}"
+                  f" {old_time * 1000:>9.1f}ms {old_time * 1000 / size_mb:>7.1f}  {old_status}")
+
+    # 校验 parse_knowledge_base_text 与文件加载一致
+    with open(kb_file, 'r', encoding='utf-8') as f:
+        assert parse_knowledge_base_text(f.read(), render_content=False)[1] == articles
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+keyword_matcher 基准测试
+在 data/articles.jsonl 的全部文章上对比：
+- 旧版 should_include_article() 的逐词 `in` 检查（排除词 + UE/AI/渲染三组分类词）
+- 旧版 check_content_quality() 的优质关键词循环
+与 KeywordMatcher 的一次匹配，以及作为参照的合并正则 (每个位置先行断言的单次扫描)。
+先校验结果完全一致，再输出耗时。
+
+用法:
+    python3 scripts/bench_keyword_matcher.py [--repeat 20]
+"""
+
+import json
+import re
+import sys
+import time
+
+from article_store import ArticleStore
+from auto_fetch_enhanced import CATEGORY_KEYWORDS, article_matcher
+from content_review import QUALITY_KEYWORDS, QUALITY_MATCHER, UE_TITLE_KEYWORDS, UE_TITLE_MATCHER
+
+
+def legacy_classify(article, exclude_keywords):
+    """旧版 should_include_article() 的匹配部分，返回 (是否排除, 分类)"""
+    title = article.get('title', '').lower()
+    summary = article.get('summary', '').lower()
+    for keyword in exclude_keywords:
+        if keyword.lower() in title or keyword.lower() in summary:
+            return True, article['category']
+    category = article['category']
+    if any(kw in title.lower() or kw in summary.lower() for kw in CATEGORY_KEYWORDS['ue']):
+        category = 'ue'
+    if any(kw in title.lower() or kw in summary.lower() for kw in CATEGORY_KEYWORDS['ai']):
+        category = 'ai'
+    if any(kw in title.lower() or kw in summary.lower() for kw in CATEGORY_KEYWORDS['render']):
+        if category not in ['render', 'ta-render']:
+            category = 'render'
+    return False, category
+
+
+def compiled_classify(article, exclude_keywords):
+    hits = article_matcher(exclude_keywords).scan(article.get('title', ''), article.get('summary', ''))
+    if hits['exclude']:
+        return True, article['category']
+    category = article['category']
+    if hits['ue']:
+        category = 'ue'
+    if hits['ai']:
+        category = 'ai'
+    if hits['render'] and category not in ['render', 'ta-render']:
+        category = 'render'
+    return False, category
+
+
+def legacy_quality(article):
+    """旧版 check_content_quality() 的关键词部分，返回 (命中的关键词, 标题是否UE相关)"""
+    title = article.get('title', '')
+    summary = article.get('summary', '')
+    keywords = [kw for kw in QUALITY_KEYWORDS if kw.lower() in title.lower() or kw.lower() in summary.lower()]
+    return keywords, any(kw in title.lower() for kw in UE_TITLE_KEYWORDS)
+
+
+def compiled_quality(article):
+    title = article.get('title', '')
+    return (QUALITY_MATCHER.scan(title, article.get('summary', ''))['quality'],
+            bool(UE_TITLE_MATCHER.scan(title)['ue']))
+
+
+def combined_regex(keywords):
+    """所有关键词合并成一个正则，(?=...) 保证重叠的关键词都能找到"""
+    words = sorted({kw.lower() for kw in keywords}, key=len, reverse=True)
+    return re.compile('(?=(' + '|'.join(re.escape(w) for w in words) + '))')
+
+
+def regex_find(pattern, *texts):
+    found = set()
+    for text in texts:
+        found.update(m.group(1) for m in pattern.finditer(text.lower()))
+    return found
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 20
+    if '--repeat' in args:
+        i = args.index('--repeat')
+        repeat = int(args[i + 1])
+        del args[i:i + 2]
+
+    articles = [article for _, article in ArticleStore().iter_articles()]
+    with open('data/sources.json', 'r', encoding='utf-8') as f:
+        settings = json.load(f).get('settings', {})
+    exclude = settings.get('exclude_keywords') or settings.get('preferences', {}).get('exclude_keywords', [])
+
+    # 结果必须与旧实现逐篇一致
+    for article in articles:
+        assert legacy_classify(article, exclude) == compiled_classify(article, exclude), article['title']
+        assert legacy_quality(article) == compiled_quality(article), article['title']
+    print(f"✅ {len(articles)} 篇文章分类/排除/优质关键词结果一致 (排除词: {exclude})\n")
+
+    category_words = [kw for kws in CATEGORY_KEYWORDS.values() for kw in kws] + list(exclude)
+    category_regex = combined_regex(category_words)
+    quality_regex = combined_regex(QUALITY_KEYWORDS)
+
+    cases = [
+        ("分类+排除", lambda a: legacy_classify(a, exclude), lambda a: compiled_classify(a, exclude),
+         lambda a: regex_find(category_regex, a.get('title', ''), a.get('summary', ''))),
+        ("质量关键词", legacy_quality, compiled_quality,
+         lambda a: regex_find(quality_regex, a.get('title', ''), a.get('summary', ''))),
+    ]
+    print(f"{'检查':<8} {'旧逐词in':>10} {'KeywordMatcher':>14} {'加速':>6} {'合并正则':>10}")
+    for name, legacy, compiled, regex in cases:
+        old = best_of(lambda: [legacy(a) for a in articles], repeat)
+        new = best_of(lambda: [compiled(a) for a in articles], repeat)
+        rx = best_of(lambda: [regex(a) for a in articles], repeat)
+        print(f"{name:<8} {old * 1000:>8.2f}ms {new * 1000:>12.2f}ms {old / new:>5.1f}x {rx * 1000:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
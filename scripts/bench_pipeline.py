@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+知识库构建流程基准测试
+用 data/articles.jsonl（抓取的原始文章）和 knowledge-base.js（知识库记录）中的真实文章做模板，
+按固定随机种子合成 1k / 10k / 100k 篇文章的语料，分阶段计时：
+
+    parse     kb_loader 解析 knowledge-base.js
+    classify  抓取文章的排除词 / 分类关键词匹配 (auto_fetch_enhanced.article_matcher)
+    render    结构化记录渲染正文HTML (article_renderer.render_record)
+    write     KnowledgeBaseStore.build 写 knowledge-base.js
+    snapshot  写元数据列式快照
+    shards    写清单和正文分片
+    review    质量评分 (content_review.score_articles)
+    index     构建站内搜索倒排索引 (search_index.build_search_index)
+
+每个阶段重复 --repeat 次取最快一次。--save-baseline 把结果存为基线 (data/bench_baseline.json)，
+之后的运行与基线比较，任一阶段变慢超过 --threshold（默认 25%，且至少慢 10ms）即标记为回退，退出码为 1。
+基线记录了 Python 版本、平台和语料指纹，与当前环境不同时给出提示。
+
+用法:
+    python3 scripts/bench_pipeline.py [--sizes 1000,10000,100000] [--repeat 3] [--seed 42]
+                                      [--threshold 0.25] [--save-baseline] [--help]
+"""
+
+import gc
+import hashlib
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+from article_renderer import render_record
+from article_store import ArticleStore
+from auto_fetch_enhanced import article_matcher, load_sources
+from content_review import score_articles
+from kb_loader import load_knowledge_base, parse_knowledge_base_text
+from kb_store import KnowledgeBaseStore, normalize_record
+from run_metrics import RunMetrics
+from search_index import build_search_index
+
+WORKSPACE = "."
+KB_FILE = f"{WORKSPACE}/knowledge-base.js"
+BASELINE_FILE = f"{WORKSPACE}/data/bench_baseline.json"
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_REPEAT = 3
+DEFAULT_SEED = 42
+DEFAULT_THRESHOLD = 0.25
+# 比基线慢不到这么多秒的不算回退（小规模阶段只有几毫秒，抖动比例很大）
+MIN_REGRESSION_SECONDS = 0.01
+
+STAGES = ('parse', 'classify', 'render', 'write', 'snapshot', 'shards', 'review', 'index')
+
+# KnowledgeBaseStore.build 内部的计时段 → 基准阶段
+BUILD_SPANS = {'kb.write_js': 'write', 'kb.snapshot': 'snapshot', 'kb.shards': 'shards'}
+
+
+# ---------- 合成语料 ----------
+
+def load_templates():
+    """真实文章模板：(原始文章列表, 知识库记录列表)"""
+    raw = [article for _, article in ArticleStore().iter_articles()]
+    _, articles = load_knowledge_base(KB_FILE, render_content=False)
+    records = [normalize_record(article) for article in articles.values()]
+    return raw, records
+
+
+def synthesize(raw_templates, record_templates, size, seed):
+    """
+    合成 size 篇文章，返回 (原始文章列表, {id: 知识库记录})。
+    相同的模板和种子得到相同的语料；标题、链接、日期按序号变化，避免所有文章完全相同。
+    """
+    rng = random.Random(seed)
+    raw_articles = []
+    records = {}
+    for i in range(size):
+        article_id = hashlib.md5(f"{seed}-{i}".encode()).hexdigest()[:12]
+        month, day = rng.randrange(1, 13), rng.randrange(1, 29)
+
+        raw = dict(rng.choice(raw_templates))
+        raw.update(id=article_id, title=f"{raw.get('title', '')} #{i}",
+                   link=f"{raw.get('link', '')}?n={i}", published=f"2026-{month:02d}-{day:02d}")
+        raw_articles.append(raw)
+
+        record = json.loads(json.dumps(rng.choice(record_templates)))
+        record.update(title=f"{record.get('title', '')} #{i}", date=f"2026-{month:02d}-{day:02d}")
+        if 'fields' in record:
+            record['fields'] = dict(record['fields'], link=f"https://example.com/{article_id}")
+        records[article_id] = record
+    return raw_articles, records
+
+
+def kb_text(records):
+    """与 KnowledgeBaseStore.build 相同格式的 knowledge-base.js 文本（不含尾部 JS）"""
+    body = ',\n'.join(f'        {json.dumps(aid, ensure_ascii=False)}: {json.dumps(record, ensure_ascii=False)}'
+                      for aid, record in records.items())
+    return f"const knowledgeBase = {{\n    meta: {{}},\n    articles: {{\n{body}\n    }},\n}};\n"
+
+
+# ---------- 计时 ----------
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_build(records, repeat):
+    """在临时目录里运行 KnowledgeBaseStore.build，从计时段中取各阶段耗时"""
+    best = {}
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = lambda name: os.path.join(tmp, name)
+            store = KnowledgeBaseStore(
+                kb_file=path('knowledge-base.js'), store_file=path('kb_store.jsonl'),
+                index_file=path('kb_store.idx'), state_file=path('kb_store.state.json'),
+                manifest_file=path('kb-manifest.js'), shard_dir=path('kb-content'),
+                search_index_file=path('kb-search.json'), render_file=path('kb-render.js'),
+                snapshot_file=path('kb_meta.snap'), journal_file=path('kb_journal.jsonl'))
+            store.add_articles(records)
+            gc.collect()
+            with RunMetrics('bench_pipeline', metrics_file=path('metrics.jsonl')) as metrics:
+                store.build({"version": "bench"}, compress=False)
+            for name, stage in metrics.stages().items():
+                if name in BUILD_SPANS:
+                    key = BUILD_SPANS[name]
+                    best[key] = min(best.get(key, stage['total']), stage['total'])
+    return best
+
+
+def run_size(raw_templates, record_templates, size, repeat, seed, settings):
+    raw_articles, records = synthesize(raw_templates, record_templates, size, seed)
+    text = kb_text(records)
+    fingerprint = hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+    matcher = article_matcher(settings.get('exclude_keywords', []))
+    items = list(records.items())
+
+    results = {
+        'parse': best_of(repeat, lambda: parse_knowledge_base_text(text, render_content=False)),
+        'classify': best_of(repeat, lambda: [matcher.scan(a.get('title', ''), a.get('summary', ''))
+                                             for a in raw_articles]),
+        'render': best_of(repeat, lambda: [render_record(record) for record in records.values()]),
+        'review': best_of(repeat, lambda: score_articles(raw_articles)),
+        'index': best_of(repeat, lambda: build_search_index(items)),
+    }
+    results.update(time_build(records, repeat))
+    return {"seconds": {stage: round(results[stage], 4) for stage in STAGES},
+            "corpus": fingerprint, "kb_mb": round(len(text.encode('utf-8')) / 1024 / 1024, 1)}
+
+
+# ---------- 基线 ----------
+
+def environment():
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine()}
+
+
+def load_baseline(path=BASELINE_FILE):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(result, baseline, threshold):
+    """返回 {阶段: (基线秒数, 变化比例, 是否回退)}"""
+    report = {}
+    for stage, seconds in result["seconds"].items():
+        base = baseline["seconds"].get(stage) if baseline else None
+        if not base:
+            report[stage] = (None, None, False)
+            continue
+        change = seconds / base - 1
+        report[stage] = (base, change, change > threshold and seconds - base > MIN_REGRESSION_SECONDS)
+    return report
+
+
+# 带值的选项和开关
+VALUE_OPTIONS = ('--sizes', '--repeat', '--seed', '--threshold')
+FLAG_OPTIONS = ('--save-baseline',)
+
+
+def usage(code):
+    print(__doc__)
+    sys.exit(code)
+
+
+def main():
+    args = sys.argv[1:]
+    if '-h' in args or '--help' in args:
+        usage(0)
+
+    # 只接受已知选项，带值的选项后面必须有值
+    i = 0
+    while i < len(args):
+        if args[i] in VALUE_OPTIONS and i + 1 < len(args):
+            i += 2
+        elif args[i] in FLAG_OPTIONS:
+            i += 1
+        elif args[i] in VALUE_OPTIONS:
+            print(f"❌ {args[i]} 缺少值")
+            usage(1)
+        else:
+            print(f"❌ 无法识别的参数: {args[i]}")
+            usage(1)
+
+    def option(name, default, cast):
+        if name not in args:
+            return default
+        try:
+            return cast(args[args.index(name) + 1])
+        except ValueError:
+            print(f"❌ {name} 的值无效: {args[args.index(name) + 1]}")
+            usage(1)
+
+    sizes = option('--sizes', DEFAULT_SIZES, lambda v: [int(x) for x in v.split(',')])
+    repeat = option('--repeat', DEFAULT_REPEAT, int)
+    seed = option('--seed', DEFAULT_SEED, int)
+    threshold = option('--threshold', DEFAULT_THRESHOLD, float)
+
+    raw_templates, record_templates = load_templates()
+    settings = load_sources().get('settings', {})
+    baseline = load_baseline()
+    env = environment()
+    if baseline and baseline.get("environment") != env:
+        print(f"⚠️ 基线来自不同环境 {baseline.get('environment')}，比较结果仅供参考")
+
+    results = {}
+    regressions = []
+    for size in sizes:
+        result = run_size(raw_templates, record_templates, size, repeat, seed, settings)
+        results[str(size)] = result
+        base = (baseline or {}).get("sizes", {}).get(str(size))
+        if base and base.get("corpus") != result["corpus"]:
+            print(f"⚠️ {size} 篇的语料与基线不同（模板文章或种子变化），比较结果仅供参考")
+        print(f"\n📊 {size} 篇文章 (knowledge-base.js {result['kb_mb']} MB, 取 {repeat} 次最快)")
+        print(f"  {'阶段':<10} {'耗时':>9} {'基线':>9} {'变化':>8}")
+        for stage, (base_seconds, change, regressed) in compare(result, base, threshold).items():
+            seconds = result["seconds"][stage]
+            base_text = f"{base_seconds:.3f}s" if base_seconds else '-'
+            change_text = f"{change * 100:+.0f}%" if change is not None else '-'
+            print(f"  {stage:<10} {seconds:>8.3f}s {base_text:>9} {change_text:>8} {'❌ 回退' if regressed else ''}")
+            if regressed:
+                regressions.append(f"{size}/{stage}")
+
+    if '--save-baseline' in args:
+        saved = baseline or {}
+        saved.update(environment=env, seed=seed, repeat=repeat)
+        saved.setdefault("sizes", {}).update(results)
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(saved, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 已保存基线: {BASELINE_FILE}")
+
+    if regressions:
+        print(f"\n❌ 超过阈值 {threshold * 100:.0f}% 的回退: {', '.join(regressions)}")
+        sys.exit(1)
+    if baseline:
+        print("\n✅ 没有发现回退")
+    elif '--save-baseline' not in args:
+        print("\n(无基线，使用 --save-baseline 保存)")
+
+
+if __name__ == "__main__":
+    main()
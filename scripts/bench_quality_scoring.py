@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+批量质量评分基准测试
+用 data/articles.jsonl 中的真实文章放大到 1x / 10x / 100x（100x 约 12 万篇），对比：
+- 旧版 check_content_quality() 逐篇评分（逐个关键词、逐个来源重复 lower()）
+- score_articles() 批量评分
+先校验两者输出（分数、等级、原因）逐篇一致，再输出耗时。
+
+用法:
+    python3 scripts/bench_quality_scoring.py [--scales 1,10,100]
+"""
+
+import sys
+import time
+
+from article_store import ArticleStore
+from content_review import QUALITY_KEYWORDS, QUALITY_SOURCES, quality_level, score_articles
+
+
+def legacy_check_content_quality(article):
+    """旧版 check_content_quality()"""
+    title = article.get('title', '')
+    summary = article.get('summary', '')
+    score = 0
+    reasons = []
+    for keyword in QUALITY_KEYWORDS:
+        if keyword.lower() in title.lower() or keyword.lower() in summary.lower():
+            score += 10
+            reasons.append(f"包含优质关键词: {keyword}")
+    source_name = article.get('source_name', '')
+    if any(source.lower() in source_name.lower() for source in QUALITY_SOURCES):
+        score += 20
+        reasons.append("来源为优质技术站点")
+    if len(summary) > 100:
+        score += 10
+        reasons.append("摘要内容完整")
+    if any(kw in title.lower() for kw in ['unreal', 'ue5', 'niagara', 'lumen']):
+        score += 15
+        reasons.append("Unreal Engine相关内容")
+    return {"score": score, "level": quality_level(score), "reasons": reasons}
+
+
+def main():
+    args = sys.argv[1:]
+    scales = [1, 10, 100]
+    if '--scales' in args:
+        scales = [int(x) for x in args[args.index('--scales') + 1].split(',')]
+
+    articles = [article for _, article in ArticleStore().iter_articles()]
+    batch = score_articles(articles)
+    for article, result in zip(articles, batch):
+        assert legacy_check_content_quality(article) == result, article['title']
+    print(f"✅ {len(articles)} 篇文章评分结果一致\n")
+
+    print(f"{'规模':>8} {'逐篇评分':>10} {'批量评分':>10} {'加速':>6}")
+    for scale in scales:
+        corpus = articles * scale
+        start = time.perf_counter()
+        for article in corpus:
+            legacy_check_content_quality(article)
+        old = time.perf_counter() - start
+        start = time.perf_counter()
+        score_articles(corpus)
+        new = time.perf_counter() - start
+        print(f"{len(corpus):>8} {old:>9.2f}s {new:>9.2f}s {old / new:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
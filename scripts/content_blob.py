@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+文章正文 blob 文件（维护工具用）
+- data/kb_content.blob: 所有文章正文HTML (UTF-8) 首尾相接
+- data/kb_content.bidx: 每行 "id<TAB>偏移<TAB>长度<TAB>容量"，只追加，同一ID后写覆盖先写
+- 读取时 mmap blob 文件，按偏移切出一篇文章解码，不读入整个知识库
+- 修改一篇文章：新正文先追加到 blob 末尾并 fsync，再追加一行索引。索引行写入前旧版本始终有效，
+  中断时最多留下 blob 末尾没有索引指向的字节（compact() 时去掉），不会出现写了一半的正文
+- compact() 去掉被覆盖的旧版本
+- 修改过、还没写回存储的文章ID记在 data/kb_content.state.json 的 dirty 中；
+  写回前中断时，下次 sync_from_store() 先把它们重新写回存储
+
+正文来自知识库存储 (kb_store.py) 渲染后的HTML，存储变化后 sync_from_store() 自动重建。
+模板改版后用 build 全量重新渲染，文章多时按 --jobs 分块交给多进程渲染（article_renderer.render_records），
+结果按存储顺序合并，与串行渲染逐字节相同。
+修改完成后 apply_to_store() 把改过的文章写回存储，再 build 生成 knowledge-base.js。
+
+用法:
+    blob = ContentBlob()
+    blob.sync_from_store(store)
+    blob.patch(article_id, lambda html: html.replace(...))
+    blob.apply_to_store(store)
+    python3 scripts/content_blob.py build [--jobs N]    # 全量重新渲染（默认按CPU核数多进程）
+    python3 scripts/content_blob.py stats | compact
+    python3 scripts/content_blob.py get <文章ID>
+"""
+
+import json
+import mmap
+import os
+import sys
+import time
+
+from article_renderer import render_records
+from kb_journal import atomic_write, truncate_partial_line
+from kb_store import KnowledgeBaseStore, normalize_record
+
+WORKSPACE = "."
+BLOB_FILE = f"{WORKSPACE}/data/kb_content.blob"
+BLOB_INDEX_FILE = f"{WORKSPACE}/data/kb_content.bidx"
+BLOB_STATE_FILE = f"{WORKSPACE}/data/kb_content.state.json"
+
+APPENDED = "appended"
+UNCHANGED = "unchanged"
+
+
+class ContentBlob:
+    """正文 blob + 偏移索引"""
+
+    def __init__(self, blob_file=BLOB_FILE, index_file=BLOB_INDEX_FILE, state_file=BLOB_STATE_FILE):
+        self.blob_file = blob_file
+        self.index_file = index_file
+        self.state_file = state_file
+        self._index = None
+        self._mm = None
+        self._file = None
+        self.dirty = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._file.close()
+            self._mm = None
+
+    # ---------- 索引 ----------
+
+    def load_index(self):
+        """返回 {id: (偏移, 长度, 容量)}"""
+        if self._index is None:
+            self._index = {}
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        # 没有换行结尾的是中断留下的半行，该次写入没有生效
+                        if not line.endswith('\n'):
+                            continue
+                        parts = line.rstrip('\n').split('\t')
+                        if len(parts) == 4:
+                            self._index[parts[0]] = tuple(int(x) for x in parts[1:])
+        return self._index
+
+    def __contains__(self, article_id):
+        return article_id in self.load_index()
+
+    def __len__(self):
+        return len(self.load_index())
+
+    def __iter__(self):
+        return iter(list(self.load_index()))
+
+    def _append_index(self, entries):
+        truncate_partial_line(self.index_file)
+        with open(self.index_file, 'a', encoding='utf-8') as f:
+            for article_id, (offset, length, capacity) in entries:
+                f.write(f"{article_id}\t{offset}\t{length}\t{capacity}\n")
+                self._index[article_id] = (offset, length, capacity)
+            f.flush()
+            os.fsync(f.fileno())
+
+    # ---------- 读取 ----------
+
+    def _map(self, end):
+        """保证 mmap 覆盖到 end（追加写入后重新映射）"""
+        if self._mm is None or len(self._mm) < end:
+            self.close()
+            self._file = open(self.blob_file, 'rb')
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mm
+
+    def get_bytes(self, article_id):
+        entry = self.load_index().get(article_id)
+        if entry is None:
+            return None
+        offset, length, _ = entry
+        if length == 0:
+            return b''
+        return self._map(offset + length)[offset:offset + length]
+
+    def get(self, article_id):
+        data = self.get_bytes(article_id)
+        return data.decode('utf-8') if data is not None else None
+
+    def items(self):
+        """逐篇产出 (id, 正文)"""
+        for article_id in self:
+            yield article_id, self.get(article_id)
+
+    # ---------- 写入 ----------
+
+    def put(self, article_id, html):
+        """
+        写入一篇文章的正文，返回 APPENDED / UNCHANGED。
+        新正文总是追加并 fsync 后才追加索引行，旧版本在索引行写入前一直有效
+        """
+        data = html.encode('utf-8')
+        if article_id in self.load_index() and self.get_bytes(article_id) == data:
+            return UNCHANGED
+        with open(self.blob_file, 'ab') as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._append_index([(article_id, (offset, len(data), len(data)))])
+        self.dirty.add(article_id)
+        self._write_state(dict(self._read_state(), dirty=sorted(self.dirty)))
+        return APPENDED
+
+    def patch(self, article_id, fix):
+        """用 fix(html) -> html 修改一篇文章，返回 put() 的结果"""
+        html = self.get(article_id)
+        if html is None:
+            raise KeyError(article_id)
+        return self.put(article_id, fix(html))
+
+    def rebuild(self, contents):
+        """用 {id: 正文} 或 (id, 正文) 序列整体重写 blob 和索引"""
+        items = contents.items() if isinstance(contents, dict) else contents
+        self.close()
+        os.makedirs(os.path.dirname(self.blob_file) or '.', exist_ok=True)
+        self._index = {}
+        offset = 0
+        with open(self.blob_file, 'wb') as blob, open(self.index_file, 'w', encoding='utf-8') as idx:
+            for article_id, html in items:
+                data = html.encode('utf-8')
+                blob.write(data)
+                idx.write(f"{article_id}\t{offset}\t{len(data)}\t{len(data)}\n")
+                self._index[article_id] = (offset, len(data), len(data))
+                offset += len(data)
+        self.dirty = set()
+        return len(self._index)
+
+    def compact(self):
+        """去掉被覆盖的旧版本，返回节省的字节数"""
+        before = os.path.getsize(self.blob_file) if os.path.exists(self.blob_file) else 0
+        contents = [(article_id, self.get(article_id)) for article_id in self]
+        dirty = self.dirty
+        self.rebuild(contents)
+        self.dirty = dirty
+        return before - os.path.getsize(self.blob_file)
+
+    # ---------- 与知识库存储同步 ----------
+
+    def _store_fingerprint(self, store):
+        if not os.path.exists(store.store_file):
+            return {}
+        stat = os.stat(store.store_file)
+        return {"store_size": stat.st_size, "store_mtime_ns": stat.st_mtime_ns}
+
+    def _read_state(self):
+        if not os.path.exists(self.state_file):
+            return {}
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_state(self, state):
+        atomic_write(self.state_file, json.dumps(state, indent=2))
+
+    def _save_state(self, store):
+        self._write_state(dict(self._store_fingerprint(store), dirty=sorted(self.dirty)))
+
+    def is_synced(self, store):
+        if not os.path.exists(self.index_file):
+            return False
+        state = self._read_state()
+        state.pop("dirty", None)
+        return bool(state) and state == self._store_fingerprint(store)
+
+    def sync_from_store(self, store, force=False, jobs=None):
+        """
+        存储变化后（或 force 时）从存储重建 blob，jobs 为渲染进程数，返回是否重建。
+        上次修改后没来得及写回存储的文章先写回
+        """
+        store.ensure_synced()
+        pending = [aid for aid in self._read_state().get("dirty", []) if aid in self]
+        if pending:
+            self.dirty.update(pending)
+            print(f"  ♻️ 写回上次中断前修改的 {self.apply_to_store(store)} 篇正文")
+        if not force and self.is_synced(store):
+            return False
+        records = store.iter_raw()
+        self.rebuild(zip(records, render_records(records.values(), jobs=jobs)))
+        self._save_state(store)
+        return True
+
+    def apply_to_store(self, store):
+        """把修改过的文章写回存储（结构化记录能无损转换时保持结构化），返回写回的篇数"""
+        if not self.dirty:
+            return 0
+        records = store.iter_raw()
+        updated = {}
+        for article_id in sorted(self.dirty):
+            if article_id in records:
+                article = json.loads(records[article_id])
+                article['content'] = self.get(article_id)
+                updated[article_id] = normalize_record(article)
+        store.add_articles(updated, overwrite=True)
+        self.dirty = set()
+        self._save_state(store)
+        return len(updated)
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    jobs = int(sys.argv[sys.argv.index('--jobs') + 1]) if '--jobs' in sys.argv else None
+    blob = ContentBlob()
+    store = KnowledgeBaseStore()
+
+    if command == 'build':
+        start = time.perf_counter()
+        blob.sync_from_store(store, force=True, jobs=jobs)
+        print(f"✅ 已生成 {blob.blob_file}: {len(blob)} 篇文章, {os.path.getsize(blob.blob_file) / 1024:.1f} KB, "
+              f"{time.perf_counter() - start:.2f}s")
+    elif command == 'stats':
+        blob.sync_from_store(store)
+        live = sum(length for _, length, _ in blob.load_index().values())
+        size = os.path.getsize(blob.blob_file)
+        print(f"📦 正文 blob: {len(blob)} 篇文章, {size / 1024:.1f} KB (有效 {live / 1024:.1f} KB)")
+    elif command == 'compact':
+        blob.sync_from_store(store)
+        print(f"✅ 压缩完成，节省 {blob.compact() / 1024:.1f} KB")
+    elif command == 'get' and len(sys.argv) > 2:
+        blob.sync_from_store(store)
+        html = blob.get(sys.argv[2])
+        if html is None:
+            print(f"❌ 找不到文章: {sys.argv[2]}")
+            sys.exit(1)
+        print(html)
+    else:
+        print(__doc__)
+        sys.exit(1)
+    blob.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,18 +6,33 @@ Realtime Tech Library - 内容质量Review工具
 2. 阅读原文链接有效性
 3. 内容质量评分
 4. 优质内容标记
+
+增量Review：data/review_log.json 按文章ID保存结果和内容哈希，
+只有新增、内容变化（或超过 REVIEW_TTL_DAYS 未检查、上次链接检查结果是临时的）的文章会重新评分和检查链接，
+质量分布随之增量更新。
 """
 
+import hashlib
 import json
 import os
 import re
 from datetime import datetime, timedelta
 
+from article_store import ArticleStore
+from keyword_matcher import KeywordMatcher
+from link_checker import LinkCache, check_links
+
 WORKSPACE = "."
-ARTICLES_FILE = f"{WORKSPACE}/data/articles.json"
 KB_FILE = f"{WORKSPACE}/knowledge-base.js"
 REVIEW_LOG = f"{WORKSPACE}/data/review_log.json"
 
+# 修改评分规则后递增，所有文章会重新Review
+REVIEW_VERSION = 2
+# 内容未变的文章超过这个天数也重新Review（主要是重新检查链接）
+REVIEW_TTL_DAYS = 30
+
+QUALITY_LEVELS = ["优质", "良好", "一般", "需改进"]
+
 # 优质来源白名单
 QUALITY_SOURCES = [
     "Unreal Engine 官方博客",
@@ -39,6 +54,12 @@ QUALITY_KEYWORDS = [
     "Houdini", "Ray Tracing", "Global Illumination", "PBR", "VFX", " Niagara"
 ]
 
+# 标题中出现即视为UE相关
+UE_TITLE_KEYWORDS = ['unreal', 'ue5', 'niagara', 'lumen']
+
+QUALITY_MATCHER = KeywordMatcher({'quality': QUALITY_KEYWORDS})
+UE_TITLE_MATCHER = KeywordMatcher({'ue': UE_TITLE_KEYWORDS})
+
 def load_json(filepath):
     if os.path.exists(filepath):
         with open(filepath, 'r', encoding='utf-8') as f:
@@ -56,79 +77,114 @@ def check_source_quality(source_name):
             return True
     return False
 
-def check_content_quality(article):
-    """检查内容质量"""
-    title = article.get('title', '')
-    summary = article.get('summary', '')
-    
-    score = 0
-    reasons = []
-    
-    # 检查优质关键词
-    for keyword in QUALITY_KEYWORDS:
-        if keyword.lower() in title.lower() or keyword.lower() in summary.lower():
+def quality_level(score):
+    """分数 -> 质量等级"""
+    if score >= 40:
+        return "优质"
+    if score >= 25:
+        return "良好"
+    if score >= 10:
+        return "一般"
+    return "需改进"
+
+def score_articles(articles):
+    """
+    批量内容质量评分，返回与 articles 一一对应的 {"score", "level", "reasons"}。
+    优质关键词和标题UE关键词各在整个文章集上扫描一次（KeywordMatcher.find_rows），
+    来源只有几十种，每种只判断一次。
+    """
+    articles = list(articles)
+    titles = [article.get('title', '') for article in articles]
+    # 关键词命中矩阵按列存储：{关键词: 命中的文章下标}，只为命中的文章建立原因列表
+    hits = QUALITY_MATCHER.find_rows(
+        (title, article.get('summary', '')) for title, article in zip(titles, articles))
+    keyword_hits = {}
+    for keyword, lower in QUALITY_MATCHER.groups['quality']:
+        for row in hits[lower]:
+            keyword_hits.setdefault(row, []).append(keyword)
+    ue_rows = {row for rows in UE_TITLE_MATCHER.find_rows((title,) for title in titles).values() for row in rows}
+    quality_sources = {}
+
+    results = []
+    for row, article in enumerate(articles):
+        score = 0
+        reasons = []
+        
+        # 检查优质关键词
+        for keyword in keyword_hits.get(row, ()):
             score += 10
             reasons.append(f"包含优质关键词: {keyword}")
-    
-    # 检查来源质量
-    if check_source_quality(article.get('source_name', '')):
-        score += 20
-        reasons.append("来源为优质技术站点")
-    
-    # 检查摘要长度（有摘要通常质量更高）
-    if len(summary) > 100:
-        score += 10
-        reasons.append("摘要内容完整")
-    
-    # 检查是否有UE相关内容
-    if any(kw in title.lower() for kw in ['unreal', 'ue5', 'niagara', 'lumen']):
-        score += 15
-        reasons.append("Unreal Engine相关内容")
-    
-    # 判断质量等级
-    if score >= 40:
-        level = "优质"
-    elif score >= 25:
-        level = "良好"
-    elif score >= 10:
-        level = "一般"
-    else:
-        level = "需改进"
-    
-    return {
-        "score": score,
-        "level": level,
-        "reasons": reasons
-    }
+        
+        # 检查来源质量
+        source_name = article.get('source_name', '')
+        if source_name not in quality_sources:
+            quality_sources[source_name] = check_source_quality(source_name)
+        if quality_sources[source_name]:
+            score += 20
+            reasons.append("来源为优质技术站点")
+        
+        # 检查摘要长度（有摘要通常质量更高）
+        if len(article.get('summary', '')) > 100:
+            score += 10
+            reasons.append("摘要内容完整")
+        
+        # 检查是否有UE相关内容
+        if row in ue_rows:
+            score += 15
+            reasons.append("Unreal Engine相关内容")
+        
+        results.append({
+            "score": score,
+            "level": quality_level(score),
+            "reasons": reasons
+        })
+    return results
 
-def check_link_validity(article):
-    """检查原文链接（标记需要检查的链接）"""
-    link = article.get('link', '')
-    
+def check_content_quality(article):
+    """检查单篇内容质量"""
+    return score_articles([article])[0]
+
+def check_link_format(link):
+    """链接格式检查（不联网），没有问题返回 None"""
     # 检查链接格式
     if not link.startswith(('http://', 'https://')):
-        return {"valid": False, "issue": "链接格式不正确"}
+        return "链接格式不正确"
     
     # 检查是否为常见无效链接
     invalid_patterns = ['example.com', 'localhost', '127.0.0.1']
     for pattern in invalid_patterns:
         if pattern in link:
-            return {"valid": False, "issue": f"包含无效域名: {pattern}"}
+            return f"包含无效域名: {pattern}"
     
-    return {"valid": True, "issue": None}
+    return None
 
-def review_article(article_id, article):
-    """Review单篇文章"""
+def check_link_validity(article, link_results=None):
+    """
+    检查原文链接：先检查格式，再使用 check_links() 的联网检查结果（如果有）。
+    cacheable 为 False 表示结果是临时的（如域名暂时无法解析），下次运行需要重新检查
+    """
+    link = article.get('link', '')
+    issue = check_link_format(link)
+    if issue:
+        return {"valid": False, "issue": issue, "cacheable": True}
+    
+    result = (link_results or {}).get(link)
+    if result is None:
+        return {"valid": True, "issue": None, "cacheable": True}
+    return {"valid": result['valid'], "issue": result['issue'], "cacheable": result.get('cacheable', True)}
+
+def review_article(article_id, article, link_results=None, quality=None):
+    """Review单篇文章；quality 为 score_articles() 批量算好的评分"""
     print(f"\n📄 Review: {article['title'][:50]}...")
     
     # 内容质量检查
-    quality = check_content_quality(article)
+    quality = quality or check_content_quality(article)
     print(f"   质量评分: {quality['score']} - {quality['level']}")
     for reason in quality['reasons'][:2]:  # 只显示前2个原因
         print(f"   ✓ {reason}")
     
     # 链接有效性检查
-    link_check = check_link_validity(article)
+    link_check = check_link_validity(article, link_results)
     if not link_check['valid']:
         print(f"   ⚠️ 链接问题: {link_check['issue']}")
     
@@ -139,27 +195,87 @@ def review_article(article_id, article):
         "quality_level": quality['level'],
         "link_valid": link_check['valid'],
         "link_issue": link_check['issue'],
+        "link_cacheable": link_check['cacheable'],
         "reviewed_at": datetime.now().isoformat()
     }
 
+def content_hash(article):
+    """参与Review的字段 + 规则版本的哈希，变化时才需要重新Review"""
+    fields = [str(REVIEW_VERSION)] + [article.get(k) or '' for k in ('title', 'summary', 'source_name', 'link')]
+    return hashlib.sha1('\0'.join(fields).encode('utf-8')).hexdigest()
+
+def load_review_log():
+    """读取Review日志，results 为 {article_id: 结果}；旧的列表格式转换后重新统计分布"""
+    log = load_json(REVIEW_LOG)
+    results = log.get('results', {})
+    if isinstance(results, list) or 'quality_distribution' not in log:
+        results = {r['article_id']: r for r in results} if isinstance(results, list) else results
+        distribution = {level: 0 for level in QUALITY_LEVELS}
+        for result in results.values():
+            distribution[result['quality_level']] += 1
+        log['quality_distribution'] = distribution
+    log['results'] = results
+    return log
+
+def needs_review(previous, digest, now):
+    if previous is None or previous.get('content_hash') != digest:
+        return True
+    # 上次的链接检查结果是临时的（网络错误等），不能沿用到 REVIEW_TTL_DAYS
+    if previous.get('link_cacheable') is False:
+        return True
+    reviewed_at = datetime.fromisoformat(previous['reviewed_at'])
+    return now - reviewed_at > timedelta(days=REVIEW_TTL_DAYS)
+
 def main():
     print("="*60)
     print("🔍 Realtime Tech Library - 内容质量Review")
     print(f"时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*60)
     
-    # 加载文章
-    articles = load_json(ARTICLES_FILE)
-    print(f"\n📚 共 {len(articles)} 篇文章需要Review")
+    # 加载文章和上次的Review结果
+    store = ArticleStore()
+    total_articles = len(store)
+    review_log = load_review_log()
+    previous_results = review_log['results']
+    quality_stats = review_log['quality_distribution']
     
-    # Review每篇文章
-    review_results = []
-    quality_stats = {"优质": 0, "良好": 0, "一般": 0, "需改进": 0}
+    # 只Review新增、内容变化、超过 REVIEW_TTL_DAYS 或上次链接检查结果是临时的文章
+    now = datetime.now()
+    changed = []
+    hashes = {}
+    for article_id, article in store.iter_articles():
+        digest = content_hash(article)
+        hashes[article_id] = digest
+        if needs_review(previous_results.get(article_id), digest, now):
+            changed.append((article_id, article))
+    removed = [aid for aid in previous_results if aid not in hashes]
+    print(f"\n📚 共 {total_articles} 篇文章, 需要Review {len(changed)} 篇 (未变化 {total_articles - len(changed)} 篇)")
     
-    for article_id, article in articles.items():
-        result = review_article(article_id, article)
-        review_results.append(result)
+    # 并发检查需要Review的原文链接（缓存期内检查过的跳过）
+    links = [a.get('link', '') for _, a in changed]
+    links = [link for link in links if not check_link_format(link)]
+    link_results = {}
+    if links:
+        print(f"\n🔗 检查 {len(links)} 个原文链接...")
+        link_cache = LinkCache()
+        link_results = check_links(links, cache=link_cache)
+        link_cache.save()
+        print(f"   {link_cache.summary()}")
+    
+    # Review变化的文章，增量更新分布统计
+    review_results = []
+    qualities = score_articles(article for _, article in changed)
+    for (article_id, article), quality in zip(changed, qualities):
+        result = review_article(article_id, article, link_results, quality)
+        result['content_hash'] = hashes[article_id]
+        old = previous_results.get(article_id)
+        if old is not None:
+            quality_stats[old['quality_level']] -= 1
         quality_stats[result['quality_level']] += 1
+        previous_results[article_id] = result
+        review_results.append(result)
+    for article_id in removed:
+        quality_stats[previous_results.pop(article_id)['quality_level']] -= 1
     
     # 统计
     print("\n" + "="*60)
@@ -168,19 +284,24 @@ def main():
     for level, count in quality_stats.items():
         print(f"  {level}: {count}篇")
     
-    # 保存Review日志
-    review_log = {
-        "review_date": datetime.now().isoformat(),
-        "total_articles": len(articles),
-        "quality_distribution": quality_stats,
-        "results": review_results
-    }
-    save_json(review_log, REVIEW_LOG)
-    print(f"\n💾 Review日志已保存: {REVIEW_LOG}")
+    # 合并进Review日志（没有变化时不重写）
+    if review_results or removed:
+        review_log.update({
+            "review_date": now.isoformat(),
+            "total_articles": len(previous_results),
+            "quality_distribution": quality_stats,
+            "last_run": {"reviewed": len(review_results), "removed": len(removed),
+                         "unchanged": total_articles - len(review_results)},
+            "results": previous_results
+        })
+        save_json(review_log, REVIEW_LOG)
+        print(f"\n💾 Review日志已更新: {REVIEW_LOG}")
+    else:
+        print("\n✓ 没有需要Review的文章")
     
-    # 标记优质文章
+    # 标记本次Review出的优质文章
     high_quality = [r for r in review_results if r['quality_level'] == '优质']
-    print(f"\n🏆 优质文章: {len(high_quality)}篇")
+    print(f"\n🏆 新增优质文章: {len(high_quality)}篇")
     for item in high_quality[:5]:  # 只显示前5篇
         print(f"  • {item['title'][:40]}...")
     
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+抓取去重索引 (所有抓取脚本共用)
+- data/dedup.bloom: 布隆过滤器，启动时只读这个固定大小的文件；判定"不存在"即可直接放行
+- data/dedup.idx: 按ID排序的精确集合，每行 "id<TAB>md5(规范化链接)"，mmap 后二分查找确认
+- data/dedup.log: 新增条目先追加到这里（未排序的小尾巴），超过 MERGE_THRESHOLD 行后合并进 dedup.idx
+- 三个文件都是 data/articles.jsonl 的派生文件，不进 git；布隆过滤器不存在时自动从文章库重建。
+  条目数是不同的规范化链接数，可能少于文章数（同一链接的旧文章只算一条）
+
+文章ID是 md5(规范化链接) 的前12位（见 url_canon.py）。ID相同但完整哈希不同说明截断后撞了，
+claim() 会给新文章换成更长的ID，而不是把它当成重复文章丢掉。
+
+用法:
+    python3 scripts/dedup_index.py build              # 从 data/articles.jsonl 重建
+    python3 scripts/dedup_index.py stats
+    python3 scripts/dedup_index.py check <链接>
+"""
+
+import hashlib
+import json
+import math
+import mmap
+import os
+import sys
+
+from url_canon import canonicalize_url
+
+WORKSPACE = "."
+DEDUP_INDEX_FILE = f"{WORKSPACE}/data/dedup.idx"
+DEDUP_LOG_FILE = f"{WORKSPACE}/data/dedup.log"
+DEDUP_BLOOM_FILE = f"{WORKSPACE}/data/dedup.bloom"
+
+DEFAULT_CAPACITY = 20000
+FALSE_POSITIVE_RATE = 0.01
+MERGE_THRESHOLD = 500
+
+# 短ID冲突时使用的ID长度
+LONG_ID_LENGTH = 20
+
+NEW = "new"
+DUPLICATE = "duplicate"
+COLLISION = "collision"
+
+
+def link_hash(link):
+    return hashlib.md5(canonicalize_url(link).encode()).hexdigest()
+
+
+class BloomFilter:
+    """固定大小的布隆过滤器，文件格式: 一行 JSON 头 + 位数组"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, error_rate=FALSE_POSITIVE_RATE):
+        self.capacity = capacity
+        self.bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.count = 0
+        self.data = bytearray((self.bits + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.md5(key.encode()).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self.data[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.data[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def save(self, path):
+        header = {"capacity": self.capacity, "bits": self.bits, "hashes": self.hashes, "count": self.count}
+        with open(path, 'wb') as f:
+            f.write(json.dumps(header).encode() + b'\n')
+            f.write(self.data)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            header = json.loads(f.readline())
+            bloom = cls.__new__(cls)
+            bloom.capacity = header["capacity"]
+            bloom.bits = header["bits"]
+            bloom.hashes = header["hashes"]
+            bloom.count = header["count"]
+            bloom.data = bytearray(f.read())
+        return bloom
+
+
+def _search_sorted(path, key):
+    """在按ID排序的 "id<TAB>hash" 文件中二分查找，返回 hash 或 None"""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    target = key.encode()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lo, hi = 0, len(mm)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = mm.rfind(b'\n', 0, mid) + 1
+            end = mm.find(b'\n', start)
+            end = len(mm) if end < 0 else end
+            line_id, _, value = mm[start:end].partition(b'\t')
+            if line_id == target:
+                return value.decode()
+            if line_id < target:
+                lo = end + 1
+            else:
+                hi = start
+    return None
+
+
+class DedupIndex:
+    """布隆过滤器 + 磁盘上的精确集合"""
+
+    def __init__(self, index_file=DEDUP_INDEX_FILE, log_file=DEDUP_LOG_FILE, bloom_file=DEDUP_BLOOM_FILE):
+        self.index_file = index_file
+        self.log_file = log_file
+        self.bloom_file = bloom_file
+        self.pending = {}
+        self.tail = {}
+        self.stats = {"bloom_negative": 0, "confirmed": 0, "false_positive": 0, "collisions": 0}
+        if not os.path.exists(bloom_file):
+            self.rebuild()
+        self.bloom = BloomFilter.load(bloom_file)
+        if os.path.exists(log_file):
+            with open(log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    article_id, _, digest = line.rstrip('\n').partition('\t')
+                    if article_id:
+                        self.tail[article_id] = digest
+
+    def __len__(self):
+        return self.bloom.count
+
+    # ---------- 查询 ----------
+
+    def _stored_hash(self, article_id):
+        if article_id in self.pending:
+            return self.pending[article_id]
+        if article_id in self.tail:
+            return self.tail[article_id]
+        return _search_sorted(self.index_file, article_id)
+
+    def lookup(self, article_id, link):
+        """返回 NEW / DUPLICATE / COLLISION"""
+        if article_id not in self.bloom and article_id not in self.pending:
+            self.stats["bloom_negative"] += 1
+            return NEW
+        stored = self._stored_hash(article_id)
+        if stored is None:
+            self.stats["false_positive"] += 1
+            return NEW
+        if stored == link_hash(link):
+            self.stats["confirmed"] += 1
+            return DUPLICATE
+        self.stats["collisions"] += 1
+        return COLLISION
+
+    def claim(self, article):
+        """
+        文章是否为新文章。短ID与另一条链接冲突时，把 article['id'] 换成更长的ID再判断。
+        """
+        status = self.lookup(article['id'], article['link'])
+        if status == COLLISION:
+            long_id = link_hash(article['link'])[:LONG_ID_LENGTH]
+            print(f"    ⚠️  文章ID冲突 {article['id']}，改用 {long_id}: {article['link'][:60]}")
+            article['id'] = long_id
+            status = self.lookup(long_id, article['link'])
+        return status == NEW
+
+    # ---------- 写入 ----------
+
+    def add(self, article_id, link):
+        self.pending[article_id] = link_hash(link)
+
+    def save(self):
+        """新增条目写入布隆过滤器和日志，日志过长时合并进排序文件"""
+        if not self.pending:
+            return
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            for article_id, digest in self.pending.items():
+                f.write(f"{article_id}\t{digest}\n")
+                self.tail[article_id] = digest
+                self.bloom.add(article_id)
+        self.pending = {}
+        if self.bloom.count > self.bloom.capacity:
+            self.rebuild()
+        elif len(self.tail) > MERGE_THRESHOLD:
+            self.merge()
+        else:
+            self.bloom.save(self.bloom_file)
+
+    def _read_sorted(self):
+        entries = {}
+        if os.path.exists(self.index_file):
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    article_id, _, digest = line.rstrip('\n').partition('\t')
+                    if article_id:
+                        entries[article_id] = digest
+        return entries
+
+    def _write_sorted(self, entries):
+        with open(self.index_file, 'w', encoding='utf-8') as f:
+            for article_id in sorted(entries):
+                f.write(f"{article_id}\t{entries[article_id]}\n")
+        if os.path.exists(self.log_file):
+            os.remove(self.log_file)
+        self.tail = {}
+
+    def merge(self):
+        """把日志合并进排序文件"""
+        entries = self._read_sorted()
+        entries.update(self.tail)
+        self._write_sorted(entries)
+        self.bloom.save(self.bloom_file)
+
+    def rebuild(self, links=None):
+        """
+        重建排序文件和布隆过滤器。links 为文章链接的可迭代对象，按规范化链接重新计算ID；
+        不传则合并已有索引，索引也不存在时从 data/articles.jsonl 导入。
+        """
+        if links is None:
+            entries = self._read_sorted()
+            entries.update(getattr(self, 'tail', {}))
+            if not entries:
+                from article_store import ArticleStore
+                links = (a.get('link', '') for _, a in ArticleStore().iter_articles())
+        if links is not None:
+            entries = {}
+            for link in links:
+                digest = link_hash(link)
+                short = digest[:12]
+                # 与 claim() 一致：短ID已被其他链接占用时用长ID
+                key = short if entries.get(short, digest) == digest else digest[:LONG_ID_LENGTH]
+                entries[key] = digest
+
+        capacity = DEFAULT_CAPACITY
+        while capacity < len(entries) * 2:
+            capacity *= 2
+        bloom = BloomFilter(capacity)
+        for article_id in entries:
+            bloom.add(article_id)
+        self._write_sorted(entries)
+        bloom.save(self.bloom_file)
+        self.bloom = bloom
+        return len(entries)
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+
+    if command == 'build':
+        from article_store import ArticleStore
+        index = DedupIndex()
+        count = index.rebuild(a.get('link', '') for _, a in ArticleStore().iter_articles())
+        print(f"✅ 去重索引已重建: {count} 条, 布隆过滤器 {index.bloom.bits // 8 // 1024} KB")
+    elif command == 'stats':
+        index = DedupIndex()
+        bloom = index.bloom
+        print(f"📇 去重索引: {len(index)} 条 (未合并 {len(index.tail)} 条)")
+        print(f"  布隆过滤器: {bloom.bits // 8 // 1024} KB, {bloom.hashes} 个哈希, 容量 {bloom.capacity}")
+    elif command == 'check' and len(sys.argv) > 2:
+        link = sys.argv[2]
+        index = DedupIndex()
+        print(index.lookup(link_hash(link)[:12], link))
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
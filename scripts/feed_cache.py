@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+RSS条件请求缓存 (ETag / Last-Modified)
+- 按源ID保存上次响应的校验头，下次请求带上 If-None-Match / If-Modified-Since
+- 服务器返回 304 时跳过下载和解析
+- 记录命中/未命中次数，保存在 data/feed_cache.json
+- feed_cache.json 随自动更新提交，下次运行才能发出条件请求；命中统计每次都会变化，
+  只有校验头变化时才需要提交（见 changed 命令）
+
+用法:
+    python3 scripts/feed_cache.py changed <旧的 feed_cache.json>    # 校验头有变化时退出码为 0，否则为 1
+"""
+
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+
+WORKSPACE = "."
+FEED_CACHE_FILE = f"{WORKSPACE}/data/feed_cache.json"
+
+
+class FeedCache:
+    """每个源的校验头缓存，线程安全，可在并发抓取中共用"""
+
+    def __init__(self, path=FEED_CACHE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.data = {"sources": {}, "stats": {"hits": 0, "misses": 0}}
+        self.run_stats = {"hits": 0, "misses": 0}
+        # 本次运行更新校验头之前的旧值，用于 revert()
+        self._previous = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.data.update(json.load(f))
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"  ⚠️ 缓存文件损坏，重新开始: {e}")
+
+    def request_headers(self, key):
+        """返回条件请求头"""
+        with self._lock:
+            entry = self.data["sources"].get(key, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record_hit(self, key):
+        """304: 内容未变化"""
+        with self._lock:
+            entry = self.data["sources"].setdefault(key, {})
+            entry["hits"] = entry.get("hits", 0) + 1
+            entry["checked_at"] = datetime.now().isoformat()
+            self.data["stats"]["hits"] += 1
+            self.run_stats["hits"] += 1
+
+    def record_miss(self, key, response_headers):
+        """200: 保存新的校验头"""
+        with self._lock:
+            entry = self.data["sources"].setdefault(key, {})
+            self._previous.setdefault(key, (entry.get("etag"), entry.get("last_modified")))
+            entry["etag"] = response_headers.get("ETag")
+            entry["last_modified"] = response_headers.get("Last-Modified")
+            entry["misses"] = entry.get("misses", 0) + 1
+            entry["checked_at"] = datetime.now().isoformat()
+            self.data["stats"]["misses"] += 1
+            self.run_stats["misses"] += 1
+
+    def revert(self, key):
+        """
+        恢复源在本次运行之前的校验头：这次抓到的文章没有全部用上（如超过分类配额被丢弃）时调用，
+        下次运行不会收到 304，还能重新看到这些文章
+        """
+        with self._lock:
+            if key not in self._previous:
+                return
+            entry = self.data["sources"][key]
+            entry["etag"], entry["last_modified"] = self._previous.pop(key)
+
+    def save(self):
+        with self._lock:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+
+    def summary(self):
+        hits, misses = self.run_stats["hits"], self.run_stats["misses"]
+        total = hits + misses
+        rate = hits / total * 100 if total else 0
+        return f"缓存命中 {hits} / 未命中 {misses} (命中率 {rate:.0f}%)"
+
+
+def validators(data):
+    """{源ID: (ETag, Last-Modified)}，不含命中统计和检查时间"""
+    return {key: (entry.get("etag"), entry.get("last_modified"))
+            for key, entry in data.get("sources", {}).items()}
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] != 'changed':
+        print(__doc__)
+        sys.exit(2)
+    old = FeedCache(sys.argv[2]).data
+    new = FeedCache().data
+    changed = [key for key in validators(new) if validators(old).get(key) != validators(new)[key]]
+    if changed:
+        print(f"🔄 校验头变化: {', '.join(changed)}")
+    sys.exit(0 if changed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+并发RSS抓取引擎
+- 线程池并发抓取所有源，总耗时取决于最慢的源而不是所有源之和
+- 每个源独立的网络超时（源配置中的 timeout 可覆盖全局值）
+- 同一域名的并发上限，避免 youtube / 80.lv 等多专题源被同时打满
+"""
+
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+DEFAULT_WORKERS = 8
+DEFAULT_TIMEOUT = 20
+DEFAULT_MAX_PER_HOST = 2
+USER_AGENT = "Mozilla/5.0 (compatible; RealtimeTechLibrary/1.0)"
+
+
+def download_feed(url, timeout=DEFAULT_TIMEOUT, cache=None, cache_key=None):
+    """
+    下载RSS原始内容，交给 feedparser.parse() 解析。
+    传入 FeedCache 时发送条件请求，服务器返回 304 则返回 None。
+    """
+    cache_key = cache_key or url
+    headers = {'User-Agent': USER_AGENT}
+    if cache is not None:
+        headers.update(cache.request_headers(cache_key))
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read()
+            if cache is not None:
+                cache.record_miss(cache_key, response.headers)
+            return body
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cache is not None:
+            cache.record_hit(cache_key)
+            return None
+        raise
+
+
+def source_timeout(source, default=DEFAULT_TIMEOUT):
+    """单个源的超时时间（秒）"""
+    return source.get('timeout', default)
+
+
+class HostLimiter:
+    """按域名限制并发数"""
+
+    def __init__(self, max_per_host=DEFAULT_MAX_PER_HOST):
+        self.max_per_host = max(1, max_per_host)
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def _semaphore(self, host):
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._semaphores[host]
+
+    @contextmanager
+    def slot(self, url):
+        semaphore = self._semaphore(urlparse(url).hostname or '')
+        with semaphore:
+            yield
+
+
+def fetch_sources_concurrently(sources, fetch_fn, workers=DEFAULT_WORKERS,
+                               max_per_host=DEFAULT_MAX_PER_HOST):
+    """
+    并发执行 fetch_fn(source)，返回 [(source, articles), ...]，顺序与 sources 一致。
+    fetch_fn 抛出的异常会被捕获并记为空结果，单个源失败不影响其他源。
+    """
+    if not sources:
+        return []
+
+    limiter = HostLimiter(max_per_host)
+
+    def run(source):
+        with limiter.slot(source.get('url', '')):
+            try:
+                return fetch_fn(source)
+            except Exception as e:
+                print(f"  ✗ {source.get('name', source.get('id'))} 失败: {e}")
+                return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(sources)))) as pool:
+        results = list(pool.map(run, sources))
+
+    return list(zip(sources, results))
+
+
+def fetch_settings(settings):
+    """从 sources.json 的 settings 读取并发抓取配置"""
+    return {
+        'workers': settings.get('fetch_workers', DEFAULT_WORKERS),
+        'timeout': settings.get('fetch_timeout', DEFAULT_TIMEOUT),
+        'max_per_host': settings.get('max_concurrent_per_host', DEFAULT_MAX_PER_HOST)
+    }
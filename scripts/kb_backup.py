@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+知识库内容寻址备份
+- 每个文章版本按内容 sha1 只存一份：zlib 压缩后追加到 backups/objects.pack，
+  backups/objects.idx 每行 "哈希<TAB>偏移<TAB>长度"（一个文件，不会因为上千个小文件占用大量磁盘块）
+- 快照只是一份清单 backups/snapshots/<时间>.json: {"meta", "articles": {id: 哈希}}，
+  相邻快照之间只新增改动过的文章，每小时做一次快照的成本是改动的大小，而不是整个知识库的大小
+- 与上一个快照相同时不创建新快照
+- restore 把快照写回增量存储 (kb_store.py) 并重新生成 knowledge-base.js；可以只恢复指定文章
+- gc 删除没有被任何快照引用的对象（重写 pack 和索引，通过 kb_journal 原子替换），
+  --keep N (N ≥ 1) 时先只保留最近 N 个快照
+- import-legacy 把以前整份复制的 backups/*.js 和 knowledge-base.js.backup.* 导入为快照
+  （无法解析的损坏副本会列出来，保留原文件）
+
+快照先写对象再写清单，中断时最多留下未被引用的对象（或 pack 末尾的半条），下次 gc 清理。
+
+用法:
+    python3 scripts/kb_backup.py snapshot [--from 文件] [--name 名称]
+    python3 scripts/kb_backup.py list
+    python3 scripts/kb_backup.py diff <快照> [<快照>|current]
+    python3 scripts/kb_backup.py restore <快照> [文章ID ...]
+    python3 scripts/kb_backup.py gc [--keep N]
+    python3 scripts/kb_backup.py import-legacy
+    # 每小时快照 (crontab): 0 * * * * cd <仓库目录> && python3 scripts/kb_backup.py snapshot
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import zlib
+from datetime import datetime
+
+from kb_journal import Journal, atomic_write, truncate_partial_line
+from kb_loader import load_knowledge_base
+from kb_store import KnowledgeBaseStore
+
+WORKSPACE = "."
+BACKUP_DIR = f"{WORKSPACE}/backups"
+PACK_FILE = f"{BACKUP_DIR}/objects.pack"
+PACK_INDEX_FILE = f"{BACKUP_DIR}/objects.idx"
+SNAPSHOT_DIR = f"{BACKUP_DIR}/snapshots"
+
+# 以前整份复制的备份
+LEGACY_PATTERNS = (f"{BACKUP_DIR}/*.js", f"{WORKSPACE}/knowledge-base.js.backup.*")
+
+CURRENT = "current"
+
+
+class BackupStore:
+    """对象 pack + 快照清单"""
+
+    def __init__(self, pack_file=PACK_FILE, index_file=PACK_INDEX_FILE, snapshot_dir=SNAPSHOT_DIR):
+        self.pack_file = pack_file
+        self.index_file = index_file
+        self.snapshot_dir = snapshot_dir
+        self._index = None
+
+    # ---------- 对象 ----------
+
+    def load_index(self):
+        """返回 {哈希: (偏移, 长度)}"""
+        if self._index is None:
+            self._index = {}
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        parts = line.rstrip('\n').split('\t')
+                        # 写入中断留下的半行不完整，跳过
+                        if len(parts) == 3 and line.endswith('\n'):
+                            self._index[parts[0]] = (int(parts[1]), int(parts[2]))
+        return self._index
+
+    def put_objects(self, raws):
+        """存文章版本（文章JSON原文），返回 (哈希列表, 新写入的对象数)"""
+        index = self.load_index()
+        digests = []
+        new = {}
+        for raw in raws:
+            data = raw.encode('utf-8')
+            digest = hashlib.sha1(data).hexdigest()
+            digests.append(digest)
+            if digest not in index and digest not in new:
+                new[digest] = zlib.compress(data)
+        if new:
+            os.makedirs(os.path.dirname(self.pack_file) or '.', exist_ok=True)
+            truncate_partial_line(self.index_file)
+            with open(self.pack_file, 'ab') as pack, open(self.index_file, 'a', encoding='utf-8') as idx:
+                offset = pack.seek(0, os.SEEK_END)
+                for digest, blob in new.items():
+                    pack.write(blob)
+                    idx.write(f"{digest}\t{offset}\t{len(blob)}\n")
+                    index[digest] = (offset, len(blob))
+                    offset += len(blob)
+                pack.flush()
+                os.fsync(pack.fileno())
+        return digests, len(new)
+
+    def get_objects(self, digests):
+        """返回与 digests 对应的文章字典列表"""
+        index = self.load_index()
+        articles = []
+        with open(self.pack_file, 'rb') as pack:
+            for digest in digests:
+                offset, length = index[digest]
+                pack.seek(offset)
+                articles.append(json.loads(zlib.decompress(pack.read(length)).decode('utf-8')))
+        return articles
+
+    def get_object(self, digest):
+        return self.get_objects([digest])[0]
+
+    # ---------- 快照 ----------
+
+    def names(self):
+        """快照名称，按时间从旧到新"""
+        if not os.path.isdir(self.snapshot_dir):
+            return []
+        return sorted(name[:-5] for name in os.listdir(self.snapshot_dir) if name.endswith('.json'))
+
+    def load(self, name):
+        with open(os.path.join(self.snapshot_dir, name + '.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def snapshot(self, records, meta, name=None, source=None):
+        """
+        records 为 {id: 文章JSON原文}。返回 (快照名称, 新写入的对象数)；
+        与最近一个快照内容相同时不创建，返回 (None, 0)
+        """
+        digests, written = self.put_objects(records.values())
+        manifest = dict(zip(records, digests))
+
+        names = self.names()
+        if names:
+            latest = self.load(names[-1])
+            if latest["articles"] == manifest and latest.get("meta") == meta:
+                return None, 0
+
+        name = name or datetime.now().strftime('%Y%m%d-%H%M%S')
+        snapshot = {"name": name, "created": datetime.now().isoformat(timespec='seconds'),
+                    "source": source, "meta": meta, "articles": manifest}
+        atomic_write(os.path.join(self.snapshot_dir, name + '.json'),
+                     json.dumps(snapshot, ensure_ascii=False, separators=(',', ':')))
+        return name, written
+
+    def articles(self, name):
+        """快照中的 {id: 文章字典}"""
+        manifest = self.load(name)["articles"]
+        return dict(zip(manifest, self.get_objects(manifest.values())))
+
+    # ---------- 清理 ----------
+
+    def gc(self, keep=None):
+        """
+        删除未被引用的对象；keep 不为 None 时先只保留最近 keep 个快照（keep 至少为 1，最新的快照不会被删除）。
+        返回 (删除的快照数, 删除的对象数, 释放的字节数)
+        """
+        if keep is not None and keep < 1:
+            raise ValueError(f"keep 至少为 1: {keep}")
+        names = self.names()
+        dropped = names[:-keep] if keep is not None else []
+        for name in dropped:
+            os.remove(os.path.join(self.snapshot_dir, name + '.json'))
+
+        referenced = set()
+        for name in self.names():
+            referenced.update(self.load(name)["articles"].values())
+        index = self.load_index()
+        if not os.path.exists(self.pack_file):
+            return len(dropped), 0, 0
+        before = os.path.getsize(self.pack_file)
+        kept = {}
+        with open(self.pack_file, 'rb') as pack, Journal().transaction('kb_backup.gc') as tx, \
+                tx.open(self.pack_file, binary=True) as out, tx.open(self.index_file) as idx:
+            for digest, (offset, length) in sorted(index.items(), key=lambda item: item[1][0]):
+                if digest in referenced:
+                    pack.seek(offset)
+                    kept[digest] = (out.tell(), length)
+                    out.write(pack.read(length))
+                    idx.write(f"{digest}\t{kept[digest][0]}\t{length}\n")
+        self._index = kept
+        return len(dropped), len(index) - len(kept), before - os.path.getsize(self.pack_file)
+
+
+def diff_manifests(old, new):
+    """比较两份 {id: 哈希}，返回 (新增ID, 删除ID, 修改ID)"""
+    added = [aid for aid in new if aid not in old]
+    removed = [aid for aid in old if aid not in new]
+    changed = [aid for aid in new if aid in old and old[aid] != new[aid]]
+    return added, removed, changed
+
+
+def current_records(store):
+    """增量存储中的当前文章和 meta"""
+    store.ensure_synced()
+    return store.iter_raw(), store.meta()
+
+
+def _manifest(backups, store, name):
+    """快照或当前存储的 {id: 哈希}（当前存储不写入对象）"""
+    if name != CURRENT:
+        return backups.load(name)["articles"]
+    records, _ = current_records(store)
+    return {aid: hashlib.sha1(raw.encode('utf-8')).hexdigest() for aid, raw in records.items()}
+
+
+def _resolve(backups, name):
+    """快照名称可以只写前缀（如日期）"""
+    if name == CURRENT:
+        return name
+    matches = [n for n in backups.names() if n.startswith(name)]
+    if not matches:
+        print(f"❌ 找不到快照: {name}")
+        sys.exit(1)
+    return matches[-1]
+
+
+def _legacy_name(path):
+    """从文件名中取时间 (20260313_171919 / 20260304-140906)，取不到时用修改时间"""
+    match = re.search(r'(\d{8})[-_](\d{6})', os.path.basename(path))
+    stamp = f"{match.group(1)}-{match.group(2)}" if match else \
+        datetime.fromtimestamp(os.path.getmtime(path)).strftime('%Y%m%d-%H%M%S')
+    return f"{stamp}-legacy"
+
+
+def _title(article):
+    return (article.get('title') or '')[:40]
+
+
+def main():
+    args = sys.argv[1:]
+    command = args[0] if args else 'list'
+    backups = BackupStore()
+    store = KnowledgeBaseStore()
+
+    def option(name):
+        return args[args.index(name) + 1] if name in args else None
+
+    if command == 'snapshot':
+        source = option('--from')
+        if source:
+            meta, articles = load_knowledge_base(source, render_content=False)
+            records = {aid: json.dumps(article, ensure_ascii=False) for aid, article in articles.items()}
+        else:
+            records, meta = current_records(store)
+        name, written = backups.snapshot(records, meta, option('--name'), source or 'kb_store')
+        if name is None:
+            print("✅ 与最近一个快照相同，未创建新快照")
+        else:
+            print(f"✅ 已创建快照 {name}: {len(records)} 篇文章, 新增对象 {written} 个")
+    elif command == 'list':
+        previous = {}
+        for name in backups.names():
+            snapshot = backups.load(name)
+            added, removed, changed = diff_manifests(previous, snapshot["articles"])
+            print(f"  {name:<24} {len(snapshot['articles']):>5} 篇  +{len(added)} -{len(removed)} ~{len(changed)}"
+                  f"  ({snapshot.get('source') or ''})")
+            previous = snapshot["articles"]
+        size = os.path.getsize(backups.pack_file) if os.path.exists(backups.pack_file) else 0
+        print(f"📦 {len(backups.names())} 个快照, {len(backups.load_index())} 个对象, {size / 1024:.1f} KB")
+    elif command == 'diff' and len(args) >= 2:
+        old_name = _resolve(backups, args[1])
+        new_name = _resolve(backups, args[2] if len(args) > 2 else CURRENT)
+        old, new = _manifest(backups, store, old_name), _manifest(backups, store, new_name)
+        added, removed, changed = diff_manifests(old, new)
+        print(f"📋 {old_name} → {new_name}: 新增 {len(added)}, 删除 {len(removed)}, 修改 {len(changed)}")
+        records = store.iter_raw() if new_name == CURRENT else None
+
+        def article(name, aid):
+            return json.loads(records[aid]) if name == CURRENT else backups.get_object(new[aid])
+
+        for aid in added:
+            print(f"  + {aid}  {_title(article(new_name, aid))}")
+        for aid in removed:
+            print(f"  - {aid}  {_title(backups.get_object(old[aid]))}")
+        for aid in changed:
+            before, after = backups.get_object(old[aid]), article(new_name, aid)
+            fields = sorted(key for key in set(before) | set(after) if before.get(key) != after.get(key))
+            print(f"  ~ {aid}  {_title(after)}  ({', '.join(fields)})")
+    elif command == 'restore' and len(args) >= 2:
+        name = _resolve(backups, args[1])
+        snapshot = backups.load(name)
+        articles = backups.articles(name)
+        ids = args[2:]
+        store.ensure_synced()
+        if ids:
+            missing = [aid for aid in ids if aid not in articles]
+            if missing:
+                print(f"❌ 快照 {name} 中没有: {', '.join(missing)}")
+                sys.exit(1)
+            store.add_articles({aid: articles[aid] for aid in ids}, overwrite=True)
+            meta = store.meta()
+            print(f"✅ 已从快照 {name} 恢复 {len(ids)} 篇文章")
+        else:
+            store.replace_articles(articles)
+            meta = snapshot.get("meta", {})
+            print(f"✅ 已恢复快照 {name}: {len(articles)} 篇文章")
+        store.build(meta)
+    elif command == 'gc':
+        keep = option('--keep')
+        if keep is not None and not (keep.isdigit() and int(keep) >= 1):
+            print(f"❌ --keep 必须是不小于 1 的整数: {keep}")
+            sys.exit(1)
+        snapshots, objects, freed = backups.gc(int(keep) if keep is not None else None)
+        print(f"✅ 删除快照 {snapshots} 个, 对象 {objects} 个, 释放 {freed / 1024:.1f} KB")
+    elif command == 'import-legacy':
+        paths = sorted({path for pattern in LEGACY_PATTERNS for path in glob.glob(pattern)}, key=_legacy_name)
+        for path in paths:
+            try:
+                meta, articles = load_knowledge_base(path, render_content=False)
+            except ValueError as e:
+                print(f"  ⚠️ 跳过无法解析的副本 {path}: {e}")
+                continue
+            records = {aid: json.dumps(article, ensure_ascii=False) for aid, article in articles.items()}
+            name, written = backups.snapshot(records, meta, _legacy_name(path), os.path.relpath(path, WORKSPACE))
+            status = f"快照 {name}, 新增对象 {written} 个" if name else "与上一个快照相同"
+            print(f"  📥 {path}: {len(records)} 篇文章, {os.path.getsize(path) / 1024:.0f} KB → {status}")
+        print("✅ 导入完成，确认后可以删除已导入的整份副本")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+knowledge-base.js 等文件的原子写入和操作日志
+- atomic_write(): 先写同目录下的临时文件并 fsync，再 os.replace 替换目标文件，
+  写到一半中断时目标文件仍是完整的旧版本，不会留下截断的 knowledge-base.js
+- Journal.transaction(): 一次操作同时替换多个文件（如存储 + 索引）。data/kb_journal.jsonl 按顺序记录
+  begin → stage（每个临时文件）→ commit（临时文件已全部写完并 fsync，附 sha1）→ done
+- 中断后 recover()：没有 commit 的操作回滚（删除临时文件，目标文件未被改动），
+  已 commit 的操作重放（把剩下的临时文件 rename 到位）。KnowledgeBaseStore.ensure_synced() 会先执行恢复
+- truncate_partial_line(): 只追加的文件（存储、备份 pack 索引）追加前去掉中断留下的半行
+- 所有操作都完成后日志清空，日志里只会留下未完成的操作，不必每次修改前整份备份 knowledge-base.js
+
+用法:
+    atomic_write('kb-manifest.js', text)
+    write_knowledge_base('knowledge-base.js', text, op='fix_syntax')
+    with Journal().transaction('kb_store.rewrite') as tx:
+        tx.write(path, text)
+        with tx.open(other_path) as f:
+            f.write(...)
+    python3 scripts/kb_journal.py status | recover
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+
+WORKSPACE = "."
+JOURNAL_FILE = f"{WORKSPACE}/data/kb_journal.jsonl"
+
+BEGIN = "begin"
+STAGE = "stage"
+COMMIT = "commit"
+DONE = "done"
+ABORTED = "aborted"
+REPLAYED = "replayed"
+ROLLED_BACK = "rolled_back"
+
+# 操作已结束的状态
+FINISHED = (DONE, ABORTED, REPLAYED, ROLLED_BACK)
+
+_tx_counter = itertools.count(1)
+
+
+def _fsync_dir(path):
+    """rename 之后同步目录项（Windows 不支持打开目录，跳过）"""
+    if os.name != 'posix':
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _sha1_file(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def atomic_write(path, data, encoding='utf-8'):
+    """原子替换单个文件：data 为 str 或 bytes"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data.encode(encoding) if isinstance(data, str) else data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    _fsync_dir(path)
+
+
+def truncate_partial_line(path):
+    """去掉追加写入中断留下的半行（文件不以换行结尾时截到最后一个换行之后）"""
+    if not os.path.exists(path):
+        return
+    with open(path, 'r+b') as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b'\n':
+            return
+        # 从尾部往前找最后一个换行（半行最多是一篇文章的长度）
+        end = size
+        while end > 0:
+            start = max(0, end - 65536)
+            f.seek(start)
+            cut = f.read(end - start).rfind(b'\n')
+            if cut >= 0:
+                f.truncate(start + cut + 1)
+                return
+            end = start
+        f.truncate(0)
+
+
+class Transaction:
+    """一次日志操作：写临时文件，commit 后统一替换"""
+
+    def __init__(self, journal, tx_id):
+        self.journal = journal
+        self.id = tx_id
+        self.files = []
+
+    @contextmanager
+    def open(self, path, encoding='utf-8', binary=False):
+        """写 path 的临时文件（默认文本方式，binary 为 True 时二进制），关闭时 fsync"""
+        tmp = f"{path}.{self.id}.tmp"
+        self.journal._append({"tx": self.id, "state": STAGE, "path": path, "tmp": tmp})
+        self.files.append((path, tmp))
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with (open(tmp, 'wb') if binary else open(tmp, 'w', encoding=encoding, newline='')) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+    def write(self, path, text, encoding='utf-8'):
+        with self.open(path, encoding) as f:
+            f.write(text)
+
+    def _commit(self):
+        files = [{"path": path, "tmp": tmp, "sha1": _sha1_file(tmp)} for path, tmp in self.files]
+        self.journal._append({"tx": self.id, "state": COMMIT, "files": files})
+        _install(files)
+        self.journal._append({"tx": self.id, "state": DONE})
+
+    def _rollback(self):
+        _discard(tmp for _, tmp in self.files)
+        self.journal._append({"tx": self.id, "state": ABORTED})
+
+
+def _install(files):
+    """把已 commit 的临时文件替换到位；已经替换过的（临时文件不存在）跳过"""
+    for entry in files:
+        if not os.path.exists(entry["tmp"]):
+            continue
+        if _sha1_file(entry["tmp"]) != entry["sha1"]:
+            raise ValueError(f"临时文件与日志记录不一致: {entry['tmp']}")
+        os.replace(entry["tmp"], entry["path"])
+        _fsync_dir(entry["path"])
+
+
+def _discard(tmps):
+    for tmp in tmps:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+class Journal:
+    """data/kb_journal.jsonl 操作日志"""
+
+    def __init__(self, path=JOURNAL_FILE):
+        self.path = path
+
+    def _append(self, entry):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def entries(self):
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # 写日志时中断留下的半行：该步骤没有生效
+                    continue
+        return entries
+
+    def pending(self):
+        """未完成的操作: {tx: {"op", "started", "staged": [(path, tmp)], "commit": files 或 None}}"""
+        operations = {}
+        for entry in self.entries():
+            tx, state = entry["tx"], entry["state"]
+            if state == BEGIN:
+                operations[tx] = {"op": entry.get("op"), "started": entry.get("started"), "staged": [], "commit": None}
+            elif tx not in operations:
+                continue
+            elif state == STAGE:
+                operations[tx]["staged"].append((entry["path"], entry["tmp"]))
+            elif state == COMMIT:
+                operations[tx]["commit"] = entry["files"]
+            elif state in FINISHED:
+                del operations[tx]
+        return operations
+
+    def _truncate_if_idle(self):
+        """所有操作都已结束时清空日志"""
+        if os.path.exists(self.path) and not self.pending():
+            with open(self.path, 'w', encoding='utf-8'):
+                pass
+
+    @contextmanager
+    def transaction(self, op):
+        """with 块内用 tx.write / tx.open 写文件，块正常结束时提交，抛出异常时回滚"""
+        tx = Transaction(self, f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{os.getpid()}-{next(_tx_counter)}")
+        self._append({"tx": tx.id, "state": BEGIN, "op": op, "started": datetime.now().isoformat(timespec='seconds')})
+        try:
+            yield tx
+        except BaseException:
+            tx._rollback()
+            raise
+        tx._commit()
+        self._truncate_if_idle()
+
+    def recover(self):
+        """处理中断的操作，返回 [(tx, op, REPLAYED 或 ROLLED_BACK)]"""
+        results = []
+        for tx, operation in self.pending().items():
+            if operation["commit"] is not None:
+                _install(operation["commit"])
+                state = REPLAYED
+            else:
+                _discard(tmp for _, tmp in operation["staged"])
+                state = ROLLED_BACK
+            self._append({"tx": tx, "state": state})
+            results.append((tx, operation["op"], state))
+        self._truncate_if_idle()
+        return results
+
+
+def write_knowledge_base(path, text, op='write', journal_file=JOURNAL_FILE):
+    """手工脚本保存 knowledge-base.js：先恢复之前中断的操作，再以一次日志操作写入"""
+    journal = Journal(journal_file)
+    journal.recover()
+    with journal.transaction(op) as tx:
+        tx.write(path, text)
+
+
+def print_recovery(results):
+    for tx, op, state in results:
+        action = "重放" if state == REPLAYED else "回滚"
+        print(f"  ♻️ 已{action}中断的操作 {op} ({tx})")
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'status'
+    journal = Journal()
+
+    if command == 'status':
+        pending = journal.pending()
+        if not pending:
+            print("✅ 没有未完成的操作")
+        for tx, operation in pending.items():
+            state = "已提交，待重放" if operation["commit"] is not None else "未提交，待回滚"
+            print(f"  ⚠️ {operation['op']} ({tx}, {operation['started']}): {state}, "
+                  f"{len(operation['staged'])} 个文件")
+    elif command == 'recover':
+        results = journal.recover()
+        print_recovery(results)
+        print(f"✅ 恢复完成: {len(results)} 个操作")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
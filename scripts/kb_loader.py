@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+knowledge-base.js 通用加载器
+单次线性扫描 const knowledgeBase = { ... } 的顶层键，meta / articles 的值直接交给
+json 的 raw_decode 解码，不再使用会在整个文件上回溯的 DOTALL 正则。
+
+兼容仓库里出现过的两种写法：
+- 自动生成格式: meta: {...}, articles: {...}, currentCategory: 'home', getArticle(id) {...}
+- 纯 JSON 格式: const knowledgeBase = {"meta": {...}, "articles": {...}};
+
+自动摘要文章在 knowledge-base.js 中是结构化记录（layout + fields，没有 content，见 article_renderer.py）。
+默认加载时用 render_record() 补上渲染好的 content，读 article['content'] 的维护脚本不受影响；
+写回时带着 content 的结构化记录在下次导入存储时重新转换（见 kb_store.normalize_record）。
+kb_store 等只需要原始记录的调用方传 render_content=False。
+
+用法:
+    from kb_loader import load_knowledge_base, iter_articles
+    meta, articles = load_knowledge_base('knowledge-base.js')
+    for article_id, article in iter_articles('knowledge-base.js'):
+        ...
+"""
+
+import json
+import re
+
+from article_renderer import render_record
+
+KB_FILE = "knowledge-base.js"
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'\s*')
+_IDENTIFIER = re.compile(r'[A-Za-z_$][\w$]*')
+_KB_PREFIX = re.compile(r'(?:const|let|var)\s+knowledgeBase\s*=\s*\{')
+
+
+class _Scanner:
+    """在 JS 文本上向前移动的游标，只前进不回溯"""
+
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def error(self, message):
+        line = self.text.count('\n', 0, self.pos) + 1
+        return ValueError(f"knowledge-base.js 解析失败 (第 {line} 行): {message}")
+
+    def skip_whitespace(self):
+        self.pos = _WHITESPACE.match(self.text, self.pos).end()
+        return self.text[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        if self.skip_whitespace() != char:
+            raise self.error(f"需要 '{char}'")
+        self.pos += 1
+
+    def enter_knowledge_base(self):
+        match = _KB_PREFIX.search(self.text)
+        if not match:
+            raise self.error("找不到 const knowledgeBase = {")
+        self.pos = match.end()
+
+    def key(self):
+        """读取对象键：JSON 字符串或 JS 标识符"""
+        if self.skip_whitespace() == '"':
+            key, self.pos = _DECODER.raw_decode(self.text, self.pos)
+            return key
+        match = _IDENTIFIER.match(self.text, self.pos)
+        if not match:
+            raise self.error("无效的对象键")
+        self.pos = match.end()
+        return match.group()
+
+    def value(self):
+        """读取一个 JSON 值"""
+        self.skip_whitespace()
+        try:
+            value, self.pos = _DECODER.raw_decode(self.text, self.pos)
+        except json.JSONDecodeError as e:
+            self.pos = e.pos
+            raise self.error(e.msg) from None
+        return value
+
+    def keys(self):
+        """
+        依次产出当前对象的键，产出时游标停在值的开头。
+        调用方必须用 value() 读完值才能继续迭代。
+        """
+        while True:
+            if self.skip_whitespace() == '}':
+                self.pos += 1
+                return
+            key = self.key()
+            self.expect(':')
+            yield key
+            char = self.skip_whitespace()
+            if char == ',':
+                self.pos += 1
+            elif char == '}':
+                self.pos += 1
+                return
+            else:
+                raise self.error("需要 ',' 或 '}'")
+
+    def items(self):
+        """逐条产出当前位置对象的 (key, value)"""
+        self.expect('{')
+        for key in self.keys():
+            yield key, self.value()
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _with_content(article):
+    """结构化记录补上渲染好的 content"""
+    if isinstance(article, dict) and 'layout' in article and not article.get('content'):
+        article['content'] = render_record(article)
+    return article
+
+
+def parse_knowledge_base_text(text, render_content=True):
+    """解析 knowledge-base.js 文本，返回 (meta, articles)；render_content 为 True 时结构化记录补上 content"""
+    scanner = _Scanner(text)
+    scanner.enter_knowledge_base()
+    result = {}
+    for key in scanner.keys():
+        # meta / articles 之后是 currentCategory 和 JS 函数，不是 JSON
+        if key not in ('meta', 'articles'):
+            break
+        result[key] = scanner.value()
+        if len(result) == 2:
+            break
+    if 'articles' not in result:
+        raise scanner.error("找不到 articles")
+    articles = result['articles']
+    if render_content:
+        for article in articles.values():
+            _with_content(article)
+    return result.get('meta', {}), articles
+
+
+def load_knowledge_base(path=KB_FILE, render_content=True):
+    """读取 knowledge-base.js，返回 (meta, articles)"""
+    return parse_knowledge_base_text(_read(path), render_content)
+
+
+def iter_articles(path=KB_FILE, render_content=True):
+    """逐篇产出 (article_id, article)，不在内存中构建完整的 articles 字典"""
+    scanner = _Scanner(_read(path))
+    scanner.enter_knowledge_base()
+    for key in scanner.keys():
+        if key == 'articles':
+            for article_id, article in scanner.items():
+                yield article_id, _with_content(article) if render_content else article
+            return
+        if key != 'meta':
+            break
+        scanner.value()
+    raise scanner.error("找不到 articles")
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+文章元数据列式快照
+- data/kb_meta.snap: 一行 JSON 头 + 按列存放的二进制数据，不含正文
+- 头里记录每一列的类型和在数据区中的偏移；读取时 mmap 文件，只解码用到的列
+- 列类型:
+    str    每行一个字符串，'\\0' 分隔的 UTF-8，整列一次 decode + split
+    dict   字典编码：不重复的取值表 + 每行一个 uint32 编号（分类、日期、作者等重复度高的列）
+    list   字典编码的列表：取值表 + 每行的起止位置 (uint32, n+1 个) + 编号
+    u32    每行一个 uint32（正文长度）
+- 头里保存 knowledge-base.js 的大小和 mtime，open_snapshot() 发现知识库变化后自动重建
+
+维护脚本只需要 id / 分类 / 日期 / 标签等字段时，用快照代替解析整个 knowledge-base.js。
+
+用法:
+    from kb_snapshot import open_snapshot
+    with open_snapshot() as snap:
+        for article_id, category in zip(snap.column('id'), snap.column('category')):
+            ...
+    python3 scripts/kb_snapshot.py build        # 从 knowledge-base.js 生成快照
+    python3 scripts/kb_snapshot.py stats
+    python3 scripts/kb_snapshot.py bench [数量]  # 与 kb_loader 解析对比加载耗时
+"""
+
+import json
+import mmap
+import os
+import sys
+import time
+from array import array
+
+from article_renderer import render_record
+from kb_loader import load_knowledge_base
+
+WORKSPACE = "."
+KB_FILE = f"{WORKSPACE}/knowledge-base.js"
+SNAPSHOT_FILE = f"{WORKSPACE}/data/kb_meta.snap"
+
+SNAPSHOT_VERSION = 1
+
+# (列名, 类型)；id 之外的列取文章记录上的同名键，缺失时为空字符串 / 空列表
+COLUMNS = (
+    ('id', 'str'),
+    ('title', 'str'),
+    ('category', 'dict'),
+    ('date', 'dict'),
+    ('author', 'dict'),
+    ('readTime', 'dict'),
+    ('difficulty', 'dict'),
+    ('layout', 'dict'),
+    ('tags', 'list'),
+    ('content_length', 'u32'),
+)
+
+_SEPARATOR = '\0'
+
+
+def _u32(values):
+    codes = array('I', values)
+    if sys.byteorder != 'little':
+        codes.byteswap()
+    return codes.tobytes()
+
+
+def _join(strings, column):
+    for value in strings:
+        if _SEPARATOR in value:
+            raise ValueError(f"列 {column} 的值包含 \\0: {value[:40]!r}")
+    return _SEPARATOR.join(strings).encode('utf-8')
+
+
+def _dictionary(values):
+    """返回 (取值表, 编号列表)"""
+    table = {}
+    codes = [table.setdefault(value, len(table)) for value in values]
+    return list(table), codes
+
+
+def _text(value):
+    return value if isinstance(value, str) else ('' if value is None else str(value))
+
+
+def _encode_column(name, kind, articles):
+    """返回 (列描述, [数据块])"""
+    if name == 'id':
+        return {}, [_join([aid for aid, _ in articles], name)]
+    if kind == 'u32':
+        return {}, [_u32(len(render_record(article)) for _, article in articles)]
+    if kind == 'str':
+        return {}, [_join([_text(article.get(name)) for _, article in articles], name)]
+    if kind == 'dict':
+        table, codes = _dictionary(_text(article.get(name)) for _, article in articles)
+        return {"size": len(table)}, [_join(table, name), _u32(codes)]
+    # list
+    offsets = [0]
+    flat = []
+    for _, article in articles:
+        flat.extend(_text(tag) for tag in article.get(name) or [])
+        offsets.append(len(flat))
+    table, codes = _dictionary(flat)
+    return {"size": len(table)}, [_join(table, name), _u32(offsets), _u32(codes)]
+
+
+def write_snapshot(articles, path=SNAPSHOT_FILE, source=None):
+    """
+    articles: 可迭代的 (id, article)。source 为知识库文件指纹，写入头部用于判断快照是否过期。
+    返回文章数。
+    """
+    articles = list(articles)
+    header = {"version": SNAPSHOT_VERSION, "count": len(articles), "source": source or {}, "columns": {}}
+    blocks = []
+    offset = 0
+    for name, kind in COLUMNS:
+        info, parts = _encode_column(name, kind, articles)
+        info.update(kind=kind, blocks=[])
+        for part in parts:
+            # 每块按 4 字节对齐，uint32 列可以直接 memoryview.cast('I')
+            padding = -offset % 4
+            blocks.append(b'\0' * padding)
+            offset += padding
+            info["blocks"].append([offset, len(part)])
+            blocks.append(part)
+            offset += len(part)
+        header["columns"][name] = info
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        line = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        # 数据区同样从 4 字节对齐的位置开始
+        f.write(line + b' ' * (-(len(line) + 1) % 4) + b'\n')
+        for block in blocks:
+            f.write(block)
+    os.replace(tmp, path)
+    return len(articles)
+
+
+class KBSnapshot:
+    """mmap 读取快照，列在第一次访问时解码并缓存"""
+
+    def __init__(self, path=SNAPSHOT_FILE):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        newline = self._mm.find(b'\n')
+        self.header = json.loads(self._mm[:newline])
+        if self.header.get("version") != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"快照版本不兼容: {self.header.get('version')}")
+        self._data = newline + 1
+        self._views = []
+        self._columns = {}
+        self._index = None
+
+    def __len__(self):
+        return self.header["count"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for view in self._views:
+            view.release()
+        self._views = []
+        if self._mm is not None:
+            self._mm.close()
+            self._file.close()
+            self._mm = None
+
+    @property
+    def source(self):
+        return self.header.get("source", {})
+
+    def _block(self, name, i):
+        offset, length = self.header["columns"][name]["blocks"][i]
+        return self._data + offset, length
+
+    def _strings(self, name, i=0):
+        start, length = self._block(name, i)
+        if self.header["count"] == 0 and self.header["columns"][name]["kind"] == 'str':
+            return []
+        return self._mm[start:start + length].decode('utf-8').split(_SEPARATOR)
+
+    def _u32(self, name, i):
+        start, length = self._block(name, i)
+        if sys.byteorder != 'little':
+            values = array('I', self._mm[start:start + length])
+            values.byteswap()
+            return values
+        view = memoryview(self._mm)[start:start + length].cast('I')
+        self._views.append(view)
+        return view
+
+    def codes(self, name):
+        """dict 列的编号 (uint32 视图，不解码字符串)，配合 dictionary(name) 做分组统计"""
+        return self._u32(name, 1)
+
+    def dictionary(self, name):
+        """dict / list 列的取值表"""
+        return self._strings(name) if self.header["columns"][name]["size"] else []
+
+    def column(self, name):
+        """整列的值：str / dict 列为字符串列表，list 列为列表的列表，u32 列为整数列表"""
+        if name in self._columns:
+            return self._columns[name]
+        kind = self.header["columns"][name]["kind"]
+        if kind == 'str':
+            values = self._strings(name)
+        elif kind == 'u32':
+            values = self._u32(name, 0).tolist()
+        elif kind == 'dict':
+            values = list(map(self.dictionary(name).__getitem__, self.codes(name)))
+        else:
+            flat = list(map(self.dictionary(name).__getitem__, self._u32(name, 2)))
+            offsets = self._u32(name, 1).tolist()
+            values = [flat[start:end] for start, end in zip(offsets, offsets[1:])]
+        self._columns[name] = values
+        return values
+
+    def counts(self, name):
+        """dict 列各取值的行数，只读编号不解码每一行"""
+        table = self.dictionary(name)
+        counts = [0] * len(table)
+        for code in self.codes(name):
+            counts[code] += 1
+        return dict(zip(table, counts))
+
+    def index_of(self, article_id):
+        if self._index is None:
+            self._index = {aid: i for i, aid in enumerate(self.column('id'))}
+        return self._index.get(article_id)
+
+    def row(self, i):
+        return {name: self.column(name)[i] for name, _ in COLUMNS}
+
+    def rows(self):
+        columns = [self.column(name) for name, _ in COLUMNS]
+        names = [name for name, _ in COLUMNS]
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+
+
+# ---------- 与 knowledge-base.js 同步 ----------
+
+def kb_fingerprint(kb_file=KB_FILE):
+    stat = os.stat(kb_file)
+    return {"kb_size": stat.st_size, "kb_mtime_ns": stat.st_mtime_ns}
+
+
+def build_snapshot(kb_file=KB_FILE, path=SNAPSHOT_FILE):
+    """解析 knowledge-base.js 生成快照，返回文章数"""
+    source = kb_fingerprint(kb_file)
+    _, articles = load_knowledge_base(kb_file, render_content=False)
+    return write_snapshot(articles.items(), path, source)
+
+
+def open_snapshot(kb_file=KB_FILE, path=SNAPSHOT_FILE):
+    """打开快照；快照不存在或 knowledge-base.js 已变化时先重建"""
+    if os.path.exists(path):
+        snapshot = KBSnapshot(path)
+        if not os.path.exists(kb_file) or snapshot.source == kb_fingerprint(kb_file):
+            return snapshot
+        snapshot.close()
+    build_snapshot(kb_file, path)
+    return KBSnapshot(path)
+
+
+def _synthetic_articles(count):
+    """基准测试用的合成文章"""
+    categories = ['ue', 'ta', 'render', 'ta-render', 'ai', 'vfx', 'multiplat']
+    for i in range(count):
+        yield f"{i:012x}", {
+            'title': f"合成文章 {i} Nanite 与 Lumen 性能分析", 'category': categories[i % len(categories)],
+            'tags': ["虚幻引擎5", "渲染优化", f"标签{i % 50}"], 'date': f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            'author': f"来源{i % 40} / 自动摘要", 'readTime': '5分钟', 'difficulty': '中等',
+            'content': '<p>正文</p>' * 300,
+        }
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+
+    if command == 'build':
+        start = time.perf_counter()
+        count = build_snapshot()
+        print(f"✅ 已生成 {SNAPSHOT_FILE}: {count} 篇文章, {os.path.getsize(SNAPSHOT_FILE) / 1024:.1f} KB, "
+              f"耗时 {time.perf_counter() - start:.2f}s")
+    elif command == 'stats':
+        with open_snapshot() as snap:
+            print(f"📇 快照: {len(snap)} 篇文章, {os.path.getsize(snap.path) / 1024:.1f} KB")
+            for category, count in sorted(snap.counts('category').items()):
+                print(f"  {category}: {count}篇")
+    elif command == 'bench':
+        import tempfile
+        from kb_loader import parse_knowledge_base_text
+
+        count = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+        articles = dict(_synthetic_articles(count))
+        with tempfile.TemporaryDirectory() as tmp:
+            kb_file = os.path.join(tmp, 'knowledge-base.js')
+            snap_file = os.path.join(tmp, 'kb_meta.snap')
+            text = f"const knowledgeBase = {{\n    meta: {{}},\n    articles: {json.dumps(articles, ensure_ascii=False)}\n}};\n"
+            with open(kb_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+            write_snapshot(articles.items(), snap_file)
+            # 合成数据本身有几百万个对象，先释放，避免计时中混入对它们的垃圾回收扫描
+            del articles, text
+
+            start = time.perf_counter()
+            parse_knowledge_base_text(open(kb_file, encoding='utf-8').read(), render_content=False)
+            parse = time.perf_counter() - start
+
+            timings = []
+            start = time.perf_counter()
+            with KBSnapshot(snap_file) as snap:
+                timings.append(("快照打开", time.perf_counter() - start))
+                start = time.perf_counter()
+                assert sum(snap.counts('category').values()) == count
+                timings.append(("按分类计数", time.perf_counter() - start))
+                for name in ('id', 'category', 'date', 'tags'):
+                    start = time.perf_counter()
+                    snap.column(name)
+                    timings.append((f"读取 {name} 列", time.perf_counter() - start))
+
+            print(f"📊 {count} 篇文章: knowledge-base.js {os.path.getsize(kb_file) / 1024 / 1024:.1f} MB, "
+                  f"快照 {os.path.getsize(snap_file) / 1024 / 1024:.1f} MB")
+            print(f"  {'kb_loader 解析全部':<16} {parse * 1000:9.1f} ms")
+            for label, elapsed in timings:
+                print(f"  {label:<16} {elapsed * 1000:9.1f} ms")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
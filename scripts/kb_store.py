@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+知识库增量存储
+- data/kb_store.jsonl: 每行一篇文章 {"id": ..., "article": {...}}，只追加，同一ID后写覆盖先写
+- data/kb_store.idx: 每行 "id<TAB>category"，去重和分类统计只读这个小文件
+- knowledge-base.js 是由存储生成的构建产物，直接拼接已序列化的记录，不再整体解析和 json.dumps
+- kb-manifest.js 是首页加载的小清单（标题/分类/标签/日期/阅读时间），
+  正文拆分到 kb-content/<id>.json（结构化记录的字段）或 kb-content/<id>.html（整段正文），
+  由 index.html 的 showArticle() 按需 fetch
+- kb-search.json 是站内搜索的倒排索引（见 search_index.py）
+- 自动摘要文章存成结构化记录 (layout + fields，见 article_renderer.py)，不存整段HTML；
+  kb-content/<id>.json 只有字段，公共HTML外壳由 kb-render.js 在浏览器端渲染一次
+- build 同时更新元数据列式快照 data/kb_meta.snap（见 kb_snapshot.py），供维护脚本快速扫描
+- build 最后生成 .gz/.br 预压缩副本和带内容哈希的文件名（见 precompress.py），并输出各产物大小
+- knowledge-base.js 和存储的整体重写通过操作日志 data/kb_journal.jsonl 原子替换（见 kb_journal.py），
+  清单、搜索索引等单个文件用临时文件 + rename 写入；中断的操作在下次 ensure_synced() 时重放或回滚
+
+新增N篇文章只追加N行。knowledge-base.js 被手工脚本 (fix_*.py / archive_tools.py 等) 修改后，
+下次运行会自动从 knowledge-base.js 重新导入，避免覆盖手工修改。
+
+用法:
+    python3 scripts/kb_store.py import    # 从 knowledge-base.js 导入
+    python3 scripts/kb_store.py build [--jobs N]     # 从存储生成 knowledge-base.js、清单和正文分片
+    python3 scripts/kb_store.py shards [--jobs N]    # 只重新生成清单、正文分片和搜索索引
+    （--jobs: 搜索索引渲染正文的进程数，默认文章数达到 article_renderer.PARALLEL_MIN 时按CPU核数）
+    python3 scripts/kb_store.py compact   # 压缩存储，去掉被覆盖的旧版本
+    python3 scripts/kb_store.py structure # 把能无损转换的正文转成结构化记录，输出体积变化
+    python3 scripts/kb_store.py stats     # 分类统计
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import datetime
+
+from article_renderer import render_js, render_record, render_records, structure_record
+from kb_journal import JOURNAL_FILE, Journal, atomic_write, print_recovery, truncate_partial_line
+from kb_loader import load_knowledge_base
+from kb_snapshot import SNAPSHOT_FILE, kb_fingerprint, write_snapshot
+from precompress import build_artifacts, print_size_report
+from run_metrics import span
+from search_index import SEARCH_INDEX_FILE, write_search_index
+
+WORKSPACE = "."
+KB_FILE = f"{WORKSPACE}/knowledge-base.js"
+STORE_FILE = f"{WORKSPACE}/data/kb_store.jsonl"
+INDEX_FILE = f"{WORKSPACE}/data/kb_store.idx"
+STATE_FILE = f"{WORKSPACE}/data/kb_store.state.json"
+MANIFEST_FILE = f"{WORKSPACE}/kb-manifest.js"
+SHARD_DIR = f"{WORKSPACE}/kb-content"
+RENDER_FILE = f"{WORKSPACE}/kb-render.js"
+
+# 清单中保留的字段，正文 content 按需加载（结构化记录还带 layout）
+MANIFEST_FIELDS = ('title', 'category', 'tags', 'date', 'readTime', 'layout')
+
+KB_HEADER = "// Realtime Tech Knowledge Base - Auto Generated"
+
+# knowledge-base.js 中 articles 之后的固定部分
+KB_JS_TAIL = '''    currentCategory: 'home',
+    getArticle(id) { const a = this.articles[id]; if (!a) return { title: '文章不存在', content: '<div class="text-center py-12"><h2>找不到该文章</h2></div>' }; if (a.layout && !a.content) a.content = kbRenderContent(a); return a; },
+    getArticlesByCategory(category) { return Object.entries(this.articles).filter(([id, a]) => a.category === category).map(([id, a]) => ({ id, ...a })); }
+};
+function showPage(pageId) { document.querySelectorAll('.page').forEach(p => p.classList.remove('active')); const t = document.getElementById('page-' + pageId); if (t) { if (['ue','ta','render','ta-render','ai'].includes(pageId)) loadCategoryPage(pageId); t.classList.add('active'); } if (pageId !== 'article') knowledgeBase.currentCategory = pageId; document.getElementById('mobile-menu').classList.add('hidden'); window.scrollTo(0, 0); }
+function loadCategoryPage(category) { const page = document.getElementById('page-' + category); const articles = knowledgeBase.getArticlesByCategory(category); const names = {'ue':'Unreal Engine','ta':'技术美术','render':'实时渲染','ta-render':'TA渲染专栏','ai':'AI技术'}; const classes = {'ue':'tag-ue','ta':'tag-ta','render':'tag-render','ta-render':'tag-ta-render','ai':'tag-ai'}; let html = articles.map(a => `<div onclick="showArticle('${a.id}')" class="glass-panel rounded-2xl p-6 card-hover cursor-pointer"><div class="flex items-center gap-2 mb-3"><span class="${classes[category]} px-2 py-1 rounded text-xs">${a.tags[0]}</span><span class="text-gray-500 text-xs">${a.readTime}</span><span class="text-gray-500 text-xs">•</span><span class="text-gray-500 text-xs">${a.difficulty}</span></div><h3 class="text-xl font-semibold text-white mb-2">${a.title}</h3><p class="text-gray-400 text-sm">${a.author} · ${a.date}</p></div>`).join(''); if (articles.length === 0) html = '<div class="glass-panel rounded-2xl p-12 text-center"><h3>该分类暂无文章</h3></div>'; page.innerHTML = `<div class="py-12 px-6"><div class="max-w-7xl mx-auto"><div class="flex items-center gap-4 mb-8"><button onclick="showPage('home')" class="flex items-center gap-2 px-4 py-2 rounded-lg glass-panel hover:bg-white/5"><i data-lucide="home" class="w-5 h-5"></i><span>回到主页</span></button><div><h2 class="text-3xl font-bold ${category === 'ta-render' ? 'text-neon-green' : 'text-white'}">${names[category]}</h2><p class="text-gray-500">共 ${articles.length} 篇技术文章</p></div></div><div class="grid grid-cols-1 md:grid-cols-2 gap-6">${html}</div></div></div>`; }
+function showArticle(id) { const a = knowledgeBase.getArticle(id); const p = document.getElementById('page-article'); p.innerHTML = `<div class="py-12 px-6"><div class="max-w-4xl mx-auto"><button onclick="backToCategory()" class="flex items-center gap-2 text-gray-400 hover:text-white mb-6"><i data-lucide="arrow-left" class="w-5 h-5"></i><span>返回分类</span></button><div class="glass-panel rounded-3xl p-8 md:p-12">${a.content}</div></div></div>`; showPage('article'); if (typeof lucide !== 'undefined') lucide.createIcons(); }
+function backToCategory() { if (knowledgeBase.currentCategory && knowledgeBase.currentCategory !== 'home') showPage(knowledgeBase.currentCategory); else showPage('home'); }
+function toggleMobileMenu() { document.getElementById('mobile-menu').classList.toggle('hidden'); }
+document.addEventListener('DOMContentLoaded', function() { if (typeof lucide !== 'undefined') lucide.createIcons(); const t = document.getElementById('last-update-time'); if (t) t.textContent = knowledgeBase.meta.lastUpdated; });
+'''
+
+
+def encode_record(article_id, article):
+    """序列化为一行存储记录"""
+    return '{"id": %s, "article": %s}\n' % (
+        json.dumps(article_id, ensure_ascii=False),
+        json.dumps(article, ensure_ascii=False)
+    )
+
+
+def normalize_record(article):
+    """
+    统一记录格式：能无损转换的正文转成结构化记录。
+    结构化记录被手工脚本写回了 content 时以 content 为准，重新转换。
+    """
+    if article.get('content') and 'layout' in article:
+        article = {key: value for key, value in article.items() if key not in ('layout', 'fields')}
+    return structure_record(article) or article
+
+
+def html_record(article):
+    """结构化记录对应的旧格式（整段 content），用于比较体积"""
+    if 'layout' not in article:
+        return article
+    plain = {key: value for key, value in article.items() if key not in ('layout', 'fields')}
+    plain['content'] = render_record(article)
+    return plain
+
+
+def split_record(line):
+    """拆出 (id, 文章JSON原文)，不解码文章本身"""
+    article_id, end = json.JSONDecoder().raw_decode(line, 7)
+    prefix = ', "article": '
+    if line[end:end + len(prefix)] != prefix:
+        raise ValueError(f"存储记录格式错误: {line[:60]}")
+    return article_id, line[end + len(prefix):].rstrip().removesuffix('}')
+
+
+class KnowledgeBaseStore:
+    """knowledge-base.js 的规范存储"""
+
+    def __init__(self, kb_file=KB_FILE, store_file=STORE_FILE,
+                 index_file=INDEX_FILE, state_file=STATE_FILE,
+                 manifest_file=MANIFEST_FILE, shard_dir=SHARD_DIR,
+                 search_index_file=SEARCH_INDEX_FILE, render_file=RENDER_FILE,
+                 snapshot_file=SNAPSHOT_FILE, journal_file=JOURNAL_FILE):
+        self.kb_file = kb_file
+        self.store_file = store_file
+        self.index_file = index_file
+        self.state_file = state_file
+        self.manifest_file = manifest_file
+        self.shard_dir = shard_dir
+        self.search_index_file = search_index_file
+        self.render_file = render_file
+        self.snapshot_file = snapshot_file
+        self.journal = Journal(journal_file)
+        self._index = None
+
+    # ---------- 索引 ----------
+
+    def load_index(self):
+        """返回 {id: category}，只读取索引文件"""
+        if self._index is None:
+            self._index = {}
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        article_id, _, category = line.rstrip('\n').partition('\t')
+                        if article_id:
+                            self._index[article_id] = category
+        return self._index
+
+    def __contains__(self, article_id):
+        return article_id in self.load_index()
+
+    def __len__(self):
+        return len(self.load_index())
+
+    def category_counts(self):
+        counts = {}
+        for category in self.load_index().values():
+            counts[category] = counts.get(category, 0) + 1
+        return counts
+
+    # ---------- 写入 ----------
+
+    def add_articles(self, articles, overwrite=False):
+        """追加文章 {id: article}，返回实际写入的ID列表"""
+        index = self.load_index()
+        added = [aid for aid in articles if overwrite or aid not in index]
+        if not added:
+            return added
+
+        os.makedirs(os.path.dirname(self.store_file) or '.', exist_ok=True)
+        truncate_partial_line(self.store_file)
+        truncate_partial_line(self.index_file)
+        with open(self.store_file, 'a', encoding='utf-8') as store, \
+                open(self.index_file, 'a', encoding='utf-8') as idx:
+            for aid in added:
+                store.write(encode_record(aid, articles[aid]))
+                idx.write(f"{aid}\t{articles[aid].get('category', '')}\n")
+                index[aid] = articles[aid].get('category', '')
+        return added
+
+    def _rewrite(self, records):
+        """用 [(id, 文章JSON原文)] 整体重写存储和索引"""
+        index = {}
+        with self.journal.transaction('kb_store.rewrite') as tx, \
+                tx.open(self.store_file) as store, tx.open(self.index_file) as idx:
+            for aid, raw in records:
+                category = json.loads(raw).get('category', '')
+                store.write('{"id": %s, "article": %s}\n' % (json.dumps(aid, ensure_ascii=False), raw))
+                idx.write(f"{aid}\t{category}\n")
+                index[aid] = category
+        self._index = index
+
+    def replace_articles(self, articles):
+        """用 {id: article} 整体替换存储（从备份快照恢复时使用）"""
+        self._rewrite((aid, json.dumps(article, ensure_ascii=False)) for aid, article in articles.items())
+        return len(articles)
+
+    def import_from_js(self):
+        """从 knowledge-base.js 重建存储（仅在首次使用或文件被外部修改后）"""
+        meta, articles = load_knowledge_base(self.kb_file, render_content=False)
+        self._rewrite((aid, json.dumps(normalize_record(a), ensure_ascii=False)) for aid, a in articles.items())
+        self._save_state(meta)
+        return len(articles)
+
+    def compact(self):
+        """去掉被覆盖的旧版本"""
+        self._rewrite(self.iter_raw().items())
+
+    def structure(self):
+        """
+        把存储中能无损转换的文章转成结构化记录。
+        返回 [(id, 旧格式字节数, 现在字节数)]，旧格式指整段 content 的记录。
+        """
+        records = {}
+        sizes = []
+        for aid, raw in self.iter_raw().items():
+            article = normalize_record(json.loads(raw))
+            records[aid] = json.dumps(article, ensure_ascii=False)
+            before = len(json.dumps(html_record(article), ensure_ascii=False).encode())
+            sizes.append((aid, before, len(records[aid].encode())))
+        self._rewrite(records.items())
+        return sizes
+
+    # ---------- 读取 ----------
+
+    def iter_raw(self):
+        """返回 {id: 文章JSON原文}，后写覆盖先写，保持首次出现的顺序"""
+        records = {}
+        if os.path.exists(self.store_file):
+            with open(self.store_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    # 没有换行结尾的最后一行是追加写入中断留下的半行，忽略
+                    if line.strip() and line.endswith('\n'):
+                        aid, raw = split_record(line)
+                        records[aid] = raw
+        return records
+
+    def get(self, article_id):
+        raw = self.iter_raw().get(article_id)
+        return json.loads(raw) if raw is not None else None
+
+    # ---------- 与 knowledge-base.js 同步 ----------
+
+    def _kb_fingerprint(self):
+        stat = os.stat(self.kb_file)
+        return {"kb_size": stat.st_size, "kb_mtime_ns": stat.st_mtime_ns}
+
+    def _kb_sha1(self):
+        with open(self.kb_file, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+    def _load_state(self):
+        if not os.path.exists(self.state_file):
+            return {}
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def meta(self):
+        """上次构建写入 knowledge-base.js 的 meta（还没有构建过时为空字典）"""
+        return self._load_state().get("meta", {})
+
+    def _save_state(self, meta=None):
+        state = self._kb_fingerprint()
+        state["kb_sha1"] = self._kb_sha1()
+        state["meta"] = meta if meta is not None else self.meta()
+        atomic_write(self.state_file, json.dumps(state, indent=2))
+
+    def kb_modified_externally(self):
+        """knowledge-base.js 是否在上次构建后被其他脚本修改"""
+        if not os.path.exists(self.kb_file):
+            return False
+        if not os.path.exists(self.state_file) or not os.path.exists(self.store_file):
+            return True
+        state = self._load_state()
+        current = self._kb_fingerprint()
+        if current["kb_size"] != state.get("kb_size"):
+            return True
+        if current["kb_mtime_ns"] == state.get("kb_mtime_ns"):
+            return False
+        # git checkout 会改变 mtime，大小相同时再比较内容
+        return self._kb_sha1() != state.get("kb_sha1")
+
+    def ensure_synced(self):
+        """先恢复中断的写入操作，必要时从 knowledge-base.js 重新导入，返回是否发生了导入"""
+        with span('kb.sync'):
+            print_recovery(self.journal.recover())
+            modified = self.kb_modified_externally()
+        if modified:
+            reason = "knowledge-base.js 已在外部修改，重新" if os.path.exists(self.store_file) else "首次"
+            with span('kb.import'):
+                count = self.import_from_js()
+            print(f"  🔄 {reason}导入 {count} 篇文章")
+            return True
+        return False
+
+    # ---------- 生成 knowledge-base.js ----------
+
+    def build(self, meta, header=KB_HEADER, compress=True, jobs=None):
+        """
+        从存储生成 knowledge-base.js；compress 为 True 时同时生成预压缩产物并输出大小报告。
+        jobs 为搜索索引渲染正文的进程数（见 article_renderer.render_records）
+        """
+        with span('kb.read_store'):
+            records = self.iter_raw()
+        meta = dict(meta, totalArticles=len(records))
+
+        with span('kb.write_js'):
+            body = ',\n'.join(f'        {json.dumps(aid, ensure_ascii=False)}: {raw}' for aid, raw in records.items())
+            with self.journal.transaction('kb_store.build') as tx, tx.open(self.kb_file) as f:
+                f.write(f"{header}\nconst knowledgeBase = {{\n")
+                f.write(f"    meta: {json.dumps(meta, indent=4)},\n")
+                f.write(f"    articles: {{\n{body}\n    }},\n")
+                f.write(KB_JS_TAIL)
+                f.write(render_js())
+            self._save_state(meta)
+
+        with span('kb.snapshot'):
+            write_snapshot(((aid, json.loads(raw)) for aid, raw in records.items()),
+                           self.snapshot_file, kb_fingerprint(self.kb_file))
+        with span('kb.shards'):
+            self.build_shards(meta, records)
+        with span('kb.search_index'):
+            self.build_search_index(records, jobs)
+        if compress:
+            with span('kb.precompress'):
+                report = build_artifacts()
+            print("  📦 预压缩构建产物:")
+            print_size_report(report)
+        return len(records)
+
+    def build_search_index(self, records=None, jobs=None):
+        """生成站内搜索索引 kb-search.json，正文按 jobs 个进程批量渲染"""
+        if records is None:
+            records = self.iter_raw()
+        bodies = render_records(records.values(), jobs=jobs)
+        return write_search_index(((aid, json.loads(raw)) for aid, raw in records.items()),
+                                  self.search_index_file, bodies)
+
+    def _shard_file(self, article_id, ext='.html'):
+        return os.path.join(self.shard_dir, re.sub(r'[^\w.-]', '_', article_id) + ext)
+
+    def build_shards(self, meta=None, records=None):
+        """
+        生成 kb-manifest.js、kb-render.js 和正文分片，返回实际写入的正文文件数。
+        结构化记录写 kb-content/<id>.json（只有字段），其余写 kb-content/<id>.html。
+        正文未变化的分片不重写；已有 contentPath 且正文为空的文章（如 Niagara V2）沿用原路径。
+        """
+        if meta is None:
+            meta = self.meta()
+        if records is None:
+            records = self.iter_raw()
+        os.makedirs(self.shard_dir, exist_ok=True)
+        site_root = os.path.dirname(self.manifest_file) or '.'
+
+        manifest = {}
+        expected = set()
+        written = 0
+        for aid, raw in records.items():
+            article = json.loads(raw)
+            entry = {key: article[key] for key in MANIFEST_FIELDS if key in article}
+            content = article.get('content')
+            if 'layout' in article and not content:
+                content = json.dumps(article['fields'], ensure_ascii=False)
+                shard = self._shard_file(aid, '.json')
+            elif content:
+                entry.pop('layout', None)
+                shard = self._shard_file(aid)
+            if content:
+                expected.add(os.path.basename(shard))
+                if not os.path.exists(shard) or _read_text(shard) != content:
+                    with open(shard, 'w', encoding='utf-8', newline='') as f:
+                        f.write(content)
+                    written += 1
+                entry['contentPath'] = os.path.relpath(shard, site_root).replace(os.sep, '/')
+            elif article.get('contentPath'):
+                entry['contentPath'] = article['contentPath']
+            manifest[aid] = entry
+
+        # 清理已删除文章的分片
+        for name in os.listdir(self.shard_dir):
+            if name.endswith(('.html', '.json')) and name not in expected:
+                os.remove(os.path.join(self.shard_dir, name))
+
+        render = render_js()
+        if not os.path.exists(self.render_file) or _read_text(self.render_file) != render:
+            atomic_write(self.render_file, render)
+
+        body = ',\n'.join(f'        {json.dumps(aid, ensure_ascii=False)}: {json.dumps(entry, ensure_ascii=False)}'
+                          for aid, entry in manifest.items())
+        atomic_write(self.manifest_file,
+                     "// Realtime Tech Knowledge Base - Manifest (正文按需从 contentPath 加载)\n"
+                     "const knowledgeBase = {\n"
+                     f"    meta: {json.dumps(dict(meta, totalArticles=len(manifest)), indent=4)},\n"
+                     f"    articles: {{\n{body}\n    }}\n}};\n")
+        return written
+
+
+def _read_text(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    jobs = int(sys.argv[sys.argv.index('--jobs') + 1]) if '--jobs' in sys.argv else None
+    store = KnowledgeBaseStore()
+
+    if command == 'import':
+        print(f"✅ 已导入 {store.import_from_js()} 篇文章")
+    elif command == 'build':
+        store.ensure_synced()
+        meta = {
+            "lastUpdated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "autoGenerated": True,
+            "version": "4.1-enhanced"
+        }
+        print(f"✅ 已生成 knowledge-base.js: {store.build(meta, jobs=jobs)} 篇文章")
+    elif command == 'shards':
+        store.ensure_synced()
+        written = store.build_shards()
+        docs, terms = store.build_search_index(jobs=jobs)
+        print(f"✅ 已生成 {store.manifest_file}，更新正文分片 {written} 个")
+        print(f"✅ 已生成 {store.search_index_file}: {docs} 篇文章, {terms} 个词项")
+    elif command == 'compact':
+        store.ensure_synced()
+        store.compact()
+        print(f"✅ 压缩完成: {len(store)} 篇文章")
+    elif command == 'structure':
+        store.ensure_synced()
+        sizes = store.structure()
+        changed = [(before, after) for _, before, after in sizes if after < before]
+        before = sum(b for _, b, _ in sizes)
+        after = sum(a for _, _, a in sizes)
+        print(f"✅ 结构化记录 {len(changed)} / {len(sizes)} 篇")
+        if changed:
+            saved = sorted(b - a for b, a in changed)
+            print(f"  每篇: 平均 {sum(b for b, _ in changed) / len(changed):,.0f} → "
+                  f"{sum(a for _, a in changed) / len(changed):,.0f} 字节, "
+                  f"节省 {saved[0]:,} ~ {saved[-1]:,} 字节 (中位数 {saved[len(saved) // 2]:,})")
+        print(f"  全部: {before / 1024 / 1024:.2f} MB → {after / 1024 / 1024:.2f} MB "
+              f"(-{(1 - after / max(before, 1)) * 100:.0f}%)")
+        print("  运行 build 重新生成 knowledge-base.js")
+    elif command == 'stats':
+        store.ensure_synced()
+        for category, count in sorted(store.category_counts().items()):
+            print(f"  {category}: {count}篇")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
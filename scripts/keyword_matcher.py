@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+多关键词一次匹配器
+把若干组关键词（排除词、UE/AI/渲染分类词、优质关键词...）在启动时整理一次：
+小写化、跨组去重、记录每个关键词属于哪些组。匹配时每段文本只 lower() 一次，
+标题和摘要用换行拼接后一起检查，每个关键词只查一次，一次调用返回所有组的命中结果。
+语义与逐个 `keyword.lower() in text.lower()` 完全相同。
+
+没有用合并正则 / Aho-Corasick：在几十个短关键词、几百字的文本上，CPython 的 `in`
+(C 实现的子串搜索) 比 sre 逐位置尝试合并正则快约 2 倍，见 bench_keyword_matcher.py。
+
+用法:
+    matcher = KeywordMatcher({'ue': ['unreal', 'ue5'], 'exclude': ['unity']})
+    hits = matcher.scan(title, summary)   # {'ue': ['unreal'], 'exclude': []}
+    hits = matcher.find_rows([(title, summary), ...])   # 批量: {'unreal': [0, 5], 'ue5': [], ...}
+
+批量匹配把所有行拼成一个字符串，每个关键词在整个语料上扫描一遍 (C 实现的 find)，
+命中后直接跳到下一行开头；Python 层的开销只和命中数有关，与行数×关键词数无关。
+"""
+
+import re
+from bisect import bisect_right
+
+
+# lower() 后包含 ASCII 字母的非 ASCII 字符只有这两个（İ -> i + 组合点, 开尔文符号 -> k），
+# bytes.lower() 不处理，按字节搜索前先替换成 str.lower() 的结果
+_ASCII_LOWER_EXCEPTIONS = ('\u0130', '\u212a')
+
+
+def _row_starts(rows):
+    """每行在 '\0'.join(rows) 中的起始位置，末尾追加一个哨兵"""
+    starts = []
+    offset = 0
+    for row in rows:
+        starts.append(offset)
+        offset += len(row) + 1
+    starts.append(offset)
+    return starts
+
+
+class KeywordMatcher:
+    """编译一次，多次匹配"""
+
+    def __init__(self, groups):
+        # group -> [(原始关键词, 小写关键词)]，保持声明顺序
+        self.groups = {name: [(kw, kw.lower()) for kw in keywords if kw]
+                       for name, keywords in groups.items()}
+        # 跨组去重，每个关键词每次只查一次（关键词不含换行，不会跨标题/摘要误匹配）
+        self._words = sorted({lower for keywords in self.groups.values() for _, lower in keywords})
+        self._ascii = all(word.isascii() for word in self._words)
+
+    def find(self, *texts):
+        """返回在任一文本中出现的小写关键词集合"""
+        joined = '\n'.join(text.lower() for text in texts if text)
+        return {word for word in self._words if word in joined}
+
+    def scan(self, *texts):
+        """返回 {组名: [命中的原始关键词, 按声明顺序]}，每组都有键"""
+        found = self.find(*texts)
+        return {name: [kw for kw, lower in keywords if lower in found]
+                for name, keywords in self.groups.items()}
+
+    def find_rows(self, rows):
+        """
+        批量匹配：rows 为文本元组的列表（如 [(标题, 摘要), ...]），
+        返回 {小写关键词: 命中的行号列表（升序）}
+        """
+        # 每行的文本用换行拼接（与 find() 一致），行之间用 \0 分隔；关键词不含这两个字符，不会跨段匹配
+        rows = ['\n'.join(text for text in texts if text) for texts in rows]
+        corpus = '\0'.join(rows)
+        if self._ascii and corpus.count('\0') == len(rows) - 1:
+            # 关键词全是 ASCII 时按 UTF-8 字节搜索：bytes.lower() 只改 ASCII 字母，比 str.lower() 快得多，
+            # 结果与 str.lower() 相同；行起始位置从 \0 的位置得到
+            for ch in _ASCII_LOWER_EXCEPTIONS:
+                if ch in corpus:
+                    corpus = corpus.replace(ch, ch.lower())
+            lowered = corpus.encode('utf-8').lower()
+            starts = [0] + [m.end() for m in re.finditer(b'\0', lowered)] + [len(lowered) + 1]
+            words = {word: word.encode() for word in self._words}
+        else:
+            # 逐行小写后再计算起始位置（个别字符 lower() 后长度会变）
+            rows = [row.lower() for row in rows]
+            lowered = '\0'.join(rows)
+            starts = _row_starts(rows)
+            words = {word: word for word in self._words}
+
+        hits = {}
+        for word, needle in words.items():
+            found = []
+            pos = lowered.find(needle)
+            while pos >= 0:
+                row = bisect_right(starts, pos) - 1
+                found.append(row)
+                pos = lowered.find(needle, starts[row + 1])
+            hits[word] = found
+        return hits
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Kimi 批量分析客户端 (asyncio)
+- 有上限的并发窗口：同时在途的请求不超过 max_in_flight
+- 令牌桶限速：平均每分钟不超过 requests_per_minute 次
+- 429 / 5xx / 网络错误按指数退避重试，优先使用服务器返回的 Retry-After
+- 返回与 auto_fetch_enhanced.generate_analysis() 相同的字段，两种后端可以互换
+
+本地测试可以用 kimi_stub_server.py 启动确定性的假服务器：
+    python3 scripts/kimi_client.py --stub 30
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+import urllib.error
+import urllib.request
+
+KIMI_API_KEY = os.environ.get('KIMI_API_KEY', '')
+KIMI_API_URL = os.environ.get('KIMI_API_URL', "https://api.moonshot.cn/v1/chat/completions")
+KIMI_MODEL = os.environ.get('KIMI_MODEL', "kimi-k2.5")
+
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_REQUESTS_PER_MINUTE = 30
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_TIMEOUT = 60
+
+CATEGORY_NAMES = {
+    "ue": "Unreal Engine",
+    "ta": "技术美术",
+    "render": "实时渲染",
+    "ta-render": "TA渲染",
+    "ai": "AI技术",
+    "vfx": "特效",
+    "multiplat": "多端开发"
+}
+
+SYSTEM_PROMPT = "你是专业的游戏技术分析师，擅长深度技术文章解析。"
+
+
+def build_prompt(title, summary, category):
+    """生成分析提示词"""
+    return f"""你是一位资深游戏技术专家。请分析以下技术文章并返回JSON格式：
+
+标题: {title}
+摘要: {summary[:500]}
+领域: {CATEGORY_NAMES.get(category, '技术')}
+
+返回格式（只返回JSON）：
+{{
+    "chinese_title": "中文标题（专业简洁）",
+    "technical_summary": "技术摘要（200字中文）",
+    "key_technologies": ["技术1", "技术2", "技术3"],
+    "technical_analysis": "深度技术分析（400字中文，包含背景、问题、解决方案）",
+    "practical_value": "实用价值（150字中文）",
+    "target_audience": "目标读者",
+    "difficulty": "简单/中等/困难"
+}}"""
+
+
+# 提示词模板 + 模型的哈希，作为分析缓存的版本号；修改提示词后旧缓存自动失效
+PROMPT_VERSION = "kimi-" + hashlib.sha1(
+    f"{KIMI_MODEL}\0{SYSTEM_PROMPT}\0{build_prompt('{title}', '{summary}', '{category}')}".encode('utf-8')
+).hexdigest()[:12]
+
+
+def normalize_analysis(raw, title):
+    """把 Kimi 返回的 JSON 整理成 generate_analysis() 的字段"""
+    return {
+        "chinese_title": raw.get("chinese_title") or title,
+        "technical_summary": raw.get("technical_summary", ""),
+        "key_technologies": list(raw.get("key_technologies") or []),
+        "technical_analysis": raw.get("technical_analysis", ""),
+        "practical_value": raw.get("practical_value", ""),
+        "related_topics": list(raw.get("related_topics") or ["相关技术", "最佳实践"]),
+        "target_audience": raw.get("target_audience", "游戏开发者"),
+        "implementation_difficulty": raw.get("implementation_difficulty") or raw.get("difficulty") or "中等"
+    }
+
+
+class RetryableError(Exception):
+    """429 / 5xx / 网络错误，可以重试"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """异步令牌桶：rate 个/秒，最多积攒 capacity 个"""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncAnalysisClient:
+    """批量调用 Kimi 生成文章分析"""
+
+    def __init__(self, api_key=KIMI_API_KEY, api_url=KIMI_API_URL, model=KIMI_MODEL,
+                 max_in_flight=DEFAULT_MAX_IN_FLIGHT, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE,
+                 max_retries=DEFAULT_MAX_RETRIES, timeout=DEFAULT_TIMEOUT,
+                 base_delay=1.0, max_delay=30.0):
+        self.api_key = api_key
+        self.api_url = api_url
+        self.model = model
+        self.max_in_flight = max_in_flight
+        self.requests_per_minute = requests_per_minute
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = {"requests": 0, "retries": 0, "failures": 0}
+
+    # ---------- 单次请求 ----------
+
+    def _post(self, prompt):
+        """阻塞的 HTTP 调用，在线程中执行"""
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.7,
+            "response_format": {"type": "json_object"}
+        }
+        request = urllib.request.Request(
+            self.api_url,
+            data=json.dumps(payload, ensure_ascii=False).encode('utf-8'),
+            headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
+            method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                result = json.loads(response.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            if e.code == 429 or e.code >= 500:
+                retry_after = e.headers.get('Retry-After')
+                raise RetryableError(f"HTTP {e.code}", float(retry_after) if retry_after else None)
+            raise
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+            raise RetryableError(str(e))
+        return json.loads(result['choices'][0]['message']['content'])
+
+    def _backoff(self, attempt, retry_after):
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    async def analyze(self, article, bucket, window):
+        """分析一篇文章，失败返回 None"""
+        title = article['title']
+        prompt = build_prompt(title, article.get('summary', ''), article.get('category', 'ta'))
+        for attempt in range(self.max_retries + 1):
+            async with window:
+                await bucket.acquire()
+                self.stats["requests"] += 1
+                try:
+                    raw = await asyncio.to_thread(self._post, prompt)
+                    return normalize_analysis(raw, title)
+                except RetryableError as e:
+                    error = e
+                except Exception as e:
+                    print(f"  ⚠️  Kimi调用失败: {title[:40]}... {e}")
+                    break
+            # 退避期间释放并发窗口
+            if attempt < self.max_retries:
+                self.stats["retries"] += 1
+                await asyncio.sleep(self._backoff(attempt, error.retry_after))
+        else:
+            print(f"  ⚠️  Kimi重试{self.max_retries}次仍失败: {title[:40]}... {error}")
+        self.stats["failures"] += 1
+        return None
+
+    # ---------- 批量 ----------
+
+    async def analyze_many(self, articles):
+        """并发分析，结果顺序与输入一致"""
+        bucket = TokenBucket(self.requests_per_minute / 60, capacity=min(self.max_in_flight, 5))
+        window = asyncio.Semaphore(self.max_in_flight)
+        return await asyncio.gather(*(self.analyze(a, bucket, window) for a in articles))
+
+    def run(self, articles, fallback=None, cache=None):
+        """
+        同步入口。fallback(article) 用于 Kimi 失败的文章（通常是本地模板 generate_analysis），
+        不传则失败的位置为 None。传入 AnalysisCache 时只请求未缓存的文章，成功结果写回缓存。
+        """
+        results = [cache.get(a, PROMPT_VERSION) if cache else None for a in articles]
+        pending = [i for i, r in enumerate(results) if r is None]
+        fresh = asyncio.run(self.analyze_many([articles[i] for i in pending])) if pending else []
+        for i, analysis in zip(pending, fresh):
+            results[i] = analysis
+            if cache and analysis is not None:
+                cache.put(articles[i], "kimi", PROMPT_VERSION, analysis)
+        if fallback is not None:
+            results = [r if r is not None else fallback(a) for r, a in zip(results, articles)]
+        return results
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] != '--stub':
+        print(__doc__)
+        sys.exit(1)
+
+    from kimi_stub_server import start_stub_server
+
+    count = int(sys.argv[2])
+    server, url = start_stub_server(fail_rate_limit=3, fail_server_error=2, delay=0.2)
+    articles = [{"title": f"Stub Article {i}", "summary": "Nanite and Lumen", "category": "ue"}
+                for i in range(count)]
+    client = AsyncAnalysisClient(api_key="stub", api_url=url, requests_per_minute=600,
+                                 max_in_flight=8, base_delay=0.05)
+    start = time.perf_counter()
+    results = client.run(articles)
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    ok = sum(1 for r in results if r is not None)
+    print(f"✅ {ok}/{count} 篇完成, 耗时 {elapsed:.2f}s, 统计: {client.stats}, "
+          f"服务器最大并发: {server.state.max_in_flight}/{client.max_in_flight}")
+    print(f"   示例: {results[0]}")
+
+
+if __name__ == "__main__":
+    main()
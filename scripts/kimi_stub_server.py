@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Kimi API 本地替身服务器
+- 兼容 /v1/chat/completions 的请求和响应格式
+- 响应内容由提示词的哈希决定，同一篇文章每次返回相同的分析
+- 可以让前 N 个请求返回 429 / 500，用来验证限速和退避逻辑
+
+用法:
+    python3 scripts/kimi_stub_server.py [--port 8765] [--fail-429 N] [--fail-500 N] [--delay 秒]
+    KIMI_API_KEY=stub KIMI_API_URL=http://127.0.0.1:8765/v1/chat/completions python3 scripts/auto_fetch_enhanced.py
+"""
+
+import hashlib
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PORT = 8765
+
+DIFFICULTIES = ["简单", "中等", "困难"]
+
+
+def stub_analysis(prompt):
+    """根据提示词生成确定性的分析结果"""
+    digest = hashlib.md5(prompt.encode('utf-8')).hexdigest()
+    title_match = re.search(r'标题: (.*)', prompt)
+    title = title_match.group(1).strip() if title_match else "未知文章"
+    return {
+        "chinese_title": f"[stub] {title}",
+        "technical_summary": f"{title} 的技术摘要 ({digest[:8]})",
+        "key_technologies": [f"tech-{digest[i:i + 4]}" for i in (0, 4, 8)],
+        "technical_analysis": f"{title} 的深度技术分析 ({digest[8:16]})",
+        "practical_value": "可用于本地测试",
+        "target_audience": "游戏开发者",
+        "difficulty": DIFFICULTIES[int(digest[:2], 16) % 3]
+    }
+
+
+class StubState:
+    def __init__(self, fail_rate_limit=0, fail_server_error=0, delay=0.0):
+        self.fail_rate_limit = fail_rate_limit
+        self.fail_server_error = fail_server_error
+        self.delay = delay
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def next_status(self):
+        """前 fail_rate_limit 个请求返回 429，随后 fail_server_error 个返回 500"""
+        with self.lock:
+            self.requests += 1
+            n = self.requests
+        if n <= self.fail_rate_limit:
+            return 429
+        if n <= self.fail_rate_limit + self.fail_server_error:
+            return 500
+        return 200
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body, headers=None):
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            with state.lock:
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            try:
+                time.sleep(state.delay)
+                status = state.next_status()
+                if status == 429:
+                    self._send(429, {"error": {"message": "rate limited"}}, {"Retry-After": "0.1"})
+                elif status == 500:
+                    self._send(500, {"error": {"message": "server error"}})
+                else:
+                    prompt = payload["messages"][-1]["content"]
+                    content = json.dumps(stub_analysis(prompt), ensure_ascii=False)
+                    self._send(200, {"choices": [{"message": {"role": "assistant", "content": content}}]})
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+    return Handler
+
+
+def start_stub_server(port=0, fail_rate_limit=0, fail_server_error=0, delay=0.0):
+    """在后台线程启动服务器，返回 (server, url)；server.state 记录请求数和最大并发"""
+    state = StubState(fail_rate_limit, fail_server_error, delay)
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(state))
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+
+
+def main():
+    args = sys.argv[1:]
+    options = {'--port': DEFAULT_PORT, '--fail-429': 0, '--fail-500': 0, '--delay': 0.0}
+    for i in range(0, len(args) - 1, 2):
+        if args[i] in options:
+            options[args[i]] = type(options[args[i]])(args[i + 1])
+
+    server, url = start_stub_server(options['--port'], options['--fail-429'],
+                                    options['--fail-500'], options['--delay'])
+    print(f"🧪 Kimi 替身服务器已启动: {url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"\n共处理 {server.state.requests} 个请求, 最大并发 {server.state.max_in_flight}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+并发原文链接检查
+- 线程池并发检查，同一域名有并发上限和请求间隔（礼貌延迟），不会把单个站点打满
+- 先发 HEAD；服务器不支持 HEAD (405/501/403) 或连接异常时，改用只取 1 字节的 GET (Range: bytes=0-0)
+- 结果缓存在 data/link_cache.json，TTL 内检查过的链接直接跳过
+- 404/410、域名不存在、连接被拒判为无效；403/429/5xx/超时记为"无法确认"
+- 只缓存确定的结果 (2xx/3xx、404/410)，网络层面的失败下次重新检查
+
+本地测试可以用 link_stub_server.py 启动替身服务器：
+    python3 scripts/link_checker.py --stub
+"""
+
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+from feed_fetcher import USER_AGENT, HostLimiter
+
+WORKSPACE = "."
+LINK_CACHE_FILE = f"{WORKSPACE}/data/link_cache.json"
+
+DEFAULT_WORKERS = 16
+DEFAULT_MAX_PER_HOST = 4
+DEFAULT_DELAY = 0.1
+DEFAULT_TIMEOUT = 10
+DEFAULT_TTL_DAYS = 7
+
+# HEAD 请求返回这些状态码时改用 GET 再试
+HEAD_FALLBACK_STATUS = {403, 405, 501}
+DEAD_STATUS = {404, 410}
+
+
+class LinkCache:
+    """链接检查结果缓存，线程安全"""
+
+    def __init__(self, path=LINK_CACHE_FILE, ttl_days=DEFAULT_TTL_DAYS):
+        self.path = path
+        self.ttl = timedelta(days=ttl_days)
+        self._lock = threading.Lock()
+        self.links = {}
+        self.run_stats = {"hits": 0, "checked": 0}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.links = json.load(f).get("links", {})
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"  ⚠️ 链接缓存损坏，重新开始: {e}")
+
+    def get(self, url):
+        """TTL 内的缓存结果，没有则返回 None"""
+        with self._lock:
+            entry = self.links.get(url)
+        if entry is None:
+            return None
+        if datetime.now() - datetime.fromisoformat(entry["checked_at"]) > self.ttl:
+            return None
+        with self._lock:
+            self.run_stats["hits"] += 1
+        return entry
+
+    def put(self, url, result):
+        with self._lock:
+            self.run_stats["checked"] += 1
+            if result.get("cacheable", True):
+                self.links[url] = dict(result, checked_at=datetime.now().isoformat())
+
+    def save(self):
+        with self._lock:
+            now = datetime.now()
+            # 顺便清理过期条目
+            links = {url: e for url, e in self.links.items()
+                     if now - datetime.fromisoformat(e["checked_at"]) <= self.ttl}
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({"links": links}, f, ensure_ascii=False, indent=1)
+
+    def summary(self):
+        return f"链接缓存命中 {self.run_stats['hits']} / 实际检查 {self.run_stats['checked']}"
+
+
+class Politeness:
+    """同一域名两次请求之间至少间隔 delay 秒"""
+
+    def __init__(self, delay=DEFAULT_DELAY):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next = {}
+
+    def wait(self, url):
+        host = urlparse(url).hostname or ''
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next.get(host, now))
+            self._next[host] = start + self.delay
+        if start > now:
+            time.sleep(start - now)
+
+
+def _request(url, method, timeout, politeness):
+    headers = {'User-Agent': USER_AGENT}
+    if method == 'GET':
+        headers['Range'] = 'bytes=0-0'
+    politeness.wait(url)
+    request = urllib.request.Request(url, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def check_url(url, timeout=DEFAULT_TIMEOUT, politeness=None):
+    """检查单个链接，返回 {"valid", "status", "issue", "cacheable"}"""
+    politeness = politeness or Politeness(0)
+    status = None
+    error = None
+    for method in ('HEAD', 'GET'):
+        try:
+            status = _request(url, method, timeout, politeness)
+            error = None
+        except urllib.error.URLError as e:
+            error = e.reason
+        except (socket.timeout, TimeoutError, ConnectionError) as e:
+            error = e
+        if error is None and status not in HEAD_FALLBACK_STATUS:
+            break
+
+    if error is not None:
+        if isinstance(error, socket.gaierror):
+            return {"valid": False, "status": None, "issue": "域名无法解析", "cacheable": False}
+        if isinstance(error, ConnectionRefusedError):
+            return {"valid": False, "status": None, "issue": "连接被拒绝", "cacheable": False}
+        return {"valid": True, "status": None, "issue": f"无法确认: {error}", "cacheable": False}
+    if status in DEAD_STATUS:
+        return {"valid": False, "status": status, "issue": f"链接失效 (HTTP {status})", "cacheable": True}
+    if status >= 400:
+        return {"valid": True, "status": status, "issue": f"无法确认 (HTTP {status})", "cacheable": False}
+    return {"valid": True, "status": status, "issue": None, "cacheable": True}
+
+
+def check_links(urls, cache=None, workers=DEFAULT_WORKERS, max_per_host=DEFAULT_MAX_PER_HOST,
+                delay=DEFAULT_DELAY, timeout=DEFAULT_TIMEOUT):
+    """并发检查一组链接，返回 {url: 结果}；缓存中未过期的链接不再请求"""
+    results = {}
+    pending = []
+    for url in dict.fromkeys(urls):
+        cached = cache.get(url) if cache is not None else None
+        if cached is not None:
+            results[url] = cached
+        else:
+            pending.append(url)
+    if not pending:
+        return results
+
+    limiter = HostLimiter(max_per_host)
+    politeness = Politeness(delay)
+
+    def run(url):
+        with limiter.slot(url):
+            try:
+                result = check_url(url, timeout, politeness)
+            except Exception as e:
+                result = {"valid": True, "status": None, "issue": f"无法确认: {e}", "cacheable": False}
+        if cache is not None:
+            cache.put(url, result)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as pool:
+        for url, result in zip(pending, pool.map(run, pending)):
+            results[url] = result
+    return results
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] != '--stub':
+        print(__doc__)
+        sys.exit(1)
+
+    from link_stub_server import start_link_stub_server
+
+    server, base = start_link_stub_server(latency=0.2)
+    paths = ['/ok', '/no-head', '/missing', '/gone', '/forbidden', '/error', '/redirect'] * 5
+    urls = [f"{base}{path}?n={i}" for i, path in enumerate(paths)]
+
+    start = time.perf_counter()
+    results = check_links(urls, workers=16, max_per_host=8, delay=0)
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    for path in paths[:7]:
+        result = results[f"{base}{path}?n={paths.index(path)}"]
+        print(f"  {path:<12} valid={result['valid']!s:<5} status={result['status']} {result['issue'] or ''}")
+    print(f"✅ {len(urls)} 个链接, 耗时 {elapsed:.2f}s (串行约 {server.state.requests * 0.2:.1f}s), "
+          f"服务器请求 {server.state.requests} 次")
+
+
+if __name__ == "__main__":
+    main()
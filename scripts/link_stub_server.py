@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+链接检查的本地替身服务器
+按路径返回固定的响应，用来验证 link_checker.py 的 HEAD/GET 回退、失效判定和并发：
+    /ok          200
+    /no-head     HEAD 返回 405，GET 返回 206
+    /missing     404
+    /gone        410
+    /forbidden   403
+    /error       500
+    /redirect    302 → /ok
+查询参数会被忽略。
+
+用法:
+    python3 scripts/link_stub_server.py [--port 8766] [--latency 秒]
+"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+DEFAULT_PORT = 8766
+
+ROUTES = {
+    '/ok': 200,
+    '/missing': 404,
+    '/gone': 410,
+    '/forbidden': 403,
+    '/error': 500,
+}
+
+
+class StubState:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.requests = 0
+        self.methods = {}
+        self.lock = threading.Lock()
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _respond(self, method):
+            with state.lock:
+                state.requests += 1
+                state.methods[method] = state.methods.get(method, 0) + 1
+            time.sleep(state.latency)
+            path = urlsplit(self.path).path
+            if path == '/redirect':
+                self.send_response(302)
+                self.send_header('Location', '/ok')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            if path == '/no-head':
+                status = 405 if method == 'HEAD' else (206 if self.headers.get('Range') else 200)
+            else:
+                status = ROUTES.get(path, 404)
+            body = b'x' if method == 'GET' else b''
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_HEAD(self):
+            self._respond('HEAD')
+
+        def do_GET(self):
+            self._respond('GET')
+
+    return Handler
+
+
+def start_link_stub_server(port=0, latency=0.0):
+    """在后台线程启动服务器，返回 (server, base_url)；server.state 记录请求数"""
+    state = StubState(latency)
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(state))
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    args = sys.argv[1:]
+    options = {'--port': DEFAULT_PORT, '--latency': 0.0}
+    for i in range(0, len(args) - 1, 2):
+        if args[i] in options:
+            options[args[i]] = type(options[args[i]])(args[i + 1])
+
+    server, base = start_link_stub_server(options['--port'], options['--latency'])
+    print(f"🧪 链接检查替身服务器已启动: {base}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"\n共处理 {server.state.requests} 个请求: {server.state.methods}")
+
+
+if __name__ == "__main__":
+    main()
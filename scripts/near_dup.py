@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+近似重复检测 (MinHash + LSH)
+同一篇报道以不同链接出现（转载、80.lv 各标签 feed 的副本）时链接去重发现不了，
+这里按 标题+摘要 的内容相似度找出来。
+
+- 切词与站内搜索一致 (search_index.tokenize)，相邻两个词组成一个 shingle
+- 每篇文章计算 64 个 MinHash 值，分成 16 个 band × 4 行做 LSH 分桶，
+  只有至少一个 band 完全相同的文章才会被比较，整体接近线性，不做两两比较
+- 候选对用签名一致率估计 Jaccard 相似度：≥ DUPLICATE_THRESHOLD 视为同一篇，抓取时跳过；
+  ≥ SIMILARITY_THRESHOLD 只提示（如 "Headshot 3.0" 与 "Headshot 3.1" 是两次不同的发布）
+- data/near_dup.bin 保存已入库文章的签名（每条: 20字节ID + 64×uint32），只追加。
+  它是 data/articles.jsonl 的派生文件，不进 git，不存在时自动从文章库重建
+
+用法:
+    python3 scripts/near_dup.py build    # 从 data/articles.jsonl 重建签名库
+    python3 scripts/near_dup.py scan     # 列出文章库中的近似重复簇
+"""
+
+import hashlib
+import os
+import struct
+import sys
+
+from search_index import strip_html, tokenize
+
+WORKSPACE = "."
+NEAR_DUP_FILE = f"{WORKSPACE}/data/near_dup.bin"
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+DUPLICATE_THRESHOLD = 0.9
+SIMILARITY_THRESHOLD = 0.7
+
+ID_WIDTH = 20
+_SIG = struct.Struct(f'<{NUM_PERM}I')
+RECORD_SIZE = ID_WIDTH + _SIG.size
+# 每次 blake2b 取 64 字节 = 16 个 uint32，4 个不同的 salt 凑满 64 个哈希函数
+_SALTS = [f"minhash{i}".encode() for i in range(NUM_PERM // 16)]
+_CHUNK = struct.Struct('<16I')
+
+
+def shingles(text):
+    tokens = tokenize(text)
+    if len(tokens) < 2:
+        return set(tokens)
+    return {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+
+def signature(text):
+    """64 个 MinHash 值（元组）；没有可用词项时返回 None"""
+    items = shingles(text)
+    if not items:
+        return None
+    columns = []
+    for salt in _SALTS:
+        rows = [_CHUNK.unpack(hashlib.blake2b(item.encode('utf-8'), salt=salt).digest()) for item in items]
+        columns.extend(map(min, zip(*rows)))
+    return tuple(columns)
+
+
+def article_text(article):
+    return f"{article.get('title', '')} {strip_html(article.get('summary', ''))}"
+
+
+def similarity(sig_a, sig_b):
+    """签名一致率，约等于 Jaccard 相似度"""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+def _band_keys(sig):
+    return [(band, sig[band * ROWS:(band + 1) * ROWS]) for band in range(BANDS)]
+
+
+class NearDupIndex:
+    """签名库 + LSH 分桶"""
+
+    def __init__(self, path=NEAR_DUP_FILE):
+        self.path = path
+        self.signatures = {}
+        self.buckets = {}
+        self.pending = []
+        if not os.path.exists(path):
+            self.rebuild()
+            return
+        with open(path, 'rb') as f:
+            data = f.read()
+        for offset in range(0, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+            article_id = data[offset:offset + ID_WIDTH].decode().rstrip()
+            self._insert(article_id, _SIG.unpack_from(data, offset + ID_WIDTH))
+
+    def rebuild(self):
+        """从 data/articles.jsonl 重建签名库（覆盖 self.path）"""
+        from article_store import ArticleStore
+
+        self.signatures, self.buckets, self.pending = {}, {}, []
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        for article_id, article in ArticleStore().iter_articles():
+            self.add(article_id, signature(article_text(article)))
+        self.save()
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def _insert(self, article_id, sig):
+        self.signatures[article_id] = sig
+        for key in _band_keys(sig):
+            self.buckets.setdefault(key, []).append(article_id)
+
+    def candidates(self, sig):
+        """与 sig 至少有一个 band 相同的文章ID"""
+        found = set()
+        for key in _band_keys(sig):
+            found.update(self.buckets.get(key, ()))
+        return found
+
+    def find(self, sig, exclude=None):
+        """返回最相似的 (文章ID, 相似度)，没有达到阈值时返回 None"""
+        best = None
+        for article_id in self.candidates(sig):
+            if article_id == exclude:
+                continue
+            score = similarity(sig, self.signatures[article_id])
+            if score >= SIMILARITY_THRESHOLD and (best is None or score > best[1]):
+                best = (article_id, score)
+        return best
+
+    def add(self, article_id, sig):
+        if sig is None or article_id in self.signatures:
+            return
+        self._insert(article_id, sig)
+        self.pending.append(article_id)
+
+    def save(self, article_ids=None):
+        """追加新签名；传入 article_ids 时只保存其中的文章（实际入库的文章）"""
+        saved = [aid for aid in self.pending if article_ids is None or aid in article_ids]
+        self.pending = []
+        if not saved:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'ab') as f:
+            for article_id in saved:
+                f.write(article_id.encode().ljust(ID_WIDTH)[:ID_WIDTH])
+                f.write(_SIG.pack(*self.signatures[article_id]))
+
+    def clusters(self):
+        """整个签名库中的近似重复簇（并查集），每簇按入库顺序排列"""
+        parent = {article_id: article_id for article_id in self.signatures}
+
+        def root(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        order = {article_id: i for i, article_id in enumerate(self.signatures)}
+        for article_id, sig in self.signatures.items():
+            for other in self.candidates(sig):
+                # 每对只比较一次，只合并真正相似的候选
+                if order[other] <= order[article_id]:
+                    continue
+                if similarity(sig, self.signatures[other]) >= SIMILARITY_THRESHOLD:
+                    a, b = root(article_id), root(other)
+                    if a != b:
+                        parent[max(a, b, key=order.get)] = min(a, b, key=order.get)
+        groups = {}
+        for article_id in self.signatures:
+            groups.setdefault(root(article_id), []).append(article_id)
+        return [ids for ids in groups.values() if len(ids) > 1]
+
+
+def filter_near_duplicates(articles, index):
+    """
+    流水线阶段：跳过与文章库或本批次中更早文章几乎相同的文章，相似但不相同的只提示。
+    保留文章的签名暂存在 index 中，入库成功后调用 index.save(入库的ID)。
+    """
+    kept = []
+    for article in articles:
+        sig = signature(article_text(article))
+        if sig is not None:
+            match = index.find(sig, exclude=article['id'])
+            if match and match[1] >= DUPLICATE_THRESHOLD:
+                print(f"    ⏭️  跳过(近似重复 {match[1]:.2f} ≈ {match[0]}): {article['title'][:50]}...")
+                continue
+            if match:
+                print(f"    🔎 相似文章({match[1]:.2f} ≈ {match[0]}): {article['title'][:50]}...")
+            index.add(article['id'], sig)
+        kept.append(article)
+    return kept
+
+
+def main():
+    from article_store import ArticleStore
+
+    command = sys.argv[1] if len(sys.argv) > 1 else 'scan'
+    if command == 'build':
+        if os.path.exists(NEAR_DUP_FILE):
+            os.remove(NEAR_DUP_FILE)
+        index = NearDupIndex()
+        print(f"✅ 签名库已重建: {len(index)} 篇 ({os.path.getsize(NEAR_DUP_FILE) // 1024} KB)")
+    elif command == 'scan':
+        titles = {aid: a.get('title', '') for aid, a in ArticleStore().iter_articles()}
+        index = NearDupIndex()
+        clusters = index.clusters()
+        print(f"🔍 {len(index)} 篇文章中发现 {len(clusters)} 个近似重复簇")
+        for ids in clusters:
+            print(f"\n  保留 {ids[0]}: {titles.get(ids[0], '')[:60]}")
+            for article_id in ids[1:]:
+                score = similarity(index.signatures[ids[0]], index.signatures[article_id])
+                label = "重复" if score >= DUPLICATE_THRESHOLD else "相似"
+                print(f"  {label} {article_id} ({score:.2f}): {titles.get(article_id, '')[:60]}")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+静态站点构建产物预压缩
+- 为 knowledge-base.js、清单、搜索索引、index.html 和 articles/ / articles-v2/ 页面生成 .gz 和 .br 副本，
+  服务器直接返回预压缩文件，不必每次请求都现场压缩
+- 首页加载的 JS/JSON 另存一份带内容哈希的文件名 (assets/kb-manifest.<哈希>.js)，内容变化后浏览器缓存自然失效；
+  映射写入 asset-manifest.json，--rewrite-html 时同时改写 index.html 中的引用（部署前在 CI 中执行）
+- gzip 固定 mtime=0，相同输入得到相同输出；brotli 需要 pip install brotli，未安装时只生成 .gz
+- kb-content/ 下的正文分片体积很小、数量多，不做预压缩
+
+用法:
+    python3 scripts/precompress.py [--rewrite-html]
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+WORKSPACE = "."
+ASSET_DIR = f"{WORKSPACE}/assets"
+ASSET_MANIFEST_FILE = f"{WORKSPACE}/asset-manifest.json"
+INDEX_HTML = f"{WORKSPACE}/index.html"
+
+# 生成带哈希文件名的资源（index.html 直接引用的）
+HASHED_ASSETS = ('knowledge-base.js', 'kb-manifest.js', 'kb-render.js', 'kb-search.json')
+
+# 生成 .gz / .br 的文件
+COMPRESSED_PATTERNS = ('index.html', 'knowledge-base.js', 'kb-manifest.js', 'kb-render.js', 'kb-search.json',
+                       'articles/*.html', 'articles-v2/*.html')
+
+HASH_LENGTH = 8
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def _write_if_changed(path, data):
+    """内容相同时不重写，保持 mtime 不变"""
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def compress_file(path):
+    """生成 path.gz 和 path.br，返回 {"raw", "gzip", "brotli"} 字节数（未安装 brotli 时为 None）"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    gz = gzip.compress(data, GZIP_LEVEL, mtime=0)
+    _write_if_changed(path + '.gz', gz)
+    sizes = {"raw": len(data), "gzip": len(gz), "brotli": None}
+    if brotli is not None:
+        br = brotli.compress(data, quality=BROTLI_QUALITY)
+        _write_if_changed(path + '.br', br)
+        sizes["brotli"] = len(br)
+    return sizes
+
+
+def hashed_name(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def write_hashed_asset(path, asset_dir=ASSET_DIR):
+    """复制为 assets/<名称>.<哈希><扩展名>，删除同名资源的旧哈希版本，返回新文件路径"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    name = os.path.basename(path)
+    target = os.path.join(asset_dir, hashed_name(name, data))
+    os.makedirs(asset_dir, exist_ok=True)
+    _write_if_changed(target, data)
+
+    stem, ext = os.path.splitext(name)
+    stale = re.compile(re.escape(stem) + r'\.[0-9a-f]{%d}' % HASH_LENGTH + re.escape(ext) + r'(\.gz|\.br)?$')
+    for old in os.listdir(asset_dir):
+        if stale.match(old) and not old.startswith(os.path.basename(target)):
+            os.remove(os.path.join(asset_dir, old))
+    return target
+
+
+def rewrite_html_references(html_file, mapping):
+    """把 index.html 中对资源的引用（src="..." 和 fetch('...')）改为带哈希的文件名，返回是否有修改"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        text = f.read()
+    updated = text
+    for name, target in mapping.items():
+        stem, ext = os.path.splitext(name)
+        # 原始文件名或上一次改写后的哈希文件名
+        pattern = re.compile(r'(["\'])(?:assets/)?' + re.escape(stem) + r'(?:\.[0-9a-f]{%d})?' % HASH_LENGTH
+                             + re.escape(ext) + r'\1')
+        updated = pattern.sub(lambda m: m.group(1) + target + m.group(1), updated)
+    if updated == text:
+        return False
+    with open(html_file, 'w', encoding='utf-8') as f:
+        f.write(updated)
+    return True
+
+
+def build_artifacts(rewrite_html=False):
+    """
+    生成哈希文件名副本和 .gz/.br，返回 [(相对路径, 大小字典)]。
+    rewrite_html 为 True 时先改写 index.html 的引用，再压缩 index.html。
+    """
+    mapping = {}
+    for name in HASHED_ASSETS:
+        path = os.path.join(WORKSPACE, name)
+        if os.path.exists(path):
+            mapping[name] = os.path.relpath(write_hashed_asset(path), WORKSPACE).replace(os.sep, '/')
+    _write_if_changed(ASSET_MANIFEST_FILE, (json.dumps(mapping, indent=2) + '\n').encode())
+    if rewrite_html:
+        rewrite_html_references(INDEX_HTML, mapping)
+
+    paths = []
+    for pattern in COMPRESSED_PATTERNS:
+        paths.extend(sorted(glob.glob(os.path.join(WORKSPACE, pattern))))
+    paths.extend(os.path.join(WORKSPACE, target) for target in mapping.values())
+    return [(os.path.relpath(path, WORKSPACE).replace(os.sep, '/'), compress_file(path)) for path in paths]
+
+
+def print_size_report(report):
+    """每个产物的原始 / gzip / brotli 大小和压缩率"""
+    def kb(size):
+        return f"{size / 1024:,.1f}" if size is not None else '-'
+
+    print(f"  {'产物':<48} {'原始KB':>9} {'gzip KB':>9} {'br KB':>9} {'压缩率':>7}")
+    totals = {"raw": 0, "gzip": 0, "brotli": 0}
+    for name, sizes in report:
+        best = sizes["brotli"] if sizes["brotli"] is not None else sizes["gzip"]
+        print(f"  {name:<48} {kb(sizes['raw']):>9} {kb(sizes['gzip']):>9} {kb(sizes['brotli']):>9} "
+              f"{best / max(sizes['raw'], 1) * 100:>6.1f}%")
+        for key in totals:
+            totals[key] += sizes[key] or 0
+    print(f"  {'合计 (' + str(len(report)) + ' 个文件)':<48} {kb(totals['raw']):>9} {kb(totals['gzip']):>9} "
+          f"{kb(totals['brotli'] if brotli is not None else None):>9}")
+    if brotli is None:
+        print("  ⚠️ 未安装 brotli (pip install brotli)，只生成了 .gz")
+
+
+def main():
+    args = sys.argv[1:]
+    if any(arg not in ('--rewrite-html',) for arg in args):
+        print(__doc__)
+        sys.exit(1)
+    report = build_artifacts(rewrite_html='--rewrite-html' in args)
+    print(f"✅ 已生成预压缩产物: {len(report)} 个文件")
+    print_size_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+更新流程的分阶段计时与性能剖析
+- span("阶段名", 属性...) 记录一段耗时，可嵌套、可在抓取线程中使用（tracemalloc 的峰值是进程级的，
+  并发段的内存峰值只作参考）；没有正在运行的 RunMetrics 时是空操作，
+  所以 kb_store 等模块可以直接打点，不必层层传参
+- 每次运行结束向 logs/metrics.jsonl 追加一行 JSON（各阶段汇总、每个源/阶段的明细、计数器），
+  与 logs/cron.log 放在一起，按行累积成趋势历史
+- --profile: cProfile 剖析主线程，结果写入 logs/profile-<时间>.prof，并在指标中记录累计耗时前 20 的函数
+- --trace-memory: tracemalloc 记录每个阶段的内存峰值和分配最多的代码位置
+
+用法:
+    with RunMetrics('auto_fetch_enhanced', profile=True) as metrics:
+        with span('fetch.source', source='80lv') as info:
+            info['articles'] = ...
+        metrics.count('new_articles', 5)
+    python3 scripts/run_metrics.py [最近N次，默认10]    # 各阶段耗时趋势
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+WORKSPACE = "."
+METRICS_FILE = f"{WORKSPACE}/logs/metrics.jsonl"
+PROFILE_DIR = f"{WORKSPACE}/logs"
+
+PROFILE_TOP = 20
+MEMORY_TOP = 10
+
+_active = None
+
+
+def profiling_flags(argv=None):
+    """从命令行参数读取 --profile / --trace-memory"""
+    argv = sys.argv[1:] if argv is None else argv
+    return {'profile': '--profile' in argv, 'trace_memory': '--trace-memory' in argv}
+
+
+class RunMetrics:
+    """一次运行的计时记录，with 块结束时写入指标文件"""
+
+    def __init__(self, run, profile=False, trace_memory=False, metrics_file=METRICS_FILE):
+        self.run = run
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.metrics_file = metrics_file
+        self.spans = []
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profiler = None
+        self._started = None
+        self._t0 = None
+
+    def __enter__(self):
+        global _active
+        self._started = datetime.now()
+        self._t0 = time.perf_counter()
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        _active = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _active
+        _active = None
+        self.finish(error=repr(exc) if exc is not None else None)
+
+    # ---------- 记录 ----------
+
+    @contextmanager
+    def span(self, name, **attrs):
+        stack = self._local.__dict__.setdefault('stack', [])
+        parent = stack[-1] if stack else None
+        stack.append(name)
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            entry = {"name": name, "start": round(start - self._t0, 4), "duration": round(duration, 4)}
+            if parent:
+                entry["parent"] = parent
+            if threading.current_thread() is not threading.main_thread():
+                entry["thread"] = threading.current_thread().name
+            if self.trace_memory:
+                entry["peak_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+            if attrs:
+                entry["attrs"] = attrs
+            with self._lock:
+                self.spans.append(entry)
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    # ---------- 汇总 ----------
+
+    def stages(self):
+        """按阶段名汇总: {name: {"count", "total", "max"}}，按首次出现的顺序"""
+        stages = {}
+        for entry in self.spans:
+            stage = stages.setdefault(entry["name"], {"count": 0, "total": 0.0, "max": 0.0})
+            stage["count"] += 1
+            stage["total"] = round(stage["total"] + entry["duration"], 4)
+            stage["max"] = max(stage["max"], entry["duration"])
+        return stages
+
+    def _profile_summary(self, stamp):
+        self._profiler.disable()
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = os.path.join(PROFILE_DIR, f"profile-{stamp}.prof")
+        self._profiler.dump_stats(path)
+        stats = pstats.Stats(self._profiler, stream=io.StringIO())
+        top = []
+        for (filename, line, func), (_, calls, _, cumulative, _) in sorted(
+                stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:PROFILE_TOP]:
+            top.append({"function": f"{os.path.basename(filename)}:{line}({func})",
+                        "calls": calls, "cumulative": round(cumulative, 4)})
+        return {"file": path, "top": top}
+
+    def _memory_summary(self):
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        top = [{"location": f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                "kb": round(stat.size / 1024, 1), "count": stat.count}
+               for stat in snapshot.statistics('lineno')[:MEMORY_TOP]]
+        return {"current_kb": round(current / 1024, 1), "peak_kb": round(peak / 1024, 1), "top": top}
+
+    def finish(self, error=None):
+        """写入一行指标，返回记录"""
+        stamp = self._started.strftime('%Y%m%d-%H%M%S')
+        record = {
+            "run": self.run,
+            "started": self._started.isoformat(timespec='seconds'),
+            "duration": round(time.perf_counter() - self._t0, 4),
+            "stages": self.stages(),
+            "counters": self.counters,
+            "spans": self.spans,
+        }
+        if error:
+            record["error"] = error
+        if self._profiler is not None:
+            record["profile"] = self._profile_summary(stamp)
+        if self.trace_memory:
+            record["memory"] = self._memory_summary()
+
+        os.makedirs(os.path.dirname(self.metrics_file) or '.', exist_ok=True)
+        with open(self.metrics_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        return record
+
+    def print_summary(self):
+        """各阶段耗时表"""
+        total = time.perf_counter() - self._t0
+        print(f"\n⏱️  阶段耗时 (总计 {total:.2f}s):")
+        for name, stage in self.stages().items():
+            print(f"  {name:<24} {stage['total']:>8.3f}s  ×{stage['count']:<4} 最长 {stage['max']:.3f}s")
+
+
+@contextmanager
+def _noop(attrs):
+    yield attrs
+
+
+def span(name, **attrs):
+    """
+    当前运行的计时段，with 得到属性字典，可在段内补充属性（如文章数）。
+    没有 RunMetrics 在运行时不做任何事
+    """
+    metrics = _active
+    return metrics.span(name, **attrs) if metrics is not None else _noop(attrs)
+
+
+def count(name, n=1):
+    if _active is not None:
+        _active.count(name, n)
+
+
+def load_history(path=METRICS_FILE, run=None):
+    """读取历史指标，可按 run 名称过滤"""
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                if run is None or record.get("run") == run:
+                    records.append(record)
+    return records
+
+
+def main():
+    args = sys.argv[1:]
+    if len(args) > 1 or (args and not (args[0].isdigit() and int(args[0]) > 0)):
+        print(__doc__)
+        sys.exit(0 if args[0] in ('-h', '--help') else 1)
+    limit = int(args[0]) if args else 10
+    records = load_history()[-limit:]
+    if not records:
+        print(f"暂无指标记录: {METRICS_FILE}")
+        return
+    names = []
+    for record in records:
+        names.extend(name for name in record["stages"] if name not in names and '.' not in name)
+    print(f"📈 最近 {len(records)} 次运行各阶段耗时 (秒):")
+    print(f"  {'时间':<20} {'运行':<22} {'总计':>7} " + ' '.join(f"{name:>10}" for name in names))
+    for record in records:
+        cells = ' '.join(f"{record['stages'][name]['total']:>10.2f}" if name in record['stages'] else f"{'-':>10}"
+                         for name in names)
+        print(f"  {record['started']:<20} {record['run']:<22} {record['duration']:>7.2f} {cells}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+站内搜索倒排索引
+- 索引标题、标签、分类和去掉 HTML 的正文
+- 英文/数字按单词切分，中日韩文字按二元组 (bigram) 切分，"虚幻引擎" → 虚幻 / 幻引 / 引擎
+- 输出 kb-search.json，index.html 首次搜索时加载，前端用同样的规则切分查询词
+
+索引格式:
+    {"ids": [文章ID...], "terms": [有序词项...], "postings": [[文档序号, 权重, 文档序号, 权重, ...], ...]}
+postings[i] 对应 terms[i]，权重 = 字段权重 × (1 + log(词频))，取整
+
+用法:
+    python3 scripts/search_index.py [knowledge-base.js] [kb-search.json]
+"""
+
+import html
+import json
+import math
+import re
+import sys
+
+from article_renderer import render_record
+from kb_journal import atomic_write
+
+SEARCH_INDEX_FILE = "./kb-search.json"
+
+# 字段权重：标题命中比正文命中重要得多
+FIELD_WEIGHTS = {'title': 10, 'tags': 6, 'category': 4, 'body': 1}
+
+# 正文中出现在超过这个比例文章里的词项（"原文链接"、"自动摘要" 等模板文字）不从正文索引
+MAX_BODY_DF_RATIO = 0.5
+
+_TOKEN = re.compile(r'[a-z0-9]+|[\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af\uf900-\ufaff]+')
+_TAG = re.compile(r'<[^>]+>')
+_SCRIPT_STYLE = re.compile(r'<(script|style|svg)\b.*?</\1>', re.DOTALL | re.IGNORECASE)
+
+
+def tokenize(text):
+    """切分为词项，与 index.html 中的 tokenize() 保持一致"""
+    tokens = []
+    for match in _TOKEN.finditer(text.lower()):
+        word = match.group()
+        if word[0].isascii():
+            tokens.append(word)
+        elif len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def strip_html(content):
+    """去掉标签和 SVG/脚本，只保留正文文字"""
+    text = _SCRIPT_STYLE.sub(' ', content or '')
+    return html.unescape(_TAG.sub(' ', text))
+
+
+def article_fields(article, content=None):
+    """content 为已渲染的正文HTML，不传时渲染"""
+    return {
+        'title': article.get('title', ''),
+        'tags': ' '.join(article.get('tags') or []),
+        'category': article.get('category', ''),
+        'body': strip_html(render_record(article) if content is None else content)
+    }
+
+
+def build_search_index(articles, bodies=None):
+    """articles: 可迭代的 (id, article)；bodies: 与 articles 一一对应的正文HTML（如 render_records 的结果），返回索引字典"""
+    ids = []
+    docs = []
+    body_df = {}
+    bodies = iter(bodies) if bodies is not None else None
+    for article_id, article in articles:
+        ids.append(article_id)
+        fields = {}
+        content = next(bodies) if bodies is not None else None
+        for field, text in article_fields(article, content).items():
+            counts = {}
+            for token in tokenize(text):
+                counts[token] = counts.get(token, 0) + 1
+            fields[field] = counts
+        for token in fields['body']:
+            body_df[token] = body_df.get(token, 0) + 1
+        docs.append(fields)
+
+    max_body_df = max(1, len(ids) * MAX_BODY_DF_RATIO)
+    postings = {}
+    for doc, fields in enumerate(docs):
+        scores = {}
+        for field, counts in fields.items():
+            for token, count in counts.items():
+                if field == 'body' and body_df[token] > max_body_df:
+                    continue
+                scores[token] = scores.get(token, 0) + FIELD_WEIGHTS[field] * (1 + math.log(count))
+        for token, score in scores.items():
+            postings.setdefault(token, []).extend((doc, max(1, round(score))))
+
+    terms = sorted(postings)
+    return {"ids": ids, "terms": terms, "postings": [postings[t] for t in terms]}
+
+
+def write_search_index(articles, path=SEARCH_INDEX_FILE, bodies=None):
+    """生成并写入 kb-search.json，返回 (文档数, 词项数)"""
+    index = build_search_index(articles, bodies)
+    atomic_write(path, json.dumps(index, ensure_ascii=False, separators=(',', ':')))
+    return len(index["ids"]), len(index["terms"])
+
+
+def main():
+    from kb_loader import iter_articles
+
+    kb_file = sys.argv[1] if len(sys.argv) > 1 else 'knowledge-base.js'
+    out_file = sys.argv[2] if len(sys.argv) > 2 else SEARCH_INDEX_FILE
+    docs, terms = write_search_index(iter_articles(kb_file, render_content=False), out_file)
+    print(f"✅ 已生成 {out_file}: {docs} 篇文章, {terms} 个词项")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+URL 规范化
+同一篇文章经常以不同链接出现：跟踪参数、http/https、www、结尾斜杠、#锚点。
+generate_article_id() 先规范化再取哈希，这些变体得到同一个文章ID。
+规范化后的链接只用于计算ID和去重，文章里保存和展示的仍是原始链接。
+
+用法:
+    python3 scripts/url_canon.py <链接>...
+"""
+
+import sys
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 不影响内容的查询参数
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'spm', '_ga', '_hsenc', '_hsmi'
+}
+TRACKING_PREFIXES = ('utm_', 'pk_', 'hsa_')
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def _is_tracking(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url):
+    """返回规范化链接；无法解析的链接原样返回（去掉首尾空白）"""
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if port and port != DEFAULT_PORTS[parts.scheme.lower()]:
+        host = f"{host}:{port}"
+
+    path = parts.path or '/'
+    while '//' in path:
+        path = path.replace('//', '/')
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking(k))
+    # http / https 视为同一篇文章
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    for url in sys.argv[1:]:
+        print(canonicalize_url(url))
+
+
+if __name__ == "__main__":
+    main()
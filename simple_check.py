@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
-import json
-import re
+import os
+import sys
 
-with open('knowledge-base.js', 'r', encoding='utf-8') as f:
-    content = f.read()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from kb_snapshot import open_snapshot
 
-match = re.search(r'articles:\s*({.*?}),\s*currentCategory', content, re.DOTALL)
-if match:
-    articles = json.loads(match.group(1))
-    print('当前文章数:', len(articles))
-    print('前5篇:', list(articles.keys())[:5])
+# 只需要ID和数量，读元数据快照即可，不解析整个 knowledge-base.js
+with open_snapshot('knowledge-base.js', 'data/kb_meta.snap') as snapshot:
+    print('当前文章数:', len(snapshot))
+    print('前5篇:', snapshot.column('id')[:5])
@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 import json
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from kb_journal import write_knowledge_base
 
 with open('knowledge-base.js', 'r', encoding='utf-8') as f:
     content = f.read()
@@ -253,7 +258,6 @@ function toggleMobileMenu() { document.getElementById('mobile-menu').classList.t
 document.addEventListener('DOMContentLoaded', function() { if (typeof lucide !== 'undefined') lucide.createIcons(); const t = document.getElementById('last-update-time'); if (t) t.textContent = knowledgeBase.meta.lastUpdated; });
 '''
     
-    with open('knowledge-base.js', 'w', encoding='utf-8') as f:
-        f.write(js_content)
+    write_knowledge_base('knowledge-base.js', js_content, op='update_article')
     
     print('✅ 文章已更新完成！')
@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 import json
-import re
+import os
+import sys
 from datetime import datetime
 
-exec(open('data/supplement_articles.py').read())
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from kb_journal import write_knowledge_base
+from kb_loader import load_knowledge_base
 
-with open('knowledge-base.js', 'r') as f:
-    content = f.read()
+exec(open('data/supplement_articles.py').read())
 
-match = re.search(r'articles:\s*({.*?}),\s*currentCategory', content, re.DOTALL)
-articles = json.loads(match.group(1))
+_, articles = load_knowledge_base('knowledge-base.js')
 
 print(f"当前文章数: {len(articles)}")
 
@@ -92,7 +93,6 @@ function toggleMobileMenu() { document.getElementById('mobile-menu').classList.t
 document.addEventListener('DOMContentLoaded', function() { if (typeof lucide !== 'undefined') lucide.createIcons(); const t = document.getElementById('last-update-time'); if (t) t.textContent = knowledgeBase.meta.lastUpdated; });
 '''
 
-with open('knowledge-base.js', 'w') as f:
-    f.write(js_content)
+write_knowledge_base('knowledge-base.js', js_content, op='update_complete')
 
 print("\n✅ 知识库已更新！")
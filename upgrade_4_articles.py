@@ -4,7 +4,12 @@
 """
 
 import json
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from kb_journal import write_knowledge_base
 
 with open('knowledge-base.js', 'r', encoding='utf-8') as f:
     content = f.read()
@@ -22,5 +27,4 @@ if match:
     meta = {"lastUpdated": "2026-02-28 19:30", "totalArticles": len(articles), "autoGenerated": True, "version": "5.0"}
     js = 'const knowledgeBase = { meta: ' + json.dumps(meta) + ', articles: ' + json.dumps(articles, ensure_ascii=False) + '}'
     
-    with open('knowledge-base.js', 'w') as f:
-        f.write(js)
+    write_knowledge_base('knowledge-base.js', js, op='upgrade_4_articles')